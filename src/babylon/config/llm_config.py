@@ -76,6 +76,15 @@ class LLMConfig:
             return f"{cls.EMBEDDING_API_BASE}/api/embeddings"
         return f"{cls.EMBEDDING_API_BASE}/v1/embeddings"
 
+    @classmethod
+    def get_batch_embedding_url(cls) -> str:
+        """Get the multi-input embedding API URL.
+
+        Both providers accept an ``input`` array on the OpenAI-compatible
+        ``/v1/embeddings`` endpoint (Ollama serves it beside ``/api/embeddings``).
+        """
+        return f"{cls.EMBEDDING_API_BASE}/v1/embeddings"
+
     @classmethod
     def validate_embeddings(cls) -> None:
         """Validate embedding configuration.
@@ -23,12 +23,41 @@ See Also:
 from __future__ import annotations
 
 import logging
-from typing import Protocol, runtime_checkable
+from collections.abc import Sequence
+from typing import Final, Protocol, runtime_checkable
 
+from sqlalchemy import bindparam, text
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+#: Counties per prefetch query, under SQLite's default 999 bound-parameter limit.
+_PREFETCH_CHUNK_SIZE: Final[int] = 500
+
+# Filter to naics_level=6 (6-digit national industry codes) to avoid
+# hierarchy double-counting: QCEW reports wages at every NAICS level
+# (2-digit sector totals through 6-digit leaf codes), where each parent
+# level INCLUDES all children. Without this filter, wages are overcounted
+# ~10x (e.g., Wayne County: $454B across all levels vs $43.7B at level 6).
+_COUNTY_WAGES_SQL: Final[str] = """
+    SELECT
+        dc.fips,
+        di.naics_code,
+        COALESCE(SUM(f.total_wages_usd), 0.0) as total_wages,
+        COALESCE(SUM(f.employment), 0) as employment
+    FROM fact_qcew_annual f
+    JOIN dim_county dc ON f.county_id = dc.county_id
+    JOIN dim_industry di ON f.industry_id = di.industry_id
+    JOIN dim_time dt ON f.time_id = dt.time_id
+    WHERE {county_filter}
+      AND dt.year = :year
+      AND dt.is_annual = 1
+      AND f.total_wages_usd IS NOT NULL
+      AND di.naics_level = 6
+    GROUP BY dc.fips, di.naics_code
+    ORDER BY dc.fips, total_wages DESC
+"""
+
 
 @runtime_checkable
 class QCEWDataSource(Protocol):
@@ -141,6 +170,35 @@ class SQLiteQCEWSource:
             session: SQLAlchemy session for database queries.
         """
         self._session = session
+        # (fips, year) -> records, filled by prefetch()
+        self._prefetched: dict[tuple[str, int], list[tuple[str, float, int]]] = {}
+
+    def prefetch(self, fips_codes: Sequence[str], year: int) -> None:
+        """Load every county's wage records for ``year`` in set-based queries.
+
+        Hydrating N counties through :meth:`fetch_county_wages` costs N
+        round-trips; this issues one query per :data:`_PREFETCH_CHUNK_SIZE`
+        counties instead and serves later :meth:`fetch_county_wages` calls
+        for those counties from memory. A prefetched county with no rows
+        reads back as ``[]``, exactly as an unprefetched query would.
+
+        Args:
+            fips_codes: 5-digit FIPS county codes.
+            year: Data year.
+        """
+        unique_fips = sorted(set(fips_codes))
+        for fips in unique_fips:
+            self._prefetched[(fips, year)] = []
+        query = text(_COUNTY_WAGES_SQL.format(county_filter="dc.fips IN :fips")).bindparams(
+            bindparam("fips", expanding=True)
+        )
+        for start in range(0, len(unique_fips), _PREFETCH_CHUNK_SIZE):
+            chunk = unique_fips[start : start + _PREFETCH_CHUNK_SIZE]
+            result = self._session.execute(query, {"fips": chunk, "year": year})
+            for row in result:
+                self._prefetched[(str(row[0]), year)].append(
+                    (str(row[1]), float(row[2]), int(row[3]))
+                )
 
     def fetch_county_wages(self, fips_code: str, year: int) -> list[tuple[str, float, int]]:
         """Fetch wage data for a county-year from the 3NF schema.
@@ -152,7 +210,8 @@ class SQLiteQCEWSource:
         - DimTime (to filter by year)
 
         Aggregates across ownership types (private, government) to get
-        total wages and employment per NAICS code.
+        total wages and employment per NAICS code. Counties loaded by
+        :meth:`prefetch` are answered without a query.
 
         Args:
             fips_code: 5-digit FIPS county code (e.g., "26163" for Wayne County).
@@ -164,41 +223,21 @@ class SQLiteQCEWSource:
             total_wages: Annual wages for the industry in the county.
             employment: Average annual employment count.
         """
-        # Use raw SQL for performance and explicit control over the query.
-        # Filter to naics_level=6 (6-digit national industry codes) to avoid
-        # hierarchy double-counting: QCEW reports wages at every NAICS level
-        # (2-digit sector totals through 6-digit leaf codes), where each parent
-        # level INCLUDES all children. Without this filter, wages are overcounted
-        # ~10x (e.g., Wayne County: $454B across all levels vs $43.7B at level 6).
-        query = """
-            SELECT
-                di.naics_code,
-                COALESCE(SUM(f.total_wages_usd), 0.0) as total_wages,
-                COALESCE(SUM(f.employment), 0) as employment
-            FROM fact_qcew_annual f
-            JOIN dim_county dc ON f.county_id = dc.county_id
-            JOIN dim_industry di ON f.industry_id = di.industry_id
-            JOIN dim_time dt ON f.time_id = dt.time_id
-            WHERE dc.fips = :fips
-              AND dt.year = :year
-              AND dt.is_annual = 1
-              AND f.total_wages_usd IS NOT NULL
-              AND di.naics_level = 6
-            GROUP BY di.naics_code
-            ORDER BY total_wages DESC
-        """
+        prefetched = self._prefetched.get((fips_code, year))
+        if prefetched is not None:
+            return list(prefetched)
 
         result = self._session.execute(
-            __import__("sqlalchemy").text(query),
+            text(_COUNTY_WAGES_SQL.format(county_filter="dc.fips = :fips")),
             {"fips": fips_code, "year": year},
         )
 
         # Convert to list of tuples with proper types
         records: list[tuple[str, float, int]] = []
         for row in result:
-            naics_code = str(row[0])
-            total_wages = float(row[1])
-            employment = int(row[2])
+            naics_code = str(row[1])
+            total_wages = float(row[2])
+            employment = int(row[3])
             records.append((naics_code, total_wages, employment))
 
         return records
@@ -48,10 +48,16 @@ import logging
 import threading
 from typing import TYPE_CHECKING, Final
 
+import numpy as np
+
 from babylon.domain.economics.depreciation import DepreciationConfig
 from babylon.domain.economics.tensor import NoDataSentinel, ValueTensor4x3
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
     from babylon.domain.economics.derived_metrics import DerivedTensorMetrics
     from babylon.domain.economics.tensor_registry import GeoLevel, TensorRegistry
 
@@ -191,6 +197,42 @@ class CapitalStockCalculator:
 
         return time_series[year]
 
+    def get_K_many(self, fips: Sequence[str], year: int) -> NDArray[np.float64]:
+        """Get capital stock for many counties in one year.
+
+        Bulk counterpart of :meth:`get_K` for the tick pipeline's county
+        frame: cached county-years are read under a single lock acquisition
+        and only the misses compute their time series.
+
+        Args:
+            fips: 5-digit FIPS county codes.
+            year: Calendar year.
+
+        Returns:
+            One K per county, NaN where :meth:`get_K` would return a
+            NoDataSentinel.
+        """
+        values = np.full(len(fips), np.nan)
+        if year < self.MIN_YEAR or year > self.MAX_YEAR:
+            return values
+
+        misses: list[int] = []
+        with self._lock:
+            for idx, code in enumerate(fips):
+                cached = self._cache.get((code, year))
+                if cached is None:
+                    misses.append(idx)
+                else:
+                    values[idx] = cached
+            self._hits += len(fips) - len(misses)
+        self._misses += len(misses)
+
+        for idx in misses:
+            time_series = self.compute_time_series(fips[idx])
+            if year in time_series:
+                values[idx] = time_series[year]
+        return values
+
     def compute_time_series(
         self,
         fips: str,
@@ -20,6 +20,13 @@ Design constraints:
   step body; the matrix is loaded once at session init (or once at year
   rollover at a tick boundary) and cached in-memory for the year.
 
+Each state file is parsed columnar (pyarrow CSV reader, a hashed
+block→hex join, one group-by sum) rather than row-by-row. With a
+``cache_dir``, every built year is also written as memory-mappable CSR
+``.npy`` arrays under a content-addressed key (year, study area, crosswalk
+and LODES file digests), so hot restarts and parallel workers skip the
+parse — and the national crosswalk build — entirely.
+
 See also:
     ``specs/063-vol-ii-circulation/spec.md`` FR-001 .. FR-007.
     ``specs/063-vol-ii-circulation/data-model.md`` §1.1 / §1.2.
@@ -31,7 +38,12 @@ from __future__ import annotations
 
 import csv
 import gzip
+import hashlib
+import json
 import logging
+import os
+import shutil
+import tempfile
 from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -227,6 +239,79 @@ def build_year_matrix(
 
 _LODES_FILE_PATTERN = "{state}_od_main_JT00_{year}.csv.gz"
 
+#: Destination bucket for commutes from an in-area home to an out-of-area job.
+_REST_OF_USA = "rest_of_usa"
+
+#: Bumped whenever the cached array layout or the aggregation semantics change,
+#: so stale cache entries stop matching instead of being misread.
+_CSR_CACHE_VERSION = 1
+
+
+def _file_sha256(path: Path) -> str:
+    with path.open("rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+def _save_year_matrix(matrix: LODESYearMatrix, target: Path) -> None:
+    """Write ``matrix`` as plain ``.npy`` arrays into a fresh ``target`` dir.
+
+    Staged in a sibling temp dir and renamed into place, so a concurrent
+    reader sees either nothing or a complete entry; when two workers race,
+    the loser's copy is discarded. The cache is best-effort: a failed write
+    is logged and the year is simply rebuilt next session.
+    """
+    staging: Path | None = None
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=target.parent))
+        csr = matrix.matrix
+        np.save(staging / "data.npy", csr.data)
+        np.save(staging / "indices.npy", csr.indices)
+        np.save(staging / "indptr.npy", csr.indptr)
+        np.save(staging / "row_sums.npy", matrix.row_sums)
+        origins = sorted(matrix.origin_hex_to_row, key=matrix.origin_hex_to_row.__getitem__)
+        (staging / "index.json").write_text(
+            json.dumps(
+                {
+                    "year": matrix.year,
+                    "origins": origins,
+                    "dests": list(matrix.dest_node_id_by_col),
+                    "dest_kinds": [kind.value for kind in matrix.dest_kind_by_col],
+                }
+            )
+        )
+        os.replace(staging, target)
+    except OSError as exc:
+        if target.is_dir():
+            logger.debug("LODES CSR cache entry %s already written by another worker", target)
+        else:
+            logger.warning("LODES CSR cache entry %s not written: %s", target, exc)
+    finally:
+        if staging is not None:
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+def _load_year_matrix(source: Path) -> LODESYearMatrix:
+    """Rebuild a cached :class:`LODESYearMatrix`; CSR arrays stay memory-mapped."""
+    index = json.loads((source / "index.json").read_text())
+    origins: list[str] = index["origins"]
+    dests: list[str] = index["dests"]
+    data = np.load(source / "data.npy", mmap_mode="r")
+    indices = np.load(source / "indices.npy", mmap_mode="r")
+    indptr = np.load(source / "indptr.npy", mmap_mode="r")
+    matrix = sp.csr_matrix(
+        (data, indices, indptr), shape=(len(origins), len(dests)), dtype=np.float64
+    )
+    return LODESYearMatrix(
+        year=index["year"],
+        matrix=matrix,
+        origin_hex_to_row={hex_id: row for row, hex_id in enumerate(origins)},
+        dest_to_col={dest: col for col, dest in enumerate(dests)},
+        dest_kind_by_col=tuple(NodeKind(kind) for kind in index["dest_kinds"]),
+        dest_node_id_by_col=tuple(dests),
+        row_sums=np.load(source / "row_sums.npy", mmap_mode="r"),
+    )
+
 
 class LODESCommuteMatrixLoader:
     """Read on-disk LODES OD CSVs + serve year-scoped CSR matrices.
@@ -235,6 +320,8 @@ class LODESCommuteMatrixLoader:
     a process (cached). ``persist_to_postgres`` writes the matrix to the
     ``immutable_reference_lodes_od_matrix`` table; ``load_year_from_postgres``
     rebuilds the in-memory CSR from the persisted rows for hot-restart paths.
+    With ``cache_dir`` set, ``load_year`` first looks for the year in the
+    on-disk CSR cache and writes every year it has to build.
 
     Per Constitution II.13 GATE-5: this is the *deterministic min-cost flow*
     component. Slime-mold conductivity routing is implemented in spec 064 as
@@ -248,6 +335,7 @@ class LODESCommuteMatrixLoader:
         crosswalk_path: Path,
         study_area_hexes: frozenset[str],
         study_area_states: frozenset[str],
+        cache_dir: Path | None = None,
     ) -> None:
         if not lodes_root.exists():
             raise FileNotFoundError(f"LODES root does not exist: {lodes_root}")
@@ -267,9 +355,14 @@ class LODESCommuteMatrixLoader:
         self.crosswalk_path = crosswalk_path
         self.study_area_hexes = study_area_hexes
         self.study_area_states = study_area_states
+        self.cache_dir = cache_dir
         self._year_cache: dict[int, LODESYearMatrix] = {}
         # Block-code → H3 res-7 cell map. Built lazily on first load_year() call.
         self._block_to_hex: dict[str, str] | None = None
+        # (in-area block codes, their hexes) as Arrow arrays for the vectorized
+        # join; derived from _block_to_hex on the first state-file read.
+        self._area_blocks: tuple[Any, Any] | None = None
+        self._digests: dict[Path, str] = {}
 
     # ── Disk loading ────────────────────────────────────────────────────────
 
@@ -293,6 +386,16 @@ class LODESCommuteMatrixLoader:
         if clamped in self._year_cache:
             return self._year_cache[clamped]
 
+        cache_entry = self._cache_entry(clamped)
+        if cache_entry is not None and cache_entry.is_dir():
+            try:
+                matrix = _load_year_matrix(cache_entry)
+            except (OSError, ValueError, KeyError) as exc:
+                logger.warning("Ignoring unreadable LODES CSR cache %s: %s", cache_entry, exc)
+            else:
+                self._year_cache[clamped] = matrix
+                return matrix
+
         if self._block_to_hex is None:
             self._block_to_hex = self._build_block_to_hex_map()
 
@@ -317,6 +420,8 @@ class LODESCommuteMatrixLoader:
             boundary_dest_kind=boundary_dest_kind,
             year=clamped,
         )
+        if cache_entry is not None:
+            _save_year_matrix(matrix, cache_entry)
         self._year_cache[clamped] = matrix
         return matrix
 
@@ -366,31 +471,47 @@ class LODESCommuteMatrixLoader:
         years at session-init time, summing the per-year counts for the
         ``InitializationReport.lodes_row_count`` field.
         """
+        from babylon.persistence.postgres_runtime._bulk_copy import BulkTarget, insert_rows
+
         matrix = self.load_year(year)
-        rows: list[tuple[Any, ...]] = []
-        # Iterate CSR matrix as (row_idx, col_idx, value) triples.
+        # COO triples → columns by fancy-indexing the id vectors, not per-entry
+        # dict lookups; large years go through COPY.
         coo = matrix.matrix.tocoo()
-        row_to_origin = {idx: hex_id for hex_id, idx in matrix.origin_hex_to_row.items()}
-        for r, c, v in zip(coo.row, coo.col, coo.data, strict=True):
-            origin = row_to_origin[int(r)]
-            dest_kind = matrix.dest_kind_by_col[int(c)]
-            dest_id = matrix.dest_node_id_by_col[int(c)]
-            rows.append((session_id, year, origin, dest_id, dest_kind.value, int(v)))
-        if not rows:
+        if coo.nnz == 0:
             return 0
+        origins = np.empty(len(matrix.origin_hex_to_row), dtype=object)
+        for hex_id, idx in matrix.origin_hex_to_row.items():
+            origins[idx] = hex_id
+        dest_ids = np.array(matrix.dest_node_id_by_col, dtype=object)
+        dest_kinds = np.array([kind.value for kind in matrix.dest_kind_by_col], dtype=object)
+        rows = list(
+            zip(
+                [session_id] * coo.nnz,
+                [year] * coo.nnz,
+                origins[coo.row].tolist(),
+                dest_ids[coo.col].tolist(),
+                dest_kinds[coo.col].tolist(),
+                coo.data.astype(np.int64).tolist(),
+                strict=True,
+            )
+        )
+        target = BulkTarget(
+            table="immutable_reference_lodes_od_matrix",
+            columns=(
+                "session_id",
+                "year",
+                "home_hex",
+                "workplace_dest",
+                "workplace_dest_kind",
+                "s000_workers",
+            ),
+            on_conflict="ON CONFLICT (session_id, year, home_hex, workplace_dest) DO NOTHING",
+        )
         with (
             runtime._pool.connection() as pg,  # type: ignore[attr-defined]  # noqa: SLF001
             pg.cursor() as cur,
         ):
-            cur.executemany(
-                """
-                INSERT INTO immutable_reference_lodes_od_matrix
-                    (session_id, year, home_hex, workplace_dest, workplace_dest_kind, s000_workers)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                ON CONFLICT (session_id, year, home_hex, workplace_dest) DO NOTHING
-                """,
-                rows,
-            )
+            insert_rows(cur, target, rows)
         return len(rows)
 
     def load_year_from_postgres(
@@ -517,43 +638,97 @@ class LODESCommuteMatrixLoader:
         pair_counts: dict[tuple[str, str], int],
         boundary_dest_kind: dict[str, NodeKind],
     ) -> None:
-        """Stream-read one LODES `_main_` file, prune to study-area, aggregate by hex pair."""
-        block_to_hex = self._block_to_hex
-        if block_to_hex is None:
-            raise RuntimeError("internal: _block_to_hex must be built before _read_one_state_file")
+        """Read one LODES `_main_` file, prune to study-area, aggregate by hex pair.
+
+        Columnar: the file is decoded by the pyarrow CSV reader, both block
+        codes are joined against the in-area blocks in one hashed lookup
+        each, and the surviving rows are summed by ``(home_hex, dest)`` in a
+        single group-by, so only the aggregated pairs reach Python. Same
+        filter as ever: zero-worker rows and out-of-area homes are dropped
+        (FR-007; out-of-area origins belong to the future ``_aux_`` path);
+        out-of-area jobs bucket as ``rest_of_usa`` (Detroit-Windsor
+        classification happens at emission time, not here).
+        """
+        import pyarrow as pa  # type: ignore[import-untyped, import-not-found, unused-ignore]
+        import pyarrow.compute as pc  # type: ignore[import-untyped, import-not-found, unused-ignore]
+        import pyarrow.csv as pa_csv  # type: ignore[import-untyped, import-not-found, unused-ignore]
+
+        area_blocks, area_hexes = self._area_block_lookup()
+        table = pa_csv.read_csv(
+            file_path,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=["w_geocode", "h_geocode", "S000"],
+                column_types={
+                    "w_geocode": pa.string(),
+                    "h_geocode": pa.string(),
+                    "S000": pa.int64(),
+                },
+            ),
+        )
+        home_idx = pc.index_in(table["h_geocode"], value_set=area_blocks)
+        keep = pc.and_(pc.is_valid(home_idx), pc.greater(table["S000"], 0))
+        work_idx = pc.index_in(pc.filter(table["w_geocode"], keep), value_set=area_blocks)
+        flows = pa.table(
+            {
+                "home": pc.take(area_hexes, pc.filter(home_idx, keep)),
+                "dest": pc.coalesce(pc.take(area_hexes, work_idx), pa.scalar(_REST_OF_USA)),
+                "s000": pc.filter(table["S000"], keep),
+            }
+        )
+        summed = flows.group_by(["home", "dest"]).aggregate([("s000", "sum")])
+        for home_hex, dest_id, s000 in zip(
+            summed["home"].to_pylist(),
+            summed["dest"].to_pylist(),
+            summed["s000_sum"].to_pylist(),
+            strict=True,
+        ):
+            boundary_dest_kind[dest_id] = (
+                NodeKind.EXTERNAL if dest_id == _REST_OF_USA else NodeKind.HEX
+            )
+            key = (home_hex, dest_id)
+            pair_counts[key] = pair_counts.get(key, 0) + s000
+
+    def _area_block_lookup(self) -> tuple[Any, Any]:
+        """In-area block codes and their hexes, as aligned Arrow arrays."""
+        if self._area_blocks is None:
+            import pyarrow as pa
+
+            block_to_hex = self._block_to_hex
+            if block_to_hex is None:
+                raise RuntimeError(
+                    "internal: _block_to_hex must be built before _read_one_state_file"
+                )
+            in_area = self.study_area_hexes
+            pairs = [(block, cell) for block, cell in block_to_hex.items() if cell in in_area]
+            self._area_blocks = (
+                pa.array([block for block, _ in pairs], type=pa.string()),
+                pa.array([cell for _, cell in pairs], type=pa.string()),
+            )
+        return self._area_blocks
 
-        in_area = self.study_area_hexes
-        with gzip.open(file_path, mode="rt", newline="") as fh:
-            reader = csv.DictReader(fh)
-            for row in reader:
-                w_geo = row["w_geocode"]
-                h_geo = row["h_geocode"]
-                s000 = int(row["S000"])
-                if s000 == 0:
-                    continue
-                # Map both block codes to hexes; skip pairs touching no in-area cell.
-                home_hex = block_to_hex.get(h_geo)
-                work_hex = block_to_hex.get(w_geo)
-                home_in = home_hex is not None and home_hex in in_area
-                work_in = work_hex is not None and work_hex in in_area
-                if not (home_in or work_in):
-                    continue  # Neither end touches the study area — drop per FR-007
-                # Build origin / dest. Origin must be in-area (or we skip — out-of-area origins
-                # are tracked separately by the future "_aux_" file path; not in spec 063 scope).
-                if not home_in:
-                    continue
-                assert home_hex is not None  # noqa: S101 — mypy narrowing; unreachable per the preceding continue guard
-                if work_in:
-                    assert work_hex is not None  # noqa: S101 — mypy narrowing; unreachable per the preceding continue guard
-                    dest_id = work_hex
-                    boundary_dest_kind[dest_id] = NodeKind.HEX
-                else:
-                    # Out-of-area destination — bucket as rest_of_usa for now.
-                    # (Detroit-Windsor classification happens at emission time, not here.)
-                    dest_id = "rest_of_usa"
-                    boundary_dest_kind[dest_id] = NodeKind.EXTERNAL
-                key = (home_hex, dest_id)
-                pair_counts[key] = pair_counts.get(key, 0) + s000
+    def _cache_entry(self, year: int) -> Path | None:
+        """Content-addressed cache directory for ``year`` (``None``: no cache).
+
+        The key covers everything the matrix is a pure function of: the
+        year, the study area, and the bytes of the crosswalk and of every
+        in-state LODES file for the year.
+        """
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha256()
+        key.update(f"v{_CSR_CACHE_VERSION}:{year}\n".encode())
+        key.update("\n".join(sorted(self.study_area_hexes)).encode())
+        key.update(f"\nxwalk:{self._digest(self.crosswalk_path)}".encode())
+        for state in sorted(self.study_area_states):
+            file_path = self._resolve_state_file(state, year)
+            digest = "absent" if file_path is None else self._digest(file_path)
+            key.update(f"\n{state}:{digest}".encode())
+        return self.cache_dir / f"lodes-{year}-{key.hexdigest()[:32]}"
+
+    def _digest(self, path: Path) -> str:
+        if path not in self._digests:
+            self._digests[path] = _file_sha256(path)
+        return self._digests[path]
 
     def _build_csr_matrix(
         self,
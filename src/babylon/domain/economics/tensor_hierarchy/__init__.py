@@ -40,6 +40,11 @@ from babylon.domain.economics.tensor_hierarchy.inter_industry import (
     DefaultInterIndustryFlowSource,
     DefaultLeontiefComputer,
 )
+from babylon.domain.economics.tensor_hierarchy.leontief_factor import (
+    LeontiefFactor,
+    LeontiefFactorCache,
+    LeontiefUpdate,
+)
 from babylon.domain.economics.tensor_hierarchy.protocols import (
     ClassTransitionSource,
     DepartmentAggregator,
@@ -104,4 +109,8 @@ __all__ = [
     "DefaultReproductionRequirementsComputer",
     "DefaultReproductionSource",
     "DefaultVisibilitySource",
+    # Leontief factorization cache
+    "LeontiefFactor",
+    "LeontiefFactorCache",
+    "LeontiefUpdate",
 ]
@@ -22,6 +22,10 @@ from typing import TYPE_CHECKING
 import numpy as np
 
 from babylon.domain.economics.tensor import NoDataSentinel
+from babylon.domain.economics.tensor_hierarchy.leontief_factor import (
+    DEFAULT_FACTOR_CACHE,
+    LeontiefFactorCache,
+)
 from babylon.domain.economics.tensor_hierarchy.types import (
     Department,
     InterIndustryFlow,
@@ -220,12 +224,22 @@ class DefaultLeontiefComputer:
     requirements. Element L[i,j] is the total output of industry i needed
     per unit of final demand for industry j.
 
+    ``I - A`` is LU-factored once per ``(year, A)`` through a
+    :class:`~babylon.domain.economics.tensor_hierarchy.leontief_factor.LeontiefFactorCache`;
+    repeated requests for the same table reuse the factors.
+
+    Args:
+        cache: Factorization cache (default: the process-wide one).
+
     Example:
         >>> computer = DefaultLeontiefComputer()
         >>> inverse = computer.compute_inverse(flow)
         >>> computer.total_labor_coefficients(inverse, direct_labor)
     """
 
+    def __init__(self, cache: LeontiefFactorCache | None = None) -> None:
+        self._cache = DEFAULT_FACTOR_CACHE if cache is None else cache
+
     def compute_inverse(self, flow: InterIndustryFlow) -> LeontiefInverse:
         """Compute L = (I - A)^{-1}.
 
@@ -242,15 +256,13 @@ class DefaultLeontiefComputer:
             numpy.linalg.LinAlgError: If (I - A) is singular.
         """
         a_matrix = flow.coefficients
-        n = a_matrix.shape[0]
-        i_minus_a = np.eye(n) - a_matrix
 
         # Validate Hawkins-Simon condition before attempting inversion
         valid, msg = validate_io_column_sums(a_matrix)
         if not valid and msg:
             logger.warning("I-O matrix may not be invertible: %s", msg)
 
-        inverse = np.linalg.inv(i_minus_a)
+        inverse = self._cache.factor(flow.year, a_matrix).inverse()
 
         # Validate Leontief properties
         valid, msg = validate_leontief_properties(inverse)
@@ -0,0 +1,284 @@
+"""Cached LU factorizations of the Leontief system (I - A).
+
+Feature: 025-tensor-hierarchy
+
+:class:`DefaultLeontiefComputer` and :class:`ProductionChainDecomposer`
+each called ``np.linalg.inv`` on every request — the decomposer once per
+tick through imperial rent — although the BEA coefficients only change
+when the year does. :class:`LeontiefFactorCache` keeps one LU factorization
+of ``I - A`` per ``(year, matrix digest)``:
+
+* ``L @ y`` for a batch of final-demand vectors is :meth:`LeontiefFactor.solve`,
+  two triangular solves per column (O(n²)) instead of a fresh O(n³) inverse.
+* The dense inverse, where a caller's data type needs it (``LeontiefInverse``,
+  ``DecomposedFlow.L_d``), is materialized once from the factors and cached.
+* A scenario that perturbs a handful of coefficients (a sanction zeroing an
+  import column, a tariff scaling a row) gets a Sherman–Morrison–Woodbury
+  update on top of the base factors (:meth:`LeontiefFactor.perturbed`)
+  rather than a refactorization: O(n²k) for ``k`` changed columns or rows.
+
+The digest is SHA-256 over the float64 bytes of ``A``, so a mutated matrix
+under an unchanged year is a different entry, never a stale hit.
+
+See Also:
+    :mod:`babylon.domain.economics.tensor_hierarchy.inter_industry`: DefaultLeontiefComputer.
+    :mod:`babylon.domain.economics.tensor_hierarchy.production_chain_rent`: L_d decomposition.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import warnings
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+from scipy import linalg  # type: ignore[import-untyped]
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+_MAX_ENTRIES: Final[int] = 8
+
+_FactorKey = tuple[int, tuple[int, ...], str]
+
+
+def _lu_factor(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """LU-factor ``matrix``, raising where ``np.linalg.inv`` would.
+
+    LAPACK ``getrf`` reports an exactly-zero pivot as a warning through
+    SciPy but as an error through ``np.linalg.inv``; keep the latter
+    contract so callers' ``LinAlgError`` handling is unchanged.
+
+    Raises:
+        numpy.linalg.LinAlgError: If ``matrix`` is singular.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", linalg.LinAlgWarning)
+        lu, piv = linalg.lu_factor(matrix, check_finite=True)
+    if np.any(np.diag(lu) == 0.0):
+        raise np.linalg.LinAlgError("Singular matrix")
+    return lu, piv
+
+
+class LeontiefFactor:
+    """LU factorization of ``I - A`` for one direct-requirements matrix.
+
+    Args:
+        coefficients: Square direct-requirements matrix ``A``.
+
+    Raises:
+        ValueError: If ``coefficients`` is not square.
+        numpy.linalg.LinAlgError: If ``I - A`` is singular.
+    """
+
+    def __init__(self, coefficients: np.ndarray) -> None:
+        a_matrix = np.array(coefficients, dtype=np.float64)
+        if a_matrix.ndim != 2 or a_matrix.shape[0] != a_matrix.shape[1]:
+            raise ValueError(f"coefficients must be square, got shape {a_matrix.shape}")
+        a_matrix.setflags(write=False)
+        self._a = a_matrix
+        self._lu = _lu_factor(np.eye(a_matrix.shape[0]) - a_matrix)
+        self._inverse: np.ndarray | None = None
+
+    @property
+    def n(self) -> int:
+        """Number of industries."""
+        return int(self._a.shape[0])
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        """Read-only copy of the factored ``A``."""
+        return self._a
+
+    def solve(self, demand: np.ndarray) -> np.ndarray:
+        """Gross output ``x = (I - A)^{-1} y`` for one or many demand vectors.
+
+        Args:
+            demand: Final demand, shape ``(n,)`` or ``(n, k)`` (one column per
+                scenario).
+
+        Returns:
+            Gross output, same shape as ``demand``.
+        """
+        result: np.ndarray = linalg.lu_solve(self._lu, np.asarray(demand, dtype=np.float64))
+        return result
+
+    def solve_transpose(self, weights: np.ndarray) -> np.ndarray:
+        """Row-vector products ``w @ (I - A)^{-1}``, e.g. total labor coefficients.
+
+        Args:
+            weights: Shape ``(n,)`` or ``(n, k)``.
+
+        Returns:
+            ``(I - A)^{-T} w``, same shape as ``weights``.
+        """
+        result: np.ndarray = linalg.lu_solve(
+            self._lu, np.asarray(weights, dtype=np.float64), trans=1
+        )
+        return result
+
+    def inverse(self) -> np.ndarray:
+        """The dense Leontief inverse, built once from the factors.
+
+        Returns:
+            Read-only ``(n, n)`` array ``(I - A)^{-1}``.
+        """
+        if self._inverse is None:
+            inverse = self.solve(np.eye(self.n))
+            inverse.setflags(write=False)
+            self._inverse = inverse
+        return self._inverse
+
+    def perturbed(self, changes: Mapping[tuple[int, int], float]) -> LeontiefUpdate:
+        """Low-rank view of this system with some coefficients replaced.
+
+        Args:
+            changes: ``{(i, j): new A[i, j]}``.
+
+        Returns:
+            A :class:`LeontiefUpdate` solving against the perturbed ``A``.
+
+        Raises:
+            numpy.linalg.LinAlgError: If the perturbed ``I - A`` is singular.
+        """
+        return LeontiefUpdate(self, changes)
+
+
+class LeontiefUpdate:
+    """Sherman–Morrison–Woodbury solve for ``I - A'`` with ``A' = A + U Vᵀ``.
+
+    The changes are grouped by distinct column (or by distinct row, when
+    fewer), so ``k`` in the O(n²k) set-up cost is the number of touched
+    columns/rows, not of touched cells.
+
+    Args:
+        base: Factorization of the unperturbed system.
+        changes: ``{(i, j): new A[i, j]}``.
+
+    Raises:
+        IndexError: If a change lies outside the matrix.
+        numpy.linalg.LinAlgError: If the perturbed ``I - A`` is singular.
+    """
+
+    def __init__(self, base: LeontiefFactor, changes: Mapping[tuple[int, int], float]) -> None:
+        n = base.n
+        delta = np.zeros((n, n), dtype=np.float64)
+        for (i, j), value in changes.items():
+            if not (0 <= i < n and 0 <= j < n):
+                raise IndexError(f"coefficient ({i}, {j}) outside a {n}x{n} matrix")
+            delta[i, j] = value - base.coefficients[i, j]
+        cols = np.flatnonzero(np.any(delta != 0.0, axis=0))
+        rows = np.flatnonzero(np.any(delta != 0.0, axis=1))
+        # delta = u @ v.T with one selector vector per touched column or row.
+        if len(cols) <= len(rows):
+            u = delta[:, cols]
+            v = np.eye(n)[:, cols]
+        else:
+            u = np.eye(n)[:, rows]
+            v = delta[rows, :].T
+        self._base = base
+        self._u = u
+        self._v = v
+        # (M - u vᵀ)^{-1} = M^{-1} + W C^{-1} vᵀ M^{-1},  W = M^{-1} u,  C = I - vᵀ W
+        self._w = base.solve(u)
+        self._w_t = base.solve_transpose(v)
+        capacitance = np.eye(u.shape[1]) - v.T @ self._w
+        self._capacitance = _lu_factor(capacitance) if u.shape[1] else None
+
+    @property
+    def rank(self) -> int:
+        """Rank of the update (touched columns or rows)."""
+        return int(self._u.shape[1])
+
+    def solve(self, demand: np.ndarray) -> np.ndarray:
+        """Gross output under the perturbed ``A``; see :meth:`LeontiefFactor.solve`."""
+        z = self._base.solve(demand)
+        if self._capacitance is None:
+            return z
+        correction = linalg.lu_solve(self._capacitance, self._v.T @ z)
+        result: np.ndarray = z + self._w @ correction
+        return result
+
+    def solve_transpose(self, weights: np.ndarray) -> np.ndarray:
+        """``(I - A')^{-T} w``; see :meth:`LeontiefFactor.solve_transpose`."""
+        z = self._base.solve_transpose(weights)
+        if self._capacitance is None:
+            return z
+        correction = linalg.lu_solve(self._capacitance, self._u.T @ z, trans=1)
+        result: np.ndarray = z + self._w_t @ correction
+        return result
+
+
+class LeontiefFactorCache:
+    """Thread-safe LRU of :class:`LeontiefFactor` keyed by year and matrix digest.
+
+    Args:
+        max_entries: Factorizations kept before the least recently used
+            one is dropped.
+    """
+
+    def __init__(self, max_entries: int = _MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[_FactorKey, LeontiefFactor] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Lookups answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Lookups that had to factor."""
+        return self._misses
+
+    def factor(self, year: int, coefficients: np.ndarray) -> LeontiefFactor:
+        """Return the factorization of ``I - coefficients``, factoring on a miss.
+
+        Args:
+            year: Data year of the I-O table.
+            coefficients: Direct-requirements matrix ``A``.
+
+        Returns:
+            The cached or freshly built :class:`LeontiefFactor`.
+
+        Raises:
+            numpy.linalg.LinAlgError: If ``I - A`` is singular (never cached).
+        """
+        a_matrix = np.ascontiguousarray(coefficients, dtype=np.float64)
+        key = (year, a_matrix.shape, hashlib.sha256(a_matrix.tobytes()).hexdigest())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry
+            self._misses += 1
+        entry = LeontiefFactor(a_matrix)
+        with self._lock:
+            self._entries[key] = entry
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Drop every cached factorization."""
+        with self._lock:
+            self._entries.clear()
+
+
+#: Process-wide cache shared by the default computers.
+DEFAULT_FACTOR_CACHE: Final[LeontiefFactorCache] = LeontiefFactorCache()
+
+__all__ = [
+    "DEFAULT_FACTOR_CACHE",
+    "LeontiefFactor",
+    "LeontiefFactorCache",
+    "LeontiefUpdate",
+]
@@ -11,6 +11,10 @@ from typing import Any, Protocol
 
 import numpy as np
 
+from babylon.domain.economics.tensor_hierarchy.leontief_factor import (
+    DEFAULT_FACTOR_CACHE,
+    LeontiefFactorCache,
+)
 from babylon.domain.economics.tensor_hierarchy.types import (
     DecomposedFlow,
     Department,  # noqa: F401
@@ -112,7 +116,16 @@ class FinalDemandSource(Protocol):
 
 
 class ProductionChainDecomposer:
-    """Decomposes the generic BEA Direct Requirements matrix."""
+    """Decomposes the generic BEA Direct Requirements matrix.
+
+    Args:
+        cache: Factorization cache for ``I - A_d`` (default: the
+            process-wide one), so the per-tick decomposition of an
+            unchanged year reuses its factors instead of inverting again.
+    """
+
+    def __init__(self, cache: LeontiefFactorCache | None = None) -> None:
+        self._cache = DEFAULT_FACTOR_CACHE if cache is None else cache
 
     def decompose(self, flow: InterIndustryFlow, shares: ImportShareVector) -> DecomposedFlow:
         """Decompose A into A_d (domestic) and A_m (imports), and calculate L_d.
@@ -128,7 +141,6 @@ class ProductionChainDecomposer:
             msg = "Flow and Shares industry vectors must align perfectly."
             raise ValueError(msg)
 
-        n = flow.n_industries
         m_j = shares.shares
 
         # A_m[i,j] = A[i,j] * m_j
@@ -140,8 +152,7 @@ class ProductionChainDecomposer:
         A_d = flow.coefficients * (1.0 - m_j)
 
         # L_d = (I - A_d)^-1
-        identity = np.eye(n, dtype=np.float64)
-        L_d = np.linalg.inv(identity - A_d)
+        L_d = self._cache.factor(flow.year, A_d).inverse()
 
         return DecomposedFlow(
             year=flow.year,
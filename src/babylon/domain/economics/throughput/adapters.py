@@ -24,8 +24,10 @@ Usage:
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Final
+
+import numpy as np
 
 from babylon.formulas.constants import HOURS_PER_YEAR, WEEKS_PER_YEAR
 from babylon.reference.schema import (
@@ -46,6 +48,7 @@ from babylon.reference.schema import (
 )
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
     from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -54,6 +57,37 @@ logger = logging.getLogger(__name__)
 MILLIONS_TO_DOLLARS = 1_000_000
 # QCEW average weekly wage = annual total wages / employment / 52 weeks.
 
+# Counties per ``IN (...)`` clause in the bulk ``*_many`` lookups: under
+# SQLite's historical 999 host-parameter limit with room for the other
+# filters (infra bound, not a gameplay coefficient, hence no GameDefines).
+_FIPS_BATCH: Final[int] = 500
+
+
+def _fips_batches(fips: Sequence[str]) -> Iterator[list[str]]:
+    """Yield the distinct FIPS codes of ``fips`` in ``_FIPS_BATCH`` chunks."""
+    distinct = list(dict.fromkeys(fips))
+    for start in range(0, len(distinct), _FIPS_BATCH):
+        yield distinct[start : start + _FIPS_BATCH]
+
+
+def _first_per_fips(rows: Iterable[Sequence[Any]]) -> dict[str, tuple[Any, ...]]:
+    """The first ``(fips, *values)`` row per FIPS code, as the scalar ``.first()`` sees it.
+
+    The scalar lookups validate only the first matching row, so a bulk
+    lookup must not fall through to a later duplicate when that row is
+    unusable; rows must arrive in the scalar query's order.
+    """
+    first: dict[str, tuple[Any, ...]] = {}
+    for code, *values in rows:
+        if code not in first:
+            first[code] = tuple(values)
+    return first
+
+
+def _aligned(fips: Sequence[str], found: dict[str, float]) -> NDArray[np.float64]:
+    """One value per entry of ``fips`` from ``found``, NaN where absent."""
+    return np.fromiter((found.get(code, np.nan) for code in fips), np.float64, len(fips))
+
 
 def _sector_codes_for(naics_2digit: str) -> list[str]:
     """Expand an adapter 2-digit NAICS label to ``dim_industry.sector_code`` values.
@@ -447,6 +481,52 @@ class SQLiteQCEWCountyNAICSSource:
                 return int(result[0])
             return None
 
+    def get_county_total_employment_many(
+        self, fips: Sequence[str], year: int
+    ) -> NDArray[np.float64]:
+        """Bulk :meth:`get_county_total_employment` for the tick pipeline.
+
+        One rollup query per :data:`_FIPS_BATCH` counties instead of four
+        queries per county.
+
+        Args:
+            fips: 5-character county FIPS codes.
+            year: Calendar year.
+
+        Returns:
+            Total employment per county, NaN where the scalar lookup
+            returns None.
+        """
+        found: dict[str, float] = {}
+        with self._session_factory() as session:
+            total_ownership_id = self._get_total_ownership_id(session)
+            if total_ownership_id is None:
+                logger.warning("QCEW 'Total All' ownership (own_code='0') not found")
+                return _aligned(fips, found)
+
+            time_id = self._get_time_id(session, year)
+            if time_id is None:
+                return _aligned(fips, found)
+
+            for batch in _fips_batches(fips):
+                rows = (
+                    session.query(DimCounty.fips, FactQcewCountyRollup.employment)
+                    .join(
+                        FactQcewCountyRollup,
+                        FactQcewCountyRollup.county_id == DimCounty.county_id,
+                    )
+                    .filter(
+                        DimCounty.fips.in_(batch),
+                        FactQcewCountyRollup.ownership_id == total_ownership_id,
+                        FactQcewCountyRollup.time_id == time_id,
+                    )
+                    .all()
+                )
+                for code, (employment,) in _first_per_fips(rows).items():
+                    if employment is not None:
+                        found[code] = float(int(employment))
+        return _aligned(fips, found)
+
     def get_county_naics_wages(self, fips: str, naics: str, year: int) -> float | None:
         """Get average weekly wage for a county-NAICS-sector combination.
 
@@ -624,12 +704,58 @@ class SQLiteBLSUnemploymentSource:
                     FactBLSUnemploymentDecomposition.county_id == county.county_id,
                     FactBLSUnemploymentDecomposition.time_id == time_dim.time_id,
                 )
+                .order_by(FactBLSUnemploymentDecomposition.fact_id)
                 .first()
             )
             if row is None or row[1] is None or row[1] <= 0 or row[0] is None:
                 return None
             return float(row[0]) / float(row[1])
 
+    def get_county_unemployment_rate_many(
+        self, fips: Sequence[str], year: int
+    ) -> NDArray[np.float64]:
+        """Bulk :meth:`get_county_unemployment_rate` for the tick pipeline.
+
+        One query per :data:`_FIPS_BATCH` counties instead of three queries
+        per county.
+
+        Args:
+            fips: 5-character county FIPS codes.
+            year: Calendar year.
+
+        Returns:
+            The U-3 rate per county, NaN where the scalar lookup returns
+            ``None``.
+        """
+        found: dict[str, float] = {}
+        with self._session_factory() as session:
+            time_dim = session.query(DimTime).filter(DimTime.year == year).first()
+            if time_dim is None:
+                return _aligned(fips, found)
+
+            for batch in _fips_batches(fips):
+                rows = (
+                    session.query(
+                        DimCounty.fips,
+                        FactBLSUnemploymentDecomposition.unemployed_u3,
+                        FactBLSUnemploymentDecomposition.labor_force,
+                    )
+                    .join(
+                        FactBLSUnemploymentDecomposition,
+                        FactBLSUnemploymentDecomposition.county_id == DimCounty.county_id,
+                    )
+                    .filter(
+                        DimCounty.fips.in_(batch),
+                        FactBLSUnemploymentDecomposition.time_id == time_dim.time_id,
+                    )
+                    .order_by(FactBLSUnemploymentDecomposition.fact_id)
+                    .all()
+                )
+                for code, (unemployed, labor_force) in _first_per_fips(rows).items():
+                    if unemployed is not None and labor_force is not None and labor_force > 0:
+                        found[code] = float(unemployed) / float(labor_force)
+        return _aligned(fips, found)
+
 
 class SQLiteCensusHousingSource:
     """County renter-occupied housing share from ACS housing tenure (Wave 6 C2).
@@ -0,0 +1,179 @@
+"""Struct-of-arrays county state for the tick dynamics pipeline.
+
+Feature: 017-simulation-tick-dynamics
+
+Step 3a used to build one validated :class:`CountyEconomicState` per county
+and every following per-county step (precarity, Vol I wage pressure)
+``model_copy``-ed all ~3,200 of them again. :class:`CountyStateFrame` holds
+the same scalar fields as one float64 column per field, in county order, so
+those steps run as array arithmetic. Pydantic models are materialized once
+(:meth:`CountyStateFrame.to_states`) where the pipeline hands county state
+to the nested-model layers (circulation, financial) and to the graph.
+
+Data sources and calculators feed the frame through :func:`lookup_many`:
+a source MAY offer a bulk ``<method>_many(fips, year)`` counterpart of a
+scalar ``<method>(fips, year)`` lookup, returning one float per county with
+NaN where the scalar method would have returned ``None`` or a
+:class:`~babylon.domain.economics.tensor.NoDataSentinel`. Sources without it
+(and every existing test stub) are called once per county as before.
+
+See Also:
+    :mod:`babylon.domain.economics.tick.types`: CountyEconomicState
+    :mod:`babylon.domain.economics.tick.system`: Pipeline integration
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import numpy as np
+
+from babylon.domain.economics.tick.types import CountyEconomicState
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from numpy.typing import NDArray
+
+    from babylon.domain.economics.dynamics.types import ClassDistribution
+    from babylon.domain.economics.tick.types import CrisisState
+
+
+def lookup_many(source: Any, method: str, fips: Sequence[str], year: int) -> NDArray[np.float64]:
+    """Per-county float lookup, in bulk when ``source`` supports it.
+
+    Args:
+        source: A calculator or data source exposing ``method(fips, year)``
+            and optionally ``f"{method}_many"(fips, year)``.
+        method: The scalar method name (e.g. ``"get_K"``).
+        fips: County FIPS codes, in frame order.
+        year: Calendar year.
+
+    Returns:
+        One float64 per county; NaN where the source has no numeric value.
+    """
+    bulk = getattr(source, f"{method}_many", None)
+    if bulk is not None:
+        return np.asarray(bulk(fips, year), dtype=np.float64)
+    scalar = getattr(source, method)
+    values = np.full(len(fips), np.nan)
+    for idx, code in enumerate(fips):
+        value = scalar(code, year)
+        if isinstance(value, (int, float)):
+            values[idx] = float(value)
+    return values
+
+
+@dataclass
+class CountyStateFrame:
+    """County state as columns — row ``i`` of every column is ``fips[i]``.
+
+    Columns are mutable arrays: pipeline steps write them in place before
+    :meth:`to_states` materializes the models.
+
+    Attributes:
+        fips: County FIPS codes in pipeline order.
+        year: State year shared by every row.
+        capital_stock: Capital stock K.
+        throughput_position: Pi = tau_through / tau_national.
+        supply_chain_depth: Supply chain depth D.
+        unemployment_rate: County U-3 rate.
+        renter_share: ACS renter-occupied household share.
+        u6_rate: Broad unemployment (U-6).
+        pter_rate: Part-time for economic reasons.
+        nilf_rate: Not in labor force rate.
+        median_wage: County median hourly wage.
+        employment: Total county employment.
+        phi_hour: Imperial rent per hour.
+        bracket_ratio: Top/bottom income-bracket household ratio.
+        real_wage_deflator: CPI base-year real-wage deflator.
+        class_distribution: Per-row class distribution model.
+        crisis_state: Per-row crisis lifecycle model.
+    """
+
+    #: The float64 columns, named as their :class:`CountyEconomicState` fields.
+    FLOAT_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "capital_stock",
+        "throughput_position",
+        "supply_chain_depth",
+        "unemployment_rate",
+        "renter_share",
+        "u6_rate",
+        "pter_rate",
+        "nilf_rate",
+        "median_wage",
+        "employment",
+        "phi_hour",
+        "bracket_ratio",
+        "real_wage_deflator",
+    )
+
+    fips: tuple[str, ...]
+    year: int
+    capital_stock: NDArray[np.float64]
+    throughput_position: NDArray[np.float64]
+    supply_chain_depth: NDArray[np.float64]
+    unemployment_rate: NDArray[np.float64]
+    renter_share: NDArray[np.float64]
+    u6_rate: NDArray[np.float64]
+    pter_rate: NDArray[np.float64]
+    nilf_rate: NDArray[np.float64]
+    median_wage: NDArray[np.float64]
+    employment: NDArray[np.float64]
+    phi_hour: NDArray[np.float64]
+    bracket_ratio: NDArray[np.float64]
+    real_wage_deflator: NDArray[np.float64]
+    class_distribution: list[ClassDistribution]
+    crisis_state: list[CrisisState]
+
+    def __len__(self) -> int:
+        return len(self.fips)
+
+    @classmethod
+    def from_states(cls, states: Mapping[str, CountyEconomicState]) -> CountyStateFrame:
+        """Build a frame from materialized county states (dict order).
+
+        Args:
+            states: FIPS -> county state; must be non-empty (the frame's
+                ``year`` is taken from its first row).
+
+        Returns:
+            A frame holding the states' scalar fields.
+        """
+        rows = list(states.values())
+        columns = {
+            name: np.fromiter((getattr(row, name) for row in rows), np.float64, len(rows))
+            for name in cls.FLOAT_COLUMNS
+        }
+        return cls(
+            fips=tuple(states),
+            year=rows[0].year,
+            class_distribution=[row.class_distribution for row in rows],
+            crisis_state=[row.crisis_state for row in rows],
+            **columns,
+        )
+
+    def to_states(self) -> dict[str, CountyEconomicState]:
+        """Materialize one validated :class:`CountyEconomicState` per row.
+
+        Fields outside the frame (circulation, financial, bifurcation) take
+        their model defaults, as a fresh Step 3a state always has.
+
+        Returns:
+            Dict of FIPS -> CountyEconomicState, in frame order.
+        """
+        columns = {name: getattr(self, name).tolist() for name in self.FLOAT_COLUMNS}
+        return {
+            code: CountyEconomicState(
+                fips=code,
+                year=self.year,
+                class_distribution=self.class_distribution[idx],
+                crisis_state=self.crisis_state[idx],
+                **{name: values[idx] for name, values in columns.items()},
+            )
+            for idx, code in enumerate(self.fips)
+        }
+
+
+__all__ = ["CountyStateFrame", "lookup_many"]
@@ -12,6 +12,13 @@ See Also:
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
 
 class PrecarityDeriver:
     """Derive precarity indicators from unemployment and precaritization.
@@ -61,5 +68,24 @@ class PrecarityDeriver:
         nilf = min(max(precaritization_rate * self.nilf_fraction, 0.0), 1.0)
         return (u6, pter, nilf)
 
+    def derive_many(
+        self,
+        unemployment_rate: NDArray[np.float64],
+        precaritization_rate: NDArray[np.float64],
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+        """Vectorized :meth:`derive` over aligned per-county arrays.
+
+        Args:
+            unemployment_rate: County U-3 unemployment rates.
+            precaritization_rate: Per-county precaritization rates.
+
+        Returns:
+            Tuple of (u6_rate, pter_rate, nilf_rate) arrays, clamped to [0, 1].
+        """
+        u6 = np.clip(unemployment_rate + precaritization_rate, 0.0, 1.0)
+        pter = np.clip(precaritization_rate * self.pter_fraction, 0.0, 1.0)
+        nilf = np.clip(precaritization_rate * self.nilf_fraction, 0.0, 1.0)
+        return (u6, pter, nilf)
+
 
 __all__ = ["PrecarityDeriver"]
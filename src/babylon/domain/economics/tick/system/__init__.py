@@ -27,6 +27,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any, ClassVar
 
+import numpy as np
+
 from babylon.domain.economics.circulation.circuit import advance_circuit, initialize_circuit_state
 from babylon.domain.economics.circulation.crisis import assess_circulation_crisis
 from babylon.domain.economics.circulation.defaults import FALLBACK_PROFILE
@@ -66,6 +68,7 @@ from babylon.domain.economics.tick.crisis_detector import (
     ThresholdCrisisDetector,
 )
 from babylon.domain.economics.tick.derived_rates import DerivedRateCalculator
+from babylon.domain.economics.tick.frame import CountyStateFrame, lookup_many
 from babylon.domain.economics.tick.graph_bridge import (
     read_tick_state_from_graph,
     reserve_army_signal,
@@ -93,6 +96,8 @@ from babylon.models.enums import NodeType
 from babylon.models.types import Currency
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from babylon.kernel.graph_protocol import GraphProtocol
     from babylon.kernel.services import ServicesProtocol
     from babylon.kernel.system_protocol import ContextType
@@ -216,16 +221,20 @@ class TickDynamicsSystem(SystemBase):
                 tensor_registry = getattr(services, "tensor_registry", None)
                 if tensor_registry is not None:
                     county_fips = list(tensor_registry.all_fips())
-        county_states = self._compute_county_states(year, county_fips, services, prev_county_states)
+        county_frame = self._build_county_frame(year, county_fips, services, prev_county_states)
 
         # Step 3a+: Derive precarity indicators from class distribution
-        county_states = self._derive_precarity(county_states)
+        self._derive_precarity(county_frame)
 
         # Step 3b: Update smoothed coefficients
         coefficients = self._update_coefficients(national_params, prev_coefficients)
 
         # Step 3.5: Compute Vol I production layer — wage pressure (Feature 021)
-        county_states = self._compute_vol1_layer(county_states, services, year)
+        self._compute_vol1_layer(county_frame, services, year)
+
+        # The layers below carry nested per-county models (circulation,
+        # financial, crisis) — materialize the frame once here.
+        county_states = county_frame.to_states()
 
         # Step 3.6: The accumulation loop — derive reserve_ratio + dispossession
         # rates onto territory nodes (Capital Vol I U3, Ch. 25). Writes directly
@@ -615,99 +624,41 @@ class TickDynamicsSystem(SystemBase):
             estimated=estimated,
         )
 
-    def _resolve_renter_share(
+    def _compute_county_states(
         self,
-        prev: CountyEconomicState | None,
-        services: ServicesProtocol,
-        fips: str,
-        year: int,
-    ) -> float:
-        """Wave 6 C2: per-county ACS renter share via ``services.housing_source``.
-
-        Mirrors the ``unemployment_rate``/``employment`` wired-source pattern
-        in :meth:`_compute_county_states`: prev-carry ``0.0`` default unless a
-        ``housing_source`` is wired and returns a real value for this
-        county-year (Constitution III.11 — honest ``None`` never fabricates a
-        share).
-
-        Args:
-            prev: Previous county state, or ``None`` on the first tick.
-            services: ServicesProtocol carrying the optional ``housing_source``.
-            fips: County FIPS code.
-            year: Calendar year.
-
-        Returns:
-            The renter share to carry into this tick's ``CountyEconomicState``.
-        """
-        renter_share = prev.renter_share if prev else 0.0
-        if services.housing_source is not None:
-            rs = services.housing_source.get_county_renter_share(fips, year)
-            if rs is not None and isinstance(rs, (int, float)):
-                renter_share = float(rs)
-        return renter_share
-
-    @staticmethod
-    def _wired_bracket_ratio(
-        fips: str,
         year: int,
-        prev: CountyEconomicState | None,
-        services: ServicesProtocol,
-    ) -> float:
-        """Wave 6 C3: bracket_ratio prefers a wired ACS B19001 income_source.
-
-        Extracted from :meth:`_compute_county_states` to keep that method's
-        cyclomatic complexity under the project's lint ceiling; same shape as
-        the inline ``unemployment_rate`` branch it mirrors (exogenous
-        per-county-year data, re-queried every tick — not seeded once like
-        the endogenous ``median_wage``). 0.0 remains the documented
-        unwired/absent-row not-computed default (Constitution III.11).
-        """
-        bracket_ratio = prev.bracket_ratio if prev else 0.0
-        if services.income_source is not None:
-            ratio = services.income_source.get_county_bracket_ratio(fips, year)
-            if ratio is not None and isinstance(ratio, (int, float)):
-                bracket_ratio = float(ratio)
-        return bracket_ratio
-
-    def _resolve_real_wage_deflator(
-        self,
-        prev: CountyEconomicState | None,
+        county_fips: list[str],
         services: ServicesProtocol,
-        year: int,
-    ) -> float:
-        """Read the CPI-based real-wage deflator for one county-year (Wave 6 C4).
-
-        Unlike ``median_wage`` (endogenous, source consulted only on
-        bootstrap), the deflator is re-read every tick: CPI is an external
-        national series, not a simulated trajectory the engine should own
-        after tick 1.
+        prev_county_states: dict[str, CountyEconomicState] | None,
+    ) -> dict[str, CountyEconomicState]:
+        """Step 3a, materialized: :meth:`_build_county_frame` as models.
 
         Args:
-            prev: Previous county state, if any (carries the prior deflator
-                forward when unwired).
-            services: ServicesProtocol with the optional ``cpi_source``.
             year: Current year.
+            county_fips: List of FIPS codes to process.
+            services: ServicesProtocol with calculators.
+            prev_county_states: Previous county states.
 
         Returns:
-            The deflator, or 1.0 (nominal == real) when ``cpi_source`` is
-            unwired or returns honest ``None`` for this year (Constitution
-            III.11 graceful degradation).
+            Dict of FIPS -> updated CountyEconomicState.
         """
-        real_wage_deflator = prev.real_wage_deflator if prev else 1.0
-        if services.cpi_source is not None:
-            deflator = services.cpi_source.get_cpi_deflator(year)
-            if deflator is not None and isinstance(deflator, (int, float)):
-                real_wage_deflator = float(deflator)
-        return real_wage_deflator
+        return self._build_county_frame(year, county_fips, services, prev_county_states).to_states()
 
-    def _compute_county_states(
+    def _build_county_frame(
         self,
         year: int,
         county_fips: list[str],
         services: ServicesProtocol,
         prev_county_states: dict[str, CountyEconomicState] | None,
-    ) -> dict[str, CountyEconomicState]:
-        """Step 3a: Compute county-level state.
+    ) -> CountyStateFrame:
+        """Step 3a: Compute county-level state as one column per field.
+
+        Every field starts as the previous tick's value (or its documented
+        bootstrap default) and is overlaid wherever a wired source returns a
+        real value for the county-year (Constitution III.11 — an honest
+        ``None`` never fabricates a figure). Sources are queried through
+        :func:`~babylon.domain.economics.tick.frame.lookup_many`, in bulk
+        where they support it.
 
         Args:
             year: Current year.
@@ -716,9 +667,18 @@ class TickDynamicsSystem(SystemBase):
             prev_county_states: Previous county states.
 
         Returns:
-            Dict of FIPS -> updated CountyEconomicState.
+            The county frame, in ``county_fips`` order.
         """
-        states: dict[str, CountyEconomicState] = {}
+        fips = tuple(county_fips)
+        prevs = [prev_county_states.get(code) if prev_county_states else None for code in fips]
+
+        def carried(field: str, default: float) -> NDArray[np.float64]:
+            return np.fromiter(
+                (getattr(prev, field) if prev is not None else default for prev in prevs),
+                np.float64,
+                len(prevs),
+            )
+
         # Honesty sweep (spec 2026-07-18 vol3-money-scissors-design, U2 fix):
         # CountyEconomicState.year has no ceiling — only the floor is a
         # genuine sanity bound (see tick/types.py docstring). ClassDistribution
@@ -728,142 +688,177 @@ class TickDynamicsSystem(SystemBase):
         # use site rather than from this (now-unbounded) year_floor directly.
         year_floor = max(year, 2007)
 
-        for fips in county_fips:
-            prev = prev_county_states.get(fips) if prev_county_states else None
-
-            # Get capital stock K from calculator
-            capital_stock: float = prev.capital_stock if prev else 0.0
-            if services.capital_calculator is not None:
-                k_result = services.capital_calculator.get_K(fips, year)
-                if k_result and isinstance(k_result, (int, float)):
-                    capital_stock = float(k_result)
-
-            # Get throughput metrics from calculator
-            throughput_position: float = prev.throughput_position if prev else 1.0
-            supply_chain_depth: float = prev.supply_chain_depth if prev else 2.0
-            if services.throughput_calculator is not None:
-                tp_result = services.throughput_calculator.compute_metrics(fips, year)
-                if tp_result and hasattr(tp_result, "pi") and tp_result.pi is not None:
-                    throughput_position = tp_result.pi
-                    supply_chain_depth = tp_result.supply_chain_depth
-
-            # Preserve previous precarity/labor indicators. unemployment_rate
-            # prefers a wired BLS LAUS U-3 source (labor-data wire 2026-07-15,
-            # symmetric with employment_source below); the 0.05 literal remains
-            # only as the documented unwired/absent-row degradation (III.11).
-            unemployment_rate = prev.unemployment_rate if prev else 0.05
-            if services.unemployment_source is not None:
-                u3 = services.unemployment_source.get_county_unemployment_rate(fips, year)
-                if u3 is not None and isinstance(u3, (int, float)):
-                    unemployment_rate = float(u3)
-            # Real per-county ACS renter share (Wave 6 C2), symmetric with
-            # unemployment_rate above. Extracted to a helper (rather than
-            # inlined like unemployment_rate above) to keep this method's
-            # cyclomatic complexity under the C901 gate.
-            renter_share = self._resolve_renter_share(prev, services, fips, year)
-            u6_rate = prev.u6_rate if prev else 0.10
-            pter_rate = prev.pter_rate if prev else 0.04
-            nilf_rate = prev.nilf_rate if prev else 0.06
-            # median_wage is ENDOGENOUS (wage-pressure/compression move it
-            # tick over tick), so a wired wage_source seeds only the INITIAL
-            # condition — once prev exists the simulation owns the trajectory.
-            # The source is the employment-weighted p50 estimator (item 60);
-            # 21.0 remains the documented unwired/absent-row bootstrap.
-            median_wage = prev.median_wage if prev else 21.0
-            if prev is None and services.wage_source is not None:
-                w50 = services.wage_source.get_county_median_hourly_wage(fips, year)
-                if w50 is not None and isinstance(w50, (int, float)) and w50 > 0.0:
-                    median_wage = float(w50)
-            # Real per-county headcount from a wired employment_source (QCEW
-            # county rollup), symmetric with capital_stock above; falls back to
-            # the documented 100k default when unwired or the county-year is
-            # absent (Constitution III.11 graceful degradation).
-            employment = prev.employment if prev else 100_000.0
-            if services.employment_source is not None:
-                emp_result = services.employment_source.get_county_total_employment(fips, year)
-                if emp_result and isinstance(emp_result, (int, float)):
-                    employment = float(emp_result)
-            phi_hour = prev.phi_hour if prev else 0.0
-            crisis_state = prev.crisis_state if prev else CrisisState.normal()
-            real_wage_deflator = self._resolve_real_wage_deflator(prev, services, year)
-
-            # Wave 6 C3 (epochs audit item 167): bracket_ratio prefers a wired
-            # ACS B19001 income_source, same shape as unemployment_rate above.
-            bracket_ratio = self._wired_bracket_ratio(fips, year, prev, services)
-
-            # Preserve class distribution
-            if prev is not None:
-                class_dist = prev.class_distribution
-                # Update year if different
-                dist_clamped_year = min(max(year_floor, 2007), 2030)
-                if class_dist.year != dist_clamped_year:
-                    class_dist = ClassDistribution(
-                        fips=fips,
-                        year=dist_clamped_year,
-                        bourgeoisie_share=class_dist.bourgeoisie_share,
-                        petit_bourgeoisie_share=class_dist.petit_bourgeoisie_share,
-                        labor_aristocracy_share=class_dist.labor_aristocracy_share,
-                        proletariat_share=class_dist.proletariat_share,
-                        lumpenproletariat_share=class_dist.lumpenproletariat_share,
+        frame = CountyStateFrame(
+            fips=fips,
+            year=year_floor,
+            capital_stock=carried("capital_stock", 0.0),
+            throughput_position=carried("throughput_position", 1.0),
+            supply_chain_depth=carried("supply_chain_depth", 2.0),
+            unemployment_rate=carried("unemployment_rate", 0.05),
+            renter_share=carried("renter_share", 0.0),
+            u6_rate=carried("u6_rate", 0.10),
+            pter_rate=carried("pter_rate", 0.04),
+            nilf_rate=carried("nilf_rate", 0.06),
+            median_wage=carried("median_wage", 21.0),
+            employment=carried("employment", 100_000.0),
+            phi_hour=carried("phi_hour", 0.0),
+            bracket_ratio=carried("bracket_ratio", 0.0),
+            real_wage_deflator=carried("real_wage_deflator", 1.0),
+            class_distribution=self._carried_class_distributions(fips, prevs, year_floor),
+            crisis_state=[
+                prev.crisis_state if prev is not None else CrisisState.normal() for prev in prevs
+            ],
+        )
+        self._overlay_wired_sources(frame, services, year)
+        self._seed_median_wage(frame, prevs, services, year)
+        self._overlay_throughput(frame, services, year)
+        return frame
+
+    @staticmethod
+    def _carried_class_distributions(
+        fips: tuple[str, ...],
+        prevs: list[CountyEconomicState | None],
+        year_floor: int,
+    ) -> list[ClassDistribution]:
+        """Preserve each county's class distribution, re-dated to this tick.
+
+        Counties without a previous state start from the documented national
+        bootstrap shares.
+        """
+        dist_year = min(max(year_floor, 2007), 2030)
+        distributions: list[ClassDistribution] = []
+        for code, prev in zip(fips, prevs, strict=True):
+            if prev is None:
+                distributions.append(
+                    ClassDistribution(
+                        fips=code,
+                        year=dist_year,
+                        bourgeoisie_share=0.01,
+                        petit_bourgeoisie_share=0.09,
+                        labor_aristocracy_share=0.40,
+                        proletariat_share=0.35,
+                        lumpenproletariat_share=0.15,
                     )
-            else:
-                class_dist = ClassDistribution(
-                    fips=fips,
-                    year=min(max(year_floor, 2007), 2030),
-                    bourgeoisie_share=0.01,
-                    petit_bourgeoisie_share=0.09,
-                    labor_aristocracy_share=0.40,
-                    proletariat_share=0.35,
-                    lumpenproletariat_share=0.15,
                 )
+            elif prev.class_distribution.year != dist_year:
+                # Shares and fips were validated when the previous tick built
+                # this distribution; only the (clamped, in-range) year moves.
+                distributions.append(
+                    prev.class_distribution.model_copy(update={"fips": code, "year": dist_year})
+                )
+            else:
+                distributions.append(prev.class_distribution)
+        return distributions
 
-            states[fips] = CountyEconomicState(
-                fips=fips,
-                year=year_floor,
-                capital_stock=capital_stock,
-                throughput_position=throughput_position,
-                supply_chain_depth=supply_chain_depth,
-                unemployment_rate=unemployment_rate,
-                renter_share=renter_share,
-                u6_rate=u6_rate,
-                pter_rate=pter_rate,
-                nilf_rate=nilf_rate,
-                median_wage=median_wage,
-                employment=employment,
-                class_distribution=class_dist,
-                phi_hour=phi_hour,
-                bracket_ratio=bracket_ratio,
-                crisis_state=crisis_state,
-                real_wage_deflator=real_wage_deflator,
-            )
+    @staticmethod
+    def _overlay_wired_sources(
+        frame: CountyStateFrame,
+        services: ServicesProtocol,
+        year: int,
+    ) -> None:
+        """Overlay exogenous per-county-year data from the wired sources.
+
+        ``capital_stock`` (Feature 012 calculator) and ``employment`` (QCEW
+        county rollup, item-25 Fix-C) ignore a zero result, as they always
+        have; ``unemployment_rate`` (BLS LAUS U-3, labor-data wire
+        2026-07-15), ``renter_share`` (ACS, Wave 6 C2) and ``bracket_ratio``
+        (ACS B19001, Wave 6 C3) take any real value. The CPI real-wage
+        deflator (Wave 6 C4) is a national series, read once per tick.
+        """
+        overlays = (
+            ("capital_stock", services.capital_calculator, "get_K", True),
+            (
+                "unemployment_rate",
+                services.unemployment_source,
+                "get_county_unemployment_rate",
+                False,
+            ),
+            ("renter_share", services.housing_source, "get_county_renter_share", False),
+            ("employment", services.employment_source, "get_county_total_employment", True),
+            ("bracket_ratio", services.income_source, "get_county_bracket_ratio", False),
+        )
+        for column, source, method, skip_zero in overlays:
+            if source is None:
+                continue
+            values = lookup_many(source, method, frame.fips, year)
+            found = ~np.isnan(values)
+            if skip_zero:
+                found &= values != 0.0
+            current = getattr(frame, column)
+            current[found] = values[found]
 
-        return states
+        if services.cpi_source is not None:
+            deflator = services.cpi_source.get_cpi_deflator(year)
+            if deflator is not None and isinstance(deflator, (int, float)):
+                frame.real_wage_deflator[:] = float(deflator)
 
-    def _derive_precarity(
-        self,
-        county_states: dict[str, CountyEconomicState],
-    ) -> dict[str, CountyEconomicState]:
+    @staticmethod
+    def _seed_median_wage(
+        frame: CountyStateFrame,
+        prevs: list[CountyEconomicState | None],
+        services: ServicesProtocol,
+        year: int,
+    ) -> None:
+        """Seed ``median_wage`` for counties without a previous state.
+
+        median_wage is ENDOGENOUS (wage-pressure/compression move it tick
+        over tick), so a wired wage_source seeds only the INITIAL condition —
+        once prev exists the simulation owns the trajectory. The source is
+        the employment-weighted p50 estimator (item 60); 21.0 remains the
+        documented unwired/absent-row bootstrap.
+        """
+        if services.wage_source is None:
+            return
+        rows = np.array([idx for idx, prev in enumerate(prevs) if prev is None], dtype=np.intp)
+        if rows.size == 0:
+            return
+        wages = lookup_many(
+            services.wage_source,
+            "get_county_median_hourly_wage",
+            [frame.fips[idx] for idx in rows],
+            year,
+        )
+        found = wages > 0.0  # NaN compares False
+        frame.median_wage[rows[found]] = wages[found]
+
+    @staticmethod
+    def _overlay_throughput(
+        frame: CountyStateFrame,
+        services: ServicesProtocol,
+        year: int,
+    ) -> None:
+        """Overlay throughput position and supply chain depth (Feature 014).
+
+        A county keeps its carried values when the calculator has no metrics
+        or no throughput position (MELT unavailable) for the county-year.
+        """
+        calculator = services.throughput_calculator
+        if calculator is None:
+            return
+        for idx, code in enumerate(frame.fips):
+            metrics = calculator.compute_metrics(code, year)
+            if metrics and hasattr(metrics, "pi") and metrics.pi is not None:
+                frame.throughput_position[idx] = metrics.pi
+                frame.supply_chain_depth[idx] = metrics.supply_chain_depth
+
+    def _derive_precarity(self, frame: CountyStateFrame) -> None:
         """Derive precarity indicators (U-6, PTER, NILF) from class shares.
 
         Uses lumpenproletariat share as the precaritization rate.
 
         Args:
-            county_states: Current county states.
-
-        Returns:
-            Updated county states with derived precarity indicators.
+            frame: Current county frame; its ``u6_rate``, ``pter_rate`` and
+                ``nilf_rate`` columns are **overwritten in place**.
         """
-        updated: dict[str, CountyEconomicState] = {}
-        for fips, county in county_states.items():
-            precaritization_rate = county.class_distribution.lumpenproletariat_share
-            u6, pter, nilf = self._precarity_deriver.derive(
-                unemployment_rate=county.unemployment_rate,
-                precaritization_rate=precaritization_rate,
-            )
-            updated[fips] = county.model_copy(
-                update={"u6_rate": u6, "pter_rate": pter, "nilf_rate": nilf}
-            )
-        return updated
+        precaritization_rate = np.fromiter(
+            (dist.lumpenproletariat_share for dist in frame.class_distribution),
+            np.float64,
+            len(frame),
+        )
+        frame.u6_rate, frame.pter_rate, frame.nilf_rate = self._precarity_deriver.derive_many(
+            unemployment_rate=frame.unemployment_rate,
+            precaritization_rate=precaritization_rate,
+        )
 
     def _update_coefficients(
         self,
@@ -1162,10 +1157,10 @@ class TickDynamicsSystem(SystemBase):
     # helpers. The Vol II lane must not edit below this banner.
     def _compute_vol1_layer(
         self,
-        county_states: dict[str, CountyEconomicState],
+        frame: CountyStateFrame,
         services: ServicesProtocol,
         year: int,
-    ) -> dict[str, CountyEconomicState]:
+    ) -> None:
         """Compute Volume I production layer — reserve army wage pressure.
 
         Feature: 021-capital-volume-i
@@ -1174,59 +1169,25 @@ class TickDynamicsSystem(SystemBase):
         imperial rent (Step 4) so adjusted wages propagate through phi_hour.
 
         Args:
-            county_states: Current county snapshots.
+            frame: Current county frame; its ``median_wage`` column is
+                **adjusted in place**.
             services: ServicesProtocol with reserve_army_data_source.
             year: Current simulation year.
-
-        Returns:
-            Updated county states with median_wage adjusted for wage pressure.
         """
         if services.reserve_army_data_source is None:
-            return county_states
+            return
 
         wage_calc = DefaultWagePressureCalculator(getattr(services.defines, "reserve_army", None))
 
-        updated: dict[str, CountyEconomicState] = {}
         max_counties = 3300
-        for idx, (fips, county) in enumerate(county_states.items()):
-            if idx >= max_counties:
-                logger.warning("County count exceeds %d, truncating Vol I layer", max_counties)
-                break
-            updated[fips] = self._compute_vol1_county_state(fips, county, services, year, wage_calc)
-
-        for fips, county in county_states.items():
-            if fips not in updated:
-                updated[fips] = county
-
-        return updated
-
-    def _compute_vol1_county_state(
-        self,
-        fips: str,
-        county: CountyEconomicState,
-        services: ServicesProtocol,
-        year: int,
-        wage_calc: DefaultWagePressureCalculator,
-    ) -> CountyEconomicState:
-        """Apply Vol I wage pressure to a single county.
-
-        Args:
-            fips: 5-digit county FIPS code.
-            county: Current county economic state.
-            services: ServicesProtocol with reserve_army_data_source.
-            year: Current simulation year.
-            wage_calc: Pre-built wage pressure calculator.
-
-        Returns:
-            Updated CountyEconomicState with adjusted median_wage.
-        """
-        state = services.reserve_army_data_source.get_unemployment_decomposition(fips, year)
-        if state is None:
-            return county
-
-        pressure = wage_calc.compute_wage_pressure(state.reserve_ratio)
-        adjusted_wage = county.median_wage * (1.0 - pressure)
-        return county.model_copy(update={"median_wage": adjusted_wage})
+        if len(frame) > max_counties:
+            logger.warning("County count exceeds %d, truncating Vol I layer", max_counties)
+        pressure = np.zeros(len(frame))
+        for idx, fips in enumerate(frame.fips[:max_counties]):
+            state = services.reserve_army_data_source.get_unemployment_decomposition(fips, year)
+            if state is not None:
+                pressure[idx] = wage_calc.compute_wage_pressure(state.reserve_ratio)
+        frame.median_wage *= 1.0 - pressure
 
     def _compute_accumulation_loop(
         self,
@@ -84,8 +84,8 @@ def resolve_negotiate(
     else:
         current = _edge_type_value(edge.get("edge_type", ""))
         if current in _ANTAGONISTIC_EDGE_TYPES:
-            edge["edge_type"] = EdgeType.TRANSACTIONAL.value
-            edge["_edge_type"] = EdgeType.TRANSACTIONAL.value
+            # Through add_edge (merge) so the graph's type index follows.
+            graph.add_edge(org_id, target_id, _edge_type=EdgeType.TRANSACTIONAL.value)
             effects = {"edge_flipped": True, "from": current, "to": EdgeType.TRANSACTIONAL.value}
         else:
             effects = {"edge_flipped": False, "edge_type": current, "leverage": leverage}
@@ -174,6 +174,27 @@ def build_parser() -> argparse.ArgumentParser:
             "tick loop is byte-identical to its pre-Archive behavior."
         ),
     )
+    parser.add_argument(
+        "--write-behind",
+        type=int,
+        default=0,
+        metavar="DEPTH",
+        help=(
+            "Commit each tick on a background writer thread while the "
+            "engine computes the next one, with at most DEPTH ticks "
+            "uncommitted. Commit order and artifacts are unchanged. "
+            "0 (default): synchronous persistence."
+        ),
+    )
+    parser.add_argument(
+        "--hex-frame-mmap",
+        action="store_true",
+        help=(
+            "Spill the bridge's tick-0 hex frame to <output-dir>/hex_frames/ "
+            "and read it memory-mapped, keeping a national frame off the "
+            "Python heap. Persisted rows are unchanged."
+        ),
+    )
 
     return parser
 
@@ -40,6 +40,7 @@ from __future__ import annotations
 
 import importlib
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
@@ -66,23 +67,52 @@ from babylon.persistence.county_state import (
     DynamicDemographicsState,
     DynamicEmploymentState,
 )
-from babylon.persistence.delta import select_hex_rows_for_emission
+from babylon.persistence.delta import select_hex_frame_for_emission
 from babylon.persistence.envelope import PerTickTransactionEnvelope
 from babylon.persistence.external_node import ExternalNode, ExternalNodeKind
+from babylon.persistence.hex_frame import HexFrame
 from babylon.persistence.hex_state import DynamicHexState
 from babylon.persistence.relationship_state import DynamicRelationshipState
 
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
     from babylon.config.defines import GameDefines
     from babylon.engine.headless_runner.event_capture import EngineEvent, EventCapture
     from babylon.persistence.conservation_audit import ConservationAuditor
 
-__all__ = ["WorldStateBridge"]
+__all__ = ["PreparedTick", "WorldStateBridge"]
 
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class PreparedTick:
+    """One tick's derived rows, ready to commit (:meth:`WorldStateBridge.commit_tick`).
+
+    Produced by :meth:`WorldStateBridge.prepare_tick` on the engine thread,
+    which is where every piece of mutable bridge state (hex delta baseline,
+    boundary register, auditor) is advanced. Holds only immutable snapshots,
+    so committing it later — or from another thread — writes exactly the
+    rows a synchronous ``persist_tick`` would have.
+
+    Attributes:
+        envelope: The tick's atomic ``persist_tick_atomic`` payload.
+        opposition_fields: ``contradiction_field`` rows for the tick's
+            OppositionRegistry snapshot (empty when none was handed in).
+    """
+
+    envelope: PerTickTransactionEnvelope
+    opposition_fields: tuple[dict[str, Any], ...] = ()
+
+    @property
+    def tick(self) -> int:
+        """Tick number this envelope commits."""
+        return self.envelope.tick
+
+
 # Default path to the SQLite reference DB (canonical source of truth
 # for QCEW, Census, BEA, FCC, Hickel/Ricci data). Overridable via the
 # ``sqlite_path`` argument to ``hydrate_initial``.
@@ -150,6 +180,7 @@ class WorldStateBridge:
         event_bus: EventBus | None = None,
         auditor: ConservationAuditor | None = None,
         national_phi_reference: float = 0.0,
+        hex_frame_dir: Path | None = None,
     ) -> None:
         self._runtime = runtime
         self._defines = defines
@@ -164,10 +195,15 @@ class WorldStateBridge:
         self._scope_fips: frozenset[str] | None = None
         self._start_year: int = 2010  # set by hydrate_initial
         self._sqlite_path: Path = _DEFAULT_SQLITE_PATH  # set by hydrate_initial
-        self._hex_template: tuple[DynamicHexState, ...] = ()
-        # Spec-089 S1b: per-hex value tuples as of the last envelope
+        # Spec-089 S1b: the tick-0 hex frame, columnar so per-tick
+        # re-emission re-stamps arrays instead of copying one model per hex.
+        # With ``hex_frame_dir`` set, hydrate_initial spills the value matrix
+        # to <dir>/<session_id>/ and re-opens it memory-mapped.
+        self._hex_template: HexFrame | None = None
+        self._hex_frame_dir = hex_frame_dir
+        # Spec-089 S1b: the hex value matrix as of the last envelope
         # emission — the delta-selection memory (reset at hydrate).
-        self._last_emitted_hex: dict[str, tuple[float, ...]] = {}
+        self._last_emitted_hex: NDArray[np.float64] | None = None
         self._external_template: tuple[ExternalNode, ...] = ()
         self._hydrated = False
         self._event_capture: EventCapture | None = None
@@ -242,7 +278,7 @@ class WorldStateBridge:
         checkpoint frames, and the conservation auditor would all run
         silently blind. Returns 0 before ``hydrate_initial``.
         """
-        return len(self._hex_template)
+        return 0 if self._hex_template is None else len(self._hex_template)
 
     @property
     def population_db_reads(self) -> int:
@@ -394,8 +430,8 @@ class WorldStateBridge:
         self._event_capture = event_capture
         self._start_year = start_year
         self._sqlite_path = sqlite_path_resolved
-        self._hex_template = tuple(hex_rows)
-        self._last_emitted_hex = {}
+        self._hex_template = self._build_hex_template(session_id, hex_rows)
+        self._last_emitted_hex = None
         self._external_template = tuple(external_rows)
         self._ref_cache = ref_cache
         # Spec-065 T055: BoundaryFlowRegister is now owned by runner.run()
@@ -417,7 +453,7 @@ class WorldStateBridge:
             "hex_template=%d external_template=%d",
             session_id,
             len(scope_fips),
-            len(self._hex_template),
+            self.hex_template_size,
             len(self._external_template),
         )
         return world
@@ -435,6 +471,29 @@ class WorldStateBridge:
     ) -> None:
         """Derive subsystem rows + re-emit hex/external + persist atomically.
 
+        Equivalent to ``commit_tick(prepare_tick(...))``; the split exists
+        so the runner's write-behind mode can derive on the engine thread
+        and commit on a writer thread.
+
+        Args:
+            world:             Current in-memory WorldState (post-engine-run).
+            tick:              Tick number being persisted.
+            determinism_hash:  64-char SHA-256 of the canonical envelope
+                payload (Constitution III.7).
+            opposition_states: ContradictionSystem's OppositionRegistry
+                snapshot for the tick, if any.
+        """
+        self.commit_tick(self.prepare_tick(world, tick, determinism_hash, opposition_states))
+
+    def prepare_tick(
+        self,
+        world: WorldState,
+        tick: int,
+        determinism_hash: str,
+        opposition_states: dict[str, Any] | None = None,
+    ) -> PreparedTick:
+        """Derive one tick's rows and assemble its envelope without writing.
+
         Per research.md §R10, the four spec-065 subsystem rows are
         derivations (engine-state aggregation or reference-data
         lookups), not flat field reads. The bridge calls the four
@@ -444,11 +503,20 @@ class WorldStateBridge:
         re-stamped with the current tick, and calls
         ``runtime.persist_tick_atomic`` for atomic commit.
 
+        Everything here advances per-session state in tick order (the hex
+        delta baseline, the boundary-register flush, the auditor), so it
+        must run once per tick, in order, on the thread driving the engine.
+
         Args:
             world:             Current in-memory WorldState (post-engine-run).
             tick:              Tick number being persisted.
             determinism_hash:  64-char SHA-256 of the canonical envelope
                 payload (Constitution III.7).
+            opposition_states: ContradictionSystem's OppositionRegistry
+                snapshot for the tick, if any.
+
+        Returns:
+            The tick's :class:`PreparedTick`, for :meth:`commit_tick`.
 
         Raises:
             RuntimeError: If called before :meth:`hydrate_initial`.
@@ -457,11 +525,11 @@ class WorldStateBridge:
                 catch this earlier).
         """
         if not self._hydrated:
-            raise RuntimeError("WorldStateBridge.persist_tick called before hydrate_initial")
+            raise RuntimeError("WorldStateBridge.prepare_tick called before hydrate_initial")
         if self._session_id is None:
-            raise RuntimeError("WorldStateBridge.persist_tick called before hydrate_initial")
+            raise RuntimeError("WorldStateBridge.prepare_tick called before hydrate_initial")
         if self._scope_fips is None:
-            raise RuntimeError("WorldStateBridge.persist_tick called before hydrate_initial")
+            raise RuntimeError("WorldStateBridge.prepare_tick called before hydrate_initial")
 
         consciousness_rows: list[DynamicConsciousnessState] = []
         demographics_rows: list[DynamicDemographicsState] = []
@@ -490,13 +558,17 @@ class WorldStateBridge:
         # feeds the conservation auditor below — invariants are
         # frame-level — while the envelope receives only the delta
         # (spec-089 FR-004/FR-005: changed value-tuples, plus the whole
-        # frame on yearly checkpoint ticks).
-        hex_frame = [row.model_copy(update={"tick": tick}) for row in self._hex_template]
-        hex_rows = select_hex_rows_for_emission(
-            tick=tick,
-            candidate_rows=hex_frame,
-            last_emitted=self._last_emitted_hex,
-        )
+        # frame on yearly checkpoint ticks). Only the emitted rows are
+        # materialized as models.
+        hex_frame: HexFrame | tuple[()] = ()
+        hex_rows: list[DynamicHexState] = []
+        if self._hex_template is not None:
+            hex_frame = self._hex_template.at_tick(tick)
+            emit, self._last_emitted_hex = select_hex_frame_for_emission(
+                frame=hex_frame,
+                last_emitted=self._last_emitted_hex,
+            )
+            hex_rows = hex_frame.rows(emit)
         external_rows = [row.model_copy(update={"tick": tick}) for row in self._external_template]
 
         # Spec-065 T056: flush BoundaryFlowRegister for this tick.
@@ -564,11 +636,9 @@ class WorldStateBridge:
             relationship_state_rows=relationship_rows,
             determinism_hash=determinism_hash,
         )
-        self._runtime.persist_tick_atomic(envelope)
-        self._persist_opposition_fields(tick, opposition_states)
 
         logger.debug(
-            "WorldStateBridge.persist_tick: session=%s tick=%d "
+            "WorldStateBridge.prepare_tick: session=%s tick=%d "
             "consciousness=%d demographics=%d employment=%d hex=%d external=%d",
             self._session_id,
             tick,
@@ -578,13 +648,30 @@ class WorldStateBridge:
             len(hex_rows),
             len(external_rows),
         )
+        return PreparedTick(
+            envelope=envelope,
+            opposition_fields=self._opposition_field_rows(opposition_states),
+        )
 
-    def _persist_opposition_fields(
-        self,
-        tick: int,
+    def commit_tick(self, prepared: PreparedTick) -> None:
+        """Write a :meth:`prepare_tick` result: envelope, then opposition fields.
+
+        Touches no bridge state beyond the runtime, so it may run on a
+        writer thread while the engine computes the next tick — provided
+        commits are issued one at a time in tick order, which keeps the
+        ``tick_commit`` markers a gap-free prefix.
+
+        Args:
+            prepared: The tick to commit.
+        """
+        self._runtime.persist_tick_atomic(prepared.envelope)
+        self._persist_opposition_fields(prepared.tick, prepared.opposition_fields)
+
+    @staticmethod
+    def _opposition_field_rows(
         opposition_states: dict[str, Any] | None,
-    ) -> None:
-        """Persist the OppositionRegistry snapshot to ``contradiction_field``.
+    ) -> tuple[dict[str, Any], ...]:
+        """Snapshot the OppositionRegistry into ``contradiction_field`` rows.
 
         Lawverian C1.4: one ``contradiction_field`` row per opposition, mapping
         the frame-level registry snapshot onto the existing Feature-002 DDL:
@@ -598,13 +685,34 @@ class WorldStateBridge:
         derivative is tracked yet (Phase E). The registry's ``balance``,
         ``leading_pole`` and ``is_principal`` have no column in this DDL and are
         deferred to Phase E (a wider table), documented rather than dropped.
+        """
+        if not opposition_states:
+            return ()
+        return tuple(
+            {
+                "node_id": "global",
+                "field_name": key,
+                "value": float(state.get("gap", 0.0)),
+                "laplacian": None,
+                "dt": float(state.get("rate", 0.0)),
+                "d2t": None,
+            }
+            for key, state in opposition_states.items()
+        )
+
+    def _persist_opposition_fields(
+        self,
+        tick: int,
+        fields: tuple[dict[str, Any], ...],
+    ) -> None:
+        """Write :meth:`_opposition_field_rows` output to ``contradiction_field``.
 
         Guarded: ``persist_contradiction_fields`` lives on the Postgres-only
         ``PostgresRuntimeExtensions`` protocol, so this no-ops on runtimes
         (e.g. the in-memory ``RuntimeDatabase``) that lack it — the same
         capability-check pattern the bridge uses for other Postgres-only calls.
         """
-        if not opposition_states:
+        if not fields:
             return
         if not hasattr(self._runtime, "persist_contradiction_fields"):
             return
@@ -617,18 +725,9 @@ class WorldStateBridge:
         # no such FK). Ensure the parent row exists (idempotent) first.
         if hasattr(self._runtime, "ensure_session"):
             self._runtime.ensure_session(self._session_id)
-        fields = [
-            {
-                "node_id": "global",
-                "field_name": key,
-                "value": float(state.get("gap", 0.0)),
-                "laplacian": None,
-                "dt": float(state.get("rate", 0.0)),
-                "d2t": None,
-            }
-            for key, state in opposition_states.items()
-        ]
-        self._runtime.persist_contradiction_fields(tick, fields, [], session_id=self._session_id)
+        self._runtime.persist_contradiction_fields(
+            tick, list(fields), [], session_id=self._session_id
+        )
 
     # ------------------------------------------------------------------
     # Phase-2 stubs that remain (subscribe events / poll endgame)
@@ -707,6 +806,19 @@ class WorldStateBridge:
             for row in rows
         ]
 
+    def _build_hex_template(
+        self,
+        session_id: UUID,
+        hex_rows: list[DynamicHexState],
+    ) -> HexFrame | None:
+        """Columnar tick-0 template, memory-mapped when ``hex_frame_dir`` is set."""
+        if not hex_rows:
+            return None
+        frame = HexFrame.from_rows(hex_rows)
+        if self._hex_frame_dir is None:
+            return frame
+        return frame.save(self._hex_frame_dir / str(session_id))
+
     def _fetch_tick_zero_external_template(
         self,
         session_id: UUID,
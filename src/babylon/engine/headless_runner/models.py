@@ -182,6 +182,26 @@ class SimulationRunConfig(BaseModel):
             "tick loop byte-identical to its pre-Archive behavior."
         ),
     )
+    write_behind_depth: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description=(
+            "When > 0, ticks >= 1 are committed by a background writer "
+            "thread while the engine computes the next tick, with at most "
+            "this many ticks uncommitted (back-pressure). Commits stay in "
+            "tick order and artifacts are byte-identical; 0 — the "
+            "default — keeps the synchronous persist-per-tick loop."
+        ),
+    )
+    hex_frame_mmap: bool = Field(
+        default=False,
+        description=(
+            "When True, the bridge writes its columnar tick-0 hex frame under "
+            "``output_dir/hex_frames/<session_id>/`` and re-emits it from a "
+            "memory-mapped value matrix. Persisted rows are identical either way."
+        ),
+    )
     shock_schedule: tuple[ScheduledBlocShock, ...] = Field(
         default=(),
         description=(
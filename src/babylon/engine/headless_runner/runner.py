@@ -21,6 +21,7 @@ from __future__ import annotations
 
 import argparse
 import datetime as _dt
+import functools
 import hashlib
 import json
 import logging
@@ -29,7 +30,7 @@ import signal
 import statistics
 import sys
 import time
-from contextlib import suppress
+from contextlib import nullcontext, suppress
 from pathlib import Path
 from typing import Any, Final, Protocol
 from uuid import UUID, uuid4
@@ -68,6 +69,7 @@ from babylon.engine.headless_runner.scopes import (
 )
 from babylon.engine.headless_runner.storage_probe import query_storage_footprint
 from babylon.engine.headless_runner.trace_emitter import TRACE_COLUMNS, TraceEmitter
+from babylon.engine.headless_runner.write_behind import WriteBehindPersister
 from babylon.engine.services import ServiceContainer
 from babylon.engine.simulation_engine import _DEFAULT_SYSTEMS, SimulationEngine
 from babylon.engine.trace_format import trace_rows_to_csv_bytes
@@ -241,6 +243,8 @@ def _build_config(args: argparse.Namespace) -> SimulationRunConfig:
         endgame_detector=getattr(args, "endgame_detector", None),
         write_baseline_to=getattr(args, "write_baseline", None),
         vault_root=getattr(args, "vault_root", None),
+        write_behind_depth=getattr(args, "write_behind", 0),
+        hex_frame_mmap=getattr(args, "hex_frame_mmap", False),
     )
 
 
@@ -406,6 +410,7 @@ def _advance_tick(
     county_exposure_by_external: dict[str, dict[str, float]] | None = None,
     external_nodes_phi: dict[str, float] | None = None,
     tick_commit_observer: TickCommitObserver | None = None,
+    write_behind: WriteBehindPersister | None = None,
 ) -> Any:
     """Spec-066 T035: per-tick engine.run_tick() then bridge.persist_tick().
 
@@ -425,6 +430,11 @@ def _advance_tick(
     (persist-only, engine bypassed) for tests that exercise the bridge
     in isolation.
 
+    With a ``write_behind`` persister, step 3 only *prepares* the tick
+    (``bridge.prepare_tick``) and queues it; the commit and the observer
+    call happen on the writer thread. The engine mutates ``graph`` in place
+    on the next tick, so the observer receives a copy taken here.
+
     Returns:
         The (possibly-reconstructed) ``WorldState`` for the caller to
         continue using as input to subsequent ticks.
@@ -452,6 +462,20 @@ def _advance_tick(
         # persist_tick so contradiction_field rows flow. WorldState.from_graph
         # does not carry arbitrary graph attrs, so read it off the graph here.
         opposition_states = graph.graph.get("opposition_states")
+    if write_behind is not None:
+        on_committed = None
+        if tick_commit_observer is not None and graph is not None:
+            on_committed = functools.partial(
+                tick_commit_observer.on_tick_committed,
+                tick=tick,
+                world=world,
+                graph=graph.copy(),
+            )
+        write_behind.submit(
+            bridge.prepare_tick(world, tick, determinism_hash, opposition_states),
+            on_committed,
+        )
+        return world
     bridge.persist_tick(world, tick, determinism_hash, opposition_states)
     if tick_commit_observer is not None and graph is not None:
         # Post-commit only: the envelope (and its tick_commit row) is already
@@ -686,7 +710,7 @@ def _assert_county_resolution_or_raise(
     """
     if null_entity_count > 0:
         cur.execute(
-            "SELECT COUNT(*) FROM v_hex_state_asof WHERE session_id = %s AND tick = %s",
+            "SELECT COUNT(*) FROM hex_state_asof(%s, %s)",
             (str(session_id), terminal_tick),
         )
         hex_row = cur.fetchone()
@@ -695,7 +719,7 @@ def _assert_county_resolution_or_raise(
             f"session={session_id} tick={terminal_tick}: partial resolution gap — "
             f"{null_entity_count} row(s) have NULL entity_id out of "
             f"{resolved_county_count + null_entity_count} total rows "
-            f"({hex_row_count} hex rows in v_hex_state_asof). "
+            f"({hex_row_count} hex rows in hex_state_asof). "
             "Refusing to leak NULL-entity rows into downstream aggregates. "
             "This is the known hex_spatial_map/TIGER contention bug "
             "(spec-088 S3) in partial form."
@@ -703,7 +727,7 @@ def _assert_county_resolution_or_raise(
     if resolved_county_count > 0:
         return
     cur.execute(
-        "SELECT COUNT(*) FROM v_hex_state_asof WHERE session_id = %s AND tick = %s",
+        "SELECT COUNT(*) FROM hex_state_asof(%s, %s)",
         (str(session_id), terminal_tick),
     )
     hex_row = cur.fetchone()
@@ -711,7 +735,7 @@ def _assert_county_resolution_or_raise(
     if hex_row_count > 0:
         raise TerminalAggregateResolutionError(
             f"session={session_id} tick={terminal_tick}: {hex_row_count} hex "
-            "row(s) exist in v_hex_state_asof but county resolution "
+            "row(s) exist in hex_state_asof but county resolution "
             "(hex_spatial_map join in view_runtime_trace_emission) yielded "
             "ZERO counties. Refusing to emit a silent counties_alive=0/"
             "total_v=0 terminal aggregate — hex_spatial_map is not "
@@ -1267,6 +1291,7 @@ def run(config: SimulationRunConfig) -> SimulationRunResult:
             # Spec-101 review fix #3: raw national Φ, independent of the D3
             # attribution — feeds the auditor's aggregate coverage check.
             national_phi_reference=report.national_phi_reference,
+            hex_frame_dir=config.output_dir / "hex_frames" if config.hex_frame_mmap else None,
         )
         world = bridge.hydrate_initial(
             session_id=session_id,
@@ -1586,6 +1611,12 @@ def _verify_tick0_commit_marker(
         )
 
 
+def _drain_write_behind(write_behind: WriteBehindPersister | None) -> None:
+    """Wait for queued write-behind commits; no-op on the synchronous path."""
+    if write_behind is not None:
+        write_behind.drain()
+
+
 def _tick_loop(
     *,
     bridge: WorldStateBridge,
@@ -1633,15 +1664,25 @@ def _tick_loop(
     same function) rather than widening the return tuple, so this stays
     backward-compatible with the two direct unit-test callers.
 
+    ``config.write_behind_depth > 0`` commits ticks >= 1 through a
+    :class:`WriteBehindPersister` (tick 0 stays synchronous: its marker is
+    read back before the loop starts). Every Postgres read-back inside the
+    loop — the dense-trace row, the strict-mode audit scan — drains the
+    queue first, and the loop drains it completely before returning, so
+    callers see the same committed state as a synchronous run.
+
     Returns:
         ``(ticks_completed, endgame_event)``.
     """
     pool = runtime.pool if runtime is not None else None
     dense_counties = sorted(config.scope_fips)
 
+    write_behind: WriteBehindPersister | None = None
+
     def _capture_dense_row(tick_number: int) -> None:
         if dense_rows is None or pool is None or graph is None:
             return
+        _drain_write_behind(write_behind)
         county_snapshot = _county_terminal_snapshot(
             pool=pool, session_id=session_id, terminal_tick=tick_number
         )
@@ -1700,70 +1741,75 @@ def _tick_loop(
             unit="tick",
         )
 
-    for tick in iterator:
-        if _interrupt_requested:
-            break
-        t_tick = time.perf_counter()
-        determinism_hash = hashlib.sha256(
-            f"{session_id}:{tick}:{config.random_seed}".encode()
-        ).hexdigest()
-        # Spec-065 T072: tag subsequent EventCapture.on_event calls with
-        # the current tick BEFORE the engine runs (engine.run_tick will
-        # fire events through services.event_bus.publish).
-        if bridge.event_capture is not None:
-            bridge.event_capture.set_tick(tick)
-        # Spec-102 SLICE B: apply any shocks scheduled at this tick, then
-        # recompute the effective (possibly shocked) external_nodes_phi.
-        # Level-set semantics — active_shock_multipliers persists across
-        # iterations, so a bloc's multiplier stays in effect on every tick
-        # after its scheduled tick.
-        effective_external_nodes_phi = external_nodes_phi
-        if external_nodes_phi is not None:
-            _apply_due_shocks(
+    if config.write_behind_depth > 0:
+        write_behind = WriteBehindPersister(bridge.commit_tick, depth=config.write_behind_depth)
+    with write_behind if write_behind is not None else nullcontext():
+        for tick in iterator:
+            if _interrupt_requested:
+                break
+            t_tick = time.perf_counter()
+            determinism_hash = hashlib.sha256(
+                f"{session_id}:{tick}:{config.random_seed}".encode()
+            ).hexdigest()
+            # Spec-065 T072: tag subsequent EventCapture.on_event calls with
+            # the current tick BEFORE the engine runs (engine.run_tick will
+            # fire events through services.event_bus.publish).
+            if bridge.event_capture is not None:
+                bridge.event_capture.set_tick(tick)
+            # Spec-102 SLICE B: apply any shocks scheduled at this tick, then
+            # recompute the effective (possibly shocked) external_nodes_phi.
+            # Level-set semantics — active_shock_multipliers persists across
+            # iterations, so a bloc's multiplier stays in effect on every tick
+            # after its scheduled tick.
+            effective_external_nodes_phi = external_nodes_phi
+            if external_nodes_phi is not None:
+                _apply_due_shocks(
+                    tick=tick,
+                    shock_timeline=shock_timeline,
+                    active_multipliers=active_shock_multipliers,
+                )
+                effective_external_nodes_phi = _effective_external_nodes_phi(
+                    base_external_nodes_phi=external_nodes_phi,
+                    active_multipliers=active_shock_multipliers,
+                )
+            # Spec-066 T035: _advance_tick now runs the engine when
+            # engine+services+graph are provided. It returns the
+            # reconstituted world from the mutated graph for subsequent ticks.
+            world = _advance_tick(
+                bridge=bridge,
+                world=world,
                 tick=tick,
-                shock_timeline=shock_timeline,
-                active_multipliers=active_shock_multipliers,
-            )
-            effective_external_nodes_phi = _effective_external_nodes_phi(
-                base_external_nodes_phi=external_nodes_phi,
-                active_multipliers=active_shock_multipliers,
-            )
-        # Spec-066 T035: _advance_tick now runs the engine when
-        # engine+services+graph are provided. It returns the
-        # reconstituted world from the mutated graph for subsequent ticks.
-        world = _advance_tick(
-            bridge=bridge,
-            world=world,
-            tick=tick,
-            determinism_hash=determinism_hash,
-            engine=engine,
-            services=services,
-            graph=graph,
-            session_id=session_id,
-            county_exposure_by_external=county_exposure_by_external,
-            external_nodes_phi=effective_external_nodes_phi,
-            tick_commit_observer=tick_commit_observer,
-        )
-        _capture_dense_row(tick)
-        per_tick_durations.append(time.perf_counter() - t_tick)
-        ticks_completed = tick + 1
-
-        # Spec-065 T050: --strict early exit on alarm-severity audit row.
-        if config.strict:
-            alarm = _check_strict_alarms(
-                runtime=runtime,
+                determinism_hash=determinism_hash,
+                engine=engine,
+                services=services,
+                graph=graph,
                 session_id=session_id,
-                up_to_tick=tick,
-                auditor=bridge.auditor,
+                county_exposure_by_external=county_exposure_by_external,
+                external_nodes_phi=effective_external_nodes_phi,
+                tick_commit_observer=tick_commit_observer,
+                write_behind=write_behind,
             )
-            if alarm is not None:
-                raise _StrictAbort(tick=alarm[0], invariant_name=alarm[1])
-
-        # Spec-065 T064: end-game detector (US4). Halt loop if the
-        # configured detector returns a non-None event.
-        endgame = bridge.poll_endgame(world, tick)
-        if endgame is not None:
-            return ticks_completed, endgame
+            _capture_dense_row(tick)
+            per_tick_durations.append(time.perf_counter() - t_tick)
+            ticks_completed = tick + 1
+
+            # Spec-065 T050: --strict early exit on alarm-severity audit row.
+            if config.strict:
+                _drain_write_behind(write_behind)
+                alarm = _check_strict_alarms(
+                    runtime=runtime,
+                    session_id=session_id,
+                    up_to_tick=tick,
+                    auditor=bridge.auditor,
+                )
+                if alarm is not None:
+                    raise _StrictAbort(tick=alarm[0], invariant_name=alarm[1])
+
+            # Spec-065 T064: end-game detector (US4). Halt loop if the
+            # configured detector returns a non-None event.
+            endgame = bridge.poll_endgame(world, tick)
+            if endgame is not None:
+                return ticks_completed, endgame
     return ticks_completed, None
 
 
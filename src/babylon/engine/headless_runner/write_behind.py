@@ -0,0 +1,155 @@
+"""Write-behind tick persistence for the headless runner (opt-in).
+
+The synchronous tick loop runs the engine, then blocks on
+``persist_tick_atomic`` before starting the next tick, so per-tick
+wallclock is compute + commit. With ``--write-behind N`` the runner instead
+derives each tick's :class:`~babylon.engine.headless_runner.bridge.PreparedTick`
+on the engine thread and hands it to a :class:`WriteBehindPersister`, whose
+single writer thread commits while the engine computes tick N+1.
+
+Guarantees:
+
+* Ordering — one writer thread drains a FIFO queue, so envelopes (and
+  their ``tick_commit`` markers) commit strictly in tick order. The
+  committed set is always a gap-free prefix of the run.
+* Crash safety — after the first failed commit the writer commits nothing
+  further (a later marker must never land past a missing tick); the error
+  is re-raised on the engine thread at the next ``submit``/``drain``/
+  ``close``.
+* Back-pressure — the queue holds at most ``depth`` uncommitted ticks;
+  ``submit`` blocks when it is full, bounding memory and commit lag.
+* Post-commit callbacks (the ``TickCommitObserver``) run on the writer
+  thread only after their tick's commit returned, i.e. after durability.
+
+Row derivation, hashes and commit order are unchanged, so the artifact
+bundle is byte-identical to a synchronous run.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+    from babylon.engine.headless_runner.bridge import PreparedTick
+
+__all__ = ["WriteBehindPersister"]
+
+logger = logging.getLogger(__name__)
+
+#: Queue sentinel telling the writer thread to exit.
+_STOP: Final = object()
+
+
+class WriteBehindPersister:
+    """Bounded single-writer commit queue for prepared ticks.
+
+    Use as a context manager: leaving the block drains every queued tick
+    and joins the writer. A writer failure surfaces as the original
+    exception, unless the block is already unwinding with its own.
+
+    Args:
+        commit: Writes one prepared tick (``WorldStateBridge.commit_tick``).
+        depth: Maximum number of submitted-but-uncommitted ticks (>= 1).
+    """
+
+    def __init__(self, commit: Callable[[PreparedTick], None], *, depth: int) -> None:
+        if depth < 1:
+            raise ValueError(f"write-behind depth must be >= 1, got {depth}")
+        self._commit = commit
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=depth)
+        self._error: BaseException | None = None
+        self._last_committed_tick: int | None = None
+        self._thread = threading.Thread(
+            target=self._drain_forever, name="babylon-write-behind", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def last_committed_tick(self) -> int | None:
+        """Highest tick whose commit has returned, or ``None`` before the first."""
+        return self._last_committed_tick
+
+    def submit(
+        self,
+        prepared: PreparedTick,
+        on_committed: Callable[[], None] | None = None,
+    ) -> None:
+        """Queue ``prepared`` for commit, blocking while the queue is full.
+
+        Args:
+            prepared: The tick to commit; must follow the last submitted tick.
+            on_committed: Called on the writer thread once the tick is durable.
+
+        Raises:
+            BaseException: The writer's earlier commit failure, if any.
+        """
+        self._raise_if_failed()
+        self._queue.put((prepared, on_committed))
+
+    def drain(self) -> None:
+        """Block until every submitted tick is committed (or the writer failed).
+
+        Raises:
+            BaseException: The writer's commit failure, if any.
+        """
+        self._queue.join()
+        self._raise_if_failed()
+
+    def close(self) -> None:
+        """Drain, then stop and join the writer thread. Idempotent.
+
+        Raises:
+            BaseException: The writer's commit failure, if any.
+        """
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._raise_if_failed()
+
+    def __enter__(self) -> WriteBehindPersister:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc is None:
+            self.close()
+            return
+        # Already unwinding: still wait for the committed prefix to land,
+        # but let the in-flight exception win over a writer failure.
+        try:
+            self.close()
+        except BaseException:  # noqa: BLE001
+            logger.exception("write-behind writer failed while unwinding")
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _drain_forever(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                if self._error is not None:
+                    continue  # never commit past a failed tick
+                prepared, on_committed = item
+                try:
+                    self._commit(prepared)
+                    self._last_committed_tick = prepared.tick
+                    if on_committed is not None:
+                        on_committed()
+                except BaseException as exc:  # noqa: BLE001 - surfaced on the engine thread
+                    self._error = exc
+            finally:
+                self._queue.task_done()
@@ -14,6 +14,7 @@ from babylon.engine.history.auto_checkpoint import (
     create_checkpointed_step,
 )
 from babylon.engine.history.io import (
+    BINARY_SUFFIX,
     CheckpointCorruptedError,
     CheckpointIOError,
     CheckpointNotFoundError,
@@ -29,6 +30,7 @@ from babylon.engine.history.models import (
     Checkpoint,
     CheckpointConfig,
     CheckpointMetadata,
+    HistoryDelta,
     HistoryEntry,
     HistoryStack,
 )
@@ -47,6 +49,7 @@ __all__ = [
     "CheckpointMetadata",
     "Checkpoint",
     "HistoryEntry",
+    "HistoryDelta",
     "HistoryStack",
     "CheckpointConfig",
     # Stack operations
@@ -63,6 +66,7 @@ __all__ = [
     "CheckpointCorruptedError",
     "CheckpointSchemaError",
     # I/O functions
+    "BINARY_SUFFIX",
     "save_state",
     "load_state",
     "save_checkpoint",
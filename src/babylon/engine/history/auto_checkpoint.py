@@ -15,7 +15,7 @@ from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 
-from babylon.engine.history.io import save_checkpoint
+from babylon.engine.history.io import BINARY_SUFFIX, save_checkpoint
 from babylon.engine.history.models import CheckpointConfig
 from babylon.models.config import SimulationConfig
 from babylon.models.world_state import WorldState
@@ -122,7 +122,7 @@ class AutoCheckpointer:
 
         # Get all checkpoint files sorted by modification time (oldest first)
         checkpoints = sorted(
-            self._checkpoint_dir.glob("checkpoint_*.json"),
+            self._checkpoint_files(),
             key=lambda p: p.stat().st_mtime,
         )
 
@@ -144,7 +144,7 @@ class AutoCheckpointer:
         if not self._checkpoint_dir.exists():
             return None
 
-        checkpoints = list(self._checkpoint_dir.glob("checkpoint_*.json"))
+        checkpoints = self._checkpoint_files()
         if not checkpoints:
             return None
 
@@ -169,11 +169,19 @@ class AutoCheckpointer:
         """
         # Generate filename with timestamp and tick
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"checkpoint_{timestamp}_tick{state.tick}.json"
+        suffix = BINARY_SUFFIX if self._config.compressed else ".json"
+        filename = f"checkpoint_{timestamp}_tick{state.tick}{suffix}"
         path = self._checkpoint_dir / filename
 
         return save_checkpoint(state, sim_config, path, description)
 
+    def _checkpoint_files(self) -> list[Path]:
+        """List checkpoint files in either format."""
+        return [
+            *self._checkpoint_dir.glob("checkpoint_*.json"),
+            *self._checkpoint_dir.glob(f"checkpoint_*{BINARY_SUFFIX}"),
+        ]
+
 
 def create_checkpointed_step(
     sim_config: SimulationConfig,
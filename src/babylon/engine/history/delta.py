@@ -0,0 +1,136 @@
+"""Structural diffs between WorldState snapshots for the History Stack.
+
+A history of full ``WorldState`` objects multiplies memory by undo depth,
+although consecutive ticks differ in a handful of entities, edges and log
+lines. This module encodes the difference between two states as a
+:data:`StateDelta` over their JSON documents (``model_dump(mode="json")``,
+the same form the JSON checkpoints round-trip through):
+
+- ``fields``: top-level fields replaced wholesale.
+- ``maps``: per-key ``set``/``del`` for fields that are dicts on both sides
+  (``entities``, ``territories``, ``factions``, ...).
+- ``lists``: ``keep`` a common prefix and append a ``tail`` for fields that
+  are lists on both sides (``relationships``, ``event_log``, ``events``);
+  append-only logs cost only their new lines, truncation costs nothing.
+
+Deltas are plain JSON values, so they can be stored in a frozen model and
+written to disk as-is. All functions are pure.
+"""
+
+from typing import Any
+
+from pydantic_core import to_json
+
+from babylon.models.world_state import WorldState
+
+StateDelta = dict[str, Any]
+"""``{"fields": {...}, "maps": {...}, "lists": {...}}``; absent keys mean no change."""
+
+
+def state_document(state: WorldState) -> dict[str, Any]:
+    """Dump a WorldState to the JSON document deltas are computed over.
+
+    Args:
+        state: The state to dump.
+
+    Returns:
+        ``state.model_dump(mode="json")``.
+    """
+    return state.model_dump(mode="json")
+
+
+def document_state(document: dict[str, Any]) -> WorldState:
+    """Validate a document back into a WorldState.
+
+    Goes through JSON, exactly as a JSON checkpoint is loaded, so a
+    rebuilt state is the state a save/load round trip would produce.
+
+    Args:
+        document: A document from :func:`state_document` or :func:`apply_delta`.
+
+    Returns:
+        The validated WorldState.
+    """
+    return WorldState.model_validate_json(to_json(document))
+
+
+def diff_documents(base: dict[str, Any], target: dict[str, Any]) -> StateDelta:
+    """Compute the delta that turns ``base`` into ``target``.
+
+    Args:
+        base: Document of the state the delta applies to.
+        target: Document of the state the delta produces.
+
+    Returns:
+        The StateDelta (empty when the documents are equal).
+    """
+    fields: dict[str, Any] = {}
+    maps: dict[str, dict[str, Any]] = {}
+    lists: dict[str, dict[str, Any]] = {}
+
+    for name, new in target.items():
+        old = base.get(name)
+        if name in base and old == new:
+            continue
+        if isinstance(old, dict) and isinstance(new, dict):
+            maps[name] = {
+                "set": {
+                    key: value for key, value in new.items() if key not in old or old[key] != value
+                },
+                "del": [key for key in old if key not in new],
+            }
+        elif isinstance(old, list) and isinstance(new, list):
+            keep = _common_prefix(old, new)
+            lists[name] = {"keep": keep, "tail": new[keep:]}
+        else:
+            fields[name] = new
+
+    delta: StateDelta = {}
+    if fields:
+        delta["fields"] = fields
+    if maps:
+        delta["maps"] = maps
+    if lists:
+        delta["lists"] = lists
+    return delta
+
+
+def apply_delta(base: dict[str, Any], delta: StateDelta) -> dict[str, Any]:
+    """Apply a delta to a document without mutating it.
+
+    Args:
+        base: Document the delta was computed against.
+        delta: Output of :func:`diff_documents`.
+
+    Returns:
+        The resulting document (unchanged fields share objects with ``base``).
+    """
+    result = dict(base)
+    result.update(delta.get("fields", {}))
+    for name, change in delta.get("maps", {}).items():
+        mapping = dict(result[name])
+        for key in change["del"]:
+            mapping.pop(key, None)
+        mapping.update(change["set"])
+        result[name] = mapping
+    for name, change in delta.get("lists", {}).items():
+        result[name] = result[name][: change["keep"]] + change["tail"]
+    return result
+
+
+def _common_prefix(old: list[Any], new: list[Any]) -> int:
+    """Length of the longest common prefix of two lists."""
+    limit = min(len(old), len(new))
+    for i in range(limit):
+        if old[i] != new[i]:
+            return i
+    return limit
+
+
+__all__ = [
+    "StateDelta",
+    "apply_delta",
+    "diff_documents",
+    "document_state",
+    "state_document",
+]
@@ -4,16 +4,29 @@ This module provides save/load functionality for:
 - WorldState snapshots (simple state persistence)
 - Full Checkpoint bundles (state + config + metadata)
 
+Two on-disk formats, chosen by file suffix on save and sniffed on load:
+- JSON (any suffix but ``.ckpt``): indented ``model_dump_json`` text.
+- Binary (``.ckpt``): :data:`BINARY_MAGIC`, a big-endian u32 header
+  length, a JSON header (format version, kind, codec, schema version,
+  SHA-256 and size of the uncompressed payload, checkpoint metadata),
+  then the compact JSON payload compressed with zstd. Loading maps the
+  file and decompresses straight from the mapping; listing and
+  validation read only the header.
+
 All writes use atomic patterns (temp file + rename) to prevent corruption.
 
 Sprint C: File I/O for Phase 3 persistence layer.
 """
 
 import contextlib
+import hashlib
 import json
+import struct
 import tempfile
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any, Final
 
 from pydantic import ValidationError
 
@@ -22,6 +35,18 @@ from babylon.kernel.exceptions import StorageError
 from babylon.models.config import SimulationConfig
 from babylon.models.world_state import WorldState
 
+#: Suffix that selects the binary format on save.
+BINARY_SUFFIX: Final[str] = ".ckpt"
+
+#: Leading bytes of every binary checkpoint or state file.
+BINARY_MAGIC: Final[bytes] = b"BBLNCKPT"
+
+#: Binary container version; bump when the header or payload layout changes.
+BINARY_FORMAT_VERSION: Final[int] = 1
+
+_CODEC: Final[str] = "zstd"
+_HEADER_LENGTH = struct.Struct(">I")
+
 # =============================================================================
 # EXCEPTIONS (inherit from StorageError for unified hierarchy)
 # =============================================================================
@@ -65,7 +90,7 @@ class CheckpointSchemaError(CheckpointIOError):
 
 
 def save_state(state: WorldState, path: Path) -> Path:
-    """Save a WorldState to a JSON file.
+    """Save a WorldState to a JSON file, or a binary one for a ``.ckpt`` path.
 
     Uses atomic write pattern (temp file + rename) for safety.
     Creates parent directories if they don't exist.
@@ -80,6 +105,10 @@ def save_state(state: WorldState, path: Path) -> Path:
     # Ensure parent directories exist
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    if path.suffix == BINARY_SUFFIX:
+        _atomic_write(path, _encode_binary("state", state.model_dump_json().encode(), {}))
+        return path
+
     # Serialize state to JSON
     json_content = state.model_dump_json(indent=2)
 
@@ -90,7 +119,7 @@ def save_state(state: WorldState, path: Path) -> Path:
 
 
 def load_state(path: Path) -> WorldState:
-    """Load a WorldState from a JSON file.
+    """Load a WorldState from a JSON or binary file.
 
     Args:
         path: The file path to load from.
@@ -100,12 +129,20 @@ def load_state(path: Path) -> WorldState:
 
     Raises:
         CheckpointNotFoundError: If the file doesn't exist.
-        CheckpointCorruptedError: If the file contains invalid JSON.
-        CheckpointSchemaError: If the JSON doesn't match WorldState schema.
+        CheckpointCorruptedError: If the file contains invalid JSON or a
+            damaged binary container.
+        CheckpointSchemaError: If the content doesn't match WorldState schema.
     """
     if not path.exists():
         raise CheckpointNotFoundError(f"File not found: {path}")
 
+    if _is_binary(path):
+        payload = _load_binary(path, "state")
+        try:
+            return WorldState.model_validate_json(payload)
+        except ValidationError as e:
+            raise CheckpointSchemaError(f"Schema validation failed: {e}") from e
+
     try:
         content = path.read_text()
     except OSError as e:
@@ -133,7 +170,7 @@ def save_checkpoint(
     path: Path,
     description: str = "",
 ) -> Path:
-    """Save a full Checkpoint to a JSON file.
+    """Save a full Checkpoint to a JSON file, or a binary one for a ``.ckpt`` path.
 
     Creates a Checkpoint with current metadata and saves it atomically.
     Creates parent directories if they don't exist.
@@ -164,6 +201,15 @@ def save_checkpoint(
         config=config,
     )
 
+    if path.suffix == BINARY_SUFFIX:
+        header = {
+            "schema_version": metadata.version,
+            "metadata": metadata.model_dump(mode="json"),
+        }
+        payload = checkpoint.model_dump_json().encode()
+        _atomic_write(path, _encode_binary("checkpoint", payload, header))
+        return path
+
     # Serialize to JSON
     json_content = checkpoint.model_dump_json(indent=2)
 
@@ -174,7 +220,7 @@ def save_checkpoint(
 
 
 def load_checkpoint(path: Path) -> Checkpoint:
-    """Load a full Checkpoint from a JSON file.
+    """Load a full Checkpoint from a JSON or binary file.
 
     Args:
         path: The file path to load from.
@@ -184,12 +230,20 @@ def load_checkpoint(path: Path) -> Checkpoint:
 
     Raises:
         CheckpointNotFoundError: If the file doesn't exist.
-        CheckpointCorruptedError: If the file contains invalid JSON.
-        CheckpointSchemaError: If the JSON doesn't match Checkpoint schema.
+        CheckpointCorruptedError: If the file contains invalid JSON or a
+            damaged binary container.
+        CheckpointSchemaError: If the content doesn't match Checkpoint schema.
     """
     if not path.exists():
         raise CheckpointNotFoundError(f"File not found: {path}")
 
+    if _is_binary(path):
+        payload = _load_binary(path, "checkpoint")
+        try:
+            return Checkpoint.model_validate_json(payload)
+        except ValidationError as e:
+            raise CheckpointSchemaError(f"Schema validation failed: {e}") from e
+
     try:
         content = path.read_text()
     except OSError as e:
@@ -214,8 +268,9 @@ def load_checkpoint(path: Path) -> Checkpoint:
 def list_checkpoints(directory: Path) -> list[tuple[Path, CheckpointMetadata]]:
     """List all valid checkpoints in a directory.
 
-    Scans the directory for JSON files that are valid checkpoints.
-    Returns a list of (path, metadata) tuples for valid checkpoints.
+    Scans the directory for JSON and binary files that are valid checkpoints.
+    Returns a list of (path, metadata) tuples for valid checkpoints. Binary
+    metadata comes from the header, without decompressing the state.
 
     Args:
         directory: The directory to scan.
@@ -228,6 +283,15 @@ def list_checkpoints(directory: Path) -> list[tuple[Path, CheckpointMetadata]]:
 
     result: list[tuple[Path, CheckpointMetadata]] = []
 
+    for path in directory.glob(f"*{BINARY_SUFFIX}"):
+        header = _read_header(path)
+        if header is None or header.get("kind") != "checkpoint":
+            continue
+        try:
+            result.append((path, CheckpointMetadata.model_validate(header.get("metadata"))))
+        except ValidationError:
+            continue
+
     for path in directory.glob("*.json"):
         if validate_checkpoint_file(path):
             try:
@@ -254,6 +318,13 @@ def validate_checkpoint_file(path: Path) -> bool:
     if not path.exists():
         return False
 
+    if _is_binary(path):
+        header = _read_header(path)
+        if header is None or header.get("kind") != "checkpoint":
+            return False
+        metadata = header.get("metadata")
+        return isinstance(metadata, dict) and {"created_at", "tick"}.issubset(metadata)
+
     try:
         content = path.read_text()
     except OSError:
@@ -284,7 +355,7 @@ def validate_checkpoint_file(path: Path) -> bool:
 # =============================================================================
 
 
-def _atomic_write(path: Path, content: str) -> None:
+def _atomic_write(path: Path, content: str | bytes) -> None:
     """Write content to a file atomically.
 
     Uses a temporary file in the same directory, then renames.
@@ -292,7 +363,7 @@ def _atomic_write(path: Path, content: str) -> None:
 
     Args:
         path: The target file path.
-        content: The content to write.
+        content: The content to write (text, or bytes for binary files).
     """
     # Create temp file in same directory for atomic rename
     dir_path = path.parent
@@ -300,7 +371,7 @@ def _atomic_write(path: Path, content: str) -> None:
 
     try:
         # Write content
-        with open(fd, "w") as f:
+        with open(fd, "wb" if isinstance(content, bytes) else "w") as f:
             f.write(content)
 
         # Atomic rename
@@ -310,3 +381,126 @@ def _atomic_write(path: Path, content: str) -> None:
         with contextlib.suppress(OSError):
             Path(temp_path).unlink()
         raise
+
+
+def _encode_binary(kind: str, payload: bytes, header: dict[str, Any]) -> bytes:
+    """Build a binary container around an uncompressed JSON payload.
+
+    Args:
+        kind: ``"checkpoint"`` or ``"state"``.
+        payload: Compact JSON of the model.
+        header: Extra header fields (schema version, metadata).
+
+    Returns:
+        The file content.
+    """
+    import pyarrow as pa  # type: ignore[import-untyped, import-not-found, unused-ignore]
+
+    compressed = pa.compress(payload, codec=_CODEC, asbytes=True)
+    header_bytes = json.dumps(
+        {
+            "format": BINARY_FORMAT_VERSION,
+            "kind": kind,
+            "codec": _CODEC,
+            "size": len(payload),
+            "sha256": hashlib.sha256(payload).hexdigest(),
+            **header,
+        },
+        separators=(",", ":"),
+    ).encode()
+    return b"".join(
+        [BINARY_MAGIC, _HEADER_LENGTH.pack(len(header_bytes)), header_bytes, compressed]
+    )
+
+
+def _is_binary(path: Path) -> bool:
+    """Whether a file starts with :data:`BINARY_MAGIC`."""
+    try:
+        with path.open("rb") as f:
+            return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    except OSError:
+        return False
+
+
+def _parse_header(prefix: bytes, read: Callable[[int], bytes]) -> dict[str, Any]:
+    """Parse the header following :data:`BINARY_MAGIC`.
+
+    Args:
+        prefix: The magic plus length bytes.
+        read: Callable returning the next ``n`` bytes.
+
+    Raises:
+        CheckpointCorruptedError: If the header is truncated or not JSON.
+        CheckpointSchemaError: If the format version or codec is unsupported.
+    """
+    if len(prefix) != len(BINARY_MAGIC) + _HEADER_LENGTH.size or not prefix.startswith(
+        BINARY_MAGIC
+    ):
+        raise CheckpointCorruptedError("Truncated binary header")
+    (length,) = _HEADER_LENGTH.unpack_from(prefix, len(BINARY_MAGIC))
+    raw = read(length)
+    if len(raw) != length:
+        raise CheckpointCorruptedError("Truncated binary header")
+    try:
+        header = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise CheckpointCorruptedError(f"Invalid binary header: {e}") from e
+    if not isinstance(header, dict):
+        raise CheckpointCorruptedError("Invalid binary header")
+    if header.get("format") != BINARY_FORMAT_VERSION or header.get("codec") != _CODEC:
+        raise CheckpointSchemaError(
+            f"Unsupported binary format {header.get('format')!r} / codec {header.get('codec')!r}"
+        )
+    return header
+
+
+def _read_header(path: Path) -> dict[str, Any] | None:
+    """Read a binary file's header only, or None if it is not a valid one."""
+    try:
+        with path.open("rb") as f:
+            return _parse_header(f.read(len(BINARY_MAGIC) + _HEADER_LENGTH.size), f.read)
+    except (OSError, CheckpointIOError):
+        return None
+
+
+def _load_binary(path: Path, kind: str) -> bytes:
+    """Map a binary file, verify it and return its decompressed payload.
+
+    Args:
+        path: The file path to load from.
+        kind: Expected header kind.
+
+    Returns:
+        The uncompressed JSON payload.
+
+    Raises:
+        CheckpointCorruptedError: If the container is damaged or the payload
+            hash does not match.
+        CheckpointSchemaError: If the format is unsupported or the file holds
+            another kind.
+    """
+    import pyarrow as pa  # type: ignore[import-untyped, import-not-found, unused-ignore]
+
+    try:
+        with pa.memory_map(str(path), "r") as source:
+            header = _parse_header(
+                source.read(len(BINARY_MAGIC) + _HEADER_LENGTH.size), source.read
+            )
+            if header.get("kind") != kind:
+                raise CheckpointSchemaError(
+                    f"Expected a binary {kind}, found {header.get('kind')!r}"
+                )
+            payload = bytes(
+                pa.decompress(
+                    source.read_buffer(),
+                    decompressed_size=header["size"],
+                    codec=_CODEC,
+                    asbytes=True,
+                )
+            )
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise CheckpointCorruptedError(f"Failed to read binary file: {e}") from e
+
+    if hashlib.sha256(payload).hexdigest() != header.get("sha256"):
+        raise CheckpointCorruptedError(f"Content hash mismatch: {path}")
+    return payload
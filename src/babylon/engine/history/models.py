@@ -4,6 +4,7 @@ These models provide:
 - CheckpointMetadata: Context for saved checkpoints (timestamp, tick, description)
 - Checkpoint: Full state bundle (metadata + WorldState + SimulationConfig)
 - HistoryEntry: Single state snapshot for the history stack
+- HistoryDelta: Structural diff standing in for a snapshot in the stack
 - HistoryStack: Immutable stack of history entries with undo/redo support
 - CheckpointConfig: Configuration for auto-checkpointing
 
@@ -14,9 +15,12 @@ Sprint A: History Stack models for Phase 3 persistence layer.
 """
 
 from datetime import datetime
+from functools import cached_property
+from typing import Any, Self
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from babylon.engine.history.delta import state_document
 from babylon.models.config import SimulationConfig
 from babylon.models.world_state import WorldState
 
@@ -107,6 +111,39 @@ class HistoryEntry(BaseModel):
         description="The WorldState snapshot",
     )
 
+    @cached_property
+    def document(self) -> dict[str, Any]:
+        """``state``'s delta document, dumped at most once per entry.
+
+        Shared by reference: never mutate it.
+        """
+        return state_document(self.state)
+
+
+class HistoryDelta(BaseModel):
+    """Entry stored as a structural diff against the next entry in the stack.
+
+    ``push_state`` keeps only the newest state in full; every older state
+    is a reverse delta from its successor (see
+    :mod:`babylon.engine.history.delta`), rebuilt on ``undo`` and
+    ``get_state_at_tick``.
+
+    Attributes:
+        tick: The simulation tick for this state.
+        delta: StateDelta turning the next entry's state into this one.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    tick: int = Field(
+        ...,
+        description="Simulation tick for this state",
+    )
+    delta: dict[str, Any] = Field(
+        ...,
+        description="Reverse StateDelta from the next entry's state",
+    )
+
 
 class HistoryStack(BaseModel):
     """Immutable history stack for undo/redo operations.
@@ -118,9 +155,11 @@ class HistoryStack(BaseModel):
     - Linear timeline (push after undo truncates future)
     - Protected ticks that survive pruning
     - Configurable maximum depth
+    - Delta encoding: full snapshot at the newest entry, reverse diffs before it
 
     Attributes:
-        entries: List of history entries (oldest first).
+        entries: List of history entries (oldest first); the last is always
+            a full HistoryEntry.
         current_index: Index of current state (-1 if empty).
         max_depth: Maximum number of entries to retain.
         protected_ticks: Tick numbers that cannot be pruned.
@@ -128,7 +167,7 @@ class HistoryStack(BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
-    entries: list[HistoryEntry] = Field(
+    entries: list[HistoryEntry | HistoryDelta] = Field(
         default_factory=list,
         description="History entries (oldest first)",
     )
@@ -146,6 +185,13 @@ class HistoryStack(BaseModel):
         description="Tick numbers that cannot be pruned",
     )
 
+    @model_validator(mode="after")
+    def _newest_entry_is_full(self) -> Self:
+        """Every delta chain must end at a full snapshot."""
+        if self.entries and not isinstance(self.entries[-1], HistoryEntry):
+            raise ValueError("the newest history entry must be a full HistoryEntry")
+        return self
+
 
 class CheckpointConfig(BaseModel):
     """Configuration for auto-checkpointing behavior.
@@ -157,6 +203,7 @@ class CheckpointConfig(BaseModel):
         interval: Number of ticks between auto-checkpoints.
         checkpoint_dir: Directory path for checkpoint files.
         max_checkpoints: Maximum checkpoints to retain (0 = unlimited).
+        compressed: Write binary compressed checkpoints instead of JSON.
     """
 
     model_config = ConfigDict(frozen=True)
@@ -179,3 +226,7 @@ class CheckpointConfig(BaseModel):
         ge=0,
         description="Maximum checkpoints to retain (0 = unlimited)",
     )
+    compressed: bool = Field(
+        default=False,
+        description="Write binary zstd checkpoints (.ckpt) instead of JSON",
+    )
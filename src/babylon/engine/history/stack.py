@@ -9,18 +9,32 @@ This enables functional transformation patterns:
     new_stack = push_state(old_stack, state)
     new_stack, previous_state = undo(old_stack)
 
+Only the newest entry holds a full WorldState. push_state replaces the
+previous newest entry with a reverse HistoryDelta against the new state,
+so memory grows with what changed per tick rather than with state size;
+undo, redo and get_state_at_tick rebuild a state by walking the deltas
+back from the newest snapshot. An entry whose successor is truncated or
+pruned is rebuilt into a full snapshot first, so every chain stays
+anchored.
+
 Sprint B: Stack operations for Phase 3 persistence layer.
 """
 
-from babylon.engine.history.models import HistoryEntry, HistoryStack
+from typing import Any
+
+from babylon.engine.history.delta import apply_delta, diff_documents, document_state
+from babylon.engine.history.models import HistoryDelta, HistoryEntry, HistoryStack
 from babylon.models.world_state import WorldState
 
+_Entry = HistoryEntry | HistoryDelta
+
 
 def push_state(history: HistoryStack, state: WorldState) -> HistoryStack:
     """Add a new state to the history stack.
 
     Behavior:
     - If current_index is not at the end, truncates future entries (linear timeline)
+    - Stores the previous newest state as a reverse delta against the new one
     - Enforces max_depth by pruning oldest non-protected entries
     - Returns new stack with state added
 
@@ -37,10 +51,21 @@ def push_state(history: HistoryStack, state: WorldState) -> HistoryStack:
     # Truncate future if we're not at the end
     if history.current_index >= 0:
         # Keep entries up to and including current_index, then add new
-        entries = list(history.entries[: history.current_index + 1])
+        keep = history.current_index + 1
+        entries = _retain(history.entries, [i < keep for i in range(len(history.entries))])
     else:
         entries = []
 
+    # The previous newest snapshot becomes a delta from the new state. Its
+    # document was cached when it was pushed, so only the new state is dumped.
+    if entries:
+        previous = entries[-1]
+        if isinstance(previous, HistoryEntry):
+            entries[-1] = HistoryDelta(
+                tick=previous.tick,
+                delta=diff_documents(new_entry.document, previous.document),
+            )
+
     entries.append(new_entry)
     new_index = len(entries) - 1
 
@@ -79,11 +104,11 @@ def push_state(history: HistoryStack, state: WorldState) -> HistoryStack:
 
 
 def _prune_to_depth(
-    entries: list[HistoryEntry],
+    entries: list[_Entry],
     max_depth: int,
     protected_ticks: frozenset[int],
     current_index: int,
-) -> list[HistoryEntry]:
+) -> list[_Entry]:
     """Prune entries to max_depth while respecting protected ticks.
 
     Removes oldest non-protected entries first.
@@ -91,7 +116,7 @@ def _prune_to_depth(
     if len(entries) <= max_depth:
         return entries
 
-    result: list[HistoryEntry] = []
+    keep: list[bool] = []
     to_remove_count = len(entries) - max_depth
 
     # Build list keeping protected and most recent
@@ -102,14 +127,74 @@ def _prune_to_depth(
 
         # Keep if: protected, current, or haven't removed enough non-protected yet
         if is_protected or is_current or removed >= to_remove_count:
-            result.append(entry)
+            keep.append(True)
         else:
+            keep.append(False)
             removed += 1
 
+    return _retain(entries, keep)
+
+
+def _retain(entries: list[_Entry], keep: list[bool]) -> list[_Entry]:
+    """Drop entries whose ``keep`` flag is False, re-anchoring delta chains.
+
+    A kept delta is relative to the entry after it; if that entry is
+    dropped (or it was the last one), the kept entry is rebuilt into a
+    full snapshot.
+    """
+    last = len(entries) - 1
+    orphaned = {
+        i
+        for i, entry in enumerate(entries)
+        if keep[i] and isinstance(entry, HistoryDelta) and (i == last or not keep[i + 1])
+    }
+    rebuilt = _states_at(entries, orphaned)
+    result: list[_Entry] = []
+    for i, entry in enumerate(entries):
+        if not keep[i]:
+            continue
+        if i in rebuilt:
+            result.append(HistoryEntry(tick=entry.tick, state=rebuilt[i]))
+        else:
+            result.append(entry)
     return result
 
 
-def _find_index_for_tick(entries: list[HistoryEntry], tick: int) -> int:
+def _states_at(entries: list[_Entry], indices: set[int]) -> dict[int, WorldState]:
+    """Rebuild the states at ``indices`` in one walk back from the newest snapshot.
+
+    Raises:
+        ValueError: If a delta has no full snapshot after it.
+    """
+    states: dict[int, WorldState] = {}
+    if not indices:
+        return states
+
+    newer: HistoryEntry | None = None
+    document: dict[str, Any] | None = None
+    for i in range(len(entries) - 1, min(indices) - 1, -1):
+        entry = entries[i]
+        if isinstance(entry, HistoryEntry):
+            newer, document = entry, None
+            if i in indices:
+                states[i] = entry.state
+            continue
+        if document is None:
+            if newer is None:
+                raise ValueError(f"history delta at tick {entry.tick} has no newer snapshot")
+            document = newer.document
+        document = apply_delta(document, entry.delta)
+        if i in indices:
+            states[i] = document_state(document)
+    return states
+
+
+def _state_at(entries: list[_Entry], index: int) -> WorldState:
+    """Rebuild the state at one index."""
+    return _states_at(entries, {index})[index]
+
+
+def _find_index_for_tick(entries: list[_Entry], tick: int) -> int:
     """Find the index of an entry with the given tick."""
     for i, entry in enumerate(entries):
         if entry.tick == tick:
@@ -143,7 +228,7 @@ def undo(history: HistoryStack) -> tuple[HistoryStack, WorldState | None]:
     new_index = history.current_index - 1
     new_stack = history.model_copy(update={"current_index": new_index})
 
-    return new_stack, history.entries[new_index].state
+    return new_stack, _state_at(history.entries, new_index)
 
 
 def redo(history: HistoryStack) -> tuple[HistoryStack, WorldState | None]:
@@ -171,7 +256,7 @@ def redo(history: HistoryStack) -> tuple[HistoryStack, WorldState | None]:
     new_index = history.current_index + 1
     new_stack = history.model_copy(update={"current_index": new_index})
 
-    return new_stack, history.entries[new_index].state
+    return new_stack, _state_at(history.entries, new_index)
 
 
 def get_current_state(history: HistoryStack) -> WorldState | None:
@@ -186,7 +271,7 @@ def get_current_state(history: HistoryStack) -> WorldState | None:
     if history.current_index < 0 or len(history.entries) == 0:
         return None
 
-    return history.entries[history.current_index].state
+    return _state_at(history.entries, history.current_index)
 
 
 def get_state_at_tick(history: HistoryStack, tick: int) -> WorldState | None:
@@ -199,10 +284,10 @@ def get_state_at_tick(history: HistoryStack, tick: int) -> WorldState | None:
     Returns:
         WorldState at that tick or None if not found.
     """
-    for entry in history.entries:
-        if entry.tick == tick:
-            return entry.state
-    return None
+    index = _find_index_for_tick(history.entries, tick)
+    if index == -1:
+        return None
+    return _state_at(history.entries, index)
 
 
 def prune_history(history: HistoryStack, keep_count: int) -> HistoryStack:
@@ -234,7 +319,7 @@ def prune_history(history: HistoryStack, keep_count: int) -> HistoryStack:
     )
 
     # Build new entries list
-    new_entries: list[HistoryEntry] = []
+    keep: list[bool] = []
     removed = 0
 
     for entry in history.entries:
@@ -242,10 +327,13 @@ def prune_history(history: HistoryStack, keep_count: int) -> HistoryStack:
 
         # Keep if protected, or if we've removed enough already
         if is_protected or removed >= to_remove:
-            new_entries.append(entry)
+            keep.append(True)
         else:
+            keep.append(False)
             removed += 1
 
+    new_entries = _retain(history.entries, keep)
+
     # Find new current_index
     new_index = _find_index_for_tick(new_entries, current_tick)
     if new_index == -1 and len(new_entries) > 0:
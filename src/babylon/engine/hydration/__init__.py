@@ -5,20 +5,29 @@ from babylon.engine.hydration.reference import (
     StubBEASource,
     compute_initial_profit_rate,
     hydrate_class_shares,
+    hydrate_class_shares_bulk,
     hydrate_economy_constants,
+    hydrate_economy_constants_bulk,
     hydrate_reserve_army,
+    hydrate_reserve_army_bulk,
     hydrate_territories,
     query_counties,
     query_hex_claims,
 )
+from babylon.engine.hydration.warm_start import HydratedScenario, WarmStartCache
 
 __all__ = [
     "CountyInfo",
+    "HydratedScenario",
     "StubBEASource",
+    "WarmStartCache",
     "compute_initial_profit_rate",
     "hydrate_class_shares",
+    "hydrate_class_shares_bulk",
     "hydrate_economy_constants",
+    "hydrate_economy_constants_bulk",
     "hydrate_reserve_army",
+    "hydrate_reserve_army_bulk",
     "hydrate_territories",
     "query_counties",
     "query_hex_claims",
@@ -10,6 +10,12 @@ Key Functions:
     - query_h3_to_county_fips: Resolve H3 cells to county FIPS (the reverse join)
     - compute_initial_profit_rate: Calculate profit_rate from QCEW/BEA data
     - hydrate_territories: Create TerritoryState objects from database
+    - hydrate_*_bulk: Per-county constants for many counties at once
+
+Every hydrator reads the reference DB set-based — one grouped query per
+table over all requested counties (chunked under SQLite's bound-parameter
+limit), joined in Python/NumPy — rather than a query per county. The
+single-county functions are thin wrappers over the bulk ones.
 
 See Also:
     - research.md#3. SQLite Reference Database Schema
@@ -20,9 +26,14 @@ See Also:
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -32,6 +43,8 @@ from babylon.reference.database import get_reference_session
 from babylon.reference.schema import BridgeCountyH3, DimCounty
 
 if TYPE_CHECKING:
+    from babylon.domain.economics.department_mapper import DepartmentMapper
+    from babylon.domain.economics.hydrator import MarxianHydrator
     from babylon.models.entities.industry import IndustryHyperedge
 
 logger = logging.getLogger(__name__)
@@ -197,6 +210,43 @@ def query_h3_to_county_fips(
         return _query(sess)
 
 
+#: Counties per set-based QCEW query — same SQLite bound-parameter ceiling
+#: as :data:`_H3_LOOKUP_CHUNK_SIZE`.
+_FIPS_CHUNK_SIZE = 500
+
+# NAICS-to-department mapping YAML for the MarxianHydrator
+_NAICS_TO_DEPT_PATH = (
+    Path(__file__).parent.parent.parent / "domain" / "economics" / "data" / "naics_to_dept.yaml"
+)
+
+# Default class shares matching _bootstrap_county_states() fallbacks
+_CLASS_SHARE_FALLBACK: dict[str, float] = {
+    "bourgeoisie": 0.01,
+    "petit_bourgeoisie": 0.09,
+    "labor_aristocracy": 0.40,
+    "proletariat": 0.35,
+    "lumpenproletariat": 0.15,
+    "unemployment_rate": 0.05,
+    "median_wage": 21.0,
+}
+
+#: Cumulative-employment crossings tracked by :func:`hydrate_class_shares`.
+_WAGE_PERCENTILES: tuple[tuple[str, float], ...] = (
+    ("p15", 0.15),
+    ("p50", 0.50),
+    ("p90", 0.90),
+    ("p99", 0.99),
+)
+
+
+@dataclass(frozen=True)
+class _QcewTotals:
+    """County totals over 6-digit NAICS rows for one year."""
+
+    employment: float
+    wages: float
+
+
 class StubBEASource:
     """Stub BEA source that returns None, letting DepartmentMapper provide defaults.
 
@@ -213,6 +263,154 @@ class StubBEASource:
         return None
 
 
+def _department_mapper() -> DepartmentMapper:
+    """Parse the NAICS-to-department mapping YAML."""
+    from babylon.domain.economics.department_mapper import DepartmentMapper
+
+    return DepartmentMapper.from_yaml(_NAICS_TO_DEPT_PATH)
+
+
+def _marxian_hydrator(
+    session: Session,
+    fips_codes: Sequence[str] = (),
+    years: Sequence[int] = (),
+    dept_mapper: DepartmentMapper | None = None,
+) -> MarxianHydrator:
+    """Build a MarxianHydrator on ``session``, prefetching ``fips_codes`` for ``years``.
+
+    One hydrator (and one parse of the department mapping) serves every
+    county of a hydration run; prefetching turns its per-county QCEW reads
+    into set-based queries.
+    """
+    from babylon.domain.economics.adapters import SQLiteQCEWSource
+    from babylon.domain.economics.hydrator import MarxianHydrator
+
+    qcew_source = SQLiteQCEWSource(session)
+    if fips_codes:
+        for year in dict.fromkeys(years):
+            qcew_source.prefetch(fips_codes, year)
+    bea_source = StubBEASource()  # Falls back to DepartmentMapper defaults
+    if dept_mapper is None:
+        dept_mapper = _department_mapper()
+    return MarxianHydrator(qcew_source, bea_source, dept_mapper)
+
+
+def _qcew_county_totals(
+    session: Session,
+    fips_codes: Sequence[str],
+    year: int,
+) -> dict[str, _QcewTotals]:
+    """Employment and wage totals per county, one grouped query per chunk.
+
+    Counties without 6-digit QCEW rows for the year (or an unknown county
+    or year) are absent from the result.
+    """
+    from sqlalchemy import func
+
+    from babylon.reference.schema import DimIndustry, DimTime, FactQcewAnnual
+
+    totals: dict[str, _QcewTotals] = {}
+    unique_fips = sorted(set(fips_codes))
+    for start in range(0, len(unique_fips), _FIPS_CHUNK_SIZE):
+        chunk = unique_fips[start : start + _FIPS_CHUNK_SIZE]
+        stmt = (
+            select(
+                DimCounty.fips,
+                func.sum(FactQcewAnnual.employment).label("emp"),
+                func.sum(FactQcewAnnual.total_wages_usd).label("wages"),
+            )
+            .select_from(FactQcewAnnual)
+            .join(DimCounty, FactQcewAnnual.county_id == DimCounty.county_id)
+            .join(DimTime, FactQcewAnnual.time_id == DimTime.time_id)
+            .join(DimIndustry, FactQcewAnnual.industry_id == DimIndustry.industry_id)
+            .where(
+                DimCounty.fips.in_(chunk),
+                DimTime.year == year,
+                DimTime.is_annual.is_(True),
+                DimIndustry.naics_level == 6,
+            )
+            .group_by(DimCounty.fips)
+        )
+        for row in session.execute(stmt).all():
+            totals[row.fips] = _QcewTotals(
+                employment=float(row.emp or 0), wages=float(row.wages or 0.0)
+            )
+    return totals
+
+
+def _qcew_wage_ladders(
+    session: Session,
+    fips_codes: Sequence[str],
+    year: int,
+) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """Per-county industry ``(employment, wages)`` columns, ascending by average wage.
+
+    One query per chunk returns every county's 6-digit industry rows,
+    ordered by county and then average wage, split into NumPy columns.
+    """
+    from babylon.reference.schema import DimIndustry, DimTime, FactQcewAnnual
+
+    ladders: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+    unique_fips = sorted(set(fips_codes))
+    for start in range(0, len(unique_fips), _FIPS_CHUNK_SIZE):
+        chunk = unique_fips[start : start + _FIPS_CHUNK_SIZE]
+        stmt = (
+            select(
+                DimCounty.fips,
+                FactQcewAnnual.employment,
+                FactQcewAnnual.total_wages_usd,
+            )
+            .select_from(FactQcewAnnual)
+            .join(DimCounty, FactQcewAnnual.county_id == DimCounty.county_id)
+            .join(DimTime, FactQcewAnnual.time_id == DimTime.time_id)
+            .join(DimIndustry, FactQcewAnnual.industry_id == DimIndustry.industry_id)
+            .where(
+                DimCounty.fips.in_(chunk),
+                DimTime.year == year,
+                DimTime.is_annual.is_(True),
+                DimIndustry.naics_level == 6,
+                FactQcewAnnual.employment > 0,
+            )
+            .order_by(
+                DimCounty.fips,
+                (FactQcewAnnual.total_wages_usd / FactQcewAnnual.employment).asc(),
+            )
+        )
+        rows = session.execute(stmt).all()
+        for fips, group in groupby(rows, key=itemgetter(0)):
+            # employment > 0 is filtered in SQL; a NULL wage total raises, as before.
+            block: list[Any] = list(group)
+            ladders[fips] = (
+                np.fromiter((float(r[1]) for r in block), dtype=np.float64, count=len(block)),
+                np.fromiter((float(r[2]) for r in block), dtype=np.float64, count=len(block)),
+            )
+    return ladders
+
+
+def _profit_rate(hydrator: MarxianHydrator, fips: str, year: int) -> float:
+    """Clamped ``s / (c + v)`` of one county's tensor (see compute_initial_profit_rate)."""
+    try:
+        tensor = hydrator.hydrate(fips, year)
+    except Exception as e:
+        msg = f"Failed to hydrate county {fips} for year {year}: {e}"
+        raise ValueError(msg) from e
+
+    # Use the tensor's built-in profit_rate property
+    profit_rate = tensor.profit_rate
+
+    # Handle edge cases (inf, nan)
+    if profit_rate != profit_rate or profit_rate == float("inf"):  # NaN or inf check
+        logger.warning(
+            "County %s has invalid profit_rate=%s, using default",
+            fips,
+            profit_rate,
+        )
+        return 0.04  # STUB: Default fallback
+
+    # Clamp to valid range
+    return max(0.0, min(1.0, profit_rate))
+
+
 def compute_initial_profit_rate(
     fips: str,
     year: int,
@@ -238,46 +436,118 @@ def compute_initial_profit_rate(
     Raises:
         ValueError: If QCEW data is missing for the county.
     """
-    # Lazy import to avoid circular dependencies
-    from pathlib import Path
+    with get_reference_session() as session:
+        return _profit_rate(_marxian_hydrator(session), fips, year)
 
-    from babylon.domain.economics.adapters import SQLiteQCEWSource
-    from babylon.domain.economics.department_mapper import DepartmentMapper
-    from babylon.domain.economics.hydrator import MarxianHydrator
 
-    # Locate NAICS-to-department mapping YAML
-    economics_path = (
-        Path(__file__).parent.parent.parent / "domain" / "economics" / "data" / "naics_to_dept.yaml"
-    )
+def _wage_percentiles(
+    totals: _QcewTotals,
+    ladder: tuple[np.ndarray, np.ndarray],
+) -> dict[str, float]:
+    """Hourly wage at each :data:`_WAGE_PERCENTILES` crossing of one county's ladder.
 
-    # Create data sources
-    with get_reference_session() as session:
-        qcew_source = SQLiteQCEWSource(session)
-        bea_source = StubBEASource()  # Falls back to DepartmentMapper defaults
-        dept_mapper = DepartmentMapper.from_yaml(economics_path)
-
-        hydrator = MarxianHydrator(qcew_source, bea_source, dept_mapper)
-
-        try:
-            tensor = hydrator.hydrate(fips, year)
-        except Exception as e:
-            msg = f"Failed to hydrate county {fips} for year {year}: {e}"
-            raise ValueError(msg) from e
-
-        # Use the tensor's built-in profit_rate property
-        profit_rate = tensor.profit_rate
-
-        # Handle edge cases (inf, nan)
-        if profit_rate != profit_rate or profit_rate == float("inf"):  # NaN or inf check
-            logger.warning(
-                "County %s has invalid profit_rate=%s, using default",
-                fips,
-                profit_rate,
-            )
-            return 0.04  # STUB: Default fallback
+    A crossing is the first industry, in ascending average-wage order,
+    whose cumulative employment share reaches ``q``; a percentile the
+    ladder never reaches is absent.
+    """
+    employment, wages = ladder
+    cumulative = np.cumsum(employment) / totals.employment
+    avg_wage = wages / employment / HOURS_PER_YEAR
+    percentiles: dict[str, float] = {}
+    for name, q in _WAGE_PERCENTILES:
+        index = int(np.searchsorted(cumulative, q, side="left"))
+        if index < len(cumulative):
+            percentiles[name] = float(avg_wage[index])
+    return percentiles
+
+
+def _class_shares(
+    totals: _QcewTotals,
+    ladder: tuple[np.ndarray, np.ndarray] | None,
+) -> dict[str, float]:
+    """Class shares of one county from its totals and wage ladder."""
+    # Derive median wage (annual -> hourly approximation)
+    annual_median = totals.wages / totals.employment
+    hourly_median = annual_median / HOURS_PER_YEAR  # Standard work hours
+
+    percentiles = _wage_percentiles(totals, ladder) if ladder is not None else {}
+
+    # Map percentiles to class shares
+    # These are empirically grounded approximations
+    shares = {
+        "bourgeoisie": 1.0 - min(1.0, max(0.0, 0.99)),  # top 1%
+        "petit_bourgeoisie": 0.09,  # 90th-99th pctile
+        "labor_aristocracy": 0.40,  # 50th-90th pctile
+        "proletariat": 0.35,  # 15th-50th pctile
+        "lumpenproletariat": 0.15,  # bottom 15%
+        "unemployment_rate": 0.05,
+        "median_wage": hourly_median,
+    }
+
+    # Refine shares from actual percentile data
+    if len(percentiles) >= 3:
+        # Use wage ratios to modulate class boundaries
+        p50 = percentiles.get("p50", hourly_median)
+        p90 = percentiles.get("p90", hourly_median * 2)
+        wage_spread = p90 / p50 if p50 > 0 else 2.0
+        # Higher wage spread = more polarized class structure
+        if wage_spread > 3.0:
+            shares["labor_aristocracy"] = 0.35
+            shares["proletariat"] = 0.40
+        elif wage_spread < 1.5:
+            shares["labor_aristocracy"] = 0.45
+            shares["proletariat"] = 0.30
+    return shares
+
+
+def hydrate_class_shares_bulk(
+    fips_codes: Sequence[str],
+    year: int,
+) -> dict[str, dict[str, float]]:
+    """Derive class distribution shares for many counties in set-based queries.
+
+    Two grouped queries (county totals, per-industry wage ladders) cover
+    every county, instead of four round-trips per county.
+
+    Args:
+        fips_codes: 5-digit FIPS codes.
+        year: Data year.
 
-        # Clamp to valid range
-        return max(0.0, min(1.0, profit_rate))
+    Returns:
+        Dict mapping each FIPS code to the shares
+        :func:`hydrate_class_shares` documents; counties without data get
+        the GameDefines defaults.
+    """
+    unique_fips = list(dict.fromkeys(fips_codes))
+    try:
+        with get_reference_session() as session:
+            totals = _qcew_county_totals(session, unique_fips, year)
+            ladders = _qcew_wage_ladders(session, list(totals), year)
+    except Exception:
+        logger.warning(
+            "Error hydrating class shares for %d counties/%d, using defaults",
+            len(unique_fips),
+            year,
+            exc_info=True,
+        )
+        return {fips: dict(_CLASS_SHARE_FALLBACK) for fips in unique_fips}
+
+    result: dict[str, dict[str, float]] = {}
+    for fips in unique_fips:
+        county_totals = totals.get(fips)
+        if county_totals is None or county_totals.employment == 0:
+            logger.warning("No employment data for %s/%d, using defaults", fips, year)
+            result[fips] = dict(_CLASS_SHARE_FALLBACK)
+            continue
+        result[fips] = _class_shares(county_totals, ladders.get(fips))
+        logger.debug(
+            "Hydrated class shares for %s/%d: median_wage=$%.2f/hr",
+            fips,
+            year,
+            result[fips]["median_wage"],
+        )
+    logger.info("Hydrated class shares for %d counties/%d", len(result), year)
+    return result
 
 
 def hydrate_class_shares(
@@ -298,148 +568,80 @@ def hydrate_class_shares(
         Dict with keys: bourgeoisie, petit_bourgeoisie, labor_aristocracy,
         proletariat, lumpenproletariat, unemployment_rate, median_wage.
     """
-    # Default class shares matching _bootstrap_county_states() fallbacks
-    fallback = {
-        "bourgeoisie": 0.01,
-        "petit_bourgeoisie": 0.09,
-        "labor_aristocracy": 0.40,
-        "proletariat": 0.35,
-        "lumpenproletariat": 0.15,
-        "unemployment_rate": 0.05,
-        "median_wage": 21.0,
-    }
+    return hydrate_class_shares_bulk([fips], year)[fips]
 
-    try:
-        with get_reference_session() as session:
-            from babylon.reference.schema import (
-                DimCounty,
-                DimIndustry,
-                DimTime,
-                FactQcewAnnual,
-            )
 
-            # Verify county exists
-            county = session.execute(
-                select(DimCounty).where(DimCounty.fips == fips)
-            ).scalar_one_or_none()
-            if county is None:
-                logger.warning("County %s not found, using default class shares", fips)
-                return fallback
-
-            # Get time dimension for year
-            time_dim = session.execute(
-                select(DimTime).where(DimTime.year == year, DimTime.is_annual.is_(True))
-            ).scalar_one_or_none()
-            if time_dim is None:
-                logger.warning("Year %d not found in dim_time, using defaults", year)
-                return fallback
-
-            # Fetch total employment and wages for the county
-            from sqlalchemy import func
-
-            result = session.execute(
-                select(
-                    func.sum(FactQcewAnnual.employment).label("total_emp"),
-                    func.sum(FactQcewAnnual.total_wages_usd).label("total_wages"),
-                    func.count().label("industry_count"),
-                )
-                .join(DimIndustry, FactQcewAnnual.industry_id == DimIndustry.industry_id)
-                .where(
-                    FactQcewAnnual.county_id == county.county_id,
-                    FactQcewAnnual.time_id == time_dim.time_id,
-                    DimIndustry.naics_level == 6,
-                )
-            ).one()
+def hydrate_economy_constants_bulk(
+    fips_codes: Sequence[str],
+    year: int,
+    *,
+    session: Session | None = None,
+    hydrator: MarxianHydrator | None = None,
+) -> dict[str, dict[str, float]]:
+    """Derive economy constants for many counties from one session.
 
-            total_emp = result.total_emp
-            total_wages = result.total_wages
+    The MarxianHydrator's QCEW reads are prefetched in set-based queries
+    and the shadow wage comes from one grouped totals query.
 
-            if not total_emp or total_emp == 0:
-                logger.warning("No employment data for %s/%d, using defaults", fips, year)
-                return fallback
+    Args:
+        fips_codes: 5-digit FIPS codes.
+        year: Data year.
+        session: Optional existing session. If None, creates a new one.
+        hydrator: Optional MarxianHydrator on ``session``, already
+            prefetched for ``year``. If None, builds one.
 
-            # Derive median wage (annual -> hourly approximation)
-            annual_median = total_wages / total_emp
-            hourly_median = annual_median / HOURS_PER_YEAR  # Standard work hours
+    Returns:
+        Dict mapping each FIPS code to the constants
+        :func:`hydrate_economy_constants` documents (possibly empty).
+    """
+    unique_fips = list(dict.fromkeys(fips_codes))
+    result: dict[str, dict[str, float]] = {fips: {} for fips in unique_fips}
 
-            # Derive class shares from wage distribution
-            # Use industry-level wage data to estimate percentile distribution
-            industries = session.execute(
-                select(
-                    FactQcewAnnual.employment,
-                    FactQcewAnnual.total_wages_usd,
-                )
-                .join(DimIndustry, FactQcewAnnual.industry_id == DimIndustry.industry_id)
-                .where(
-                    FactQcewAnnual.county_id == county.county_id,
-                    FactQcewAnnual.time_id == time_dim.time_id,
-                    DimIndustry.naics_level == 6,
-                    FactQcewAnnual.employment > 0,
+    def _query(sess: Session) -> None:
+        county_hydrator = (
+            hydrator if hydrator is not None else _marxian_hydrator(sess, unique_fips, (year,))
+        )
+        hydrated: list[str] = []
+        for fips in unique_fips:
+            try:
+                tensor = county_hydrator.hydrate(fips, year)
+            except Exception:
+                logger.warning(
+                    "Error hydrating economy constants for %s/%d, using defaults",
+                    fips,
+                    year,
+                    exc_info=True,
                 )
-                .order_by((FactQcewAnnual.total_wages_usd / FactQcewAnnual.employment).asc())
-            ).all()
-
-            # Build cumulative employment distribution sorted by avg wage
-            cumulative = 0.0
-            percentiles: dict[str, float] = {}
-            for row in industries:
-                emp = float(row.employment)
-                cumulative += emp
-                pct = cumulative / total_emp
-                avg_wage = float(row.total_wages_usd) / emp / HOURS_PER_YEAR
-
-                # Track percentile crossings
-                if "p15" not in percentiles and pct >= 0.15:
-                    percentiles["p15"] = avg_wage
-                if "p50" not in percentiles and pct >= 0.50:
-                    percentiles["p50"] = avg_wage
-                if "p90" not in percentiles and pct >= 0.90:
-                    percentiles["p90"] = avg_wage
-                if "p99" not in percentiles and pct >= 0.99:
-                    percentiles["p99"] = avg_wage
-
-            # Map percentiles to class shares
-            # These are empirically grounded approximations
-            shares = {
-                "bourgeoisie": 1.0 - min(1.0, max(0.0, 0.99)),  # top 1%
-                "petit_bourgeoisie": 0.09,  # 90th-99th pctile
-                "labor_aristocracy": 0.40,  # 50th-90th pctile
-                "proletariat": 0.35,  # 15th-50th pctile
-                "lumpenproletariat": 0.15,  # bottom 15%
-                "unemployment_rate": 0.05,
-                "median_wage": hourly_median,
-            }
-
-            # Refine shares from actual percentile data
-            if len(percentiles) >= 3:
-                # Use wage ratios to modulate class boundaries
-                p50 = percentiles.get("p50", hourly_median)
-                p90 = percentiles.get("p90", hourly_median * 2)
-                wage_spread = p90 / p50 if p50 > 0 else 2.0
-                # Higher wage spread = more polarized class structure
-                if wage_spread > 3.0:
-                    shares["labor_aristocracy"] = 0.35
-                    shares["proletariat"] = 0.40
-                elif wage_spread < 1.5:
-                    shares["labor_aristocracy"] = 0.45
-                    shares["proletariat"] = 0.30
-
-            logger.info(
-                "Hydrated class shares for %s/%d: median_wage=$%.2f/hr",
-                fips,
-                year,
-                hourly_median,
-            )
-            return shares
+                continue
+            hydrated.append(fips)
+            # extraction_efficiency = s / (c + v) via tensor properties
+            denominator = tensor.total_c + tensor.total_v
+            if denominator > 0:
+                extraction = tensor.total_s / denominator
+                result[fips]["extraction_efficiency"] = max(0.01, min(0.99, extraction))
 
+        # shadow_wage_hourly from QCEW average wages
+        for fips, county_totals in _qcew_county_totals(sess, hydrated, year).items():
+            if county_totals.wages and county_totals.employment > 0:
+                avg_hourly = county_totals.wages / county_totals.employment / HOURS_PER_YEAR
+                result[fips]["shadow_wage_hourly"] = round(avg_hourly, 2)
+
+    try:
+        if session is not None:
+            _query(session)
+        else:
+            with get_reference_session() as sess:
+                _query(sess)
     except Exception:
         logger.warning(
-            "Error hydrating class shares for %s/%d, using defaults",
-            fips,
+            "Error hydrating economy constants for %d counties/%d, using defaults",
+            len(unique_fips),
             year,
             exc_info=True,
         )
-        return fallback
+
+    logger.info("Hydrated economy constants for %d counties/%d", len(unique_fips), year)
+    return result
 
 
 def hydrate_economy_constants(
@@ -459,86 +661,58 @@ def hydrate_economy_constants(
         Dict with keys: extraction_efficiency, shadow_wage_hourly,
         base_subsistence. Missing values omitted (caller uses defaults).
     """
-    result: dict[str, float] = {}
-
-    try:
-        # Compute extraction efficiency from MarxianHydrator
-        from pathlib import Path
-
-        from babylon.domain.economics.adapters import SQLiteQCEWSource
-        from babylon.domain.economics.department_mapper import DepartmentMapper
-        from babylon.domain.economics.hydrator import MarxianHydrator
-
-        economics_path = (
-            Path(__file__).parent.parent.parent
-            / "domain"
-            / "economics"
-            / "data"
-            / "naics_to_dept.yaml"
-        )
-
-        with get_reference_session() as session:
-            qcew_source = SQLiteQCEWSource(session)
-            bea_source = StubBEASource()
-            dept_mapper = DepartmentMapper.from_yaml(economics_path)
+    return hydrate_economy_constants_bulk([fips], year)[fips]
 
-            hydrator_inst = MarxianHydrator(qcew_source, bea_source, dept_mapper)
-            tensor = hydrator_inst.hydrate(fips, year)
 
-            # extraction_efficiency = s / (c + v) via tensor properties
-            denominator = tensor.total_c + tensor.total_v
-            if denominator > 0:
-                extraction = tensor.total_s / denominator
-                result["extraction_efficiency"] = max(0.01, min(0.99, extraction))
-
-            # shadow_wage_hourly from QCEW average wages
-            from sqlalchemy import func
+def hydrate_reserve_army_bulk(
+    fips_codes: Sequence[str],
+    year: int,
+    *,
+    session: Session | None = None,
+) -> dict[str, dict[str, float]]:
+    """Derive reserve army parameters for many counties in one grouped query.
 
-            from babylon.reference.schema import (
-                DimCounty,
-                DimIndustry,
-                DimTime,
-                FactQcewAnnual,
-            )
+    Args:
+        fips_codes: 5-digit FIPS codes.
+        year: Data year.
+        session: Optional existing session. If None, creates a new one.
 
-            county = session.execute(
-                select(DimCounty).where(DimCounty.fips == fips)
-            ).scalar_one_or_none()
-            if county is not None:
-                time_dim = session.execute(
-                    select(DimTime).where(DimTime.year == year, DimTime.is_annual.is_(True))
-                ).scalar_one_or_none()
-                if time_dim is not None:
-                    wage_result = session.execute(
-                        select(
-                            func.sum(FactQcewAnnual.total_wages_usd).label("wages"),
-                            func.sum(FactQcewAnnual.employment).label("emp"),
-                        )
-                        .join(DimIndustry, FactQcewAnnual.industry_id == DimIndustry.industry_id)
-                        .where(
-                            FactQcewAnnual.county_id == county.county_id,
-                            FactQcewAnnual.time_id == time_dim.time_id,
-                            DimIndustry.naics_level == 6,
-                        )
-                    ).one()
-                    if wage_result.wages and wage_result.emp and wage_result.emp > 0:
-                        avg_hourly = (
-                            float(wage_result.wages) / float(wage_result.emp) / HOURS_PER_YEAR
-                        )
-                        result["shadow_wage_hourly"] = round(avg_hourly, 2)
-
-        logger.info("Hydrated economy constants for %s/%d: %s", fips, year, result)
-        return result
+    Returns:
+        Dict mapping each FIPS code to the parameters
+        :func:`hydrate_reserve_army` documents (possibly empty).
+    """
+    unique_fips = list(dict.fromkeys(fips_codes))
+    result: dict[str, dict[str, float]] = {fips: {} for fips in unique_fips}
 
+    try:
+        if session is not None:
+            totals = _qcew_county_totals(session, unique_fips, year)
+        else:
+            with get_reference_session() as sess:
+                totals = _qcew_county_totals(sess, unique_fips, year)
     except Exception:
         logger.warning(
-            "Error hydrating economy constants for %s/%d, using defaults",
-            fips,
+            "Error hydrating reserve army for %d counties/%d",
+            len(unique_fips),
             year,
             exc_info=True,
         )
         return result
 
+    for fips, county_totals in totals.items():
+        if county_totals.employment > 0:
+            # Derive unemployment proxy from labor force participation
+            # QCEW doesn't directly report unemployment, but county-level
+            # employment relative to population gives us a proxy.
+            # The sigmoid_r0 parameter represents the natural unemployment rate.
+            # For most US counties, this is 3-8% (BLS county unemployment data).
+            # We use the QCEW employment density as a proxy indicator.
+            # Counties with higher employment density tend toward lower natural rates.
+            result[fips]["sigmoid_r0"] = 0.05  # BLS national average proxy
+
+    logger.info("Hydrated reserve army for %d counties/%d", len(unique_fips), year)
+    return result
+
 
 def hydrate_reserve_army(
     fips: str,
@@ -556,77 +730,29 @@ def hydrate_reserve_army(
     Returns:
         Dict with key sigmoid_r0 if derivable. Empty dict otherwise.
     """
-    result: dict[str, float] = {}
-
-    try:
-        with get_reference_session() as session:
-            from sqlalchemy import func
-
-            from babylon.reference.schema import (
-                DimCounty,
-                DimIndustry,
-                DimTime,
-                FactQcewAnnual,
-            )
-
-            county = session.execute(
-                select(DimCounty).where(DimCounty.fips == fips)
-            ).scalar_one_or_none()
-            if county is None:
-                return result
-
-            time_dim = session.execute(
-                select(DimTime).where(DimTime.year == year, DimTime.is_annual.is_(True))
-            ).scalar_one_or_none()
-            if time_dim is None:
-                return result
-
-            # Get total employment for the county
-            emp_result = session.execute(
-                select(func.sum(FactQcewAnnual.employment).label("total_emp"))
-                .join(DimIndustry, FactQcewAnnual.industry_id == DimIndustry.industry_id)
-                .where(
-                    FactQcewAnnual.county_id == county.county_id,
-                    FactQcewAnnual.time_id == time_dim.time_id,
-                    DimIndustry.naics_level == 6,
-                )
-            ).scalar()
-
-            if emp_result and emp_result > 0:
-                # Derive unemployment proxy from labor force participation
-                # QCEW doesn't directly report unemployment, but county-level
-                # employment relative to population gives us a proxy.
-                # The sigmoid_r0 parameter represents the natural unemployment rate.
-                # For most US counties, this is 3-8% (BLS county unemployment data).
-                # We use the QCEW employment density as a proxy indicator.
-                # Counties with higher employment density tend toward lower natural rates.
-                result["sigmoid_r0"] = 0.05  # BLS national average proxy
-
-            logger.info("Hydrated reserve army for %s/%d: %s", fips, year, result)
-            return result
-
-    except Exception:
-        logger.warning(
-            "Error hydrating reserve army for %s/%d",
-            fips,
-            year,
-            exc_info=True,
-        )
-        return result
+    return hydrate_reserve_army_bulk([fips], year)[fips]
 
 
 def hydrate_territories(
     fips_codes: list[str],
     year: int = 2022,
+    *,
+    session: Session | None = None,
+    hydrator: MarxianHydrator | None = None,
 ) -> tuple[dict[str, TerritoryState], dict[str, HexState]]:
     """Hydrate territories from SQLite reference database.
 
     This is the main entry point for initializing simulation state from
-    the reference database.
+    the reference database. County metadata, hex claims and the QCEW
+    rows behind every county's profit rate are each read with set-based
+    queries over one session.
 
     Args:
         fips_codes: List of 5-digit FIPS codes for counties to hydrate.
         year: Data year for QCEW/BEA data (default 2022).
+        session: Optional existing session. If None, creates a new one.
+        hydrator: Optional MarxianHydrator on ``session``, already
+            prefetched for ``year``. If None, builds one.
 
     Returns:
         Tuple of (territories, hexes):
@@ -643,44 +769,54 @@ def hydrate_territories(
     # Deduplicate while preserving order
     unique_fips = list(dict.fromkeys(fips_codes))
 
-    with get_reference_session() as session:
+    territories: dict[str, TerritoryState] = {}
+    all_hexes: dict[str, HexState] = {}
+
+    def _query(sess: Session) -> None:
         # Step 1: Fetch county metadata
-        counties = query_counties(unique_fips, session)
+        counties = query_counties(unique_fips, sess)
 
         # Step 2: Fetch H3 cells
         county_ids = [counties[fips].county_id for fips in unique_fips]
-        hex_claims_by_county = query_hex_claims(county_ids, session)
-
-    # Step 3: Compute profit rates and build territories
-    territories: dict[str, TerritoryState] = {}
-    all_hexes: dict[str, HexState] = {}
+        hex_claims_by_county = query_hex_claims(county_ids, sess)
 
-    for fips in unique_fips:
-        county = counties[fips]
-        hex_indices = hex_claims_by_county.get(county.county_id, set())
-
-        # Compute initial profit_rate from QCEW/BEA
-        try:
-            initial_r = compute_initial_profit_rate(fips, year)
-        except ValueError as e:
-            logger.error("Failed to compute profit_rate for %s: %s", fips, e)
-            raise
-
-        # Create TerritoryState
-        territory = TerritoryState(
-            territory_id=fips,
-            controlling_polity=fips,  # MVP: controlling_polity = territory_id
-            hex_claims=frozenset(hex_indices),
-            tick=0,
-            profit_rate=initial_r,
-            equilibrium_r=initial_r,  # Territory-specific equilibrium
+        # Step 3: Compute profit rates and build territories
+        county_hydrator = (
+            hydrator if hydrator is not None else _marxian_hydrator(sess, unique_fips, (year,))
         )
-        territories[fips] = territory
 
-        # Create HexState for each hex
-        for h3_idx in hex_indices:
-            if h3_idx not in all_hexes:
-                all_hexes[h3_idx] = HexState(h3_index=h3_idx)
+        for fips in unique_fips:
+            county = counties[fips]
+            hex_indices = hex_claims_by_county.get(county.county_id, set())
+
+            # Compute initial profit_rate from QCEW/BEA
+            try:
+                initial_r = _profit_rate(county_hydrator, fips, year)
+            except ValueError as e:
+                logger.error("Failed to compute profit_rate for %s: %s", fips, e)
+                raise
+
+            # Create TerritoryState
+            territory = TerritoryState(
+                territory_id=fips,
+                controlling_polity=fips,  # MVP: controlling_polity = territory_id
+                hex_claims=frozenset(hex_indices),
+                tick=0,
+                profit_rate=initial_r,
+                equilibrium_r=initial_r,  # Territory-specific equilibrium
+            )
+            territories[fips] = territory
+
+            # Create HexState for each hex
+            for h3_idx in hex_indices:
+                if h3_idx not in all_hexes:
+                    all_hexes[h3_idx] = HexState(h3_index=h3_idx)
+
+    if session is not None:
+        _query(session)
+    else:
+        with get_reference_session() as sess:
+            _query(sess)
 
     logger.info(
         "Hydrated %d territories with %d total hex cells",
@@ -694,59 +830,53 @@ def hydrate_territories(
 def hydrate_industry_hyperedges(
     fips_codes: list[str],
     year: int = 2022,
+    *,
+    session: Session | None = None,
+    dept_mapper: DepartmentMapper | None = None,
 ) -> dict[str, IndustryHyperedge]:
     """Hydrate industry hyperedges from SQLite reference database.
 
     Args:
         fips_codes: List of 5-digit FIPS codes for counties.
         year: Data year for QCEW/BEA data (default 2022).
+        session: Optional existing session. If None, creates a new one.
+        dept_mapper: Optional parsed department mapping. If None, parses
+            the bundled NAICS-to-department YAML.
 
     Returns:
         Dict mapping industry ID (e.g. ind_62) to IndustryHyperedge.
     """
-    from pathlib import Path
+    from sqlalchemy import func
 
-    from sqlalchemy import func, select
-
-    from babylon.domain.economics.department_mapper import DepartmentMapper
     from babylon.models.entities.industry import IndustryHyperedge
     from babylon.reference.database import get_reference_session
-    from babylon.reference.schema import (
-        DimCounty,
-        DimIndustry,
-        DimTime,
-        FactQcewAnnual,
-    )
-
-    economics_path = (
-        Path(__file__).parent.parent.parent / "domain" / "economics" / "data" / "naics_to_dept.yaml"
-    )
+    from babylon.reference.schema import DimIndustry, DimTime, FactQcewAnnual
 
     industries: dict[str, IndustryHyperedge] = {}
 
     if not fips_codes:
         return industries
 
-    with get_reference_session() as session:
-        dept_mapper = DepartmentMapper.from_yaml(economics_path)
+    mapper = dept_mapper if dept_mapper is not None else _department_mapper()
 
+    def _query(sess: Session) -> None:
         # Get relevant counties
         counties = (
-            session.execute(select(DimCounty).where(DimCounty.fips.in_(fips_codes))).scalars().all()
+            sess.execute(select(DimCounty).where(DimCounty.fips.in_(fips_codes))).scalars().all()
         )
         county_ids = [c.county_id for c in counties]
         if not county_ids:
-            return industries
+            return
 
         # Get time dimension
-        time_dim = session.execute(
+        time_dim = sess.execute(
             select(DimTime).where(DimTime.year == year, DimTime.is_annual.is_(True))
         ).scalar_one_or_none()
         if time_dim is None:
-            return industries
+            return
 
         # We will aggregate QCEW at 2-digit NAICS level
-        results = session.execute(
+        results = sess.execute(
             select(
                 DimIndustry.naics_code,
                 DimIndustry.industry_title,
@@ -769,14 +899,14 @@ def hydrate_industry_hyperedges(
             wages = float(r.wages or 0.0)
 
             # Map departments
-            alloc = dept_mapper.get_allocation(naics_2digit)
+            alloc = mapper.get_allocation(naics_2digit)
             if alloc:
                 weights = alloc.to_dict()
             else:
                 weights = {"dept_I": 0.0, "dept_IIa": 0.0, "dept_IIb": 0.0, "dept_III": 0.0}
 
-            cv_ratio = dept_mapper.get_sector_cv_ratio(naics_2digit) or 1.0
-            sv_ratio = dept_mapper.get_sector_sv_ratio(naics_2digit) or 1.0
+            cv_ratio = mapper.get_sector_cv_ratio(naics_2digit) or 1.0
+            sv_ratio = mapper.get_sector_sv_ratio(naics_2digit) or 1.0
 
             # approximate occ and profit rate
             occ = cv_ratio
@@ -794,6 +924,12 @@ def hydrate_industry_hyperedges(
             )
             industries[f"ind_{naics_2digit}"] = ind
 
+    if session is not None:
+        _query(session)
+    else:
+        with get_reference_session() as sess:
+            _query(sess)
+
     return industries
 
 
@@ -801,9 +937,12 @@ __all__ = [
     "CountyInfo",
     "compute_initial_profit_rate",
     "hydrate_class_shares",
+    "hydrate_class_shares_bulk",
     "hydrate_economy_constants",
+    "hydrate_economy_constants_bulk",
     "hydrate_industry_hyperedges",
     "hydrate_reserve_army",
+    "hydrate_reserve_army_bulk",
     "hydrate_territories",
     "query_counties",
     "query_hex_claims",
@@ -0,0 +1,313 @@
+"""Content-addressed warm-start cache for hydrated scenarios.
+
+:meth:`~babylon.engine.simulation.Simulation.from_sqlite` spends its
+startup reading the reference SQLite: territories and hex claims, a
+MarxianHydrator tensor per county-year, Tier A constants, industry
+hyperedges. Optimization campaigns and test suites start thousands of
+runs from the same initial conditions, and every one of them repeats
+that work. :class:`WarmStartCache` stores the hydrated result — a
+:class:`HydratedScenario` — once, and later runs of the same scenario
+load it instead of touching the reference DB.
+
+An entry is addressed by :func:`scenario_key`: the SHA-256 of the
+reference database file, the scenario configuration (counties in order,
+year, tensor years), the canonical ``GameDefines`` the caller passed in,
+and the code that produced the entry (``babylon.__version__`` plus a
+digest of the :data:`_HYDRATION_MODULES` sources). Any change to any of
+them is a different key, never a stale hit. The key also carries the
+interpreter cache tag and a format version, because entries are pickles.
+
+The cache is best-effort, like the parse cache in
+:mod:`babylon.sentinels._ast`: an unreadable entry is a miss and an
+unwritable directory skips the write, both logged at warning level.
+Writes are published with ``os.replace``, so concurrent workers sharing
+one root never read a partial entry.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+import babylon
+from babylon.domain.economics.tensor import NoDataSentinel
+
+if TYPE_CHECKING:
+    from babylon.config.defines import GameDefines
+    from babylon.domain.economics.tensor import ValueTensor4x3
+    from babylon.domain.economics.tensor_registry import TensorRegistry
+    from babylon.models.entities.industry import IndustryHyperedge
+    from babylon.models.snapshots import HexState, TerritoryState
+
+logger = logging.getLogger(__name__)
+
+#: Bump when :class:`HydratedScenario`'s shape changes.
+_FORMAT_VERSION: Final[int] = 1
+
+_SUFFIX: Final[str] = ".pickle"
+
+#: Modules whose source decides what a hydration produces or how its
+#: entries unpickle; their digest is part of every key.
+_HYDRATION_MODULES: Final[tuple[str, ...]] = (
+    "babylon.domain.economics.adapters",
+    "babylon.domain.economics.department_mapper",
+    "babylon.domain.economics.hydrator",
+    "babylon.domain.economics.tensor",
+    "babylon.domain.economics.tensor_registry",
+    "babylon.engine.hydration.reference",
+    "babylon.engine.hydration.warm_start",
+    "babylon.engine.simulation._legacy",
+    "babylon.models.entities.industry",
+    "babylon.models.snapshots",
+)
+
+# Errors a missing, truncated, corrupt or outdated pickle raises on load.
+_LOAD_ERRORS: Final = (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError)
+
+# (path, size, mtime_ns) -> sha256, so a process hashes the DB once.
+_DB_DIGESTS: dict[tuple[str, int, int], str] = {}
+_DB_DIGESTS_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class HydratedScenario:
+    """Everything ``Simulation.from_sqlite`` reads from the reference DB.
+
+    Attributes:
+        territories: TerritoryState per FIPS.
+        hexes: HexState per H3 index.
+        industries: IndustryHyperedge per industry id.
+        defines: GameDefines with the Tier A constants applied.
+        tensors: Registry entries per ``(fips, year)``, failures included
+            as their :class:`NoDataSentinel`.
+    """
+
+    territories: dict[str, TerritoryState]
+    hexes: dict[str, HexState]
+    industries: dict[str, IndustryHyperedge]
+    defines: GameDefines
+    tensors: dict[tuple[str, int], ValueTensor4x3 | NoDataSentinel]
+
+    @staticmethod
+    def capture_tensors(
+        registry: TensorRegistry,
+        fips_codes: Sequence[str],
+        years: Sequence[int],
+    ) -> dict[tuple[str, int], ValueTensor4x3 | NoDataSentinel]:
+        """Snapshot the registry entries a hydration run loaded.
+
+        Args:
+            registry: The freshly hydrated registry.
+            fips_codes: Counties it was hydrated for.
+            years: Years it was hydrated for (out-of-range years are
+                skipped, as :meth:`TensorRegistry.hydrate_counties` does).
+
+        Returns:
+            Entry per ``(fips, year)``.
+        """
+        return {
+            (fips, year): registry.get(fips, year)
+            for fips in dict.fromkeys(fips_codes)
+            for year in years
+            if registry.MIN_YEAR <= year <= registry.MAX_YEAR
+        }
+
+    def restore_tensors(self, registry: TensorRegistry) -> None:
+        """Load :attr:`tensors` into ``registry``.
+
+        Args:
+            registry: An empty registry.
+        """
+        for (fips, year), entry in self.tensors.items():
+            if isinstance(entry, NoDataSentinel):
+                registry.put_sentinel(fips, year, entry.reason)
+            else:
+                registry.put(fips, year, entry)
+
+
+def reference_db_digest(path: Path) -> str:
+    """SHA-256 of the reference database file, memoized per process.
+
+    The memo is keyed by path, size and modification time, so a rebuilt
+    database is re-hashed.
+
+    Args:
+        path: The reference SQLite file.
+
+    Returns:
+        64-char lowercase hex digest.
+    """
+    stat = path.stat()
+    memo_key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+    with _DB_DIGESTS_LOCK:
+        digest = _DB_DIGESTS.get(memo_key)
+    if digest is None:
+        with path.open("rb") as fh:
+            digest = hashlib.file_digest(fh, "sha256").hexdigest()
+        with _DB_DIGESTS_LOCK:
+            _DB_DIGESTS[memo_key] = digest
+    return digest
+
+
+@functools.cache
+def hydration_code_digest() -> str:
+    """SHA-256 over the sources of :data:`_HYDRATION_MODULES`, once per process.
+
+    Returns:
+        64-char lowercase hex digest.
+    """
+    digest = hashlib.sha256()
+    for name in _HYDRATION_MODULES:
+        spec = importlib.util.find_spec(name)
+        if spec is None or spec.origin is None:
+            raise RuntimeError(f"hydration module {name} has no source to hash")
+        digest.update(name.encode("utf-8"))
+        digest.update(Path(spec.origin).read_bytes())
+    return digest.hexdigest()
+
+
+def scenario_key(
+    *,
+    reference_digest: str,
+    fips_codes: Sequence[str],
+    year: int,
+    years: Sequence[int] | None,
+    defines: GameDefines,
+) -> str:
+    """Content address of one hydrated scenario.
+
+    Args:
+        reference_digest: :func:`reference_db_digest` of the reference DB.
+        fips_codes: Counties, in caller order (the first is the Tier A
+            primary county).
+        year: Data year.
+        years: Tensor years, or ``None`` for ``[year]``.
+        defines: The GameDefines passed in, before Tier A overrides.
+
+    Returns:
+        64-char lowercase SHA-256 hex digest.
+    """
+    canonical = json.dumps(
+        {
+            "format": _FORMAT_VERSION,
+            "python": sys.implementation.cache_tag,
+            "babylon": babylon.__version__,
+            "code": hydration_code_digest(),
+            "reference_db": reference_digest,
+            "scenario": {
+                "fips_codes": list(fips_codes),
+                "year": year,
+                "years": None if years is None else list(years),
+            },
+            "defines": defines.model_dump(mode="json"),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class WarmStartCache:
+    """Directory of pickled :class:`HydratedScenario` entries, one per key.
+
+    Args:
+        root: Cache directory (created on first write).
+        reference_db: Reference SQLite file whose digest goes into every
+            key (default: the configured normalized database).
+    """
+
+    def __init__(self, root: Path, reference_db: Path | None = None) -> None:
+        if reference_db is None:
+            from babylon.reference.database import NORMALIZED_DB_PATH
+
+            reference_db = NORMALIZED_DB_PATH
+        self._root = Path(root)
+        self._reference_db = Path(reference_db)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def key(
+        self,
+        *,
+        fips_codes: Sequence[str],
+        year: int,
+        years: Sequence[int] | None,
+        defines: GameDefines,
+    ) -> str:
+        """:func:`scenario_key` against this cache's reference database."""
+        return scenario_key(
+            reference_digest=reference_db_digest(self._reference_db),
+            fips_codes=fips_codes,
+            year=year,
+            years=years,
+            defines=defines,
+        )
+
+    def get(self, key: str) -> HydratedScenario | None:
+        """Return the scenario stored under ``key``, or ``None`` on a miss.
+
+        An entry that exists but cannot be loaded is logged and treated as a
+        miss, so the caller re-hydrates (and overwrites it).
+        """
+        path = self._path(key)
+        try:
+            scenario = pickle.loads(path.read_bytes())  # noqa: S301 - our own cache
+        except FileNotFoundError:
+            return None
+        except _LOAD_ERRORS as exc:
+            logger.warning("Warm-start entry %s is unreadable, re-hydrating: %s", path, exc)
+            return None
+        if not isinstance(scenario, HydratedScenario):
+            logger.warning(
+                "Warm-start entry %s holds %s, not a HydratedScenario; re-hydrating",
+                path,
+                type(scenario).__name__,
+            )
+            return None
+        return scenario
+
+    def put(self, key: str, scenario: HydratedScenario) -> None:
+        """Atomically publish ``scenario`` under ``key``.
+
+        A failed write is logged and skipped: the run already holds the
+        hydrated scenario, the cache only saves the next one.
+        """
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(pickle.dumps(scenario, protocol=pickle.HIGHEST_PROTOCOL))
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except (OSError, TypeError, pickle.PicklingError) as exc:
+            logger.warning("Warm-start entry %s not written: %s", path, exc)
+
+    def _path(self, key: str) -> Path:
+        return self._root / f"{key}{_SUFFIX}"
+
+
+__all__ = [
+    "HydratedScenario",
+    "WarmStartCache",
+    "hydration_code_digest",
+    "reference_db_digest",
+    "scenario_key",
+]
@@ -5,7 +5,8 @@ coefficients against simulation outcomes: parameter injection/introspection
 (:mod:`.params`, ADR038), a backend-agnostic trial result
 (:mod:`.backends.types`), two execution backends — the Postgres-backed
 headless runner and the fast in-memory legacy engine (:mod:`.backends`) —
-dispatched through one entry point (:mod:`.runner_api`), a unified
+dispatched through one entry point (:mod:`.runner_api`), a trial scheduler
+that fans those trials out over worker processes (:mod:`.scheduler`), a unified
 override/range grammar (:mod:`.ranges`), objective functions including the
 Carceral Equilibrium scorer (:mod:`.objectives`), and a reproducibility
 receipt for replaying any trial (:mod:`.reproducibility`).
@@ -43,6 +44,7 @@ from babylon.engine.optimization.params import (
 )
 from babylon.engine.optimization.reproducibility import ReproRecord
 from babylon.engine.optimization.runner_api import run
+from babylon.engine.optimization.scheduler import TrialScheduler, TrialSettings, TrialSpec
 from babylon.engine.optimization.sweep import run_sweep
 
 run_sensitivity: Callable[..., Any] | None
@@ -60,6 +62,9 @@ except ImportError:  # pragma: no cover - exercised only without the dev group i
 __all__ = [
     "Result",
     "run",
+    "TrialScheduler",
+    "TrialSettings",
+    "TrialSpec",
     "inject_parameter",
     "inject_parameters",
     "get_tunable_parameters",
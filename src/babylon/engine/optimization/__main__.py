@@ -8,7 +8,12 @@ module's single ``run_*`` entry point (:func:`~babylon.engine.optimization.sweep
 :func:`~babylon.engine.optimization.bayesian.run_bayesian`). Every subcommand
 shares a ``--backend {headless,in-memory}`` flag (translated to the
 ``"headless"``/``"in_memory"`` strings :func:`~babylon.engine.optimization.runner_api.run`
-expects); ``sweep``'s ``--param``/``--param2`` and ``monte-carlo``'s repeated
+expects) and a ``--workers N`` flag (trial worker processes, via
+:class:`~babylon.engine.optimization.scheduler.TrialScheduler`). ``sweep`` and
+``sensitivity`` also take ``--fork-at K``, which applies the varied
+coefficients from tick ``K + 1``, so the base-defines warm-up runs once per
+seed and every trial forks from it. ``sweep``'s
+``--param``/``--param2`` and ``monte-carlo``'s repeated
 ``--param`` are validated eagerly through
 :mod:`~babylon.engine.optimization.ranges` so a malformed spec fails at the
 CLI boundary with a clean usage error, not deep inside a trial.
@@ -116,6 +121,70 @@ def _add_scope_scenario_args(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _positive_int(raw: str) -> int:
+    """Argparse ``type=`` validator for a count that must be at least 1.
+
+    :param raw: Raw flag value.
+    :returns: The parsed integer.
+    :raises argparse.ArgumentTypeError: If ``raw`` is not an integer >= 1.
+    """
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {raw!r}") from exc
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return value
+
+
+def _add_workers_arg(parser: argparse.ArgumentParser) -> None:
+    """Add the shared ``--workers`` flag to a subcommand parser.
+
+    :param parser: Subcommand parser to attach the flag to.
+    """
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=None,
+        metavar="N",
+        help="Trial worker processes. Results are identical for any N. Default: 1 (sequential).",
+    )
+
+
+def _non_negative_int(raw: str) -> int:
+    """Argparse ``type=`` validator for a count that may be 0.
+
+    :param raw: Raw flag value.
+    :returns: The parsed integer.
+    :raises argparse.ArgumentTypeError: If ``raw`` is not an integer >= 0.
+    """
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {raw!r}") from exc
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {value}")
+    return value
+
+
+def _add_fork_at_arg(parser: argparse.ArgumentParser) -> None:
+    """Add the shared ``--fork-at`` flag to a subcommand parser.
+
+    :param parser: Subcommand parser to attach the flag to.
+    """
+    parser.add_argument(
+        "--fork-at",
+        type=_non_negative_int,
+        default=None,
+        metavar="K",
+        help=(
+            "Warm-up ticks run with the base defines; the varied coefficients take effect "
+            "from tick K+1 and every trial forks from the shared warm-up (backend=in-memory "
+            "only). Default: 0 (off)."
+        ),
+    )
+
+
 def _add_objective_arg(parser: argparse.ArgumentParser) -> None:
     """Add the shared ``--objective`` flag to a subcommand parser.
 
@@ -159,6 +228,8 @@ def _add_sweep_subparser(subparsers: argparse._SubParsersAction[argparse.Argumen
         "--seed", type=int, default=None, help="RNG seed threaded through every trial."
     )
     _add_backend_arg(parser)
+    _add_workers_arg(parser)
+    _add_fork_at_arg(parser)
     _add_scope_scenario_args(parser)
     _add_objective_arg(parser)
     parser.add_argument(
@@ -205,6 +276,7 @@ def _add_monte_carlo_subparser(
     )
     parser.add_argument("--max-ticks", type=int, default=None, help="Maximum ticks per sample.")
     _add_backend_arg(parser)
+    _add_workers_arg(parser)
     _add_scope_scenario_args(parser)
     _add_objective_arg(parser)
     parser.add_argument("--csv-path", type=Path, default=None, help="Output CSV path.")
@@ -259,6 +331,8 @@ def _add_sensitivity_subparser(
         "--seed", type=int, default=None, help="RNG seed threaded through every trial."
     )
     _add_backend_arg(parser)
+    _add_workers_arg(parser)
+    _add_fork_at_arg(parser)
     _add_scope_scenario_args(parser)
     _add_objective_arg(parser)
     parser.add_argument(
@@ -305,6 +379,7 @@ def _add_bayesian_subparser(
     )
     parser.add_argument("--max-ticks", type=int, default=None, help="Maximum ticks per trial.")
     _add_backend_arg(parser)
+    _add_workers_arg(parser)
     parser.add_argument(
         "--seed", type=int, default=None, help="RNG seed threaded into every trial."
     )
@@ -363,7 +438,15 @@ def _dispatch_sweep(args: argparse.Namespace) -> int:
     :returns: Process exit code.
     """
     kwargs = _kwargs_from(
-        args, "param2", "max_ticks", "seed", "scope_name", "scenario", "output_csv"
+        args,
+        "param2",
+        "max_ticks",
+        "seed",
+        "scope_name",
+        "scenario",
+        "output_csv",
+        "workers",
+        "fork_at",
     )
     if args.backend is not None:
         kwargs["backend"] = _BACKEND_TRANSLATION[args.backend]
@@ -388,6 +471,7 @@ def _dispatch_monte_carlo(args: argparse.Namespace) -> int:
         "scenario",
         "csv_path",
         "report_path",
+        "workers",
     )
     if args.seed is not None:
         kwargs["base_seed"] = args.seed
@@ -422,6 +506,8 @@ def _dispatch_sensitivity(args: argparse.Namespace) -> int:
         "output_dir",
         "morris_output",
         "sobol_output",
+        "workers",
+        "fork_at",
     )
     if args.param_names is not None:
         kwargs["param_names"] = [p.strip() for p in args.param_names.split(",") if p.strip()]
@@ -445,7 +531,7 @@ def _dispatch_bayesian(args: argparse.Namespace) -> int:
             "Bayesian tuning requires optuna, which is not installed. "
             "Install the dev dependency group: `uv sync`."
         )
-    kwargs = _kwargs_from(args, "study_name", "storage", "n_trials", "max_ticks", "seed")
+    kwargs = _kwargs_from(args, "study_name", "storage", "n_trials", "max_ticks", "seed", "workers")
     if args.backend is not None:
         kwargs["backend"] = _BACKEND_TRANSLATION[args.backend]
     if args.categories is not None:
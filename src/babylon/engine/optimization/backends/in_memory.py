@@ -15,10 +15,23 @@ Track-A phase-milestone detection is real here (not a documented gap as in
 the headless backend) — ``WorldState.events`` is per-tick, not cumulative
 (a tick with no events is ``[]``), so milestones are accumulated across the
 loop in this module, first-occurrence only.
+
+Trials can also fork from a shared prefix. :func:`snapshot_in_memory` runs
+the loop to tick ``K`` and freezes what it carries between ticks: the
+immutable ``WorldState``, the ``persistent_context`` image and the
+milestone/tension accumulators. ``run_in_memory(start_from=...)`` then
+continues from that snapshot instead of tick 0. A snapshot is never
+mutated (each fork deep-copies the context it will mutate, and the
+``WorldState`` event log forks on extension), so one snapshot can seed any
+number of trials. A fork runs ticks ``<= K`` with the snapshot's defines
+and later ticks with its own; :mod:`babylon.engine.optimization.scheduler`
+uses this to schedule overrides from a ``diverge_at`` tick.
 """
 
 from __future__ import annotations
 
+import copy
+from dataclasses import dataclass
 from typing import Any
 
 from babylon.config.defines import GameDefines
@@ -37,12 +50,35 @@ _MILESTONE_EVENT_TYPES: dict[str, EventType] = {
 
 _SCENARIO_FACTORIES = ("imperial_circuit", "two_node")
 
+# Built scenarios, per process. All three parts are frozen models, so every
+# trial in the process starts from the same build (as forks share a snapshot).
+_SCENARIOS: dict[str, tuple[Any, Any, GameDefines]] = {}
+
 
 def _build_scenario(scenario: str) -> tuple[Any, Any, GameDefines]:
     """Resolve a scenario name to its ``(WorldState, SimulationConfig, GameDefines)``.
 
+    Built once per process and reused.
+
+    :raises ValueError: If ``scenario`` is not a recognized name.
+    """
+    built = _SCENARIOS.get(scenario)
+    if built is None:
+        built = _SCENARIOS[scenario] = _create_scenario(scenario)
+    return built
+
+
+def warm_scenario(scenario: str) -> None:
+    """Build ``scenario`` into this process's cache ahead of the first trial.
+
+    :param scenario: One of ``"imperial_circuit"`` or ``"two_node"``.
     :raises ValueError: If ``scenario`` is not a recognized name.
     """
+    _build_scenario(scenario)
+
+
+def _create_scenario(scenario: str) -> tuple[Any, Any, GameDefines]:
+    """Call the factory for ``scenario``; see :func:`_build_scenario`."""
     if scenario == "imperial_circuit":
         from babylon.engine.scenarios import create_imperial_circuit_scenario
 
@@ -83,11 +119,118 @@ def _scan_tick_events(
     return terminal_outcome
 
 
+@dataclass(frozen=True)
+class InMemorySnapshot:
+    """One in-memory trial's loop state after ``tick`` ticks.
+
+    :ivar scenario: Scenario the trial was built from.
+    :ivar seed: The trial's RNG seed (already on ``sim_config``).
+    :ivar tick: Ticks completed.
+    :ivar state: ``WorldState`` after ``tick`` ticks (immutable, shared).
+    :ivar sim_config: The seeded ``SimulationConfig``.
+    :ivar persistent_context: Cross-tick context image. Never mutated; each
+        fork deep-copies it.
+    :ivar phase_milestones: First-occurrence milestone ticks so far.
+    :ivar terminal_outcome: Terminal outcome so far, if any.
+    :ivar max_tension: Maximum EXPLOITATION tension so far.
+    :ivar died: Whether the periphery worker has already died.
+    """
+
+    scenario: str
+    seed: int
+    tick: int
+    state: Any
+    sim_config: Any
+    persistent_context: dict[str, Any]
+    phase_milestones: dict[str, int | None]
+    terminal_outcome: str | None
+    max_tension: float
+    died: bool
+
+
+def _initial_snapshot(scenario: str, seed: int) -> InMemorySnapshot:
+    """Tick-0 loop state for ``scenario`` seeded with ``seed``."""
+    state, sim_config, _base_defines = _build_scenario(scenario)
+    return InMemorySnapshot(
+        scenario=scenario,
+        seed=seed,
+        tick=0,
+        state=state,
+        sim_config=sim_config.model_copy(update={"rng_seed": seed}),
+        persistent_context={},
+        phase_milestones=dict.fromkeys(_MILESTONE_EVENT_TYPES),
+        terminal_outcome=None,
+        max_tension=_max_exploitation_tension(state),
+        died=False,
+    )
+
+
+def _advance(snapshot: InMemorySnapshot, defines: GameDefines, until_tick: int) -> InMemorySnapshot:
+    """Run ``snapshot`` forward to ``until_tick`` (or death); ``snapshot`` is unchanged."""
+    from babylon.engine.services import ServiceContainer
+    from babylon.engine.simulation_engine import step
+
+    # One container for the whole loop: step() only clears its per-tick
+    # transients instead of rebuilding the registries every tick.
+    services = ServiceContainer.create(snapshot.sim_config, defines)
+    state = snapshot.state
+    persistent_context = copy.deepcopy(snapshot.persistent_context)
+    phase_milestones = dict(snapshot.phase_milestones)
+    terminal_outcome = snapshot.terminal_outcome
+    max_tension = snapshot.max_tension
+    ticks_survived = snapshot.tick
+    died = snapshot.died
+
+    for tick in range(snapshot.tick + 1, until_tick + 1):
+        if died:
+            break
+        state = step(state, snapshot.sim_config, persistent_context, defines, services=services)
+        ticks_survived = tick
+        max_tension = max(max_tension, _max_exploitation_tension(state))
+        terminal_outcome = _scan_tick_events(state.events, phase_milestones, terminal_outcome)
+
+        periphery_worker = state.entities.get(PERIPHERY_WORKER_ID)
+        if periphery_worker is not None and not periphery_worker.active:
+            died = True
+
+    return InMemorySnapshot(
+        scenario=snapshot.scenario,
+        seed=snapshot.seed,
+        tick=ticks_survived,
+        state=state,
+        sim_config=snapshot.sim_config,
+        persistent_context=persistent_context,
+        phase_milestones=phase_milestones,
+        terminal_outcome=terminal_outcome,
+        max_tension=max_tension,
+        died=died,
+    )
+
+
+def snapshot_in_memory(
+    defines: GameDefines,
+    seed: int,
+    tick: int,
+    scenario: str = "imperial_circuit",
+) -> InMemorySnapshot:
+    """Run a trial's first ``tick`` ticks once and freeze its loop state.
+
+    :param defines: ``GameDefines`` for the shared prefix.
+    :param seed: RNG seed every fork continues with.
+    :param tick: Ticks to run before snapshotting (fewer on early death).
+    :param scenario: One of ``"imperial_circuit"`` or ``"two_node"``.
+    :returns: Snapshot to pass as ``run_in_memory(start_from=...)``.
+    """
+    return _advance(_initial_snapshot(scenario, seed), defines, tick)
+
+
 def run_in_memory(
     defines: GameDefines,
     seed: int,
     max_ticks: int,
     scenario: str = "imperial_circuit",
+    *,
+    start_from: InMemorySnapshot | None = None,
 ) -> Result:
     """Run one trial via the fast in-memory legacy engine path.
 
@@ -102,39 +245,31 @@ def run_in_memory(
         process-global ``random`` module either way.
     :param max_ticks: Maximum ticks to run before declaring survival.
     :param scenario: One of ``"imperial_circuit"`` or ``"two_node"``.
+    :param start_from: Continue from this :func:`snapshot_in_memory` prefix
+        instead of tick 0. Must match ``seed`` and ``scenario`` and sit at or
+        before ``max_ticks``.
     :returns: Backend-normalized :class:`Result`.
+    :raises ValueError: If ``start_from`` cannot seed this trial.
     """
     from babylon.engine.headless_runner.runner import _defines_hash
-    from babylon.engine.simulation_engine import step
-
-    state, sim_config, _base_defines = _build_scenario(scenario)
-    sim_config = sim_config.model_copy(update={"rng_seed": seed})
-    persistent_context: dict[str, Any] = {}
-
-    phase_milestones: dict[str, int | None] = dict.fromkeys(_MILESTONE_EVENT_TYPES)
-    terminal_outcome: str | None = None
-    max_tension = _max_exploitation_tension(state)
-    ticks_survived = 0
-    died = False
 
-    for tick in range(1, max_ticks + 1):
-        state = step(state, sim_config, persistent_context, defines)
-        ticks_survived = tick
-        max_tension = max(max_tension, _max_exploitation_tension(state))
-        terminal_outcome = _scan_tick_events(state.events, phase_milestones, terminal_outcome)
-
-        periphery_worker = state.entities.get(PERIPHERY_WORKER_ID)
-        if periphery_worker is not None and not periphery_worker.active:
-            died = True
-            break
+    if start_from is None:
+        start_from = _initial_snapshot(scenario, seed)
+    elif (start_from.seed, start_from.scenario) != (seed, scenario) or start_from.tick > max_ticks:
+        raise ValueError(
+            f"Snapshot (seed={start_from.seed}, scenario={start_from.scenario!r}, "
+            f"tick={start_from.tick}) cannot seed trial (seed={seed}, "
+            f"scenario={scenario!r}, max_ticks={max_ticks})"
+        )
+    final = _advance(start_from, defines, max_ticks)
 
     return Result(
-        ticks_survived=ticks_survived,
-        outcome="DIED" if died else "SURVIVED",
-        max_tension=max_tension,
-        final_wealth=sum(float(e.wealth) for e in state.entities.values()),
-        phase_milestones=phase_milestones,
-        terminal_outcome=terminal_outcome,
+        ticks_survived=final.tick,
+        outcome="DIED" if final.died else "SURVIVED",
+        max_tension=final.max_tension,
+        final_wealth=sum(float(e.wealth) for e in final.state.entities.values()),
+        phase_milestones=final.phase_milestones,
+        terminal_outcome=final.terminal_outcome,
         defines_hash=_defines_hash(defines),
         rng_seed=seed,
         backend="in_memory",
@@ -142,4 +277,4 @@ def run_in_memory(
     )
 
 
-__all__ = ["run_in_memory"]
+__all__ = ["InMemorySnapshot", "run_in_memory", "snapshot_in_memory", "warm_scenario"]
@@ -45,6 +45,7 @@ from babylon.engine.optimization.params import (
     inject_parameters,
 )
 from babylon.engine.optimization.runner_api import run as run_trial
+from babylon.engine.optimization.scheduler import TrialScheduler, TrialSettings, TrialSpec
 
 try:
     import optuna
@@ -222,6 +223,7 @@ def create_objective(
     max_ticks: int,
     backend: str,
     seed: int,
+    scheduler: TrialScheduler | None = None,
 ) -> Any:
     """Build an Optuna objective closed over one trial configuration.
 
@@ -233,6 +235,11 @@ def create_objective(
     :param seed: RNG seed threaded into every trial (Constitution III.7 —
         every trial is independently reproducible given its sampled
         parameters, this seed, and this backend).
+    :param scheduler: When given, each trial's simulation runs on this
+        :class:`~babylon.engine.optimization.scheduler.TrialScheduler`
+        (built over ``GameDefines()`` and this configuration) instead of
+        in the calling thread — the parallel path Optuna's ``n_jobs``
+        threads share.
     :returns: A callable compatible with ``optuna.Study.optimize``.
     :raises ImportError: If Optuna is not installed.
     """
@@ -250,14 +257,17 @@ def create_objective(
             intermediate-value pruner decides this trial is not competitive.
         """
         params = _sample_params(trial, search_space)
-        defines = inject_parameters(GameDefines(), params)
 
         # Infrastructure-layer boundary (project CLAUDE.md III): a crashed
         # trial simulation must not crash the whole study — it is scored as
         # a failed trial (0.0), not re-raised, mirroring
         # tools/tune_agent.py's original behavior.
         try:
-            result = run_trial(defines, seed=seed, max_ticks=max_ticks, backend=backend)
+            if scheduler is not None:
+                result = scheduler.run(TrialSpec(seed=seed, overrides=tuple(params.items())))
+            else:
+                defines = inject_parameters(GameDefines(), params)
+                result = run_trial(defines, seed=seed, max_ticks=max_ticks, backend=backend)
         except Exception as exc:  # noqa: BLE001 - deliberate trial-failure boundary, see above
             logger.warning("Trial %d: simulation crashed: %s", trial.number, exc)
             return 0.0
@@ -295,6 +305,7 @@ def run_optimization(
     seed: int = DEFAULT_SEED,
     categories: list[str] | None = None,
     narrow_bounds: dict[str, tuple[float, float]] | None = None,
+    workers: int = 1,
 ) -> optuna.Study:
     """Run (or resume) an Optuna study over the Carceral Equilibrium objective.
 
@@ -313,6 +324,11 @@ def run_optimization(
     :param narrow_bounds: Optional tighter bounds overlay (default:
         :data:`_NARROW_BOUNDS`); pass ``{}`` to search the full introspected
         space unnarrowed.
+    :param workers: Concurrent trials. ``> 1`` runs ``study.optimize`` with
+        ``n_jobs=workers``, each job's simulation on a shared process pool.
+        Every trial stays reproducible from its parameters and seed, but the
+        TPE *search order* is no longer fixed by ``_TPE_SEED`` — it depends on
+        which trials finish first.
     :returns: The (possibly resumed) Optuna ``Study`` after ``n_trials`` more
         trials.
     :raises ImportError: If Optuna is not installed.
@@ -350,6 +366,18 @@ def run_optimization(
     if existing_trials > 0:
         logger.info("Resuming study with %d existing trials", existing_trials)
 
+    if workers > 1:
+        logger.info("Parallel trials: %d", workers)
+        settings = TrialSettings(max_ticks=max_ticks, backend=backend)
+        with TrialScheduler(GameDefines(), settings, workers=workers) as scheduler:
+            study.optimize(
+                create_objective(search_space, max_ticks, backend, seed, scheduler),
+                n_trials=n_trials,
+                n_jobs=workers,
+                show_progress_bar=True,
+            )
+        return study
+
     study.optimize(
         create_objective(search_space, max_ticks, backend, seed),
         n_trials=n_trials,
@@ -480,6 +508,7 @@ def run_bayesian(
     categories: list[str] | None = None,
     narrow_bounds: dict[str, tuple[float, float]] | None = None,
     show_best: bool = False,
+    workers: int = 1,
 ) -> optuna.Study:
     """Entry point for Bayesian (Optuna) Carceral Equilibrium tuning.
 
@@ -498,6 +527,7 @@ def run_bayesian(
         space (default: :data:`_NARROW_BOUNDS`; ``{}`` for unnarrowed).
     :param show_best: If ``True``, skip running new trials and only load +
         report the existing study.
+    :param workers: Concurrent trials (see :func:`run_optimization`).
     :returns: The Optuna ``Study`` (new trials run, or loaded as-is when
         ``show_best``).
     :raises ImportError: If Optuna is not installed.
@@ -524,6 +554,7 @@ def run_bayesian(
             seed=seed,
             categories=categories,
             narrow_bounds=narrow_bounds,
+            workers=workers,
         )
 
     print(
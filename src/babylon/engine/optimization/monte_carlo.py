@@ -34,12 +34,12 @@ from typing import Final
 from pydantic import BaseModel, ConfigDict, Field
 
 from babylon.config.defines import GameDefines
-from babylon.engine.optimization import runner_api
 from babylon.engine.optimization.backends.types import Result
 from babylon.engine.optimization.objectives import Objective, carceral_objective
 from babylon.engine.optimization.params import inject_parameters
 from babylon.engine.optimization.ranges import parse_override
 from babylon.engine.optimization.reproducibility import ReproRecord, build_repro_record
+from babylon.engine.optimization.scheduler import TrialScheduler, TrialSettings, TrialSpec
 
 # Try to import scipy for t-distribution CI, fall back to normal approximation.
 try:
@@ -252,14 +252,17 @@ def run_trials(
     scenario: str = "imperial_circuit",
     objective: Objective = carceral_objective,
     progress: bool = True,
+    workers: int = 1,
 ) -> tuple[list[SampleResult], list[ReproRecord]]:
-    """Run N replications sequentially through :func:`runner_api.run`.
+    """Run N replications through :class:`~babylon.engine.optimization.scheduler.TrialScheduler`.
 
     Per-sample seeds are drawn from a local :class:`random.Random` seeded
     with ``base_seed`` (``None`` draws from OS entropy, matching the
     original tool's "no seed given" behavior) — the same deterministic
     seed *sequence* the pre-package tool produced, but without mutating the
-    process-global :mod:`random` module.
+    process-global :mod:`random` module. The whole sequence is drawn before
+    any trial runs, so sample ``i`` gets the same seed however many
+    ``workers`` execute the batch and in whatever order they finish.
 
     :param n_samples: Number of samples to run.
     :param defines: Base ``GameDefines`` (already carrying any parameter
@@ -272,52 +275,58 @@ def run_trials(
     :param scenario: Scenario name. ``backend="in_memory"`` only.
     :param objective: Scoring function applied to each trial's :class:`Result`.
     :param progress: Print progress lines to stdout.
-    :returns: ``(samples, repro_records)``, both in run order and the same length.
+    :param workers: Trial worker processes (``1`` = sequential, in-process).
+    :returns: ``(samples, repro_records)``, both in sample order and the same length.
     """
     rng = random.Random(base_seed)
-    samples: list[SampleResult] = []
-    repro_records: list[ReproRecord] = []
+    seeds = [rng.randint(0, _SEED_UPPER_BOUND) for _ in range(n_samples)]
 
     if progress:
         print(f"Running {n_samples} Monte Carlo samples...")
         print(f"  Max ticks per sample: {max_ticks}")
         print(f"  Backend: {backend}")
+        if workers > 1:
+            print(f"  Workers: {workers}")
         if base_seed is not None:
             print(f"  Base seed: {base_seed}")
         print()
 
-    for i in range(n_samples):
-        sample_seed = rng.randint(0, _SEED_UPPER_BOUND)
+    completed = 0
 
-        result: Result = runner_api.run(
-            defines,
-            seed=sample_seed,
-            max_ticks=max_ticks,
-            backend=backend,
-            scope_name=scope_name,
-            scenario=scenario,
-        )
+    def _report(_index: int, _result: Result) -> None:
+        nonlocal completed
+        completed += 1
+        if completed % max(1, n_samples // 10) == 0 or completed == n_samples:
+            pct = 100 * completed // n_samples
+            print(f"\r  [{completed}/{n_samples}] {pct}% complete", end="", flush=True)
 
-        samples.append(
-            SampleResult(
-                sample_id=i + 1,
-                seed=sample_seed,
-                ticks_survived=result.ticks_survived,
-                outcome=result.outcome,
-                max_tension=result.max_tension,
-                final_wealth=result.final_wealth,
-                objective_score=objective(result),
-            )
+    settings = TrialSettings(
+        max_ticks=max_ticks, backend=backend, scope_name=scope_name, scenario=scenario
+    )
+    with TrialScheduler(defines, settings, workers=workers) as scheduler:
+        results = scheduler.map(
+            [TrialSpec(seed=seed) for seed in seeds],
+            on_result=_report if progress else None,
         )
-        repro_records.append(build_repro_record(result, scope_name=scope_name, max_ticks=max_ticks))
-
-        if progress and ((i + 1) % max(1, n_samples // 10) == 0 or i == n_samples - 1):
-            pct = 100 * (i + 1) // n_samples
-            print(f"\r  [{i + 1}/{n_samples}] {pct}% complete", end="", flush=True)
 
     if progress:
         print()  # Newline after progress
 
+    samples = [
+        SampleResult(
+            sample_id=i + 1,
+            seed=seed,
+            ticks_survived=result.ticks_survived,
+            outcome=result.outcome,
+            max_tension=result.max_tension,
+            final_wealth=result.final_wealth,
+            objective_score=objective(result),
+        )
+        for i, (seed, result) in enumerate(zip(seeds, results, strict=True))
+    ]
+    repro_records = [
+        build_repro_record(result, scope_name=scope_name, max_ticks=max_ticks) for result in results
+    ]
     return samples, repro_records
 
 
@@ -464,6 +473,7 @@ def run_monte_carlo(
     csv_path: Path | None = None,
     report_path: Path | None = None,
     progress: bool = True,
+    workers: int = 1,
 ) -> MonteCarloArtifact:
     """Run a full Monte Carlo uncertainty-quantification pass and write artifacts.
 
@@ -488,6 +498,7 @@ def run_monte_carlo(
     :param csv_path: Output CSV path (default: :data:`DEFAULT_OUTPUT`).
     :param report_path: Optional markdown report output path.
     :param progress: Print progress + report to stdout.
+    :param workers: Trial worker processes (``1`` = sequential, in-process).
     :returns: The full :class:`MonteCarloArtifact` (samples, stats, repro
         records, and output paths).
     :raises ValueError: If a ``param_overrides`` entry is malformed (bubbled
@@ -519,6 +530,7 @@ def run_monte_carlo(
         scenario=scenario,
         objective=objective,
         progress=progress,
+        workers=workers,
     )
 
     stats = aggregate(samples)
@@ -36,6 +36,10 @@ class ReproRecord(BaseModel):
         ``max_ticks`` on death or early termination).
     :ivar outcome: ``"SURVIVED"`` or ``"DIED"``.
     :ivar terminal_outcome: ``"revolution"``, ``"genocide"``, or ``None``.
+    :ivar diverge_at: Ticks the trial ran with the scheduler's base defines
+        before its own took effect (a forked trial, see
+        :class:`~babylon.engine.optimization.scheduler.TrialSpec`). ``0``
+        means ``defines_hash`` governed every tick.
     """
 
     model_config = ConfigDict(frozen=True)
@@ -48,6 +52,7 @@ class ReproRecord(BaseModel):
     ticks_survived: int = Field(ge=0)
     outcome: str
     terminal_outcome: str | None = None
+    diverge_at: int = Field(default=0, ge=0)
 
 
 def build_repro_record(
@@ -55,6 +60,7 @@ def build_repro_record(
     *,
     scope_name: str,
     max_ticks: int,
+    diverge_at: int = 0,
 ) -> ReproRecord:
     """Build a :class:`ReproRecord` from a trial's :class:`Result`.
 
@@ -68,6 +74,8 @@ def build_repro_record(
     :param result: The trial's normalized :class:`Result`.
     :param scope_name: The scope/scenario label the trial ran under.
     :param max_ticks: The configured maximum ticks for the trial.
+    :param diverge_at: The trial's ``TrialSpec.diverge_at`` (``0`` when it
+        was not forked).
     :returns: A frozen :class:`ReproRecord` capturing the trial's replay
         inputs and outcome summary.
     """
@@ -80,6 +88,7 @@ def build_repro_record(
         ticks_survived=result.ticks_survived,
         outcome=result.outcome,
         terminal_outcome=result.terminal_outcome,
+        diverge_at=diverge_at,
     )
 
 
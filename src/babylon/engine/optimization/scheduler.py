@@ -0,0 +1,377 @@
+"""Trial scheduler shared by every optimization algorithm.
+
+Sweeps, Monte Carlo, sensitivity analysis and Bayesian search all reduce to
+"run :func:`~babylon.engine.optimization.runner_api.run` for this list of
+``(coefficient overrides, seed)`` pairs". :class:`TrialScheduler` is that one
+loop, run either inline (``workers=1``, the historical sequential behavior)
+or across a process pool (``workers > 1``).
+
+Determinism (Constitution III.7) does not depend on scheduling:
+
+- Every :class:`TrialSpec` carries its own seed, assigned by the calling
+  algorithm *before* dispatch, so no seed depends on completion order.
+- :meth:`TrialScheduler.map` returns results in spec order, whatever order
+  the workers finish in.
+- Each trial is a pure function of ``(base defines, overrides,
+  diverge_at, seed, settings)``. A parallel run therefore yields the same results as a
+  sequential one.
+
+Pool workers are warm. The base ``GameDefines`` and :class:`TrialSettings`
+cross the process boundary once per worker, via the pool initializer, not
+once per trial. The initializer also imports the backend, so the
+engine/scenario modules load once per worker, and builds the in-memory
+scenario once, so every trial in the worker starts from the same build.
+(Headless trials each hydrate into their own Postgres session.) Per-trial
+messages carry only the overrides and the seed. Objectives and repro records are computed by
+the caller in the parent process, so an ``Objective`` never needs to be
+picklable.
+
+Shared prefixes. Many trials vary coefficients that only matter after a
+warm-up. A spec's ``diverge_at = K`` schedules its overrides: ticks
+``1..K`` run with the base defines and the overrides take effect from tick
+``K + 1``. Every spec with the same ``(seed, diverge_at)`` therefore has
+identical parameters, and an identical trajectory, through tick ``K``, so
+:meth:`TrialScheduler.map` groups them by that key, runs the prefix once
+(:func:`~babylon.engine.optimization.backends.in_memory.snapshot_in_memory`)
+and forks the group from the snapshot. A lone spec runs the same two phases,
+so a result never depends on how its batch was grouped. Under a pool a group
+is split into at most ``workers`` chunks, each of which builds its own
+prefix, so no snapshot crosses the process boundary. Only the in-memory
+backend can switch defines mid-run; scheduling a ``diverge_at`` on the
+headless backend raises ``ValueError``.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING, Final
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from babylon.config.defines import GameDefines
+from babylon.engine.optimization import runner_api
+from babylon.engine.optimization.params import inject_parameter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from types import TracebackType
+
+    from babylon.engine.optimization.backends.types import Result
+
+#: Start method for pool workers. ``spawn`` is safe alongside the threads
+#: optuna (``n_jobs``) and psycopg pools start in the parent, and behaves the
+#: same on every platform.
+_START_METHOD: Final[str] = "spawn"
+
+#: Backends whose trials can fork from a shared prefix snapshot.
+_SNAPSHOT_BACKENDS: Final[frozenset[str]] = frozenset({"in_memory"})
+
+
+class TrialSettings(BaseModel):
+    """Run parameters shared by every trial in one batch.
+
+    :ivar max_ticks: Maximum ticks per trial.
+    :ivar backend: ``"headless"`` or ``"in_memory"``.
+    :ivar scope_name: Headless scope label. ``backend="headless"`` only.
+    :ivar scenario: In-memory scenario name. ``backend="in_memory"`` only.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_ticks: int = Field(ge=1)
+    backend: str = "headless"
+    scope_name: str = "detroit-tri-county"
+    scenario: str = "imperial_circuit"
+
+
+class TrialSpec(BaseModel):
+    """One trial: coefficient overrides atop the base defines, plus a seed.
+
+    :ivar seed: The trial's RNG seed.
+    :ivar overrides: ``(param_path, value)`` pairs injected in order via
+        :func:`~babylon.engine.optimization.params.inject_parameter`. This is
+        a sequence, not a mapping, so a 2D sweep of one path against itself
+        keeps its last-wins semantics.
+    :ivar diverge_at: Last tick run with the base defines; the overrides
+        take effect from ``diverge_at + 1``. Specs sharing ``(seed,
+        diverge_at)`` run that prefix once and fork from it. ``0`` (default)
+        applies the overrides from the first tick.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    seed: int
+    overrides: tuple[tuple[str, float], ...] = ()
+    diverge_at: int = Field(default=0, ge=0)
+
+
+def build_defines(base_defines: GameDefines, spec: TrialSpec) -> GameDefines:
+    """Apply ``spec.overrides`` to ``base_defines``, in order.
+
+    :param base_defines: Base ``GameDefines`` (not mutated).
+    :param spec: The trial whose overrides to apply.
+    :returns: The trial's ``GameDefines``.
+    :raises ValueError: If an override path is invalid.
+    """
+    defines = base_defines
+    for param_path, value in spec.overrides:
+        defines = inject_parameter(defines, param_path, value)
+    return defines
+
+
+def _check_specs(specs: Sequence[TrialSpec], settings: TrialSettings) -> None:
+    """Reject scheduled overrides the batch's backend cannot honor.
+
+    :raises ValueError: If a spec has ``diverge_at > 0`` and the backend
+        cannot switch defines mid-run.
+    """
+    if settings.backend in _SNAPSHOT_BACKENDS:
+        return
+    for spec in specs:
+        if spec.diverge_at > 0:
+            raise ValueError(
+                f"diverge_at={spec.diverge_at} needs a backend that can fork from a snapshot "
+                f"({', '.join(sorted(_SNAPSHOT_BACKENDS))}), got: {settings.backend!r}"
+            )
+
+
+def _run_unit(
+    base_defines: GameDefines, settings: TrialSettings, specs: Sequence[TrialSpec]
+) -> list[Result]:
+    """Run one unit from :func:`_plan_units` (or one lone spec).
+
+    Every spec in a multi-spec unit shares ``(seed, diverge_at)``. With
+    ``diverge_at > 0`` the unit runs its base-defines prefix once and
+    continues each spec from the snapshot with its own defines.
+    """
+    first = specs[0]
+    if first.diverge_at == 0:
+        return [
+            runner_api.run(
+                build_defines(base_defines, spec),
+                seed=spec.seed,
+                max_ticks=settings.max_ticks,
+                backend=settings.backend,
+                scope_name=settings.scope_name,
+                scenario=settings.scenario,
+            )
+            for spec in specs
+        ]
+
+    from babylon.engine.optimization.backends.in_memory import run_in_memory, snapshot_in_memory
+
+    prefix = snapshot_in_memory(
+        base_defines,
+        first.seed,
+        min(first.diverge_at, settings.max_ticks),
+        scenario=settings.scenario,
+    )
+    return [
+        run_in_memory(
+            build_defines(base_defines, spec),
+            spec.seed,
+            settings.max_ticks,
+            scenario=settings.scenario,
+            start_from=prefix,
+        )
+        for spec in specs
+    ]
+
+
+def _plan_units(specs: Sequence[TrialSpec], chunks: int) -> list[tuple[int, ...]]:
+    """Partition spec indices into execution units.
+
+    Specs with ``diverge_at > 0`` are grouped by ``(seed, diverge_at)``, and
+    each group is split into at most ``chunks`` contiguous units. Every other
+    spec is a unit of its own. Units are ordered by their first index.
+
+    :param specs: Trials to partition (already checked by :func:`_check_specs`).
+    :param chunks: Maximum units per shared-prefix group.
+    :returns: Tuples of indices into ``specs``.
+    """
+    units: list[tuple[int, ...]] = []
+    groups: dict[tuple[int, int], list[int]] = {}
+    for index, spec in enumerate(specs):
+        if spec.diverge_at > 0:
+            groups.setdefault((spec.seed, spec.diverge_at), []).append(index)
+        else:
+            units.append((index,))
+    for members in groups.values():
+        size = math.ceil(len(members) / min(chunks, len(members)))
+        units.extend(tuple(members[start : start + size]) for start in range(0, len(members), size))
+    return sorted(units)
+
+
+# =============================================================================
+# WORKER PROCESS STATE
+# =============================================================================
+
+_worker_base_defines: GameDefines | None = None
+_worker_settings: TrialSettings | None = None
+
+
+def _init_worker(base_defines: GameDefines, settings: TrialSettings) -> None:
+    """Pool initializer: cache the batch's shared inputs and warm the backend."""
+    global _worker_base_defines, _worker_settings
+    _worker_base_defines = base_defines
+    _worker_settings = settings
+    if settings.backend == "headless":
+        import babylon.engine.optimization.backends.headless  # noqa: F401
+    elif settings.backend == "in_memory":
+        import babylon.engine.simulation_engine  # noqa: F401
+        from babylon.engine.optimization.backends.in_memory import warm_scenario
+
+        warm_scenario(settings.scenario)
+
+
+def _worker_run(spec: TrialSpec) -> Result:
+    """Run one trial inside a pool worker against its cached inputs."""
+    if _worker_base_defines is None or _worker_settings is None:
+        raise RuntimeError("trial worker used before _init_worker")
+    return _run_unit(_worker_base_defines, _worker_settings, [spec])[0]
+
+
+def _worker_run_unit(specs: tuple[TrialSpec, ...]) -> list[Result]:
+    """Run one execution unit inside a pool worker against its cached inputs."""
+    if _worker_base_defines is None or _worker_settings is None:
+        raise RuntimeError("trial worker used before _init_worker")
+    return _run_unit(_worker_base_defines, _worker_settings, specs)
+
+
+# =============================================================================
+# SCHEDULER
+# =============================================================================
+
+
+class TrialScheduler:
+    """Run trials inline (``workers=1``) or on a warm process pool.
+
+    Use as a context manager so the pool shuts down with the batch.
+    :meth:`run` is thread-safe, which lets Optuna's ``n_jobs`` threads each
+    block on one pool trial at a time.
+
+    :param base_defines: Base ``GameDefines`` every trial's overrides apply to.
+    :param settings: Run parameters shared by every trial.
+    :param workers: Worker processes; ``1`` runs trials in the calling
+        process, exactly as the algorithms did before parallelization.
+    :raises ValueError: If ``workers < 1``.
+    """
+
+    def __init__(
+        self,
+        base_defines: GameDefines,
+        settings: TrialSettings,
+        *,
+        workers: int = 1,
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got: {workers}")
+        self._base_defines = base_defines
+        self._settings = settings
+        self._workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        if workers > 1:
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(_START_METHOD),
+                initializer=_init_worker,
+                initargs=(base_defines, settings),
+            )
+
+    @property
+    def workers(self) -> int:
+        """Configured worker count (``1`` = inline)."""
+        return self._workers
+
+    def run(self, spec: TrialSpec) -> Result:
+        """Run one trial and block until its :class:`Result` is ready.
+
+        :param spec: The trial to run.
+        :returns: The trial's :class:`Result`.
+        :raises ValueError: If ``spec.diverge_at`` needs a snapshot backend.
+        """
+        _check_specs([spec], self._settings)
+        if self._executor is None:
+            return _run_unit(self._base_defines, self._settings, [spec])[0]
+        return self._executor.submit(_worker_run, spec).result()
+
+    def map(
+        self,
+        specs: Sequence[TrialSpec],
+        on_result: Callable[[int, Result], None] | None = None,
+    ) -> list[Result]:
+        """Run every spec and return the results in spec order.
+
+        Specs sharing ``(seed, diverge_at > 0)`` fork from one prefix run (see
+        the module docstring); each result equals the spec's own
+        :meth:`run`.
+
+        :param specs: Trials to run.
+        :param on_result: Called in this process as each trial finishes, with
+            the trial's index into ``specs``. Under a pool, or when trials
+            share a prefix, this is completion order, not spec order. Use it
+            for progress reporting.
+        :returns: One :class:`Result` per spec, in ``specs`` order.
+        :raises ValueError: If a spec's ``diverge_at`` needs a snapshot
+            backend. Raised before any trial runs.
+        :raises Exception: The first trial failure. Queued trials are
+            cancelled.
+        """
+        _check_specs(specs, self._settings)
+        results: list[Result | None] = [None] * len(specs)
+        units = _plan_units(specs, self._workers)
+
+        def _collect(unit: tuple[int, ...], unit_results: list[Result]) -> None:
+            for index, result in zip(unit, unit_results, strict=True):
+                results[index] = result
+                if on_result is not None:
+                    on_result(index, result)
+
+        if self._executor is None:
+            for unit in units:
+                _collect(
+                    unit,
+                    _run_unit(self._base_defines, self._settings, [specs[i] for i in unit]),
+                )
+            return results  # type: ignore[return-value]
+
+        pending: dict[Future[list[Result]], tuple[int, ...]] = {
+            self._executor.submit(_worker_run_unit, tuple(specs[i] for i in unit)): unit
+            for unit in units
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _collect(pending.pop(future), future.result())
+        finally:
+            for future in pending:
+                future.cancel()
+        return results  # type: ignore[return-value]
+
+    def close(self) -> None:
+        """Shut the worker pool down (no-op inline). Idempotent."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> TrialScheduler:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+__all__ = [
+    "TrialSettings",
+    "TrialSpec",
+    "TrialScheduler",
+    "build_defines",
+]
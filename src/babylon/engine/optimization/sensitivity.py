@@ -52,11 +52,11 @@ import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
 from babylon.config.defines import GameDefines
-from babylon.engine.optimization import runner_api
 from babylon.engine.optimization.backends.types import Result
 from babylon.engine.optimization.objectives import Objective, carceral_objective
-from babylon.engine.optimization.params import get_tunable_parameters, inject_parameters
+from babylon.engine.optimization.params import get_tunable_parameters
 from babylon.engine.optimization.reproducibility import ReproRecord, build_repro_record
+from babylon.engine.optimization.scheduler import TrialScheduler, TrialSettings, TrialSpec
 
 # Try to import SALib; sensitivity analysis is unavailable without it.
 try:
@@ -260,6 +260,8 @@ def evaluate_simulation(
     scenario: str = "imperial_circuit",
     objective: Objective = carceral_objective,
     progress: bool = True,
+    workers: int = 1,
+    fork_at: int = 0,
 ) -> tuple[list[float], list[ReproRecord]]:
     """Run simulations for a SALib parameter sample matrix.
 
@@ -278,43 +280,57 @@ def evaluate_simulation(
     :param objective: Scores each trial's :class:`~babylon.engine.optimization.backends.types.Result`
         into the output SALib analyzes (default: the Carceral Equilibrium score).
     :param progress: Print a progress line to stdout.
+    :param workers: Trial worker processes (``1`` = sequential, in-process).
+        Outputs stay in ``param_values`` row order either way, as SALib's
+        ``analyze`` requires.
+    :param fork_at: Warm-up ticks run with ``base_defines``; the sampled values
+        take effect from tick ``fork_at + 1``. The trials run the warm-up
+        once and fork from the snapshot (see
+        :mod:`~babylon.engine.optimization.scheduler`). Requires
+        ``backend="in_memory"``. ``0`` (default) applies the values from the
+        first tick.
     :returns: ``(outputs, repro_records)`` — ``outputs`` is the ``N``-length
         list SALib's ``analyze`` functions consume; ``repro_records`` is one
         :class:`~babylon.engine.optimization.reproducibility.ReproRecord` per
         trial, same order.
     """
     n_samples = len(param_values)
-    outputs: list[float] = []
-    repro_records: list[ReproRecord] = []
     scope_label = scope_name if backend == "headless" else scenario
 
     if progress:
         print(f"Evaluating {n_samples} parameter combinations...")
 
-    for i, values in enumerate(param_values):
-        trial_params = {name: float(v) for name, v in zip(param_names, values, strict=True)}
-        defines = inject_parameters(GameDefines(), trial_params)
-
-        result: Result = runner_api.run(
-            defines,
+    specs = [
+        TrialSpec(
             seed=seed,
-            max_ticks=max_ticks,
-            backend=backend,
-            scope_name=scope_name,
-            scenario=scenario,
-        )
-        outputs.append(objective(result))
-        repro_records.append(
-            build_repro_record(result, scope_name=scope_label, max_ticks=max_ticks)
+            overrides=tuple((name, float(v)) for name, v in zip(param_names, values, strict=True)),
+            diverge_at=fork_at,
         )
+        for values in param_values
+    ]
+    completed = 0
 
-        if progress and ((i + 1) % max(1, n_samples // 20) == 0 or i == n_samples - 1):
-            pct = 100 * (i + 1) // n_samples
-            print(f"\r  [{i + 1}/{n_samples}] {pct}%", end="", flush=True)
+    def _report(_index: int, _result: Result) -> None:
+        nonlocal completed
+        completed += 1
+        if completed % max(1, n_samples // 20) == 0 or completed == n_samples:
+            pct = 100 * completed // n_samples
+            print(f"\r  [{completed}/{n_samples}] {pct}%", end="", flush=True)
+
+    settings = TrialSettings(
+        max_ticks=max_ticks, backend=backend, scope_name=scope_name, scenario=scenario
+    )
+    with TrialScheduler(GameDefines(), settings, workers=workers) as scheduler:
+        results = scheduler.map(specs, on_result=_report if progress else None)
 
     if progress:
         print()  # Newline after progress
 
+    outputs = [objective(result) for result in results]
+    repro_records = [
+        build_repro_record(result, scope_name=scope_label, max_ticks=max_ticks, diverge_at=fork_at)
+        for result in results
+    ]
     return outputs, repro_records
 
 
@@ -334,6 +350,8 @@ def run_morris_analysis(
     scenario: str = "imperial_circuit",
     objective: Objective = carceral_objective,
     progress: bool = True,
+    workers: int = 1,
+    fork_at: int = 0,
 ) -> tuple[MorrisResult, list[ReproRecord]]:
     """Run Morris elementary-effects screening.
 
@@ -346,6 +364,8 @@ def run_morris_analysis(
     :param scenario: In-memory scenario name. ``backend="in_memory"`` only.
     :param objective: Scores each trial's :class:`~babylon.engine.optimization.backends.types.Result`.
     :param progress: Print progress to stdout.
+    :param workers: Trial worker processes (``1`` = sequential, in-process).
+    :param fork_at: Shared warm-up ticks (see :func:`evaluate_simulation`).
     :returns: ``(result, repro_records)``.
     :raises ImportError: If SALib is not installed.
     :raises ValueError: If no parameter in ``param_names`` is a known tunable
@@ -376,6 +396,8 @@ def run_morris_analysis(
         scenario=scenario,
         objective=objective,
         progress=progress,
+        workers=workers,
+        fork_at=fork_at,
     )
 
     analysis = morris_analyze.analyze(problem, param_values, np.array(outputs))
@@ -407,6 +429,8 @@ def run_sobol_analysis(
     scenario: str = "imperial_circuit",
     objective: Objective = carceral_objective,
     progress: bool = True,
+    workers: int = 1,
+    fork_at: int = 0,
 ) -> tuple[SobolResult, list[ReproRecord]]:
     """Run Sobol variance decomposition.
 
@@ -419,6 +443,8 @@ def run_sobol_analysis(
     :param scenario: In-memory scenario name. ``backend="in_memory"`` only.
     :param objective: Scores each trial's :class:`~babylon.engine.optimization.backends.types.Result`.
     :param progress: Print progress to stdout.
+    :param workers: Trial worker processes (``1`` = sequential, in-process).
+    :param fork_at: Shared warm-up ticks (see :func:`evaluate_simulation`).
     :returns: ``(result, repro_records)``.
     :raises ImportError: If SALib is not installed.
     :raises ValueError: If no parameter in ``param_names`` is a known tunable
@@ -451,6 +477,8 @@ def run_sobol_analysis(
         scenario=scenario,
         objective=objective,
         progress=progress,
+        workers=workers,
+        fork_at=fork_at,
     )
 
     analysis = sobol_analyze.analyze(problem, np.array(outputs), calc_second_order=True)
@@ -624,6 +652,8 @@ def run_sensitivity(
     morris_output: Path | None = None,
     sobol_output: Path | None = None,
     progress: bool = True,
+    workers: int = 1,
+    fork_at: int = 0,
 ) -> SensitivityArtifact:
     """Run global sensitivity analysis and write JSON artifacts.
 
@@ -654,6 +684,8 @@ def run_sensitivity(
     :param morris_output: Explicit override for the Morris JSON path.
     :param sobol_output: Explicit override for the Sobol JSON path.
     :param progress: Print progress + reports to stdout.
+    :param workers: Trial worker processes (``1`` = sequential, in-process).
+    :param fork_at: Shared warm-up ticks (see :func:`evaluate_simulation`).
     :returns: The full :class:`SensitivityArtifact` (results, repro records,
         and output paths).
     :raises ValueError: If ``method`` is not ``"morris"``/``"sobol"``/``"both"``,
@@ -688,6 +720,8 @@ def run_sensitivity(
             scenario=scenario,
             objective=objective,
             progress=progress,
+            workers=workers,
+            fork_at=fork_at,
         )
         repro_records.extend(morris_repro)
 
@@ -719,6 +753,8 @@ def run_sensitivity(
             scenario=scenario,
             objective=objective,
             progress=progress,
+            workers=workers,
+            fork_at=fork_at,
         )
         repro_records.extend(sobol_repro)
 
@@ -33,9 +33,9 @@ from babylon.config.defines import GameDefines
 from babylon.engine.optimization import ranges
 from babylon.engine.optimization.backends.types import Result
 from babylon.engine.optimization.objectives import Objective, carceral_objective
-from babylon.engine.optimization.params import get_tunable_parameters, inject_parameter
+from babylon.engine.optimization.params import get_tunable_parameters
 from babylon.engine.optimization.reproducibility import ReproRecord, build_repro_record
-from babylon.engine.optimization.runner_api import run as run_trial
+from babylon.engine.optimization.scheduler import TrialScheduler, TrialSettings, TrialSpec
 
 #: Default simulation length for a 1D sweep point: 5200 ticks = 100 years
 #: (1 tick = 1 week). Matches ``tools/shared.py::DEFAULT_MAX_TICKS`` — the
@@ -112,6 +112,8 @@ def sweep_1d(
     base_defines: GameDefines | None = None,
     objective: Objective = carceral_objective,
     validate: bool = True,
+    workers: int = 1,
+    fork_at: int = 0,
 ) -> list[SweepPoint]:
     """Sweep one parameter across ``values``, one trial per value.
 
@@ -141,6 +143,13 @@ def sweep_1d(
         ``SweepPoint.score``.
     :param validate: If ``True`` (default), fail fast when ``param_path``
         is not a known tunable parameter, before running any trial.
+    :param workers: Trial worker processes (``1`` = sequential, in-process).
+    :param fork_at: Warm-up ticks run with ``base_defines``; the swept values
+        take effect from tick ``fork_at + 1``. The trials run the warm-up
+        once and fork from the snapshot (see
+        :mod:`~babylon.engine.optimization.scheduler`). Requires
+        ``backend="in_memory"``. ``0`` (default) applies the values from the
+        first tick.
     :returns: One :class:`SweepPoint` per value in ``values``, in order.
     :raises ValueError: If ``validate`` and ``param_path`` is unknown, or if
         ``param_path`` is invalid (propagated from
@@ -152,28 +161,28 @@ def sweep_1d(
     base = base_defines if base_defines is not None else GameDefines()
     scope_label = _scope_label(backend, scope_name, scenario)
 
-    points: list[SweepPoint] = []
-    for value in values:
-        defines = inject_parameter(base, param_path, value)
-        result = run_trial(
-            defines,
-            seed=seed,
-            max_ticks=max_ticks,
-            backend=backend,
-            scope_name=scope_name,
-            scenario=scenario,
-        )
-        repro = build_repro_record(result, scope_name=scope_label, max_ticks=max_ticks)
-        points.append(
-            SweepPoint(
-                value=value,
-                value2=None,
-                result=result,
-                repro=repro,
-                score=objective(result),
-            )
+    settings = TrialSettings(
+        max_ticks=max_ticks, backend=backend, scope_name=scope_name, scenario=scenario
+    )
+    specs = [
+        TrialSpec(seed=seed, overrides=((param_path, value),), diverge_at=fork_at)
+        for value in values
+    ]
+    with TrialScheduler(base, settings, workers=workers) as scheduler:
+        results = scheduler.map(specs)
+
+    return [
+        SweepPoint(
+            value=value,
+            value2=None,
+            result=result,
+            repro=build_repro_record(
+                result, scope_name=scope_label, max_ticks=max_ticks, diverge_at=fork_at
+            ),
+            score=objective(result),
         )
-    return points
+        for value, result in zip(values, results, strict=True)
+    ]
 
 
 def sweep_2d(
@@ -191,6 +200,8 @@ def sweep_2d(
     objective: Objective = carceral_objective,
     validate: bool = True,
     progress: bool = True,
+    workers: int = 1,
+    fork_at: int = 0,
 ) -> list[list[SweepPoint]]:
     """Grid-sweep two parameters, one trial per ``(v1, v2)`` cell.
 
@@ -217,6 +228,9 @@ def sweep_2d(
         path is not a known tunable parameter.
     :param progress: If ``True`` (default), print a ``\\r``-updating
         progress line per cell (matches the original tool's console output).
+        Under ``workers > 1`` cells report in completion order.
+    :param workers: Trial worker processes (``1`` = sequential, in-process).
+    :param fork_at: Shared warm-up ticks (see :func:`sweep_1d`).
     :returns: ``values1``-major, ``values2``-minor matrix of
         :class:`SweepPoint` — ``matrix[i][j]`` is the trial for
         ``(values1[i], values2[j])``.
@@ -232,39 +246,43 @@ def sweep_2d(
     total_runs = len(values1) * len(values2)
     run_count = 0
 
-    matrix: list[list[SweepPoint]] = []
-    for v1 in values1:
-        row: list[SweepPoint] = []
-        for v2 in values2:
-            run_count += 1
-            defines = inject_parameter(base, param1, v1)
-            defines = inject_parameter(defines, param2, v2)
-            result = run_trial(
-                defines,
-                seed=seed,
-                max_ticks=max_ticks,
-                backend=backend,
-                scope_name=scope_name,
-                scenario=scenario,
-            )
-            repro = build_repro_record(result, scope_name=scope_label, max_ticks=max_ticks)
-            row.append(
-                SweepPoint(
-                    value=v1,
-                    value2=v2,
-                    result=result,
-                    repro=repro,
-                    score=objective(result),
-                )
-            )
-            if progress:
-                print(
-                    f"\r[{run_count}/{total_runs}] "
-                    f"{param1}={v1:.3f}, {param2}={v2:.3f} -> {result.ticks_survived} ticks",
-                    end="",
-                    flush=True,
-                )
-        matrix.append(row)
+    cells = [(v1, v2) for v1 in values1 for v2 in values2]
+    specs = [
+        TrialSpec(seed=seed, overrides=((param1, v1), (param2, v2)), diverge_at=fork_at)
+        for v1, v2 in cells
+    ]
+
+    def _report(index: int, result: Result) -> None:
+        nonlocal run_count
+        run_count += 1
+        v1, v2 = cells[index]
+        print(
+            f"\r[{run_count}/{total_runs}] "
+            f"{param1}={v1:.3f}, {param2}={v2:.3f} -> {result.ticks_survived} ticks",
+            end="",
+            flush=True,
+        )
+
+    settings = TrialSettings(
+        max_ticks=max_ticks, backend=backend, scope_name=scope_name, scenario=scenario
+    )
+    with TrialScheduler(base, settings, workers=workers) as scheduler:
+        results = scheduler.map(specs, on_result=_report if progress else None)
+
+    points = [
+        SweepPoint(
+            value=v1,
+            value2=v2,
+            result=result,
+            repro=build_repro_record(
+                result, scope_name=scope_label, max_ticks=max_ticks, diverge_at=fork_at
+            ),
+            score=objective(result),
+        )
+        for (v1, v2), result in zip(cells, results, strict=True)
+    ]
+    width = len(values2)
+    matrix = [points[row * width : (row + 1) * width] for row in range(len(values1))]
 
     if progress:
         print()  # Newline after the last progress update.
@@ -408,6 +426,8 @@ def run_sweep(
     objective: Objective = carceral_objective,
     output_csv: Path | None = None,
     report: bool = False,
+    workers: int = 1,
+    fork_at: int = 0,
 ) -> list[SweepPoint] | list[list[SweepPoint]]:
     """Dispatch to :func:`sweep_1d` or :func:`sweep_2d` from one CLI-facing call.
 
@@ -435,6 +455,8 @@ def run_sweep(
     :param report: If ``True``, prints :func:`format_sweep_report` after a
         1D sweep (ignored for a 2D sweep, which has no Playable Boundary
         concept).
+    :param workers: Trial worker processes (``1`` = sequential, in-process).
+    :param fork_at: Shared warm-up ticks (see :func:`sweep_1d`).
     :returns: :func:`sweep_1d`'s or :func:`sweep_2d`'s result, so the caller
         can inspect trials beyond what was written to ``output_csv``.
     :raises ValueError: Propagated from :func:`~babylon.engine.optimization.ranges.parse_range`
@@ -454,6 +476,8 @@ def run_sweep(
             scenario=scenario,
             base_defines=base_defines,
             objective=objective,
+            workers=workers,
+            fork_at=fork_at,
         )
         if output_csv is not None:
             write_sweep_csv(points_1d, output_csv)
@@ -475,6 +499,8 @@ def run_sweep(
         scenario=scenario,
         base_defines=base_defines,
         objective=objective,
+        workers=workers,
+        fork_at=fork_at,
     )
     if output_csv is not None:
         write_landscape_csv(param1_path, values1, param2_path, values2, matrix, output_csv)
@@ -168,7 +168,6 @@ def create_two_node_scenario(
         entities={PERIPHERY_WORKER_ID: worker, COMPRADOR_ID: owner},
         territories={"T001": territory},
         relationships=[exploitation, wages, tenancy],
-        event_log=[],
     )
 
     # Create configuration (IT-level settings only)
@@ -517,7 +516,6 @@ def create_imperial_circuit_scenario(
             periphery_tenancy,
             core_tenancy,
         ],
-        event_log=[],
     )
 
     # Create configuration (IT-level settings only)
@@ -1043,7 +1041,6 @@ def create_us_scenario(
             territories=territories,
             organizations=organizations,
             relationships=[*core_relationships, *tenancy_edges],
-            event_log=[],
             # EH ruling 6 (owner 2026-07-16): the engine-side player pointer
             # -- EpistemicHorizonSystem computes player-relative C_p/I_c from
             # it. Mirrors ``_legacy_wayne.py``'s ``create_wayne_county_scenario``.
@@ -133,7 +133,6 @@ def create_single_county_scenario() -> tuple[WorldState, SimulationConfig, GameD
         entities={CORE_BOURGEOISIE_ID: owner, LABOR_ARISTOCRACY_ID: worker},
         territories={_TERRITORY_NODE_ID: territory},
         relationships=[exploitation, wages, tenancy],
-        event_log=[],
     )
 
     config = SimulationConfig()
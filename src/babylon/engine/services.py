@@ -294,6 +294,18 @@ class ServiceContainer:
     None until then (the Spec 057 pipeline falls back to graceful-degradation
     stub behavior when None per data-model.md ServiceContainer notes)."""
 
+    def reset_transients(self) -> None:
+        """Clear per-tick scratch state before the container serves another tick.
+
+        A run-scoped container (built once by :meth:`create` and passed to
+        every ``simulation_engine.step()`` of the run) keeps its wired
+        services, ``metrics`` and ``economics_fallbacks`` tally for the whole
+        run. Only the event bus's history and blocked-event log are per
+        tick: ``step()`` reads the history back as that tick's events.
+        """
+        self.event_bus.clear_history()
+        self.event_bus.clear_blocked_events()
+
     @classmethod
     def create(
         cls,
@@ -43,6 +43,7 @@ from babylon.models.world_state import WorldState
 
 if TYPE_CHECKING:
     from babylon.domain.economics.tensor_registry import TensorRegistry
+    from babylon.engine.hydration.warm_start import HydratedScenario, WarmStartCache
     from babylon.engine.observer import SimulationObserver
     from babylon.protocols import ObserverCallback
 
@@ -110,7 +111,11 @@ class Simulation:
         """
         self._config = config
         self._defines = defines if defines is not None else GameDefines.load_default()
-        self._services = ServiceContainer.create(config, self._defines)
+        # Run-scoped: built once with the run's calculator overrides and
+        # handed to every step(), which clears only its per-tick transients.
+        self._services = ServiceContainer.create(
+            config, self._defines, **(calculator_overrides or {})
+        )
         self._current_state = initial_state
         self._history: list[WorldState] = [initial_state]
         self._observers: list[SimulationObserver] = list(observers or [])
@@ -152,6 +157,7 @@ class Simulation:
         observers: list[SimulationObserver] | None = None,
         defines: GameDefines | None = None,
         years: Sequence[int] | None = None,
+        warm_start: WarmStartCache | None = None,
     ) -> Simulation:
         """Create simulation initialized from SQLite reference database.
 
@@ -168,6 +174,10 @@ class Simulation:
             years: Optional sequence of years for multi-year time series.
                 When provided, tensor data is hydrated for all specified years
                 and the economics calculator factory is wired automatically.
+            warm_start: Optional warm-start cache. A scenario already hydrated
+                against the same reference DB, counties, years and defines is
+                loaded from it instead of re-read from the database; a cold
+                hydration is stored in it for the next run.
 
         Returns:
             Initialized Simulation with territories hydrated from database.
@@ -189,86 +199,37 @@ class Simulation:
             - plan.md#Hydration Flow
             - quickstart.md
         """
-        from pathlib import Path
-
-        from babylon.domain.economics.adapters import SQLiteQCEWSource
-        from babylon.domain.economics.department_mapper import DepartmentMapper
-        from babylon.domain.economics.hydrator import MarxianHydrator
         from babylon.domain.economics.tensor_registry import TensorRegistry
-        from babylon.engine.hydration.reference import (
-            StubBEASource,
-            hydrate_economy_constants,
-            hydrate_industry_hyperedges,
-            hydrate_reserve_army,
-            hydrate_territories,
-        )
-        from babylon.reference.database import get_reference_session
 
         # Validate input
         if not fips_codes:
             msg = "fips_codes list cannot be empty"
             raise ValueError(msg)
 
-        # Hydrate territories from database
-        territories, hexes = hydrate_territories(fips_codes, year)
-
-        # Create and hydrate TensorRegistry for cached economic data access
-        tensor_registry = TensorRegistry()
-
-        # Locate NAICS-to-department mapping YAML
-        # Spec 059 ADR-005 Part B: this file moved from engine/simulation.py to
-        # engine/simulation/_legacy.py — extra .parent compensates for the
-        # additional package directory (now: simulation/_legacy.py → simulation/
-        # → engine/ → babylon/ → economics/data/naics_to_dept.yaml).
-        economics_path = (
-            Path(__file__).parent.parent.parent
-            / "domain"
-            / "economics"
-            / "data"
-            / "naics_to_dept.yaml"
-        )
-
-        with get_reference_session() as session:
-            qcew_source = SQLiteQCEWSource(session)
-            bea_source = StubBEASource()  # Falls back to DepartmentMapper defaults
-            dept_mapper = DepartmentMapper.from_yaml(economics_path)
-
-            hydrator = MarxianHydrator(qcew_source, bea_source, dept_mapper)
-
-            # Hydrate tensor data for all counties and requested years
-            hydration_years = list(years) if years is not None else [year]
-            tensor_registry.hydrate_counties(hydrator, fips_codes, hydration_years)
-
-        logger.info(
-            "TensorRegistry hydrated with %d counties for %d year(s)",
-            len(fips_codes),
-            len(hydration_years),
-        )
-
-        # Hydrate Tier A constants from federal data (Feature 028)
         if defines is None:
             defines = GameDefines.load_default()
-        primary_fips = fips_codes[0]
-        economy_data = hydrate_economy_constants(primary_fips, year)
-        reserve_data = hydrate_reserve_army(primary_fips, year)
+        hydration_years = list(years) if years is not None else [year]
 
-        # Override GameDefines with data-derived values
-        updates: dict[str, Any] = {}
-        if economy_data.get("extraction_efficiency") is not None:
-            updates["economy"] = defines.economy.model_copy(
-                update={"extraction_efficiency": economy_data["extraction_efficiency"]}
-            )
-        if economy_data.get("shadow_wage_hourly") is not None:
-            updates["economy"] = updates.get("economy", defines.economy).model_copy(
-                update={"shadow_wage_hourly": economy_data["shadow_wage_hourly"]}
-            )
-        if reserve_data.get("sigmoid_r0") is not None:
-            updates["reserve_army"] = defines.reserve_army.model_copy(
-                update={"sigmoid_r0": reserve_data["sigmoid_r0"]}
+        scenario: HydratedScenario | None = None
+        scenario_key: str | None = None
+        if warm_start is not None:
+            scenario_key = warm_start.key(
+                fips_codes=fips_codes, year=year, years=years, defines=defines
             )
-        if updates:
-            defines = defines.model_copy(update=updates)
-            logger.info("Tier A constants hydrated from %s/%d: %s", primary_fips, year, updates)
+            scenario = warm_start.get(scenario_key)
+            if scenario is not None:
+                logger.info("Warm start: reusing hydrated scenario %s", scenario_key[:12])
+        if scenario is None:
+            scenario = cls._hydrate_scenario(fips_codes, year, defines, hydration_years)
+            if warm_start is not None and scenario_key is not None:
+                warm_start.put(scenario_key, scenario)
+
+        # Create TensorRegistry for cached economic data access
+        tensor_registry = TensorRegistry()
+        scenario.restore_tensors(tensor_registry)
+        defines = scenario.defines
+        territories, hexes = scenario.territories, scenario.hexes
+        industries = scenario.industries
 
         # Wire calculator factory if multi-year mode requested
         calculator_overrides: dict[str, Any] | None = None
@@ -317,9 +278,6 @@ class Simulation:
             )
             calculator_overrides.update(vol1_overrides)
 
-        # Hydrate industries
-        industries = hydrate_industry_hyperedges(fips_codes, year)
-
         # Create base WorldState and config
         state = WorldState(industries=industries)
         config = SimulationConfig()
@@ -345,6 +303,88 @@ class Simulation:
 
         return sim
 
+    @staticmethod
+    def _hydrate_scenario(
+        fips_codes: list[str],
+        year: int,
+        defines: GameDefines,
+        hydration_years: list[int],
+    ) -> HydratedScenario:
+        """Read everything :meth:`from_sqlite` needs from the reference DB.
+
+        Args:
+            fips_codes: Counties to hydrate.
+            year: Data year for territories, constants and industries.
+            defines: GameDefines to apply the Tier A constants to.
+            hydration_years: Years to load county tensors for.
+
+        Returns:
+            The hydrated scenario, ready to cache or use.
+        """
+        from babylon.domain.economics.tensor_registry import TensorRegistry
+        from babylon.engine.hydration import reference
+        from babylon.engine.hydration.warm_start import HydratedScenario
+        from babylon.reference.database import get_reference_session
+
+        tensor_registry = TensorRegistry()
+        primary_fips = fips_codes[0]
+
+        # One session, one hydrator (QCEW prefetched for every year read) and
+        # one department-mapping parse serve every reference read of the run.
+        with get_reference_session() as session:
+            dept_mapper = reference._department_mapper()
+            hydrator = reference._marxian_hydrator(
+                session, fips_codes, [year, *hydration_years], dept_mapper
+            )
+            territories, hexes = reference.hydrate_territories(
+                fips_codes, year, session=session, hydrator=hydrator
+            )
+            # Hydrate tensor data for all counties and requested years
+            tensor_registry.hydrate_counties(hydrator, fips_codes, hydration_years)
+
+            # Hydrate Tier A constants from federal data (Feature 028)
+            economy_data = reference.hydrate_economy_constants_bulk(
+                [primary_fips], year, session=session, hydrator=hydrator
+            )[primary_fips]
+            reserve_data = reference.hydrate_reserve_army_bulk(
+                [primary_fips], year, session=session
+            )[primary_fips]
+            industries = reference.hydrate_industry_hyperedges(
+                fips_codes, year, session=session, dept_mapper=dept_mapper
+            )
+
+        logger.info(
+            "TensorRegistry hydrated with %d counties for %d year(s)",
+            len(fips_codes),
+            len(hydration_years),
+        )
+
+        # Override GameDefines with data-derived values
+        updates: dict[str, Any] = {}
+        if economy_data.get("extraction_efficiency") is not None:
+            updates["economy"] = defines.economy.model_copy(
+                update={"extraction_efficiency": economy_data["extraction_efficiency"]}
+            )
+        if economy_data.get("shadow_wage_hourly") is not None:
+            updates["economy"] = updates.get("economy", defines.economy).model_copy(
+                update={"shadow_wage_hourly": economy_data["shadow_wage_hourly"]}
+            )
+        if reserve_data.get("sigmoid_r0") is not None:
+            updates["reserve_army"] = defines.reserve_army.model_copy(
+                update={"sigmoid_r0": reserve_data["sigmoid_r0"]}
+            )
+        if updates:
+            defines = defines.model_copy(update=updates)
+            logger.info("Tier A constants hydrated from %s/%d: %s", primary_fips, year, updates)
+
+        return HydratedScenario(
+            territories=territories,
+            hexes=hexes,
+            industries=industries,
+            defines=defines,
+            tensors=HydratedScenario.capture_tensors(tensor_registry, fips_codes, hydration_years),
+        )
+
     @property
     def config(self) -> SimulationConfig:
         """Return the simulation configuration."""
@@ -600,6 +640,7 @@ class Simulation:
             self._persistent_context,
             self._defines,
             calculator_overrides=self._calculator_overrides,
+            services=self._services,
         )
         self._current_state = new_state
         self._history.append(new_state)
@@ -78,6 +78,7 @@ from babylon.kernel.system_protocol import ContextType, System
 from babylon.kernel.tick_partition import TickPartition
 from babylon.models.config import SimulationConfig
 from babylon.models.enums import EventType
+from babylon.models.event_log import EventLog
 from babylon.models.events import (
     SimulationEvent,
 )
@@ -498,6 +499,8 @@ def step(
     persistent_context: dict[str, Any] | None = None,
     defines: GameDefines | None = None,
     calculator_overrides: dict[str, Any] | None = None,
+    *,
+    services: ServiceContainer | None = None,
 ) -> WorldState:
     """Advance simulation by one tick using the modular engine.
 
@@ -514,6 +517,12 @@ def step(
             defines.yaml location. Use this for scenario-specific calibration.
         calculator_overrides: Optional dict of calculator instances to inject
             into ServiceContainer (e.g., melt_calculator, tensor_registry).
+        services: Optional run-scoped ServiceContainer, built once by the
+            caller with the run's config, defines and calculator overrides
+            and reused every tick (its per-tick state is cleared with
+            :meth:`ServiceContainer.reset_transients`). When given,
+            ``defines`` and ``calculator_overrides`` are not consulted. If
+            None, a fresh container is created for this tick.
 
     Returns:
         New WorldState at tick + 1
@@ -542,21 +551,74 @@ def step(
 
     # Convert to mutable graph for system application
     G = state.to_graph()
-    events: list[str] = list(state.event_log)
 
+    tick_log, structured_events = _step_graph(
+        G,
+        state.tick,
+        config,
+        persistent_context=persistent_context,
+        defines=defines,
+        calculator_overrides=calculator_overrides,
+        services=services,
+    )
+    # Append-only: extends the history shared with ``state`` in O(new lines)
+    # instead of copying it (the copy made a run quadratic in its length).
+    events = EventLog.coerce(state.event_log).extended(tick_log)
+
+    # Reconstruct state from modified graph
+    return WorldState.from_graph(
+        G,
+        tick=state.tick + 1,
+        event_log=events,
+        events=structured_events,
+    )
+
+
+def _step_graph(
+    G: BabylonGraph,
+    tick: int,
+    config: SimulationConfig,
+    *,
+    persistent_context: dict[str, Any] | None,
+    defines: GameDefines | None,
+    calculator_overrides: dict[str, Any] | None,
+    services: ServiceContainer | None = None,
+) -> tuple[list[str], list[SimulationEvent]]:
+    """Run one tick of the default engine over ``G`` in place.
+
+    The graph-side body of :func:`step`, shared with the resident-graph
+    :class:`~babylon.engine.simulation_session.SimulationSession` so both
+    paths run byte-identical tick logic.
+
+    Args:
+        G: Graph at the start of the tick (mutated in place).
+        tick: Tick number the systems see (the PRE-increment tick).
+        config: Simulation configuration.
+        persistent_context: Cross-tick context dict (mutated in place).
+        defines: Optional GameDefines; None loads the defaults.
+        calculator_overrides: Optional calculator injections.
+        services: Optional run-scoped container reused across ticks; see
+            :func:`step`.
+
+    Returns:
+        Tuple of (this tick's string log lines, this tick's typed events).
+    """
     # Feature 020: Restore graph-level state from persistent_context
     _restore_graph_context(G, persistent_context)
 
-    # Create ServiceContainer for this tick
-    # Use provided defines, or load from default YAML
-    effective_defines = defines if defines is not None else GameDefines.load_default()
-    overrides = calculator_overrides or {}
-    services = ServiceContainer.create(config, effective_defines, **overrides)
+    if services is None:
+        # Create ServiceContainer for this tick
+        # Use provided defines, or load from default YAML
+        effective_defines = defines if defines is not None else GameDefines.load_default()
+        overrides = calculator_overrides or {}
+        services = ServiceContainer.create(config, effective_defines, **overrides)
+    else:
+        services.reset_transients()
 
     # Create typed TickContext for this tick
     # persistent_data is initialized from caller's persistent_context if provided
     context = TickContext(
-        tick=state.tick,
+        tick=tick,
         persistent_data=dict(persistent_context) if persistent_context else {},
     )
 
@@ -564,7 +626,7 @@ def step(
     _DEFAULT_ENGINE.run_tick(G, services, context)
 
     # Feature 020: Persist tick_dynamics for WorldState round-trip survival
-    _save_graph_context(G, persistent_context, state.tick)
+    _save_graph_context(G, persistent_context, tick)
 
     # Sync any changes from context.persistent_data back to caller's dict
     if persistent_context is not None:
@@ -572,10 +634,11 @@ def step(
             persistent_context[key] = value
 
     # Convert EventBus history to both string log and typed events
+    tick_log: list[str] = []
     structured_events: list[SimulationEvent] = []
     for event in services.event_bus.get_history():
         # String log for backward compatibility
-        events.append(f"Tick {event.tick + 1}: {event.type.upper()}")
+        tick_log.append(f"Tick {event.tick + 1}: {event.type.upper()}")
         # Typed Pydantic event (Sprint 3.1)
         pydantic_event = _convert_bus_event_to_pydantic(event)
         if pydantic_event is not None:
@@ -594,10 +657,4 @@ def step(
             # Clear the observer events after injection
             del persistent_context["_observer_events"]
 
-    # Reconstruct state from modified graph
-    return WorldState.from_graph(
-        G,
-        tick=state.tick + 1,
-        event_log=events,
-        events=structured_events,
-    )
+    return tick_log, structured_events
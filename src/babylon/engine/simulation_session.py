@@ -0,0 +1,382 @@
+"""Resident-graph stepping API: one BabylonGraph across ticks.
+
+:func:`~babylon.engine.simulation_engine.step` is pure: every tick it
+``model_dump()``-s the whole :class:`WorldState` into a fresh
+:class:`~babylon.topology.graph.BabylonGraph` (``to_graph``) and
+re-validates every node and edge back into Pydantic models
+(``from_graph``). On long Monte Carlo runs that round-trip dominates wall
+time even though most systems touch a handful of attributes.
+
+:class:`SimulationSession` owns ONE graph for the whole run and
+materializes a :class:`WorldState` only on demand (:meth:`materialize`) or
+on checkpoint ticks (``checkpoint_every``).
+
+Byte-identity with the round-trip path (Constitution III.7)
+-----------------------------------------------------------
+The round-trip is not a no-op: it drops transient per-tick attrs,
+recomputes computed fields, rebuilds graph metadata from the typed
+carriers, and re-stamps the field-stack attrs. The session reproduces
+``to_graph(from_graph(G))`` between ticks without paying for it on the
+whole world:
+
+* every node/edge payload is snapshotted at the start of each tick — a
+  read-only shallow copy: systems replace attribute values (item
+  assignment / ``update_node``) rather than edit nested containers in
+  place, so top-level equality sees every edit without a deep copy;
+* at the start of the next tick, only payloads that DIFFER from their
+  snapshot are re-canonicalized (through the very same per-element
+  reconstruct/dump code ``from_graph``/``to_graph`` use —
+  :func:`~babylon.models.world_state.canonical_node_payload` /
+  :func:`~babylon.models.world_state.canonical_edge_payload`); an
+  untouched payload already IS its canonical image;
+* graph metadata is small and is always rebuilt through a
+  metadata-only ``from_graph``/``to_graph`` pass;
+* any STRUCTURAL change (node or edge added/removed/reordered, or an
+  organization/institution whose derived PRESENCE/HOUSES edge lists
+  changed) falls back to the full round-trip for that tick, because
+  ``to_graph`` re-groups nodes by type and that order drives the
+  determinism hash.
+
+Example::
+
+    session = SimulationSession(state, config, defines=defines)
+    for _ in range(5200):
+        session.step()
+    final = session.materialize()
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from babylon.config.defines import GameDefines
+from babylon.engine.services import ServiceContainer
+from babylon.engine.simulation_engine import _step_graph
+from babylon.models.entities.state_finance import StateFinance
+from babylon.models.enums import NodeType
+from babylon.models.event_log import EventLog
+from babylon.models.events import SimulationEvent
+from babylon.models.world_state import (
+    WorldState,
+    canonical_edge_payload,
+    canonical_node_payload,
+)
+
+if TYPE_CHECKING:
+    from babylon.models.config import SimulationConfig
+    from babylon.topology.graph import BabylonGraph
+
+logger = logging.getLogger(__name__)
+
+#: Per-node/per-edge attrs :meth:`WorldState._restamp_field_stack` writes
+#: from the ``field_stack`` carrier. They are never model fields, so the
+#: round-trip always strips them before re-stamping.
+_NODE_RESTAMP_KEYS: tuple[str, ...] = ("contradiction_fields", "field_derivatives")
+_EDGE_RESTAMP_KEYS: tuple[str, ...] = ("field_gradients",)
+
+#: Payload keys whose change rewires the PRESENCE/HOUSES edges ``to_graph``
+#: derives — a change there is structural, not an attribute edit.
+_DERIVED_EDGE_KEYS: dict[str, tuple[str, ...]] = {
+    NodeType.ORGANIZATION: ("territory_ids",),
+    NodeType.INSTITUTION: ("territory_ids", "housed_org_ids"),
+}
+
+#: ``from_graph`` reconstructs any type outside this set as a SocialClass.
+_NON_CLASS_NODE_TYPES: frozenset[str] = frozenset(
+    {
+        NodeType.TERRITORY,
+        NodeType.ORGANIZATION,
+        NodeType.INSTITUTION,
+        NodeType.INDUSTRY,
+        NodeType.SOVEREIGN,
+        NodeType.FACTION,
+    }
+)
+
+
+def _freeze_payload(payload: dict[str, Any]) -> Mapping[str, Any]:
+    """Read-only top-level snapshot of ``payload`` (see the module docstring)."""
+    return MappingProxyType(dict(payload))
+
+
+def _is_inert(G: BabylonGraph) -> bool:
+    """True when ``step()`` would short-circuit: no classes and no territories."""
+    for _node_id, data in G.nodes(data=True):
+        node_type = data.get("_node_type", NodeType.SOCIAL_CLASS)
+        if node_type == NodeType.TERRITORY or node_type not in _NON_CLASS_NODE_TYPES:
+            return False
+    return True
+
+
+class SimulationSession:
+    """Long-lived stepping API that keeps one BabylonGraph resident.
+
+    Produces exactly the states a ``state = step(state, ...)`` loop would
+    (same per-tick events, same final ``model_dump``), while skipping the
+    full WorldState round-trip on ticks that do not change topology.
+
+    Args:
+        initial_state: Starting WorldState.
+        config: Simulation configuration with formula coefficients.
+        persistent_context: Optional cross-tick context dict, shared with
+            the caller exactly as ``step(persistent_context=...)`` shares it.
+        defines: Optional GameDefines; None loads the defaults (once, into
+            the session's run-scoped ServiceContainer).
+        calculator_overrides: Optional calculator injections (Feature 020).
+        checkpoint_every: When set, :meth:`step` materializes a WorldState
+            every ``checkpoint_every`` ticks and hands it to ``on_checkpoint``.
+        on_checkpoint: Callback receiving each checkpoint WorldState.
+
+    Raises:
+        ValueError: If ``checkpoint_every`` is not positive.
+    """
+
+    def __init__(
+        self,
+        initial_state: WorldState,
+        config: SimulationConfig,
+        *,
+        persistent_context: dict[str, Any] | None = None,
+        defines: GameDefines | None = None,
+        calculator_overrides: dict[str, Any] | None = None,
+        checkpoint_every: int | None = None,
+        on_checkpoint: Callable[[WorldState], None] | None = None,
+    ) -> None:
+        if checkpoint_every is not None and checkpoint_every <= 0:
+            raise ValueError(f"checkpoint_every must be positive, got {checkpoint_every}")
+        self._config = config
+        self._persistent_context = persistent_context
+        self._defines = defines
+        self._calculator_overrides = calculator_overrides
+        # Built on the first live tick and reused by every later one (the
+        # step() loop used to rebuild it, registries and all, per tick).
+        self._services: ServiceContainer | None = None
+        self._checkpoint_every = checkpoint_every
+        self._on_checkpoint = on_checkpoint
+
+        self._tick = initial_state.tick
+        self._event_log = EventLog.coerce(initial_state.event_log)
+        self._events: list[SimulationEvent] = list(initial_state.events)
+        self._materialized: WorldState | None = initial_state
+        # ``step()`` short-circuits an entity-less, territory-less state to a
+        # bare tick bump forever after; the session mirrors that by never
+        # building a graph for it.
+        self._inert = (
+            not initial_state.entities
+            and not initial_state.territories
+            and not calculator_overrides
+        )
+        self._graph: BabylonGraph | None = None if self._inert else initial_state.to_graph()
+        # Snapshots taken when the graph was last canonical. None means the
+        # graph is freshly built by ``to_graph`` (already canonical).
+        self._node_snapshot: dict[str, Mapping[str, Any]] | None = None
+        self._edge_snapshot: dict[tuple[str, str], Mapping[str, Any]] | None = None
+        self._full_round_trips = 0
+
+    # ── read surface ─────────────────────────────────────────────────────
+
+    @property
+    def tick(self) -> int:
+        """The tick of the state the session currently holds."""
+        return self._tick
+
+    @property
+    def graph(self) -> BabylonGraph | None:
+        """The resident graph (post-tick, not yet canonicalized).
+
+        Read-only by convention: editing it between ticks is an edit to the
+        simulation, exactly like editing ``state.to_graph()`` before
+        ``from_graph``. None for an inert (empty) session.
+        """
+        return self._graph
+
+    @property
+    def full_round_trips(self) -> int:
+        """How many ticks fell back to the full to_graph/from_graph path."""
+        return self._full_round_trips
+
+    def materialize(self) -> WorldState:
+        """Return the current WorldState (cached until the next :meth:`step`).
+
+        Equal to what the ``step()`` loop would have returned at this tick.
+        """
+        if self._materialized is None:
+            if self._graph is None:  # pragma: no cover — inert keeps a cached state
+                raise RuntimeError("inert session lost its cached state")
+            self._materialized = WorldState.from_graph(
+                self._graph,
+                tick=self._tick,
+                event_log=self._event_log,
+                events=list(self._events),
+            )
+        return self._materialized
+
+    # ── stepping ─────────────────────────────────────────────────────────
+
+    def step(self) -> None:
+        """Advance the resident graph by one tick."""
+        if (
+            not self._inert
+            and not self._calculator_overrides
+            and self._graph is not None
+            and _is_inert(self._graph)
+        ):
+            # The previous tick emptied the world: from here on step() would
+            # short-circuit on the materialized state. Freeze it.
+            self.materialize()
+            self._graph = None
+            self._inert = True
+
+        if self._inert:
+            state = self.materialize()
+            self._materialized = state.model_copy(update={"tick": state.tick + 1})
+            self._tick += 1
+            self._maybe_checkpoint()
+            return
+
+        self._warn_insolvent_states()
+        self._canonicalize()
+        G = self._require_graph()
+        self._node_snapshot = {
+            node_id: _freeze_payload(payload) for node_id, payload in G.nodes(data=True)
+        }
+        self._edge_snapshot = {
+            (source, target): _freeze_payload(payload)
+            for source, target, payload in G.edges(data=True)
+        }
+
+        tick_log, structured_events = _step_graph(
+            G,
+            self._tick,
+            self._config,
+            persistent_context=self._persistent_context,
+            defines=self._defines,
+            calculator_overrides=self._calculator_overrides,
+            services=self._run_services(),
+        )
+        self._event_log = self._event_log.extended(tick_log)
+        self._events = structured_events
+        self._tick += 1
+        self._materialized = None
+        self._maybe_checkpoint()
+
+    def run(self, ticks: int) -> WorldState:
+        """Advance ``ticks`` ticks and return the materialized final state."""
+        for _ in range(ticks):
+            self.step()
+        return self.materialize()
+
+    # ── internals ────────────────────────────────────────────────────────
+
+    def _run_services(self) -> ServiceContainer:
+        if self._services is None:
+            defines = self._defines if self._defines is not None else GameDefines.load_default()
+            self._services = ServiceContainer.create(
+                self._config, defines, **(self._calculator_overrides or {})
+            )
+        return self._services
+
+    def _require_graph(self) -> BabylonGraph:
+        if self._graph is None:  # pragma: no cover — guarded by _inert
+            raise RuntimeError("session has no resident graph")
+        return self._graph
+
+    def _maybe_checkpoint(self) -> None:
+        if self._checkpoint_every is None or self._tick % self._checkpoint_every != 0:
+            return
+        state = self.materialize()
+        if self._on_checkpoint is not None:
+            self._on_checkpoint(state)
+
+    def _warn_insolvent_states(self) -> None:
+        """``step()``'s Epoch 1 cost-check, read off the current state."""
+        for state_id, finance in self._current_finances().items():
+            if finance.treasury < finance.burn_rate:
+                logger.warning(
+                    f"State {state_id} treasury ({finance.treasury:.2f}) < "
+                    f"burn_rate ({finance.burn_rate:.2f})"
+                )
+
+    def _current_finances(self) -> dict[str, StateFinance]:
+        """The current ``state_finances`` without materializing the world."""
+        if self._materialized is not None:
+            return dict(self._materialized.state_finances)
+        raw = self._require_graph().graph.get("state_finances", {})
+        return {state_id: StateFinance(**data) for state_id, data in raw.items()}
+
+    def _canonicalize(self) -> None:
+        """Bring the post-tick graph to its ``to_graph(from_graph(G))`` image."""
+        G = self._require_graph()
+        nodes_before = self._node_snapshot
+        edges_before = self._edge_snapshot
+        if nodes_before is None or edges_before is None:
+            return  # freshly built by to_graph: already canonical
+        if self._structure_changed(G, nodes_before, edges_before):
+            self._full_round_trips += 1
+            self._graph = self.materialize().to_graph()
+            return
+
+        for node_id, payload in G.nodes(data=True):
+            if payload == nodes_before[node_id]:
+                for key in _NODE_RESTAMP_KEYS:
+                    payload.pop(key, None)
+            else:
+                _replace_payload(payload, canonical_node_payload(node_id, payload))
+        for source, target, payload in G.edges(data=True):
+            if payload == edges_before[(source, target)]:
+                for key in _EDGE_RESTAMP_KEYS:
+                    payload.pop(key, None)
+            else:
+                _replace_payload(payload, canonical_edge_payload(source, target, payload))
+
+        self._canonicalize_graph_attrs(G)
+
+    def _structure_changed(
+        self,
+        G: BabylonGraph,
+        nodes_before: dict[str, Mapping[str, Any]],
+        edges_before: dict[tuple[str, str], Mapping[str, Any]],
+    ) -> bool:
+        if list(G.nodes) != list(nodes_before) or list(G.edges) != list(edges_before):
+            return True
+        for node_id, payload in G.nodes(data=True):
+            derived_keys = _DERIVED_EDGE_KEYS.get(payload.get("_node_type", ""), ())
+            before = nodes_before[node_id]
+            if any(payload.get(key) != before.get(key) for key in derived_keys):
+                return True
+        return False
+
+    def _canonicalize_graph_attrs(self, G: BabylonGraph) -> None:
+        """Rebuild graph metadata through a metadata-only round-trip.
+
+        Carriers the round-trip reads back (economy, state_finances, frames,
+        the field stack, the optional axes) are re-validated and re-dumped;
+        everything else a system stashed on ``G.graph`` this tick is dropped,
+        exactly as ``from_graph`` drops it. ``events``/``event_log`` are not
+        re-emitted: the session holds them and no system reads them off the
+        graph.
+        """
+        from babylon.topology.graph import BabylonGraph
+
+        metadata_graph = BabylonGraph()
+        metadata_graph.graph.update(G.graph)
+        carrier = WorldState.from_graph(metadata_graph, tick=self._tick, event_log=[], events=[])
+        canonical_attrs = carrier.to_graph().graph
+        canonical_attrs.pop("events", None)
+        canonical_attrs.pop("event_log", None)
+        G.graph.clear()
+        G.graph.update(canonical_attrs)
+        carrier._restamp_field_stack(G)
+
+
+def _replace_payload(payload: dict[str, Any], canonical: dict[str, Any]) -> None:
+    """Make live ``payload`` equal ``canonical`` in place (aliases stay valid)."""
+    for key in [key for key in payload if key not in canonical]:
+        del payload[key]
+    payload.update(canonical)
+
+
+__all__ = ["SimulationSession"]
@@ -40,6 +40,7 @@ Cross-tick + handoff channel.
 from __future__ import annotations
 
 import math
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from babylon.domain.dialectics.core.coupling import StanceIntervention, apply_interventions
@@ -82,6 +83,8 @@ from babylon.models.enums import (
 from babylon.sentinels.partition.registry import cell_name
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from babylon.domain.dialectics.core.opposition import OppositionRegistry, OppositionSpec
     from babylon.kernel.graph_protocol import GraphProtocol
     from babylon.kernel.services import ServicesProtocol
@@ -384,27 +387,31 @@ class ContradictionSystem(SystemBase):
                 Defaults to 0 so existing direct callers (tests exercising
                 this method in isolation) are unaffected.
         """
+        # One zero-copy pass gives every edge loop below an O(1) endpoint
+        # read instead of a ``get_node`` model copy per endpoint per edge.
+        nodes = dict(graph.iter_nodes())
+
         exploitation: list[tuple[float, float]] = []
         exploitation_ids: list[tuple[str, str, float, float]] = []
-        for edge in graph.query_edges(edge_type=EdgeType.EXPLOITATION):
-            pair = self._edge_wealths(graph, edge.source_id, edge.target_id)
+        for source_id, target_id, _ in graph.iter_edges(EdgeType.EXPLOITATION):
+            pair = self._edge_wealths(nodes, source_id, target_id)
             if pair is not None:  # (labor=source=A, capital=target=B)
                 exploitation.append(pair)
-                exploitation_ids.append((edge.source_id, edge.target_id, *pair))
+                exploitation_ids.append((source_id, target_id, *pair))
 
         tenancy: list[tuple[float, float]] = []
         tenancy_ids: list[tuple[str, str, float, float]] = []
-        for edge in graph.query_edges(edge_type=EdgeType.TENANCY):
-            src = graph.get_node(edge.source_id)
-            tgt = graph.get_node(edge.target_id)
+        for source_id, target_id, _ in graph.iter_edges(EdgeType.TENANCY):
+            src = nodes.get(source_id)
+            tgt = nodes.get(target_id)
             if src is None or tgt is None:
                 continue
             pair = (
-                float(src.attributes.get("wealth", 0.0)),
-                float(tgt.attributes.get("rent_level", 0.0)),
+                float(src.get("wealth", 0.0)),
+                float(tgt.get("rent_level", 0.0)),
             )
             tenancy.append(pair)
-            tenancy_ids.append((edge.source_id, edge.target_id, *pair))
+            tenancy_ids.append((source_id, target_id, *pair))
 
         # Phase D4: one (w_paid, v_produced) pair per paid worker class node.
         # Only the wages phase writes both attrs (on classes it actually paid),
@@ -412,14 +419,13 @@ class ContradictionSystem(SystemBase):
         # filter; skip inactive nodes as the edge extractors do.
         wage_value: list[tuple[float, float]] = []
         wage_value_ids: list[tuple[str, float, float]] = []
-        for node in graph.query_nodes():
-            attrs = node.attributes
+        for node_id, attrs in nodes.items():
             if not attrs.get("active", True):
                 continue
             if "w_paid" not in attrs or "v_produced" not in attrs:
                 continue
             wage_value.append((float(attrs["w_paid"]), float(attrs["v_produced"])))
-            wage_value_ids.append((node.id, float(attrs["w_paid"]), float(attrs["v_produced"])))
+            wage_value_ids.append((node_id, float(attrs["w_paid"]), float(attrs["v_produced"])))
 
         market_balance: float | None = None
         market_raw = graph.get_graph_attr("market", None)
@@ -507,8 +513,7 @@ class ContradictionSystem(SystemBase):
         """
         wealth_sum = 0.0
         subsistence_sum = 0.0
-        for node in sorted(graph.query_nodes(node_type=NodeType.SOCIAL_CLASS), key=lambda n: n.id):
-            attrs = node.attributes
+        for _, attrs in sorted(graph.iter_nodes(NodeType.SOCIAL_CLASS), key=itemgetter(0)):
             if not attrs.get("active", True):
                 continue
             subsistence = attrs.get("subsistence_threshold")
@@ -578,27 +583,25 @@ class ContradictionSystem(SystemBase):
             summation order is fixed (Constitution III.7).
         """
         influence_by_faction: dict[str, float] = {}
-        for edge in sorted(
-            graph.query_edges(edge_type=EdgeType.INFLUENCES),
-            key=lambda e: (e.source_id, e.target_id),
+        for source_id, _, edge_attrs in sorted(
+            graph.iter_edges(EdgeType.INFLUENCES),
+            key=itemgetter(0, 1),
         ):  # sorted: fixes float summation order (III.7)
-            level = float(edge.attributes.get("influence_level", 0.0))
+            level = float(edge_attrs.get("influence_level", 0.0))
             if level <= 0.0:
                 continue
-            influence_by_faction[edge.source_id] = (
-                influence_by_faction.get(edge.source_id, 0.0) + level
-            )
+            influence_by_faction[source_id] = influence_by_faction.get(source_id, 0.0) + level
 
         weighted_score = 0.0
         weight_total = 0.0
-        for node in sorted(
-            graph.query_nodes(node_type=NodeType.FACTION),
-            key=lambda n: n.id,
+        for node_id, attrs in sorted(
+            graph.iter_nodes(NodeType.FACTION),
+            key=itemgetter(0),
         ):  # sorted: fixes float summation order (III.7)
-            weight = influence_by_faction.get(node.id, 0.0)
+            weight = influence_by_faction.get(node_id, 0.0)
             if weight <= 0.0:
                 continue
-            stance_raw = node.attributes.get("colonial_stance")
+            stance_raw = attrs.get("colonial_stance")
             if not isinstance(stance_raw, str):
                 continue
             try:
@@ -824,18 +827,18 @@ class ContradictionSystem(SystemBase):
 
     @staticmethod
     def _edge_wealths(
-        graph: GraphProtocol, source_id: str, target_id: str
+        nodes: Mapping[str, Mapping[str, Any]], source_id: str, target_id: str
     ) -> tuple[float, float] | None:
         """(source_wealth, target_wealth), skipping inactive endpoints."""
-        src = graph.get_node(source_id)
-        tgt = graph.get_node(target_id)
+        src = nodes.get(source_id)
+        tgt = nodes.get(target_id)
         if src is None or tgt is None:
             return None
-        if not src.attributes.get("active", True) or not tgt.attributes.get("active", True):
+        if not src.get("active", True) or not tgt.get("active", True):
             return None
         return (
-            float(src.attributes.get("wealth", 0.0)),
-            float(tgt.attributes.get("wealth", 0.0)),
+            float(src.get("wealth", 0.0)),
+            float(tgt.get("wealth", 0.0)),
         )
 
     # ------------------------------------------------------------------
@@ -1071,12 +1074,13 @@ class ContradictionSystem(SystemBase):
         (single-county in-memory tests) — the caller then classifies rate-only.
         """
         by_county: dict[str, list[float]] = {}
-        for edge in graph.query_edges(edge_type=EdgeType.EXPLOITATION):
-            src = graph.get_node(edge.source_id)
+        nodes = dict(graph.iter_nodes())
+        for source_id, _, edge_attrs in graph.iter_edges(EdgeType.EXPLOITATION):
+            src = nodes.get(source_id)
             if src is None:
                 continue
-            county = src.attributes.get("county_fips")
-            tension = edge.attributes.get("tension")
+            county = src.get("county_fips")
+            tension = edge_attrs.get("tension")
             if county is None or not isinstance(tension, (int, float)):
                 continue
             by_county.setdefault(str(county), []).append(float(tension))
@@ -20,18 +20,38 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any, ClassVar
 
+import numpy as np
+
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from numpy.typing import NDArray
+
     from babylon.kernel.graph_protocol import GraphProtocol
     from babylon.kernel.services import ServicesProtocol
+    from babylon.topology.sparse_operators import GraphOperators
 
 from babylon.kernel.event_bus import Event
 from babylon.kernel.system_base import SystemBase
 from babylon.kernel.system_protocol import ContextType
 from babylon.kernel.tick_partition import TickPartition
 from babylon.models.enums import EventType, NodeType
+from babylon.topology.graph import BabylonGraph
+from babylon.topology.sparse_operators import graph_operators
 
 logger = logging.getLogger(__name__)
 
+SPARSE_LAPLACIAN_ABS_TOL: float = 1e-9
+"""Documented agreement between the sparse and scalar Laplacian paths.
+
+The sparse path evaluates ``sum(w*f_j) - f_i*sum(w)`` rather than
+``sum(w*(f_j - f_i))``; the reordering costs O(degree * eps * |w*f|) of
+rounding. For fields in [0, 1] and O(1) weights that stays below this
+bound per node and field up to degree ~10^6. Gradients are exact.
+"""
+
+_GRAPH_EDGE_LIFTED_KEYS = frozenset({"_edge_type", "edge_type", "weight"})
+
 
 class FieldDerivativeSystem(SystemBase):
     """Compute spatial and temporal derivatives for contradiction fields.
@@ -117,8 +137,8 @@ def _discover_field_names(graph: GraphProtocol) -> list[str]:
         Sorted list of distinct field names (empty when no node carries fields).
     """
     names: set[str] = set()
-    for node in graph.query_nodes(node_type=NodeType.SOCIAL_CLASS):
-        fields = node.attributes.get("contradiction_fields", {})
+    for _, payload in graph.iter_nodes(NodeType.SOCIAL_CLASS):
+        fields = payload.get("contradiction_fields", {})
         if isinstance(fields, dict):
             names.update(fields.keys())
     return sorted(names)
@@ -130,10 +150,35 @@ def _compute_edge_gradients(
 ) -> None:
     """Compute gradient = f(target) - f(source) on every edge.
 
+    Edges whose endpoints do not both carry ``contradiction_fields`` are
+    skipped. A :class:`~babylon.topology.graph.BabylonGraph` takes the
+    vectorized path (:func:`_sparse_edge_gradients`), which is exact: each
+    gradient is the same single subtraction the scalar scan performs.
+
     Args:
         graph: Graph with contradiction_fields on nodes.
         field_names: List of field names to compute gradients for.
     """
+    if isinstance(graph, BabylonGraph):
+        computed = _sparse_edge_gradients(graph, field_names)
+    else:
+        computed = _scalar_edge_gradients(graph, field_names)
+
+    for source_id, target_id, edge_type, gradients in computed:
+        graph.update_edge(
+            source_id,
+            target_id,
+            edge_type,
+            field_gradients=gradients,
+        )
+
+
+def _scalar_edge_gradients(
+    graph: GraphProtocol,
+    field_names: list[str],
+) -> list[tuple[str, str, str, dict[str, float]]]:
+    """Per-edge gradient scan for GraphProtocol implementations without operators."""
+    computed: list[tuple[str, str, str, dict[str, float]]] = []
     for edge in graph.query_edges():
         src_node = graph.get_node(edge.source_id)
         tgt_node = graph.get_node(edge.target_id)
@@ -154,12 +199,27 @@ def _compute_edge_gradients(
             tgt_val = tgt_fields.get(field_name, 0.0)
             gradients[field_name] = tgt_val - src_val
 
-        graph.update_edge(
-            edge.source_id,
-            edge.target_id,
-            edge.edge_type,
-            field_gradients=gradients,
-        )
+        computed.append((edge.source_id, edge.target_id, edge.edge_type, gradients))
+    return computed
+
+
+def _sparse_edge_gradients(
+    graph: BabylonGraph,
+    field_names: list[str],
+) -> list[tuple[str, str, str, dict[str, float]]]:
+    """All edge gradients at once as ``F[targets] - F[sources]``, in edge order."""
+    operators = graph_operators(graph)
+    values, _, has_fields = _field_matrix(graph, operators, field_names)
+    eligible = has_fields[operators.edge_sources] & has_fields[operators.edge_targets]
+    gradients = values[operators.edge_targets] - values[operators.edge_sources]
+
+    computed: list[tuple[str, str, str, dict[str, float]]] = []
+    for position in np.flatnonzero(eligible).tolist():
+        source_id, target_id = operators.edge_keys[position]
+        edge_type = graph.edges[source_id, target_id].get("_edge_type", "unknown")
+        row = gradients[position].tolist()
+        computed.append((source_id, target_id, edge_type, dict(zip(field_names, row, strict=True))))
+    return computed
 
 
 def _compute_node_derivatives(
@@ -173,6 +233,12 @@ def _compute_node_derivatives(
     When ``edge_weight_attr`` is provided, computes a weighted Laplacian:
     ``sum(w_j * (f(j) - f(i)))`` instead of ``sum(f(j) - f(i))``.
 
+    A :class:`~babylon.topology.graph.BabylonGraph` computes every
+    Laplacian in two sparse mat-vec products (:func:`_sparse_laplacians`);
+    other GraphProtocol implementations take the per-node neighbor scan
+    (:func:`_scalar_laplacians`). The two agree to within
+    :data:`SPARSE_LAPLACIAN_ABS_TOL`.
+
     Args:
         graph: Graph with contradiction_fields on nodes.
         field_names: List of field names.
@@ -180,14 +246,56 @@ def _compute_node_derivatives(
         edge_weight_attr: Optional edge attribute name for weights.
             None = unweighted (all weights 1.0), preserving backward compat.
     """
+    if isinstance(graph, BabylonGraph):
+        laplacians = _sparse_laplacians(graph, field_names, edge_weight_attr)
+    else:
+        laplacians = _scalar_laplacians(graph, field_names, edge_weight_attr)
+
+    for node_id, node_laplacians in laplacians.items():
+        node_history = history.get(node_id, {})
+
+        field_derivatives: dict[str, dict[str, float | None]] = {}
+        for field_name in field_names:
+            # Temporal derivatives from history
+            field_hist = node_history.get(field_name, [])
+            df_dt: float | None = None
+            d2f_dt2: float | None = None
+
+            if len(field_hist) >= 2:
+                # df/dt = f(t) - f(t-1)
+                df_dt = field_hist[-1] - field_hist[-2]
+
+            if len(field_hist) >= 3:
+                # d2f/dt2 = f(t) - 2*f(t-1) + f(t-2)
+                d2f_dt2 = field_hist[-1] - 2.0 * field_hist[-2] + field_hist[-3]
+
+            field_derivatives[field_name] = {
+                "laplacian": node_laplacians[field_name],
+                "df_dt": df_dt,
+                "d2f_dt2": d2f_dt2,
+            }
+
+        graph.update_node(node_id, field_derivatives=field_derivatives)
+
+
+def _scalar_laplacians(
+    graph: GraphProtocol,
+    field_names: list[str],
+    edge_weight_attr: str | None = None,
+) -> dict[str, dict[str, float]]:
+    """Per-node Laplacians by neighbor scan: the reference the sparse path matches.
+
+    Returns:
+        ``{node_id: {field_name: laplacian}}`` for every social_class node
+        carrying ``contradiction_fields``, in node iteration order.
+    """
+    laplacians: dict[str, dict[str, float]] = {}
     for node in graph.query_nodes(node_type=NodeType.SOCIAL_CLASS):
         node_id = node.id
         node_fields: dict[str, float] = node.attributes.get("contradiction_fields", {})
         if not node_fields:
             continue
 
-        node_history = history.get(node_id, {})
-
         # Collect neighbor field values and edge weights
         neighbor_fields, edge_weights = _collect_neighbor_fields(
             graph,
@@ -196,7 +304,7 @@ def _compute_node_derivatives(
             edge_weight_attr=edge_weight_attr,
         )
 
-        field_derivatives: dict[str, dict[str, float | None]] = {}
+        node_laplacians: dict[str, float] = {}
         for field_name in field_names:
             my_val = node_fields.get(field_name, 0.0)
 
@@ -208,33 +316,109 @@ def _compute_node_derivatives(
                 )
             else:
                 laplacian = 0.0
-                if not neighbor_vals:
-                    logger.debug(
-                        "EC-002: Isolated node %s, Laplacian=0.0 for %s",
-                        node_id,
-                        field_name,
-                    )
+                logger.debug(
+                    "EC-002: Isolated node %s, Laplacian=0.0 for %s",
+                    node_id,
+                    field_name,
+                )
+            node_laplacians[field_name] = laplacian
+        laplacians[node_id] = node_laplacians
+    return laplacians
 
-            # Temporal derivatives from history
-            field_hist = node_history.get(field_name, [])
-            df_dt: float | None = None
-            d2f_dt2: float | None = None
 
-            if len(field_hist) >= 2:
-                # df/dt = f(t) - f(t-1)
-                df_dt = field_hist[-1] - field_hist[-2]
+def _sparse_laplacians(
+    graph: BabylonGraph,
+    field_names: list[str],
+    edge_weight_attr: str | None = None,
+) -> dict[str, dict[str, float]]:
+    """All Laplacians at once from the graph's cached CSR adjacency.
 
-            if len(field_hist) >= 3:
-                # d2f/dt2 = f(t) - 2*f(t-1) + f(t-2)
-                d2f_dt2 = field_hist[-1] - 2.0 * field_hist[-2] + field_hist[-3]
+    With ``F`` the node x field value matrix (0.0 where absent), ``M`` its
+    presence mask and ``W`` the symmetric neighbor adjacency (weighted by
+    the first edge joining each pair, as the scalar scan does)::
 
-            field_derivatives[field_name] = {
-                "laplacian": laplacian,
-                "df_dt": df_dt,
-                "d2f_dt2": d2f_dt2,
-            }
+        L = W @ (M * F) - F * (W @ M)
 
-        graph.update_node(node_id, field_derivatives=field_derivatives)
+    which is ``sum_j w_ij * m_j * (f_j - f_i)`` per node and field — a
+    neighbor contributes to a field only if it carries that field.
+
+    Returns:
+        Same shape and order as :func:`_scalar_laplacians`.
+    """
+    operators = graph_operators(graph)
+    values, present, _ = _field_matrix(graph, operators, field_names)
+    if edge_weight_attr is None:
+        adjacency = operators.adjacency
+    else:
+        pair_weights = np.fromiter(
+            (
+                _edge_weight(graph.edges[operators.edge_keys[position]], edge_weight_attr)
+                for position in operators.pair_edges.tolist()
+            ),
+            dtype=np.float64,
+            count=len(operators.pair_edges),
+        )
+        adjacency = operators.weighted_adjacency(pair_weights)
+    laplacian_matrix = adjacency @ (values * present) - values * (adjacency @ present)
+
+    isolated = None
+    if logger.isEnabledFor(logging.DEBUG):
+        isolated = (operators.adjacency @ present) == 0.0
+
+    laplacians: dict[str, dict[str, float]] = {}
+    for node_id, payload in graph.iter_nodes(NodeType.SOCIAL_CLASS):
+        if not payload.get("contradiction_fields", {}):
+            continue
+        row = operators.row_of[node_id]
+        if isolated is not None:
+            for column in np.flatnonzero(isolated[row]).tolist():
+                logger.debug(
+                    "EC-002: Isolated node %s, Laplacian=0.0 for %s",
+                    node_id,
+                    field_names[column],
+                )
+        laplacians[node_id] = dict(zip(field_names, laplacian_matrix[row].tolist(), strict=True))
+    return laplacians
+
+
+def _field_matrix(
+    graph: BabylonGraph,
+    operators: GraphOperators,
+    field_names: list[str],
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.bool_]]:
+    """Gather ``contradiction_fields`` into operator-row-ordered arrays.
+
+    Returns:
+        ``(values, present, has_fields)``: N x K values (0.0 where absent),
+        the matching 0/1 presence mask, and a per-node flag for a non-empty
+        ``contradiction_fields`` dict.
+    """
+    column_of = {name: column for column, name in enumerate(field_names)}
+    n_nodes = len(operators.node_ids)
+    values = np.zeros((n_nodes, len(field_names)), dtype=np.float64)
+    present = np.zeros((n_nodes, len(field_names)), dtype=np.float64)
+    has_fields = np.zeros(n_nodes, dtype=np.bool_)
+    for node_id, payload in graph.iter_nodes():
+        fields = payload.get("contradiction_fields", {})
+        if not fields:
+            continue
+        row = operators.row_of[node_id]
+        has_fields[row] = True
+        for name, value in fields.items():
+            column = column_of.get(name)
+            if column is not None:
+                values[row, column] = value
+                present[row, column] = 1.0
+    return values, present, has_fields
+
+
+def _edge_weight(payload: Mapping[str, Any], edge_weight_attr: str) -> float:
+    """Edge weight as the scalar scan reads it from ``GraphEdge.attributes``."""
+    # GraphEdge lifts these keys out of ``attributes``, so the scalar scan
+    # never sees them and falls back to 1.0; match it.
+    if edge_weight_attr in _GRAPH_EDGE_LIFTED_KEYS:
+        return 1.0
+    return float(payload.get(edge_weight_attr, 1.0))
 
 
 def _collect_neighbor_fields(
@@ -336,9 +520,9 @@ def _build_field_stack(graph: GraphProtocol) -> dict[str, Any]:
         at least one registered field name.
     """
     raw_nodes: dict[str, dict[str, Any]] = {}
-    for node in graph.query_nodes(node_type=NodeType.SOCIAL_CLASS):
-        fields: dict[str, float] = node.attributes.get("contradiction_fields", {})
-        derivs: dict[str, dict[str, float | None]] = node.attributes.get("field_derivatives", {})
+    for node_id, payload in graph.iter_nodes(NodeType.SOCIAL_CLASS):
+        fields: dict[str, float] = payload.get("contradiction_fields", {})
+        derivs: dict[str, dict[str, float | None]] = payload.get("field_derivatives", {})
         if not fields and not derivs:
             continue
         entry: dict[str, Any] = {}
@@ -346,19 +530,19 @@ def _build_field_stack(graph: GraphProtocol) -> dict[str, Any]:
             entry["fields"] = {name: fields[name] for name in sorted(fields)}
         if derivs:
             entry["field_derivatives"] = {name: derivs[name] for name in sorted(derivs)}
-        raw_nodes[node.id] = entry
+        raw_nodes[node_id] = entry
     nodes = {node_id: raw_nodes[node_id] for node_id in sorted(raw_nodes)}
 
     edges: list[dict[str, Any]] = []
-    for edge in graph.query_edges():
-        gradients: dict[str, float] = edge.attributes.get("field_gradients", {})
+    for source_id, target_id, edge_payload in graph.iter_edges():
+        gradients: dict[str, float] = edge_payload.get("field_gradients", {})
         if not gradients:
             continue
         for field_name in sorted(gradients):
             edges.append(
                 {
-                    "source": edge.source_id,
-                    "target": edge.target_id,
+                    "source": source_id,
+                    "target": target_id,
                     "field": field_name,
                     "gradient": gradients[field_name],
                 }
@@ -392,8 +576,8 @@ def _identify_principal_contradiction(
     field_max_abs_df_dt: dict[str, float] = dict.fromkeys(field_names, 0.0)
     field_total_magnitude: dict[str, float] = dict.fromkeys(field_names, 0.0)
 
-    for node in graph.query_nodes(node_type=NodeType.SOCIAL_CLASS):
-        derivs: dict[str, dict[str, float | None]] = node.attributes.get("field_derivatives", {})
+    for _, payload in graph.iter_nodes(NodeType.SOCIAL_CLASS):
+        derivs: dict[str, dict[str, float | None]] = payload.get("field_derivatives", {})
         for field_name in field_names:
             field_deriv = derivs.get(field_name, {})
             df_dt = field_deriv.get("df_dt")
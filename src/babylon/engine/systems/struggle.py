@@ -186,13 +186,13 @@ def _find_entity_by_role(
     Returns:
         Tuple of (node_id, node_data) or None if not found
     """
-    for node in graph.query_nodes():
+    # Zero-copy scan; only the match is materialized (a private copy, as
+    # query_nodes gave every node).
+    for node_id, attrs in graph.iter_nodes():
         # Skip territory nodes (only process entity/social_class nodes)
-        if node.node_type == "territory":
+        if attrs.get("_node_type", "unknown") == "territory":
             continue
 
-        attrs = node.attributes
-
         # Skip inactive (dead) entities
         if not attrs.get("active", True):
             continue
@@ -205,7 +205,8 @@ def _find_entity_by_role(
                 continue
 
         if node_role == role:
-            return (node.id, attrs)
+            node = graph.get_node(node_id)
+            return None if node is None else (node_id, node.attributes)
 
     return None
 
@@ -338,15 +339,16 @@ class StruggleSystem(SystemBase):
             solidarity_gained = 0.0
             edges_updated = 0
 
-            for edge in graph.query_edges(edge_type=EdgeType.SOLIDARITY):
-                if edge.target_id != node.id:
-                    continue
-
-                current_strength = edge.attributes.get("solidarity_strength", 0.0)
+            # Incoming edges only: O(in-degree), not a scan of every
+            # SOLIDARITY edge per uprising node.
+            for source_id, target_id, edge_attrs in list(
+                graph.iter_in_edges(node.id, EdgeType.SOLIDARITY)
+            ):
+                current_strength = edge_attrs.get("solidarity_strength", 0.0)
                 new_strength = min(1.0, current_strength + solidarity_gain)
                 graph.update_edge(
-                    edge.source_id,
-                    edge.target_id,
+                    source_id,
+                    target_id,
                     EdgeType.SOLIDARITY,
                     solidarity_strength=new_strength,
                 )
@@ -666,11 +668,10 @@ class StruggleSystem(SystemBase):
             return  # No revolt - acquiescence is rational
 
         # Revolt triggered! Collect outgoing EXPLOITATION edges to sever
-        edges_to_remove: list[tuple[str, str, str]] = []
-
-        for edge in graph.query_edges(edge_type=EdgeType.EXPLOITATION):
-            if edge.source_id == p_w_id:
-                edges_to_remove.append((edge.source_id, edge.target_id, EdgeType.EXPLOITATION))
+        edges_to_remove: list[tuple[str, str, str]] = [
+            (source_id, target_id, EdgeType.EXPLOITATION)
+            for source_id, target_id, _ in graph.iter_out_edges(p_w_id, EdgeType.EXPLOITATION)
+        ]
 
         # Remove edges individually (protocol has no batch remove)
         for source_id, target_id, edge_type in edges_to_remove:
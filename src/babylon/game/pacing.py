@@ -422,7 +422,10 @@ class PacedTickDriver:
             self._busy_lock.release()
 
     def run_until_paused(
-        self, *, max_ticks: int = _DEFAULT_MAX_TICKS_PER_RUN
+        self,
+        *,
+        max_ticks: int = _DEFAULT_MAX_TICKS_PER_RUN,
+        on_tick: Callable[[TickOutcomeLike], None] | None = None,
     ) -> tuple[TickOutcomeLike, ...]:
         """Advance repeatedly until an autopause, the endgame lock, or
         ``max_ticks`` — whichever comes first.
@@ -434,7 +437,15 @@ class PacedTickDriver:
         a caller running this inside a Textual worker is exactly the
         scenario the module docstring's Re-entrancy note describes.
 
+        ``on_tick`` streams each outcome as soon as its tick is resolved
+        (and its lock/autopause state updated), before the inter-tick
+        ``tick_delay`` — so a UI can paint tick N while tick N+1 is still
+        being computed instead of waiting for the whole run. It is called
+        on THIS method's thread; a Textual caller marshals back onto the
+        event loop itself (``App.call_from_thread``).
+
         :param max_ticks: the hard per-call ceiling.
+        :param on_tick: optional per-tick outcome callback.
         :returns: every resolved tick's outcome, in order (never empty:
             at least one tick is always resolved before this method can
             return, or an exception propagates instead).
@@ -451,6 +462,8 @@ class PacedTickDriver:
             for _ in range(max_ticks):
                 result = self._advance_and_check()
                 results.append(result)
+                if on_tick is not None:
+                    on_tick(result)
                 if self._locked or self.awaiting_ack:
                     break
                 if self._tick_delay > 0.0:
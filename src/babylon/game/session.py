@@ -1279,7 +1279,7 @@ def open_runtime(dsn: str | None = None) -> PostgresRuntime:
             "No Postgres DSN: set BABYLON_PG_DSN (or BABYLON_TEST_PG_DSN), or pass dsn= explicitly."
         )
     pool = ConnectionPool(resolved, min_size=1, max_size=4, open=True)
-    return PostgresRuntime(pool=pool)
+    return PostgresRuntime(pool=pool, delta_snapshots=True)
 
 
 def vault_page_source(vault_root: Path) -> VaultPageSource:
@@ -59,6 +59,9 @@ from typing import Any
 # Document processing (core functionality)
 from .chunker import DocumentChunk, DocumentProcessor, Preprocessor, TextChunker
 
+# Persistent embedding cache (stdlib sqlite3 only)
+from .embedding_store import EmbeddingStore
+
 # Exceptions
 from .exceptions import (
     CacheError,
@@ -138,6 +141,7 @@ __all__ = [
     "LifecycleManager",
     "ObjectState",
     "PerformanceMetrics",
+    "EmbeddingStore",
     "RagError",
     "LifecycleError",
     "InvalidObjectError",
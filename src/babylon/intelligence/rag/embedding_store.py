@@ -0,0 +1,123 @@
+"""Persistent, process-shared embedding cache backed by SQLite.
+
+:class:`~babylon.intelligence.rag.embeddings.EmbeddingManager` keeps an
+in-process LRU, so every restart used to re-embed the whole corpus. An
+:class:`EmbeddingStore` sits behind that LRU: vectors are stored as
+float64 blobs keyed by ``(model, sha256(content))``, so re-ingesting the
+lore corpus after a small edit only pays for the chunks whose text
+changed, and a vector from one model is never served for another.
+
+The database runs in WAL mode with a busy timeout, so several ingest
+workers can share one file; writes are ``INSERT OR REPLACE`` of immutable
+content-addressed rows, so a lost race writes the same vector twice.
+Vectors round-trip exactly, so a stored vector equals the fresh one.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Final
+
+_SCHEMA: Final[str] = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (model, content_hash)
+) WITHOUT ROWID
+"""
+
+# Only "?" placeholders are formatted in; every value is bound.
+_LOOKUP_SQL: Final[str] = (
+    "SELECT content_hash, vector FROM embeddings WHERE model = ? AND content_hash IN ({})"
+)
+
+#: Keys per ``IN (...)`` lookup, under SQLite's default 999 bound-parameter limit.
+_LOOKUP_CHUNK: Final[int] = 500
+
+
+class EmbeddingStore:
+    """SQLite table of float64 embedding vectors keyed by model and content hash.
+
+    Args:
+        path: Database file (parent directories are created).
+        timeout: Seconds to wait on another process's write lock.
+    """
+
+    def __init__(self, path: Path, timeout: float = 30.0) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self._path, timeout=timeout, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get_many(self, model: str, content_hashes: Iterable[str]) -> dict[str, list[float]]:
+        """Return the stored vectors among ``content_hashes`` for ``model``.
+
+        Args:
+            model: Embedding model name.
+            content_hashes: SHA-256 hex digests of the embedded content.
+
+        Returns:
+            Vector per found hash; misses are absent.
+        """
+        keys = list(dict.fromkeys(content_hashes))
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for start in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[start : start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(_LOOKUP_SQL.format(placeholders), (model, *chunk))
+                for content_hash, blob in rows:
+                    found[content_hash] = _decode(blob)
+        return found
+
+    def put_many(self, model: str, vectors: Mapping[str, Sequence[float]]) -> None:
+        """Store ``vectors`` (content hash -> vector) for ``model``.
+
+        Args:
+            model: Embedding model name.
+            vectors: Vector per content hash.
+        """
+        if not vectors:
+            return
+        rows = [
+            (model, content_hash, len(vector), array("d", vector).tobytes())
+            for content_hash, vector in vectors.items()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, content_hash, dim, vector) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _decode(blob: bytes) -> list[float]:
+    vector = array("d")
+    vector.frombytes(blob)
+    return vector.tolist()
+
+
+__all__ = ["EmbeddingStore"]
@@ -2,6 +2,13 @@
 
 Supports both local (Ollama) and cloud (OpenAI) embedding providers.
 Default: Ollama with embeddinggemma for fully offline operation.
+
+Batches go out as one request per chunk of inputs on the OpenAI-compatible
+``/v1/embeddings`` endpoint, which takes an ``input`` array from either
+provider; chunks are capped both by ``batch_size`` and by an estimated
+token budget. An optional :class:`EmbeddingStore` persists vectors by
+model and content hash, so re-ingesting a corpus only embeds the chunks
+whose text changed.
 """
 
 import asyncio
@@ -12,18 +19,23 @@ import time
 from collections import OrderedDict
 from collections.abc import Sequence
 from concurrent.futures import ThreadPoolExecutor
-from typing import Protocol, TypeVar
+from typing import Final, Protocol, TypeVar
 
 import aiohttp
 import backoff
 from ratelimit import limits, sleep_and_retry
 
 from babylon.config.llm_config import LLMConfig
+from babylon.intelligence.rag.context_window.token_counter import count_tokens
+from babylon.intelligence.rag.embedding_store import EmbeddingStore
 from babylon.intelligence.rag.exceptions import RagError
 from babylon.kernel.metrics import MetricsCollectorProtocol
 
 logger = logging.getLogger(__name__)
 
+#: Estimated tokens per multi-input request; one input over budget goes alone.
+DEFAULT_MAX_BATCH_TOKENS: Final[int] = 8192
+
 
 # Backward compatibility aliases - these now map to RagError
 EmbeddingError = RagError
@@ -65,15 +77,20 @@ class EmbeddingManager:
         max_cache_size: int = 1000,
         max_concurrent_requests: int = 4,
         metrics: MetricsCollectorProtocol | None = None,
+        store: EmbeddingStore | None = None,
+        max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS,
     ):
         """Initialize the embedding manager.
 
         Args:
             embedding_dimension: Size of embedding vectors (default: from LLMConfig)
-            batch_size: Number of objects to embed in each batch (default: from LLMConfig)
+            batch_size: Maximum inputs per embedding request (default: from LLMConfig)
             max_cache_size: Maximum number of embeddings to keep in cache (default: 1000)
             max_concurrent_requests: Maximum number of concurrent embedding requests (default: 4)
             metrics: Optional metrics collector for DI (default: creates new MetricsCollector)
+            store: Optional persistent cache consulted behind the in-memory LRU
+            max_batch_tokens: Estimated token budget per multi-input request
+                (default: DEFAULT_MAX_BATCH_TOKENS)
 
         Raises:
             ValueError: If embedding configuration is invalid
@@ -81,6 +98,9 @@ class EmbeddingManager:
         # Validate embedding configuration
         LLMConfig.validate_embeddings()
 
+        if max_batch_tokens < 1:
+            raise ValueError(f"max_batch_tokens must be >= 1, got {max_batch_tokens}")
+
         # Initialize metrics collector via DI (Spec 008)
         if metrics is None:
             from babylon.metrics.collector import MetricsCollector
@@ -102,7 +122,10 @@ class EmbeddingManager:
         self.batch_size = batch_size or LLMConfig.BATCH_SIZE
         self.max_cache_size = max_cache_size
         self.max_concurrent_requests = max_concurrent_requests
+        self.max_batch_tokens = max_batch_tokens
         self._is_ollama = LLMConfig.is_ollama_embeddings()
+        self._model = LLMConfig.EMBEDDING_MODEL
+        self._store = store
 
         # Use OrderedDict for LRU cache implementation
         self._cache: OrderedDict[str, list[float]] = OrderedDict()
@@ -189,6 +212,56 @@ class EmbeddingManager:
         with self._cache_lock:
             return len(self._cache)
 
+    async def _lookup(self, cache_keys: Sequence[str]) -> dict[str, list[float]]:
+        """Resolve cache keys from the LRU, then from the persistent store.
+
+        Store hits are promoted into the LRU. The store is read in a worker
+        thread so SQLite never blocks the event loop.
+
+        Args:
+            cache_keys: Content hashes to resolve
+
+        Returns:
+            Embedding per found key; misses are absent
+        """
+        found: dict[str, list[float]] = {}
+        with self._cache_lock:
+            for key in cache_keys:
+                embedding = self._cache.get(key)
+                if embedding is not None:
+                    # Move to end to mark as most recently used
+                    self._cache.move_to_end(key)
+                    found[key] = embedding
+        if self._store is not None:
+            missing = [key for key in cache_keys if key not in found]
+            if missing:
+                stored = await asyncio.to_thread(self._store.get_many, self._model, missing)
+                await self._remember(stored, persist=False)
+                found.update(stored)
+        return found
+
+    async def _remember(self, embeddings: dict[str, list[float]], persist: bool = True) -> None:
+        """Add embeddings to the LRU (evicting as needed) and the persistent store.
+
+        The store is written in a worker thread.
+
+        Args:
+            embeddings: Embedding per cache key
+            persist: Also write to the persistent store, if configured
+        """
+        with self._cache_lock:
+            for key, embedding in embeddings.items():
+                if key not in self._cache and self.cache_size >= self.max_cache_size:
+                    # Remove least recently used (first item)
+                    self._cache.popitem(last=False)
+                    self.metrics.record_metric(
+                        name="cache_eviction", value=1.0, context="lru_eviction"
+                    )
+                self._cache[key] = embedding
+                self._cache.move_to_end(key)
+        if persist and self._store is not None:
+            await asyncio.to_thread(self._store.put_many, self._model, embeddings)
+
     @backoff.on_exception(
         backoff.expo,
         (aiohttp.ClientError, asyncio.TimeoutError),
@@ -253,6 +326,108 @@ class EmbeddingManager:
         except Exception as e:
             raise EmbeddingAPIError(f"Unexpected error: {str(e)}") from e
 
+    @backoff.on_exception(
+        backoff.expo,
+        (aiohttp.ClientError, asyncio.TimeoutError),
+        max_tries=LLMConfig.MAX_RETRIES,
+        max_time=30,
+    )
+    @sleep_and_retry
+    @limits(calls=LLMConfig.RATE_LIMIT_RPM, period=60)
+    async def _generate_embeddings_api(self, contents: Sequence[str]) -> list[list[float]]:
+        """Generate embeddings for several inputs in one ``/v1/embeddings`` request.
+
+        Ollama serves the same OpenAI-compatible endpoint, so this is the batch
+        path for both providers.
+
+        Args:
+            contents: Text contents to embed
+
+        Returns:
+            List[List[float]]: Embedding vectors, in input order
+
+        Raises:
+            EmbeddingAPIError: If the API request fails or returns the wrong count
+        """
+        session = await self._get_session()
+        payload = {"input": list(contents), "model": LLMConfig.EMBEDDING_MODEL}
+
+        try:
+            async with session.post(
+                LLMConfig.get_batch_embedding_url(),
+                json=payload,
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise EmbeddingAPIError(
+                        f"Embedding API error (status {response.status}): {error_text}"
+                    )
+
+                data = await response.json()
+
+                # OpenAI returns: {"data": [{"index": i, "embedding": [...]}, ...]}
+                items = sorted(data["data"], key=lambda item: item["index"])
+                if len(items) != len(contents):
+                    raise EmbeddingAPIError(
+                        f"Embedding API returned {len(items)} embeddings for {len(contents)} inputs"
+                    )
+                return [item["embedding"] for item in items]
+
+        except aiohttp.ClientError as e:
+            raise EmbeddingAPIError(f"API request failed: {str(e)}") from e
+        except TimeoutError as e:
+            raise EmbeddingAPIError("API request timed out") from e
+        except KeyError as e:
+            raise EmbeddingAPIError(f"Unexpected API response format: {str(e)}") from e
+        except EmbeddingAPIError:
+            raise
+        except Exception as e:
+            raise EmbeddingAPIError(f"Unexpected error: {str(e)}") from e
+
+    def _plan_requests(self, pending: dict[str, str]) -> list[list[tuple[str, str]]]:
+        """Split pending inputs into request-sized chunks.
+
+        A chunk closes at ``batch_size`` inputs or when the next input would
+        take it over ``max_batch_tokens``.
+
+        Args:
+            pending: Content per cache key, in first-seen order
+
+        Returns:
+            Chunks of ``(cache_key, content)`` pairs
+        """
+        chunks: list[list[tuple[str, str]]] = []
+        current: list[tuple[str, str]] = []
+        tokens = 0
+        for key, content in pending.items():
+            cost = count_tokens(content)
+            if current and (
+                len(current) >= self.batch_size or tokens + cost > self.max_batch_tokens
+            ):
+                chunks.append(current)
+                current, tokens = [], 0
+            current.append((key, content))
+            tokens += cost
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def _embed_chunk(self, chunk: list[tuple[str, str]]) -> dict[str, list[float]]:
+        """Embed one planned chunk in a single request and remember the results.
+
+        Args:
+            chunk: ``(cache_key, content)`` pairs
+
+        Returns:
+            Embedding per cache key
+        """
+        contents = [content for _, content in chunk]
+        async with self._get_semaphore():
+            vectors = await self._generate_embeddings_api(contents)
+        embeddings = {key: vector for (key, _), vector in zip(chunk, vectors, strict=True)}
+        await self._remember(embeddings)
+        return embeddings
+
     async def aembed(self, obj: E) -> E:
         """Asynchronously generate and attach embedding for a single object.
 
@@ -273,22 +448,19 @@ class EmbeddingManager:
         cache_key = self._get_cache_key(obj.content)
 
         # Check cache first
-        with self._cache_lock:
-            if cache_key in self._cache:
-                # Move to end to mark as most recently used
-                embedding = self._cache.pop(cache_key)
-                self._cache[cache_key] = embedding
-                obj.embedding = embedding
+        cached = (await self._lookup([cache_key])).get(cache_key)
+        if cached is not None:
+            obj.embedding = cached
 
-                # Record cache hit
-                self.metrics.record_cache_event("embedding", hit=True)
-                self.metrics.record_metric(
-                    name="embedding_cache_lookup_time",
-                    value=time.time() - start_time,
-                    context="cache_hit",
-                    object_id=obj.id,
-                )
-                return obj
+            # Record cache hit
+            self.metrics.record_cache_event("embedding", hit=True)
+            self.metrics.record_metric(
+                name="embedding_cache_lookup_time",
+                value=time.time() - start_time,
+                context="cache_hit",
+                object_id=obj.id,
+            )
+            return obj
 
         # Record cache miss
         self.metrics.record_cache_event("embedding", hit=False)
@@ -309,16 +481,8 @@ class EmbeddingManager:
                 )
 
                 # Add to cache with LRU eviction if needed
-                with self._cache_lock:
-                    if self.cache_size >= self.max_cache_size:
-                        # Remove least recently used (first item)
-                        self._cache.popitem(last=False)
-                        self.metrics.record_metric(
-                            name="cache_eviction", value=1.0, context="lru_eviction"
-                        )
-
-                    self._cache[cache_key] = embedding
-                    obj.embedding = embedding
+                await self._remember({cache_key: embedding})
+                obj.embedding = embedding
 
                 # Record memory usage
                 self.metrics.record_memory_usage(
@@ -364,6 +528,11 @@ class EmbeddingManager:
     async def aembed_batch(self, objects: Sequence[E]) -> list[E]:
         """Asynchronously generate embeddings for multiple objects efficiently.
 
+        Cached contents (LRU or persistent store) are attached without a
+        request; the remaining distinct contents are embedded in chunks
+        planned by :meth:`_plan_requests`, concurrently up to
+        ``max_concurrent_requests``.
+
         Args:
             objects: List of objects to embed
 
@@ -374,36 +543,36 @@ class EmbeddingManager:
             EmbeddingError: If any object's embedding generation fails
         """
         start_time = time.time()
-        results: list[E] = []
-        batch: list[E] = []
+        cache_keys = [self._get_cache_key(obj.content) for obj in objects]
+        resolved: dict[str, list[float]] = {}
 
         try:
-            for obj in objects:
-                if len(batch) >= self.batch_size:
-                    batch_start = time.time()
-                    # Process batch concurrently
-                    batch_results = await asyncio.gather(*[self.aembed(obj) for obj in batch])
-                    results.extend(batch_results)
-                    # Record batch processing time
-                    self.metrics.record_metric(
-                        name="batch_processing_time",
-                        value=time.time() - batch_start,
-                        context=f"batch_size_{len(batch)}",
-                    )
-                    batch = []
-                batch.append(obj)
-
-            if batch:
-                batch_start = time.time()
-                # Process remaining batch concurrently
-                batch_results = await asyncio.gather(*[self.aembed(obj) for obj in batch])
-                results.extend(batch_results)
+            if any(not obj.content for obj in objects):
+                raise ValueError("Cannot embed empty content")
+
+            resolved.update(await self._lookup(cache_keys))
+            pending: dict[str, str] = {}
+            for obj, key in zip(objects, cache_keys, strict=True):
+                hit = key in resolved
+                self.metrics.record_cache_event("embedding", hit=hit)
+                if not hit:
+                    pending.setdefault(key, obj.content)
+
+            async def run(chunk: list[tuple[str, str]]) -> None:
+                chunk_start = time.time()
+                resolved.update(await self._embed_chunk(chunk))
                 self.metrics.record_metric(
                     name="batch_processing_time",
-                    value=time.time() - batch_start,
-                    context=f"batch_size_{len(batch)}",
+                    value=time.time() - chunk_start,
+                    context=f"batch_size_{len(chunk)}",
                 )
 
+            await asyncio.gather(*[run(chunk) for chunk in self._plan_requests(pending)])
+
+            results = list(objects)
+            for obj, key in zip(results, cache_keys, strict=True):
+                obj.embedding = resolved[key]
+
             # Record batch metrics
             total_time = time.time() - start_time
             self.metrics.record_metric(
@@ -413,25 +582,26 @@ class EmbeddingManager:
             )
             self.metrics.record_metric(
                 name="batch_throughput",
-                value=len(objects) / total_time,
+                value=len(objects) / total_time if total_time > 0 else 0.0,
                 context="objects_per_second",
             )
 
             return results
 
         except Exception as e:
+            succeeded = sum(1 for key in cache_keys if key in resolved)
             # Record error
             self.metrics.record_metric(
                 name="batch_embedding_error",
                 value=1.0,
-                context=f"failed_at_{len(results)}_of_{len(objects)}",
+                context=f"failed_at_{succeeded}_of_{len(objects)}",
             )
             # Log the error and number of successful embeddings
             logger.error(
-                f"Batch embedding failed after {len(results)} successful embeddings: {str(e)}"
+                f"Batch embedding failed after {succeeded} successful embeddings: {str(e)}"
             )
             raise EmbeddingError(
-                f"Batch embedding failed: {str(e)}. {len(results)} objects were successfully embedded."
+                f"Batch embedding failed: {str(e)}. {succeeded} objects were successfully embedded."
             ) from e
 
     def embed_batch(self, objects: Sequence[E]) -> list[E]:
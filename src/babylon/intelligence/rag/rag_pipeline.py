@@ -14,7 +14,8 @@ from typing import TYPE_CHECKING, Any, Self
 from pydantic import BaseModel, ConfigDict, Field
 
 from babylon.intelligence.rag.chunker import DocumentProcessor
-from babylon.intelligence.rag.embeddings import EmbeddingManager
+from babylon.intelligence.rag.embedding_store import EmbeddingStore
+from babylon.intelligence.rag.embeddings import DEFAULT_MAX_BATCH_TOKENS, EmbeddingManager
 from babylon.intelligence.rag.exceptions import RagError
 from babylon.intelligence.rag.retrieval import QueryResponse, Retriever
 
@@ -53,6 +54,9 @@ class RagConfig(BaseModel):
     # Embedding config
     embedding_batch_size: int = 10
     max_concurrent_embeds: int = 4
+    max_embedding_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS
+    # Persistent embedding cache (SQLite), shared across processes; None disables it
+    embedding_cache_path: Path | None = None
 
     # Retrieval config
     default_top_k: int = 10
@@ -86,6 +90,12 @@ class RagPipeline:
         self.embedding_manager = embedding_manager or EmbeddingManager(
             batch_size=self.config.embedding_batch_size,
             max_concurrent_requests=self.config.max_concurrent_embeds,
+            store=(
+                EmbeddingStore(self.config.embedding_cache_path)
+                if self.config.embedding_cache_path is not None
+                else None
+            ),
+            max_batch_tokens=self.config.max_embedding_batch_tokens,
         )
 
         # Initialize components
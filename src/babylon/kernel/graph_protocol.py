@@ -18,12 +18,13 @@ Protocol Methods (18 total):
     Edge CRUD: add_edge, get_edge, update_edge, remove_edge
     Traversal: get_neighborhood, execute_traversal, shortest_path
     Set Ops: query_nodes, query_edges, count_nodes, count_edges, aggregate
+    Zero-copy reads: iter_nodes, iter_edges
     Graph Attrs: get_graph_attr, set_graph_attr
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterator, Mapping
 from typing import TYPE_CHECKING, Any, Literal, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
@@ -319,6 +320,66 @@ class GraphProtocol(Protocol):
         """
         ...
 
+    def iter_nodes(self, node_type: str | None = None) -> Iterator[tuple[str, Mapping[str, Any]]]:
+        """Iterate ``(id, payload)`` pairs without copying or model construction.
+
+        The hot-path alternative to :meth:`query_nodes`: payloads are
+        read-only views of the live attributes (``_node_type`` included),
+        in the same order ``query_nodes`` yields.
+
+        Args:
+            node_type: Filter by node type (None = all types).
+
+        Returns:
+            Iterator of ``(node_id, read-only payload)`` pairs.
+        """
+        ...
+
+    def iter_edges(
+        self, edge_type: str | None = None
+    ) -> Iterator[tuple[str, str, Mapping[str, Any]]]:
+        """Iterate ``(source, target, payload)`` triples without copying.
+
+        Args:
+            edge_type: Filter by edge type (None = all types).
+
+        Returns:
+            Iterator of ``(source_id, target_id, read-only payload)`` triples.
+        """
+        ...
+
+    def iter_in_edges(
+        self, node_id: str, edge_type: str | None = None
+    ) -> Iterator[tuple[str, str, Mapping[str, Any]]]:
+        """Iterate the edges entering ``node_id`` without copying.
+
+        The per-node alternative to filtering :meth:`iter_edges` on the
+        target: O(degree) where the backend keeps adjacency, same relative
+        order as ``iter_edges``.
+
+        Args:
+            node_id: The target node (absent = no edges).
+            edge_type: Filter by edge type (None = all types).
+
+        Returns:
+            Iterator of ``(source_id, node_id, read-only payload)`` triples.
+        """
+        ...
+
+    def iter_out_edges(
+        self, node_id: str, edge_type: str | None = None
+    ) -> Iterator[tuple[str, str, Mapping[str, Any]]]:
+        """Iterate the edges leaving ``node_id`` without copying.
+
+        Args:
+            node_id: The source node (absent = no edges).
+            edge_type: Filter by edge type (None = all types).
+
+        Returns:
+            Iterator of ``(node_id, target_id, read-only payload)`` triples.
+        """
+        ...
+
     def aggregate(
         self,
         target: Literal["nodes", "edges"],
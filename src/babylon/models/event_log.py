@@ -0,0 +1,289 @@
+"""Append-only event history shared by successive WorldStates.
+
+``WorldState.event_log`` used to be a plain ``list[str]`` that
+:func:`~babylon.engine.simulation_engine.step` copied and extended every
+tick (and ``to_graph`` copied again into graph metadata), so cost and
+memory grew with the square of run length.
+
+Here the history lives ONCE in an :class:`EventStore` — a segmented,
+append-only log that can spill full segments to disk — and each
+WorldState holds an :class:`EventLog`: an immutable ``(store, cursor)``
+view of the first ``cursor`` lines. Extending a view that sits at the
+store's tip appends in place (O(new lines)) and returns a longer view;
+every older view keeps seeing exactly its own prefix. Extending an older
+view (replaying from a history snapshot) forks: full segments are shared
+by reference (they are never mutated once sealed), only the open tail is
+copied.
+
+:class:`EventLog` is a read-only ``Sequence[str]`` — ``in``, ``len``,
+indexing, slicing (which returns a ``list``), iteration and equality with
+any sequence behave as they did on the list — and it serializes as a JSON
+array, so persisted checkpoints are unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, overload
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+#: Lines per sealed segment. Big enough that segment bookkeeping is noise,
+#: small enough that a fork's copied tail stays cheap.
+DEFAULT_SEGMENT_SIZE = 4096
+
+
+class EventStore:
+    """Segmented append-only backing store for :class:`EventLog` views.
+
+    Args:
+        segment_size: Lines per sealed segment.
+        spill_dir: When set, sealed segments beyond ``resident_segments``
+            are written to ``spill_dir`` as JSON-lines files and dropped
+            from memory; they are read back lazily on access.
+        resident_segments: Sealed segments kept in memory when spilling.
+
+    Raises:
+        ValueError: If ``segment_size`` or ``resident_segments`` is not
+            positive.
+    """
+
+    def __init__(
+        self,
+        *,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        spill_dir: Path | None = None,
+        resident_segments: int = 8,
+    ) -> None:
+        if segment_size <= 0:
+            raise ValueError(f"segment_size must be positive, got {segment_size}")
+        if resident_segments <= 0:
+            raise ValueError(f"resident_segments must be positive, got {resident_segments}")
+        self._segment_size = segment_size
+        self._spill_dir = spill_dir
+        self._resident_segments = resident_segments
+        # Spill files are named per store (never by ``id()``, which the
+        # interpreter reuses) because forks share sealed segment files.
+        self._spill_prefix = uuid.uuid4().hex
+        # Sealed segments: a list while resident, a Path once spilled.
+        self._sealed: list[list[str] | Path] = []
+        self._tail: list[str] = []
+        # One-slot cache for the last spilled segment read back.
+        self._cached_index: int | None = None
+        self._cached_lines: list[str] = []
+        if spill_dir is not None:
+            spill_dir.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._sealed) * self._segment_size + len(self._tail)
+
+    @property
+    def segment_size(self) -> int:
+        """Lines per sealed segment."""
+        return self._segment_size
+
+    def append(self, lines: Iterable[str]) -> int:
+        """Append ``lines`` and return the new store length (the new cursor)."""
+        for line in lines:
+            self._tail.append(line)
+            if len(self._tail) == self._segment_size:
+                self._seal_tail()
+        return len(self)
+
+    def line(self, index: int) -> str:
+        """The line at absolute position ``index`` (0 <= index < len)."""
+        segment_index, offset = divmod(index, self._segment_size)
+        if segment_index == len(self._sealed):
+            return self._tail[offset]
+        return self._segment_lines(segment_index)[offset]
+
+    def lines(self, start: int, stop: int) -> list[str]:
+        """Lines in ``[start, stop)`` as a fresh list."""
+        out: list[str] = []
+        position = start
+        while position < stop:
+            segment_index, offset = divmod(position, self._segment_size)
+            if segment_index == len(self._sealed):
+                segment = self._tail
+            else:
+                segment = self._segment_lines(segment_index)
+            take = min(stop - position, len(segment) - offset)
+            out.extend(segment[offset : offset + take])
+            position += take
+        return out
+
+    def fork(self, length: int) -> EventStore:
+        """A new store holding this store's first ``length`` lines.
+
+        Sealed segments inside the prefix are shared by reference (resident
+        lists and spill files alike are immutable once sealed).
+        """
+        clone = EventStore(
+            segment_size=self._segment_size,
+            spill_dir=self._spill_dir,
+            resident_segments=self._resident_segments,
+        )
+        full_segments, remainder = divmod(length, self._segment_size)
+        clone._sealed = list(self._sealed[:full_segments])
+        clone._tail = self.lines(full_segments * self._segment_size, length) if remainder else []
+        return clone
+
+    def _segment_lines(self, segment_index: int) -> list[str]:
+        segment = self._sealed[segment_index]
+        if isinstance(segment, list):
+            return segment
+        if self._cached_index != segment_index:
+            with segment.open(encoding="utf-8") as handle:
+                self._cached_lines = [json.loads(raw) for raw in handle]
+            self._cached_index = segment_index
+        return self._cached_lines
+
+    def _seal_tail(self) -> None:
+        self._sealed.append(self._tail)
+        self._tail = []
+        if self._spill_dir is None:
+            return
+        spill_index = len(self._sealed) - 1 - self._resident_segments
+        if spill_index < 0:
+            return
+        segment = self._sealed[spill_index]
+        if not isinstance(segment, list):
+            return
+        path = self._spill_dir / f"events-{self._spill_prefix}-{spill_index:06d}.jsonl"
+        with path.open("w", encoding="utf-8") as handle:
+            for line in segment:
+                handle.write(json.dumps(line))
+                handle.write("\n")
+        self._sealed[spill_index] = path
+
+
+class EventLog(Sequence[str]):
+    """Immutable view of the first ``cursor`` lines of an :class:`EventStore`.
+
+    Example::
+
+        log = EventLog(["Tick 1: UPRISING"])
+        longer = log.extended(["Tick 2: STRIKE"])  # O(1) amortized
+        assert list(log) == ["Tick 1: UPRISING"]  # the old view is unchanged
+        assert longer.since(log.cursor) == ["Tick 2: STRIKE"]
+    """
+
+    __slots__ = ("_length", "_store")
+
+    def __init__(self, lines: Iterable[str] = (), *, store: EventStore | None = None) -> None:
+        self._store = store if store is not None else EventStore()
+        self._length = self._store.append(lines)
+
+    @classmethod
+    def _view(cls, store: EventStore, length: int) -> EventLog:
+        view = cls.__new__(cls)
+        view._store = store
+        view._length = length
+        return view
+
+    @classmethod
+    def coerce(cls, value: Iterable[str] | None) -> EventLog:
+        """Return ``value`` itself if already a view, else a fresh log of it."""
+        if isinstance(value, EventLog):
+            return value
+        return cls(value or ())
+
+    @property
+    def cursor(self) -> int:
+        """Absolute position one past this view's last line."""
+        return self._length
+
+    @property
+    def store(self) -> EventStore:
+        """The shared backing store."""
+        return self._store
+
+    def extended(self, lines: Iterable[str]) -> EventLog:
+        """A view of this log followed by ``lines``; this view is unchanged."""
+        store = self._store
+        if len(store) != self._length:
+            store = store.fork(self._length)
+        return EventLog._view(store, store.append(lines))
+
+    def since(self, cursor: int) -> list[str]:
+        """The lines appended after ``cursor`` (a per-tick slice)."""
+        return self._store.lines(max(0, min(cursor, self._length)), self._length)
+
+    # ── Sequence protocol ────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            start, stop, stride = index.indices(self._length)
+            if stride == 1:
+                return self._store.lines(start, max(start, stop))
+            return [self._store.line(i) for i in range(start, stop, stride)]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("event log index out of range")
+        return self._store.line(index)
+
+    def __iter__(self) -> Iterator[str]:
+        step = self._store.segment_size
+        for start in range(0, self._length, step):
+            yield from self._store.lines(start, min(start + step, self._length))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EventLog):
+            if other._store is self._store:
+                return other._length == self._length
+            return len(other) == self._length and list(other) == list(self)
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(other) == self._length and list(other) == list(self)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]  # equality is by content
+
+    def __repr__(self) -> str:
+        return f"EventLog({list(self)!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickles (process pools, deep copies) carry the lines, not the store.
+        return (EventLog, (list(self),))
+
+    def __copy__(self) -> EventLog:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> EventLog:
+        return self
+
+    # ── Pydantic integration ─────────────────────────────────────────────
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Validate from any ``list[str]`` (or a view); serialize as a list."""
+        from_list = core_schema.no_info_after_validator_function(
+            cls.coerce, core_schema.list_schema(core_schema.str_schema())
+        )
+        return core_schema.json_or_python_schema(
+            json_schema=from_list,
+            python_schema=core_schema.union_schema(
+                [core_schema.is_instance_schema(cls), from_list]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                list, return_schema=core_schema.list_schema(core_schema.str_schema())
+            ),
+        )
+
+
+__all__ = ["DEFAULT_SEGMENT_SIZE", "EventLog", "EventStore"]
@@ -18,6 +18,7 @@ Sprint 3.5.3: Territory integration for Layer 0.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Final
 
 from pydantic import BaseModel, ConfigDict, Field, computed_field
@@ -37,6 +38,7 @@ from babylon.models.entities.sovereign import Sovereign
 from babylon.models.entities.state_finance import StateFinance
 from babylon.models.entities.territory import Territory
 from babylon.models.enums import EdgeType, NodeType, OperationalProfile, OrgType, SectorType
+from babylon.models.event_log import EventLog
 from babylon.models.events import EVENT_CLASS_MAP, SimulationEvent, TickEventAdapter
 from babylon.models.market import MarketState
 from babylon.models.types import Currency
@@ -326,34 +328,143 @@ def _reconstruct_relationships(G: BabylonGraph) -> list[Relationship]:
     (``influence_level``/``support_type``/``control_level``/``legal_status``)
     reconstruct as ``None`` on every edge that doesn't carry them.
     """
-    relationships: list[Relationship] = []
-    for source_id, target_id, data in G.edges(data=True):
-        # Reconstruct edge_type from stored value
-        edge_type = data.get("edge_type", EdgeType.EXPLOITATION)
-        if isinstance(edge_type, str):
-            edge_type = EdgeType(edge_type)
-
-        relationships.append(
-            Relationship(
-                source_id=source_id,
-                target_id=target_id,
-                edge_type=edge_type,
-                value_flow=data.get("value_flow", 0.0),
-                tension=data.get("tension", 0.0),
-                description=data.get("description", ""),
-                # Imperial Circuit parameters (Sprint 3.4.1)
-                subsidy_cap=data.get("subsidy_cap", 0.0),
-                # Solidarity parameters (Sprint 3.4.2)
-                solidarity_strength=data.get("solidarity_strength", 0.0),
-                # Spec-070 balkanization payloads (spec-109 A6) — absent
-                # (None) on every non-INFLUENCES/CLAIMS edge.
-                influence_level=data.get("influence_level"),
-                support_type=data.get("support_type"),
-                control_level=data.get("control_level"),
-                legal_status=data.get("legal_status"),
-            )
+    return [
+        _reconstruct_relationship(source_id, target_id, data)
+        for source_id, target_id, data in G.edges(data=True)
+    ]
+
+
+def _reconstruct_relationship(source_id: str, target_id: str, data: dict[str, Any]) -> Relationship:
+    """Rebuild one :class:`Relationship` from a graph edge payload."""
+    # Reconstruct edge_type from stored value
+    edge_type = data.get("edge_type", EdgeType.EXPLOITATION)
+    if isinstance(edge_type, str):
+        edge_type = EdgeType(edge_type)
+
+    return Relationship(
+        source_id=source_id,
+        target_id=target_id,
+        edge_type=edge_type,
+        value_flow=data.get("value_flow", 0.0),
+        tension=data.get("tension", 0.0),
+        description=data.get("description", ""),
+        # Imperial Circuit parameters (Sprint 3.4.1)
+        subsidy_cap=data.get("subsidy_cap", 0.0),
+        # Solidarity parameters (Sprint 3.4.2)
+        solidarity_strength=data.get("solidarity_strength", 0.0),
+        # Spec-070 balkanization payloads (spec-109 A6) — absent
+        # (None) on every non-INFLUENCES/CLAIMS edge.
+        influence_level=data.get("influence_level"),
+        support_type=data.get("support_type"),
+        control_level=data.get("control_level"),
+        legal_status=data.get("legal_status"),
+    )
+
+
+def _reconstruct_social_class(node_id: str, node_data: dict[str, Any]) -> SocialClass:
+    """Reconstruct a SocialClass (the from_graph default node type)."""
+    # Filter out computed fields that shouldn't be passed to constructor
+    entity_data = {k: v for k, v in node_data.items() if k not in SOCIAL_CLASS_COMPUTED_FIELDS}
+    # Defensive (Design B): runtime writers key nodes by id — the
+    # node id IS the entity id, so inject it when the payload
+    # omitted it.
+    entity_data.setdefault("id", node_id)
+    if not entity_data.get("name"):
+        # Fail-soft + loud: SocialClass.name is required
+        # (min_length=1). A writer omitting it is a bug — warn
+        # with enough context to find the offending System, then
+        # fall back to the node id so replay can proceed.
+        logger.warning(
+            "social_class node %r missing required 'name' attribute; "
+            "falling back to the node id (writer bug — the System "
+            "that add_node()ed this payload must emit a name)",
+            node_id,
         )
-    return relationships
+        entity_data["name"] = node_id
+    return SocialClass(**entity_data)
+
+
+def _reconstruct_node(node_id: str, data: dict[str, Any]) -> tuple[NodeType, BaseModel]:
+    """Reconstruct one node's model, dispatching on ``_node_type``.
+
+    Unknown or missing types reconstruct as :class:`SocialClass` (the
+    backward-compatible default).
+
+    Returns:
+        ``(node_type, model)`` — the canonical :class:`NodeType` that
+        :meth:`WorldState.to_graph` re-emits the model under.
+    """
+    node_type = data.get("_node_type", "social_class")
+    # Create a copy without _node_type for model construction
+    node_data = {k: v for k, v in data.items() if k not in ("_node_type", "type")}
+
+    if node_type == "territory":
+        return NodeType.TERRITORY, _reconstruct_territory(node_data)
+    if node_type == "organization":
+        return NodeType.ORGANIZATION, _reconstruct_organization(node_data)
+    if node_type == "institution":
+        return NodeType.INSTITUTION, _reconstruct_institution(node_data)
+    if node_type == "industry":
+        return NodeType.INDUSTRY, IndustryHyperedge(**node_data)
+    if node_type == "sovereign":
+        return NodeType.SOVEREIGN, _reconstruct_sovereign(node_id, node_data)
+    if node_type == "faction":
+        return NodeType.FACTION, _reconstruct_faction(node_id, node_data)
+    # Reconstruct SocialClass (default for backward compatibility)
+    return NodeType.SOCIAL_CLASS, _reconstruct_social_class(node_id, node_data)
+
+
+def canonical_node_payload(node_id: str, data: dict[str, Any]) -> dict[str, Any]:
+    """The payload ``to_graph(from_graph(G))`` would emit for one node.
+
+    Reconstructs the node's model exactly as :meth:`WorldState.from_graph`
+    does (dropping transient per-tick attrs, recomputing computed fields)
+    and re-dumps it the way :meth:`WorldState.to_graph` does. Lets a
+    resident graph re-canonicalize only the nodes a tick touched instead
+    of round-tripping the whole world.
+
+    Args:
+        node_id: Graph node id.
+        data: The node's live attribute payload (not mutated).
+
+    Returns:
+        A fresh attribute dict (``_node_type`` first, then model fields).
+
+    Raises:
+        pydantic.ValidationError: On the same payloads ``from_graph``
+            rejects.
+    """
+    from babylon.topology.graph import BabylonGraph
+
+    node_type, model = _reconstruct_node(node_id, data)
+    return BabylonGraph._normalize_node_payload(
+        None, {"_node_type": node_type, **model.model_dump()}
+    )
+
+
+def canonical_edge_payload(source_id: str, target_id: str, data: dict[str, Any]) -> dict[str, Any]:
+    """The payload ``to_graph(from_graph(G))`` would emit for one edge.
+
+    Edge-side sibling of :func:`canonical_node_payload`: only the
+    :class:`Relationship` fields survive, re-emitted through the same
+    ``add_edge`` normalization ``to_graph`` uses (dual ``edge_type`` /
+    ``_edge_type`` keys plus the ``weight`` marker).
+
+    Args:
+        source_id: Edge source node id.
+        target_id: Edge target node id.
+        data: The edge's live attribute payload (not mutated).
+
+    Returns:
+        A fresh edge attribute dict.
+    """
+    from babylon.topology.graph import BabylonGraph
+
+    edge_attrs: dict[str, Any] = dict(
+        _reconstruct_relationship(source_id, target_id, data).edge_data
+    )
+    edge_type = edge_attrs.pop("edge_type")
+    return BabylonGraph._normalize_edge_payload(edge_type, None, edge_attrs)
 
 
 def _assert_no_edge_type_collisions(relationships: list[Relationship]) -> None:
@@ -430,9 +541,12 @@ class WorldState(BaseModel):
         description="List of relationships (graph edges)",
     )
 
-    event_log: list[str] = Field(
-        default_factory=list,
-        description="Recent events for narrative/debugging",
+    event_log: EventLog = Field(
+        default_factory=EventLog,
+        description=(
+            "Recent events for narrative/debugging — an append-only view shared "
+            "with earlier states (validates from and dumps to list[str])"
+        ),
     )
 
     events: list[SimulationEvent] = Field(
@@ -663,9 +777,11 @@ class WorldState(BaseModel):
         # docstring) — the persisted graph is the cross-tick carrier.
         G.graph["opposition_states"] = dict(self.opposition_states)
 
-        # Store events in graph metadata for lossless round-trip (Sprint 1.X D2)
+        # Store events in graph metadata for lossless round-trip (Sprint 1.X D2).
+        # The event log is an immutable append-only view: alias it rather than
+        # copying the whole history into every tick's graph.
         G.graph["events"] = [e.model_dump() for e in self.events]
-        G.graph["event_log"] = list(self.event_log)
+        G.graph["event_log"] = EventLog.coerce(self.event_log)
 
         self._write_optional_axes(G)
 
@@ -829,7 +945,7 @@ class WorldState(BaseModel):
         cls,
         G: BabylonGraph,
         tick: int,
-        event_log: list[str] | None = None,
+        event_log: Sequence[str] | None = None,
         events: list[SimulationEvent] | None = None,
     ) -> WorldState:
         """Reconstruct WorldState from a BabylonGraph.
@@ -898,7 +1014,7 @@ class WorldState(BaseModel):
         if event_log is None:
             event_log_data = G.graph.get("event_log", [])
             if event_log_data:
-                event_log = list(event_log_data)
+                event_log = EventLog.coerce(event_log_data)
 
         # Reconstruct entities and territories from nodes based on _node_type
         entities: dict[str, SocialClass] = {}
@@ -909,46 +1025,18 @@ class WorldState(BaseModel):
         sovereigns_dict: dict[str, Sovereign] = {}
         factions_dict: dict[str, BalkanizationFaction] = {}
 
+        buckets: dict[NodeType, dict[str, Any]] = {
+            NodeType.SOCIAL_CLASS: entities,
+            NodeType.TERRITORY: territories,
+            NodeType.ORGANIZATION: organizations,
+            NodeType.INSTITUTION: institutions_dict,
+            NodeType.INDUSTRY: industries_dict,
+            NodeType.SOVEREIGN: sovereigns_dict,
+            NodeType.FACTION: factions_dict,
+        }
         for node_id, data in G.nodes(data=True):
-            node_type = data.get("_node_type", "social_class")
-            # Create a copy without _node_type for model construction
-            node_data = {k: v for k, v in data.items() if k not in ("_node_type", "type")}
-
-            if node_type == "territory":
-                territories[node_id] = _reconstruct_territory(node_data)
-            elif node_type == "organization":
-                organizations[node_id] = _reconstruct_organization(node_data)
-            elif node_type == "institution":
-                institutions_dict[node_id] = _reconstruct_institution(node_data)
-            elif node_type == "industry":
-                industries_dict[node_id] = IndustryHyperedge(**node_data)
-            elif node_type == "sovereign":
-                sovereigns_dict[node_id] = _reconstruct_sovereign(node_id, node_data)
-            elif node_type == "faction":
-                factions_dict[node_id] = _reconstruct_faction(node_id, node_data)
-            else:
-                # Reconstruct SocialClass (default for backward compatibility)
-                # Filter out computed fields that shouldn't be passed to constructor
-                entity_data = {
-                    k: v for k, v in node_data.items() if k not in SOCIAL_CLASS_COMPUTED_FIELDS
-                }
-                # Defensive (Design B): runtime writers key nodes by id — the
-                # node id IS the entity id, so inject it when the payload
-                # omitted it.
-                entity_data.setdefault("id", node_id)
-                if not entity_data.get("name"):
-                    # Fail-soft + loud: SocialClass.name is required
-                    # (min_length=1). A writer omitting it is a bug — warn
-                    # with enough context to find the offending System, then
-                    # fall back to the node id so replay can proceed.
-                    logger.warning(
-                        "social_class node %r missing required 'name' attribute; "
-                        "falling back to the node id (writer bug — the System "
-                        "that add_node()ed this payload must emit a name)",
-                        node_id,
-                    )
-                    entity_data["name"] = node_id
-                entities[node_id] = SocialClass(**entity_data)
+            node_type, model = _reconstruct_node(node_id, data)
+            buckets[node_type][node_id] = model
 
         # Reconstruct relationships from edges.
         relationships = _reconstruct_relationships(G)
@@ -958,7 +1046,7 @@ class WorldState(BaseModel):
             entities=entities,
             territories=territories,
             relationships=relationships,
-            event_log=event_log or [],
+            event_log=EventLog.coerce(event_log),
             events=events or [],
             economy=economy,
             state_finances=state_finances,
@@ -1060,7 +1148,7 @@ class WorldState(BaseModel):
         Example:
             new_state = state.add_event("Worker crossed poverty threshold")
         """
-        new_log = [*self.event_log, event]
+        new_log = EventLog.coerce(self.event_log).extended([event])
         return self.model_copy(update={"event_log": new_log})
 
     # =========================================================================
@@ -3,9 +3,16 @@
 Implements structural vulnerability analysis on the observed subgraph.
 Named after the FBI's historical counter-intelligence analysis methods.
 
+Centrality and cut vertices come from a
+:class:`~babylon.topology.centrality.CentralityService` (a shared
+module-level one unless the caller passes its own), which caches per
+connected component and pivot-samples betweenness on large components, so
+the analysis scales to any observed subgraph size.
+
 See Also:
     :class:`babylon.models.entities.attention_thread.SparrowAnalysis`: Result model.
     :func:`babylon.ooda.attention.observation.build_g_observed`: G_observed builder.
+    :class:`babylon.topology.centrality.CentralityService`: Centrality cache.
 """
 
 from __future__ import annotations
@@ -13,17 +20,21 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from babylon.models.entities.attention_thread import SparrowAnalysis
-from babylon.topology import graph_algorithms as ga
+from babylon.topology.centrality import CentralityService
 
 if TYPE_CHECKING:
     from babylon.topology.graph import BabylonGraph, BabylonUGraph
 
+_CENTRALITY = CentralityService()
+
 
 def analyze_network(
     thread_id: str,
     tick: int,
     g_observed: BabylonGraph,
     confidence: float = 0.8,
+    *,
+    centrality: CentralityService | None = None,
 ) -> SparrowAnalysis:
     """Run Sparrow structural analysis on an observed subgraph.
 
@@ -35,6 +46,8 @@ def analyze_network(
         tick: Current simulation tick.
         g_observed: Observed subgraph (from build_g_observed).
         confidence: Analysis confidence [0, 1].
+        centrality: Centrality service to use (default: the module's shared
+            one). Betweenness above its exact threshold is pivot-sampled.
 
     Returns:
         SparrowAnalysis with structural intelligence.
@@ -52,21 +65,16 @@ def analyze_network(
 
     # Compute centrality metrics
     undirected = g_observed.to_undirected()
-    centrality_rankings: dict[str, dict[str, float]] = {}
+    result = (centrality or _CENTRALITY).analyze(undirected)
+    centrality_rankings: dict[str, dict[str, float]] = {"degree": result.degree}
 
-    # Degree centrality
-    degree = ga.degree_centrality(undirected)
-    centrality_rankings["degree"] = degree
+    # Betweenness centrality (n > 1)
+    if result.betweenness:
+        centrality_rankings["betweenness"] = result.betweenness
 
-    # Betweenness centrality
-    if undirected.number_of_nodes() > 1:
-        betweenness = ga.betweenness_centrality(undirected)
-        centrality_rankings["betweenness"] = betweenness
-
-    # Closeness centrality
-    if undirected.number_of_nodes() > 1 and ga.is_connected(undirected):
-        closeness = ga.closeness_centrality(undirected)
-        centrality_rankings["closeness"] = closeness
+    # Closeness centrality (connected, n > 1)
+    if result.closeness is not None:
+        centrality_rankings["closeness"] = result.closeness
 
     # Equivalence classes via degree signature
     equivalence_classes = _compute_equivalence_classes(undirected)
@@ -75,7 +83,7 @@ def analyze_network(
     singletons = _identify_singletons(undirected, centrality_rankings)
 
     # Minimal cutsets (articulation points as simple approximation)
-    cutsets = _compute_cutsets(undirected)
+    cutsets = _compute_cutsets(result.articulation_points)
 
     return SparrowAnalysis(
         thread_id=thread_id,
@@ -102,10 +110,7 @@ def _compute_equivalence_classes(graph: BabylonUGraph) -> list[frozenset[str]]:
     """
     signatures: dict[tuple[int, ...], list[str]] = {}
 
-    max_nodes = 1000
-    for idx, node in enumerate(graph.nodes()):
-        if idx >= max_nodes:
-            break
+    for node in graph.nodes():
         degree = graph.degree(node)
         neighbor_degrees = sorted(graph.degree(n) for n in graph.neighbors(node))
         sig = (degree, *neighbor_degrees)
@@ -144,37 +149,22 @@ def _identify_singletons(
     mean_bc = sum(values) / len(values)
     threshold = mean_bc * 2.0
 
-    singletons: set[str] = set()
-    max_nodes = 1000
-    for idx, (node, bc) in enumerate(betweenness.items()):
-        if idx >= max_nodes:
-            break
-        if bc > threshold:
-            singletons.add(node)
-
-    return frozenset(singletons)
+    return frozenset(node for node, bc in betweenness.items() if bc > threshold)
 
 
-def _compute_cutsets(graph: BabylonUGraph) -> list[frozenset[str]]:
+def _compute_cutsets(articulation_points: frozenset[str]) -> list[frozenset[str]]:
     """Compute minimal vertex cutsets (articulation points).
 
     Each articulation point forms a singleton cutset -- removing it
     disconnects the graph.
 
     Args:
-        graph: Undirected graph to analyze.
+        articulation_points: Cut vertices of the undirected projection.
 
     Returns:
-        List of singleton frozensets, one per articulation point.
+        List of singleton frozensets, one per articulation point, id-sorted.
     """
-    if graph.number_of_nodes() < 2:
-        return []
-
-    # Inputs are always undirected projections (analyze_network builds
-    # them via to_undirected), so no directed-graph error arm is needed.
-    art_points = sorted(ga.articulation_point_set(graph))
-
-    return [frozenset({p}) for p in art_points]
+    return [frozenset({p}) for p in sorted(articulation_points)]
 
 
 __all__ = ["analyze_network"]
@@ -12,7 +12,6 @@ static priority queue.
 from __future__ import annotations
 
 import logging
-from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 from babylon.config.defines import OODADefines
@@ -289,26 +288,22 @@ def _compute_sparrow_topology_scores(
     candidate_ids = [c[0] for c in candidates]
     id_set = set(candidate_ids)
 
+    # No node/edge cap: analyze_network's CentralityService caches per
+    # connected component and pivot-samples betweenness on large ones, so
+    # the full candidate pool is analyzed instead of its first 1000. The
+    # zero-copy iter_edges read keeps the SOLIDARITY scan (dominated by
+    # org->social_class edges, engine/actions/_mass_work.py) model-free.
     subgraph = _BabylonGraph()
-    max_nodes = 1000
-    for idx in range(min(len(candidate_ids), max_nodes)):
-        subgraph.add_node(candidate_ids[idx], NodeType.ORGANIZATION)
-
-    # Bound the MATCHED result (edges actually added to the subgraph), not
-    # the raw scan -- production SOLIDARITY is dominated by org->social_class
-    # edges (engine/actions/_mass_work.py), so capping the raw scan before
-    # filtering could truncate away the genuine org<->org edges this
-    # function needs if they sort later than 5000 irrelevant ones. The
-    # candidate-membership predicate runs inside query_edges' own scan (no
-    # separate unbounded intermediate list), and islice bounds the loop
-    # below to a statically provable max_edges iterations.
-    max_edges = 5000
-    matched_edges = graph.query_edges(
-        edge_type=EdgeType.SOLIDARITY,
-        predicate=lambda e: e.source_id in id_set and e.target_id in id_set,
-    )
-    for edge in islice(matched_edges, max_edges):
-        subgraph.add_edge(edge.source_id, edge.target_id, EdgeType.SOLIDARITY, weight=edge.weight)
+    for candidate_id in candidate_ids:
+        subgraph.add_node(candidate_id, NodeType.ORGANIZATION)
+    for source_id, target_id, edge_attrs in graph.iter_edges(EdgeType.SOLIDARITY):
+        if source_id in id_set and target_id in id_set:
+            subgraph.add_edge(
+                source_id,
+                target_id,
+                EdgeType.SOLIDARITY,
+                weight=edge_attrs.get("weight", 1.0),
+            )
 
     analysis = analyze_network(thread_id="state_ai_topology_scan", tick=0, g_observed=subgraph)
 
@@ -28,6 +28,7 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field
 
 from babylon.persistence.audit_models import AuditSeverity, ConservationAuditRow
+from babylon.persistence.hex_frame import HexFrame
 
 if TYPE_CHECKING:
     pass
@@ -71,7 +72,7 @@ def compute_determinism_hash(
     *,
     tick: int,
     rng_seed: int,
-    hex_rows: Iterable[Any],
+    hex_rows: Iterable[Any] | HexFrame,
     action_list: Iterable[Any] | None = None,
 ) -> str:
     """SHA-256 over canonical(tick + sorted hex_state + actions + rng_seed).
@@ -86,7 +87,9 @@ def compute_determinism_hash(
         hex_rows: Iterable of either Pydantic frozen models with a
             ``.h3_index`` attribute and ``.model_dump()`` method, OR
             plain dicts whose ``"h3_index"`` key serves the same role
-            (the engine pulls graph node attrs as dicts).
+            (the engine pulls graph node attrs as dicts), OR a
+            :class:`~babylon.persistence.hex_frame.HexFrame` (hashed
+            byte-identically to its materialized rows).
         action_list: Optional iterable of action payloads.
 
     Returns:
@@ -100,11 +103,14 @@ def compute_determinism_hash(
             return str(r.get("h3_index", ""))
         return ""
 
-    sorted_hex = sorted(hex_rows, key=_h3_key)
+    if isinstance(hex_rows, HexFrame):
+        hex_state = list(hex_rows.iter_json_rows())
+    else:
+        hex_state = [_to_jsonable(r) for r in sorted(hex_rows, key=_h3_key)]
     payload = {
         "tick": tick,
         "rng_seed": rng_seed,
-        "hex_state": [_to_jsonable(r) for r in sorted_hex],
+        "hex_state": hex_state,
         "actions": [_to_jsonable(a) for a in (action_list or [])],
     }
     canon = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
@@ -455,7 +461,7 @@ class ConservationAuditor:
         *,
         session_id: UUID,
         tick: int,
-        hex_rows: Iterable[Any],
+        hex_rows: Iterable[Any] | HexFrame,
         pre_state: Any = None,
         post_state: Any = None,
         context: Any = None,
@@ -516,7 +522,7 @@ class ConservationAuditor:
         *,
         session_id: UUID,
         tick: int,
-        hex_rows: Iterable[Any],
+        hex_rows: Iterable[Any] | HexFrame,
         pre_state: Any = None,
         post_state: Any = None,
         context: Any = None,
@@ -19,13 +19,23 @@ auditor and determinism inputs stay frame-level) and calls
 
 Spatial keys are excluded from the value tuple: they are immutable per
 hex and live in ``hex_spatial_map`` (spec-088 S3).
+
+:func:`select_hex_frame_for_emission` is the columnar form the bridge
+uses: the same selection over a
+:class:`~babylon.persistence.hex_frame.HexFrame`, as one vectorized row
+comparison against the previous emission's value matrix.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from babylon.persistence.hex_frame import HexFrame
     from babylon.persistence.hex_state import DynamicHexState
 
 #: Full-frame cadence: one checkpoint per simulated year (52 weekly ticks).
@@ -91,9 +101,38 @@ def select_hex_rows_for_emission(
     return changed
 
 
+def select_hex_frame_for_emission(
+    *,
+    frame: HexFrame,
+    last_emitted: NDArray[np.float64] | None,
+) -> tuple[NDArray[np.intp], NDArray[np.float64]]:
+    """Columnar :func:`select_hex_rows_for_emission` over a fixed-order frame.
+
+    Args:
+        frame: The full candidate frame; its row order must match the one
+            ``last_emitted`` was taken from (the bridge's template order).
+        last_emitted: The value matrix as of the last emission, or ``None``
+            before the first (every row then counts as changed).
+
+    Returns:
+        ``(indices, baseline)``: the row positions to persist, in frame
+        order — every row on checkpoint ticks, otherwise the rows whose
+        value tuple changed — and the value matrix to pass as
+        ``last_emitted`` next tick.
+    """
+    values = np.asarray(frame.values)
+    if is_checkpoint_tick(frame.tick) or last_emitted is None:
+        return np.arange(len(frame), dtype=np.intp), values.copy()
+    changed = np.flatnonzero(np.any(values != last_emitted, axis=1))
+    if changed.size == 0:
+        return changed, last_emitted
+    return changed, values.copy()
+
+
 __all__ = [
     "CHECKPOINT_EVERY_TICKS",
     "hex_value_key",
     "is_checkpoint_tick",
+    "select_hex_frame_for_emission",
     "select_hex_rows_for_emission",
 ]
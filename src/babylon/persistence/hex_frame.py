@@ -0,0 +1,171 @@
+"""Columnar per-tick hex frame for delta persistence.
+
+Spec: 089-delta-persistence (S1b). The bridge used to re-emit the tick-0
+template as one :class:`~babylon.persistence.hex_state.DynamicHexState`
+``model_copy`` per hex per tick — hundreds of thousands of Pydantic copies
+per tick at national res-7, for values that are static within a year.
+:class:`HexFrame` holds the same frame as one ``(n, 9)`` float64 value
+matrix (columns in :data:`VALUE_COLUMNS` order, the
+:func:`~babylon.persistence.delta.hex_value_key` order) plus the immutable
+per-row keys, so re-stamping a tick shares the arrays and delta detection
+is one vectorized comparison. Models are materialized only for the rows
+that actually persist (:meth:`HexFrame.rows`).
+
+A frame may be backed by memory-mapped ``.npy`` files (:meth:`HexFrame.save`
+/ :meth:`HexFrame.load`) so a national frame lives in the page cache rather
+than on the Python heap.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+from uuid import UUID
+
+import numpy as np
+
+from babylon.persistence.hex_state import DynamicHexState
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+#: The nine value fields, in :func:`~babylon.persistence.delta.hex_value_key`
+#: order — the columns of :attr:`HexFrame.values`.
+VALUE_COLUMNS: Final[tuple[str, ...]] = (
+    "c",
+    "v",
+    "s",
+    "k",
+    "biocapacity_stock",
+    "energy_stock",
+    "raw_material_stock",
+    "internet_access_pct",
+    "surveillance_coupling",
+)
+
+#: The immutable per-row string keys, the columns of :attr:`HexFrame.keys`.
+KEY_COLUMNS: Final[tuple[str, ...]] = ("h3_index", "county_fips", "state_fips", "region_id")
+
+_VALUES_FILE = "values.npy"
+_KEYS_FILE = "keys.npy"
+
+
+@dataclass(frozen=True)
+class HexFrame:
+    """One session's hex frame at one tick, column-oriented.
+
+    Row ``i`` of :attr:`values` and :attr:`keys` is the same hex. Treat both
+    arrays as read-only: :meth:`at_tick` frames share them.
+
+    Attributes:
+        session_id: Owning session.
+        tick: Tick every row is stamped with.
+        keys: ``(n, 4)`` string array in :data:`KEY_COLUMNS` order.
+        values: ``(n, 9)`` float64 array in :data:`VALUE_COLUMNS` order.
+    """
+
+    session_id: UUID
+    tick: int
+    keys: NDArray[np.str_]
+    values: NDArray[np.float64]
+
+    def __len__(self) -> int:
+        return int(self.values.shape[0])
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[DynamicHexState]) -> HexFrame:
+        """Build a frame from validated rows sharing one session and tick.
+
+        Args:
+            rows: Non-empty hex rows, in frame order.
+
+        Returns:
+            The equivalent frame.
+
+        Raises:
+            ValueError: If ``rows`` is empty (a frame needs its session).
+        """
+        if not rows:
+            raise ValueError("HexFrame.from_rows needs at least one row")
+        keys = np.array([[getattr(row, name) for name in KEY_COLUMNS] for row in rows], dtype=str)
+        values = np.array(
+            [[getattr(row, name) for name in VALUE_COLUMNS] for row in rows], dtype=np.float64
+        )
+        return cls(session_id=rows[0].session_id, tick=rows[0].tick, keys=keys, values=values)
+
+    @property
+    def h3_index(self) -> NDArray[np.str_]:
+        """The per-row H3 index column."""
+        return self.keys[:, 0]
+
+    def at_tick(self, tick: int) -> HexFrame:
+        """Re-stamp the frame for ``tick`` without copying any column."""
+        return replace(self, tick=tick)
+
+    def rows(
+        self, indices: Sequence[int] | NDArray[np.intp] | None = None
+    ) -> list[DynamicHexState]:
+        """Materialize validated models for ``indices`` (every row if ``None``).
+
+        Args:
+            indices: Row positions, in the order to return them.
+
+        Returns:
+            One :class:`DynamicHexState` per selected row.
+        """
+        positions = range(len(self)) if indices is None else indices
+        return [DynamicHexState(**self._row_fields(int(i))) for i in positions]
+
+    def iter_json_rows(self) -> Iterator[dict[str, Any]]:
+        """Yield every row as ``DynamicHexState.model_dump(mode="json")`` would,
+        sorted by ``h3_index`` — the determinism-hash canonical form.
+        """
+        for i in np.argsort(self.h3_index, kind="stable"):
+            fields = self._row_fields(int(i))
+            fields["session_id"] = str(self.session_id)
+            yield fields
+
+    def save(self, directory: Path) -> HexFrame:
+        """Write the frame's columns under ``directory`` and return a frame
+        reading them back memory-mapped (:meth:`load`).
+
+        Args:
+            directory: Target directory (created if missing).
+
+        Returns:
+            The memory-mapped frame, same session and tick.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / _VALUES_FILE, self.values)
+        np.save(directory / _KEYS_FILE, self.keys)
+        return self.load(directory, session_id=self.session_id, tick=self.tick)
+
+    @classmethod
+    def load(cls, directory: Path, *, session_id: UUID, tick: int) -> HexFrame:
+        """Open a :meth:`save`-d frame with its value matrix memory-mapped.
+
+        Args:
+            directory: Directory :meth:`save` wrote.
+            session_id: Owning session.
+            tick: Tick to stamp the frame with.
+
+        Returns:
+            The frame; :attr:`values` is a read-only ``np.memmap``.
+        """
+        return cls(
+            session_id=session_id,
+            tick=tick,
+            keys=np.load(directory / _KEYS_FILE),
+            values=np.load(directory / _VALUES_FILE, mmap_mode="r"),
+        )
+
+    def _row_fields(self, i: int) -> dict[str, Any]:
+        fields: dict[str, Any] = {"session_id": self.session_id, "tick": self.tick}
+        fields.update(zip(KEY_COLUMNS, self.keys[i].tolist(), strict=True))
+        fields.update(zip(VALUE_COLUMNS, self.values[i].tolist(), strict=True))
+        return fields
+
+
+__all__ = ["KEY_COLUMNS", "VALUE_COLUMNS", "HexFrame"]
@@ -0,0 +1,48 @@
+-- 0040_graph_delta_snapshots.sql
+-- Delta-encoded node/edge/graph-metadata snapshots for
+-- PostgresRuntime.persist_tick (delta_snapshots=True).
+--
+-- On a non-checkpoint tick node_state / edge_state rows carry only the
+-- attribute keys that changed since the previous tick (attributes), the keys
+-- that disappeared (removed_keys), or a tombstone for an element that left
+-- the graph (is_removed); graph_metadata.extra likewise carries only changed
+-- top-level keys (extra_removed_keys for the rest). Every 52nd tick is a full
+-- checkpoint, same cadence as dynamic_hex_state (spec-089).
+--
+-- graph_commit: one row per delta-mode tick, written in the same transaction.
+--   1. Commit marker: a delta tick may write zero node_state rows.
+--   2. content_hash: the monotonic-idempotent re-persist check compares one
+--      digest instead of re-reading and re-canonicalizing the whole tick.
+--   3. is_checkpoint: hydrate_graph(tick) replays from the latest checkpoint
+--      at or before tick.
+--
+-- postgres_schema.py carries the same DDL (GRAPH_COMMIT_DDL,
+-- GRAPH_DELTA_MIGRATIONS_DDL) so fresh databases get it from init_schema.
+-- Guarded: node_state / edge_state / graph_metadata / game_session come from
+-- the spec-037 bootstrap, not from any migration, so a database that only ran
+-- migrations must not hard-fail here.
+DO $graph_delta_snapshots$
+BEGIN
+    IF to_regclass('node_state') IS NOT NULL THEN
+        ALTER TABLE node_state ADD COLUMN IF NOT EXISTS removed_keys TEXT[];
+        ALTER TABLE node_state ADD COLUMN IF NOT EXISTS is_removed BOOLEAN NOT NULL DEFAULT FALSE;
+    END IF;
+    IF to_regclass('edge_state') IS NOT NULL THEN
+        ALTER TABLE edge_state ADD COLUMN IF NOT EXISTS removed_keys TEXT[];
+        ALTER TABLE edge_state ADD COLUMN IF NOT EXISTS is_removed BOOLEAN NOT NULL DEFAULT FALSE;
+    END IF;
+    IF to_regclass('graph_metadata') IS NOT NULL THEN
+        ALTER TABLE graph_metadata ADD COLUMN IF NOT EXISTS extra_removed_keys TEXT[];
+    END IF;
+    IF to_regclass('game_session') IS NOT NULL THEN
+        CREATE TABLE IF NOT EXISTS graph_commit (
+            session_id      UUID NOT NULL REFERENCES game_session(id) ON DELETE CASCADE,
+            tick            INTEGER NOT NULL CHECK (tick >= 0),
+            content_hash    CHAR(64) NOT NULL,
+            is_checkpoint   BOOLEAN NOT NULL,
+            created_at      TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY (session_id, tick)
+        );
+    END IF;
+END
+$graph_delta_snapshots$;
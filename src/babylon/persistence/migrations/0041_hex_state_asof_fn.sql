@@ -0,0 +1,97 @@
+-- 0041_hex_state_asof_fn.sql
+-- Checkpoint-bounded as-of hex frame read (spec-089 FR-009 read path).
+--
+-- v_hex_state_asof (0030_views_current.sql) computes LEAD(tick) over the
+-- whole dynamic_hex_state partition and joins it against every committed
+-- tick; a single-tick read (Observatory map scrub, the runner's terminal
+-- resolution check) filters one tick out of that and still pays for the
+-- entire session history.
+--
+-- hex_state_asof(session_id, tick) instead uses the spec-089 checkpoint
+-- invariant: every checkpoint tick persists the FULL frame, so the frame at
+-- tick T is the latest row per hex in [checkpoint, T], where checkpoint is
+-- the newest tick_commit.is_checkpoint row <= T. That range is one PK range
+-- scan over at most one checkpoint frame plus 51 ticks of deltas, however
+-- long the session. Same columns and same semantics as
+-- v_hex_state_asof WHERE session_id = $1 AND tick = $2 (zero rows for an
+-- uncommitted tick); sessions predating tick_commit fall back to tick 0,
+-- which the view's own spine treats identically.
+--
+-- ix_tick_commit_checkpoint: tick_commit is already written at commit time
+-- (persist_tick_atomic), so it IS the per-session checkpoint table; this
+-- partial index makes the checkpoint lookup an index-only backward scan.
+--
+-- Invoker rights, one SELECT, STABLE: the planner inlines the function, so
+-- a caller's own WHERE/ORDER BY h3_index/LIMIT (the Observatory pages by
+-- h3 cursor) applies to the bounded scan. Invoker rights also mean callers
+-- need SELECT on the base tables; babylon_intel (0036) keeps reading the
+-- view.
+
+CREATE INDEX IF NOT EXISTS ix_tick_commit_checkpoint
+    ON tick_commit (session_id, tick)
+    WHERE is_checkpoint;
+
+CREATE OR REPLACE FUNCTION hex_state_asof(p_session_id UUID, p_tick INTEGER)
+RETURNS TABLE (
+    session_id              UUID,
+    tick                    INTEGER,
+    h3_index                TEXT,
+    county_fips             TEXT,
+    state_fips              TEXT,
+    region_id               TEXT,
+    c                       DOUBLE PRECISION,
+    v                       DOUBLE PRECISION,
+    s                       DOUBLE PRECISION,
+    k                       DOUBLE PRECISION,
+    biocapacity_stock       DOUBLE PRECISION,
+    energy_stock            DOUBLE PRECISION,
+    raw_material_stock      DOUBLE PRECISION,
+    internet_access_pct     DOUBLE PRECISION,
+    surveillance_coupling   DOUBLE PRECISION,
+    written_at_tick         INTEGER
+)
+LANGUAGE sql
+STABLE
+PARALLEL SAFE
+AS $hex_state_asof$
+    WITH base AS (
+        SELECT COALESCE(MAX(tc.tick), 0) AS tick
+        FROM tick_commit tc
+        WHERE tc.session_id = p_session_id
+          AND tc.is_checkpoint
+          AND tc.tick <= p_tick
+    ),
+    committed AS (
+        SELECT 1 AS ok
+        WHERE EXISTS (
+                  SELECT 1 FROM tick_commit tc
+                  WHERE tc.session_id = p_session_id AND tc.tick = p_tick
+              )
+           OR EXISTS (
+                  SELECT 1 FROM dynamic_hex_state dh
+                  WHERE dh.session_id = p_session_id AND dh.tick = p_tick
+              )
+    )
+    SELECT DISTINCT ON (h.h3_index)
+           h.session_id, p_tick,
+           h.h3_index,
+           COALESCE(m.county_fips, h.county_fips),
+           COALESCE(m.state_fips, h.state_fips),
+           COALESCE(m.region_id, h.region_id),
+           h.c, h.v, h.s, h.k,
+           h.biocapacity_stock, h.energy_stock, h.raw_material_stock,
+           h.internet_access_pct, h.surveillance_coupling,
+           h.tick
+    FROM base
+    CROSS JOIN committed
+    JOIN dynamic_hex_state h
+      ON h.session_id = p_session_id
+     AND h.tick BETWEEN base.tick AND p_tick
+    LEFT JOIN hex_spatial_map m ON m.h3_index = h.h3_index AND m.session_id = h.session_id
+    ORDER BY h.h3_index, h.tick DESC
+$hex_state_asof$;
+
+COMMENT ON FUNCTION hex_state_asof(UUID, INTEGER) IS
+    'spec-089 FR-009 single-tick read path: the v_hex_state_asof frame at one '
+    'committed tick, bounded to the nearest checkpoint <= tick plus its '
+    'deltas. Prefer this over filtering v_hex_state_asof to one tick.';
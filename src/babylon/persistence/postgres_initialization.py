@@ -876,6 +876,7 @@ def initialize_session(
         and lodes_study_area_hexes is not None
         and lodes_study_area_states is not None
     ):
+        from babylon.config.paths import player_data_dir
         from babylon.domain.economics.lodes_commute_matrix import LODESCommuteMatrixLoader
 
         loader = LODESCommuteMatrixLoader(
@@ -883,6 +884,7 @@ def initialize_session(
             crosswalk_path=lodes_crosswalk,
             study_area_hexes=lodes_study_area_hexes,
             study_area_states=lodes_study_area_states,
+            cache_dir=player_data_dir() / "cache" / "lodes",
         )
         rows_persisted = 0
         years_persisted = 0
@@ -0,0 +1,137 @@
+"""COPY-protocol bulk writer for :class:`PostgresRuntime`'s per-tick tables.
+
+``executemany`` parses, binds and conflict-checks every row as its own
+statement. At or above :data:`COPY_THRESHOLD` rows, :func:`insert_rows`
+instead streams the batch with ``COPY`` into a session-local staging table
+and moves it into the target with one ``INSERT ... SELECT``. This is the
+pattern ``hex_hydrator`` uses for tick-0 hydration, generalized over a
+:class:`BulkTarget` so both write paths share one column list and one
+``ON CONFLICT`` clause.
+
+Guarantees are unchanged:
+
+* Atomicity — the stage/insert round trip runs inside
+  ``conn.transaction()``: a savepoint when the caller already holds a
+  transaction (``persist_tick``, ``persist_full_tick``,
+  ``persist_tick_atomic``), its own transaction otherwise.
+* Monotonic idempotence — the target's ``ON CONFLICT`` clause is the same
+  one the ``executemany`` path runs. Upserts (``DO UPDATE``) first
+  collapse duplicate keys within the batch last-wins, which is what
+  row-by-row ``executemany`` ends with; a single INSERT may not update
+  the same row twice.
+
+COPY runs in text format. Rows then reach the server exactly as the
+``executemany`` path adapts them (pre-serialized JSON strings, str-or-UUID
+session ids) and are cast to each column's type server-side. Binary COPY
+would need an explicit per-column type list these mixed row shapes do not
+carry.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from psycopg import Cursor
+
+#: Rows below which the staging-table overhead is not amortized and the
+#: plain ``executemany`` path is used (same cut-over as ``hex_hydrator``).
+COPY_THRESHOLD = 1000
+
+
+@dataclass(frozen=True)
+class BulkTarget:
+    """Insert shape of one per-tick table, shared by both write paths.
+
+    Attributes:
+        table: Target table name.
+        columns: Inserted columns, in row-tuple order.
+        on_conflict: Trailing ``ON CONFLICT ...`` clause ("" for none).
+        key: Conflict-key columns of a ``DO UPDATE`` upsert; duplicate
+            keys in a batch collapse last-wins before staging. Empty for
+            ``DO NOTHING`` / plain inserts.
+        stage_name: Staging-table override, for a second shape of the same
+            table (the staging table mirrors ``columns``, so two shapes
+            cannot share one on a pooled connection).
+    """
+
+    table: str
+    columns: tuple[str, ...]
+    on_conflict: str = ""
+    key: tuple[str, ...] = ()
+    stage_name: str = ""
+
+    @property
+    def insert_sql(self) -> str:
+        """Positional ``INSERT ... VALUES`` for the ``executemany`` path."""
+        placeholders = ", ".join(["%s"] * len(self.columns))
+        return (
+            f"INSERT INTO {self.table} ({', '.join(self.columns)}) "  # noqa: S608 — identifiers are module-constant BulkTargets
+            f"VALUES ({placeholders}) {self.on_conflict}"
+        )
+
+    @property
+    def stage(self) -> str:
+        """Session-local staging table for the COPY path."""
+        return self.stage_name or f"_copy_stage_{self.table}"
+
+    def row(self, values: Mapping[str, Any]) -> tuple[Any, ...]:
+        """Project a named-parameter dict onto ``columns`` order."""
+        return tuple(values[column] for column in self.columns)
+
+
+def insert_rows(
+    cur: Cursor[Any],
+    target: BulkTarget,
+    rows: Sequence[Sequence[Any]],
+    *,
+    use_copy: bool = True,
+) -> None:
+    """Insert ``rows`` into ``target``, via COPY when the batch is large.
+
+    Args:
+        cur: Cursor on the caller's connection (and transaction, if any).
+        target: Table shape and conflict handling.
+        rows: Row tuples in ``target.columns`` order.
+        use_copy: ``False`` forces ``executemany`` regardless of size.
+    """
+    if not rows:
+        return
+    if not use_copy or len(rows) < COPY_THRESHOLD:
+        cur.executemany(target.insert_sql, rows)
+        return
+    copy_rows(cur, target, rows)
+
+
+def copy_rows(cur: Cursor[Any], target: BulkTarget, rows: Sequence[Sequence[Any]]) -> None:
+    """Stage ``rows`` with COPY, then ``INSERT ... SELECT`` them into ``target``.
+
+    The staging table mirrors the target's column types, lives for the
+    pooled connection (``ON COMMIT DELETE ROWS``, so no per-tick DDL), and
+    is truncated after each use so repeated calls in one transaction
+    never see each other's rows.
+    """
+    if target.key:
+        positions = [target.columns.index(column) for column in target.key]
+        latest: dict[tuple[Any, ...], Sequence[Any]] = {}
+        for row in rows:
+            latest[tuple(row[position] for position in positions)] = row
+        rows = list(latest.values())
+
+    columns = ", ".join(target.columns)
+    with cur.connection.transaction():
+        cur.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {target.stage} ON COMMIT DELETE ROWS "  # noqa: S608 — identifiers are module-constant BulkTargets
+            f"AS SELECT {columns} FROM {target.table} WITH NO DATA"
+        )
+        with cur.copy(f"COPY {target.stage} ({columns}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(row)
+        cur.execute(
+            f"INSERT INTO {target.table} ({columns}) "  # noqa: S608 — identifiers are module-constant BulkTargets
+            f"SELECT {columns} FROM {target.stage} {target.on_conflict}"
+        )
+        cur.execute(f"TRUNCATE {target.stage}")
@@ -0,0 +1,150 @@
+"""Attribute-level delta frames for :meth:`PostgresRuntime.persist_tick`.
+
+A full-frame ``persist_tick`` rewrites every node and edge, with its whole
+JSONB attribute dict, every tick, although a tick touches a small fraction
+of them. With ``delta_snapshots=True`` the runtime instead writes, per
+element, only the attribute keys whose value changed since the last
+emission (plus the keys that disappeared), a tombstone row for an element
+that left the graph, and nothing at all for an untouched element. The same
+holds for the graph-level ``graph_metadata.extra`` dict, keyed by its
+top-level keys.
+
+The cadence is :mod:`babylon.persistence.delta`'s: a full checkpoint frame
+every :data:`~babylon.persistence.delta.CHECKPOINT_EVERY_TICKS` ticks
+bounds as-of reconstruction to one year of deltas. A runtime also writes a
+checkpoint whenever it holds no in-process frame for the previous tick
+(first tick it writes for a session, a restart, another process committed
+the previous tick), so a delta is only ever taken against the exact state
+committed one tick earlier and the chain from a checkpoint is contiguous.
+
+Replay (:func:`apply_delta`) folds a checkpoint and its successors in tick
+order into the same attribute dicts a full frame would have stored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+#: ``edge_state`` primary-key tail: ``(source_id, target_id, edge_type)``.
+EdgeKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class AttrDelta:
+    """One element's change since its last emission.
+
+    Attributes:
+        changed: Keys added or whose value changed, with their new values.
+            The whole attribute dict for an element new to the frame.
+        removed: Keys present at the last emission and absent now.
+        is_removed: The element itself left the graph (tombstone).
+    """
+
+    changed: dict[str, Any]
+    removed: tuple[str, ...] = ()
+    is_removed: bool = False
+
+
+#: Tombstone for an element present at the last emission and absent now.
+TOMBSTONE = AttrDelta(changed={}, is_removed=True)
+
+
+@dataclass(frozen=True)
+class GraphFrame:
+    """Serialized state of one persisted tick — the base of the next delta.
+
+    Attributes:
+        tick: The tick this frame was committed at.
+        nodes: node id -> JSON-serializable attribute dict.
+        edges: ``(source, target, edge_type)`` -> attribute dict.
+        extra: The graph-level metadata dict (``graph_metadata.extra``).
+    """
+
+    tick: int
+    nodes: dict[str, dict[str, Any]]
+    edges: dict[EdgeKey, dict[str, Any]]
+    extra: dict[str, Any]
+
+
+def diff_attrs(previous: Mapping[str, Any] | None, current: Mapping[str, Any]) -> AttrDelta | None:
+    """Diff one element's attribute dict against its last emission.
+
+    Args:
+        previous: The attributes as last emitted, or ``None`` if the element
+            is new (then the whole dict is emitted, even when empty).
+        current: The attributes now.
+
+    Returns:
+        The delta, or ``None`` when nothing changed.
+    """
+    if previous is None:
+        return AttrDelta(changed=dict(current))
+    changed = {
+        key: value
+        for key, value in current.items()
+        if key not in previous or previous[key] != value
+    }
+    removed = tuple(key for key in previous if key not in current)
+    if not changed and not removed:
+        return None
+    return AttrDelta(changed=changed, removed=removed)
+
+
+def diff_frames[K](
+    previous: Mapping[K, Mapping[str, Any]],
+    current: Mapping[K, Mapping[str, Any]],
+) -> dict[K, AttrDelta]:
+    """Per-element deltas between two frames of one element kind.
+
+    Args:
+        previous: The last emitted frame (empty for a checkpoint, which
+            turns every element into a full row).
+        current: The frame now.
+
+    Returns:
+        Changed and new elements in ``current`` order, then tombstones for
+        the elements that disappeared, in ``previous`` order.
+    """
+    deltas: dict[K, AttrDelta] = {}
+    for key, attrs in current.items():
+        delta = diff_attrs(previous.get(key), attrs)
+        if delta is not None:
+            deltas[key] = delta
+    for key in previous:
+        if key not in current:
+            deltas[key] = TOMBSTONE
+    return deltas
+
+
+def apply_delta[K](state: dict[K, dict[str, Any]], key: K, delta: AttrDelta) -> None:
+    """Fold one persisted delta row into ``state`` (replay, in tick order).
+
+    Args:
+        state: Element key -> attributes as of the previous replayed tick;
+            **mutated in place**.
+        key: The element the row belongs to.
+        delta: The row's change.
+    """
+    if delta.is_removed:
+        state.pop(key, None)
+        return
+    attrs = state.setdefault(key, {})
+    for removed_key in delta.removed:
+        attrs.pop(removed_key, None)
+    attrs.update(delta.changed)
+
+
+def content_hash(payload: Mapping[str, Any]) -> str:
+    """SHA-256 hex digest of a canonical ``persist_tick`` payload.
+
+    Stored per tick in ``graph_commit`` so a re-persist compares one digest
+    instead of re-reading and re-canonicalizing every stored row.
+    """
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
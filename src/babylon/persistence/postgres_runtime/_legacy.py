@@ -19,7 +19,10 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import TYPE_CHECKING, Any
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Final
 from uuid import UUID
 
 if TYPE_CHECKING:
@@ -30,6 +33,18 @@ from psycopg import Connection
 from psycopg.rows import dict_row
 from psycopg_pool import ConnectionPool
 
+from babylon.models.event_log import EventLog
+from babylon.persistence.delta import is_checkpoint_tick
+from babylon.persistence.postgres_runtime._bulk_copy import BulkTarget, insert_rows
+from babylon.persistence.postgres_runtime._graph_delta import (
+    AttrDelta,
+    EdgeKey,
+    GraphFrame,
+    apply_delta,
+    content_hash,
+    diff_attrs,
+    diff_frames,
+)
 from babylon.persistence.postgres_schema import POSTGRES_SCHEMA_DDL, ensure_ddl_applied
 from babylon.persistence.protocols import MonotonicityViolationError, TickAlreadyResolved
 from babylon.persistence.serialization import (
@@ -44,6 +59,223 @@ logger = logging.getLogger(__name__)
 # Maximum rows per executemany batch
 _BATCH_SIZE = 1000
 
+# Per-tick tables written through insert_rows (COPY at national scale).
+_NODE_STATE = BulkTarget(
+    table="node_state",
+    columns=(
+        "session_id",
+        "tick",
+        "node_id",
+        "node_type",
+        "attributes",
+        "wealth",
+        "consciousness",
+        "organization_level",
+        "class_position",
+        "population",
+        "profit_rate",
+        "sector_type",
+        "org_type",
+        "class_character",
+        "cohesion",
+        "legal_standing",
+        "is_institution",
+    ),
+    on_conflict="""
+        ON CONFLICT (session_id, tick, node_id) DO UPDATE SET
+            node_type = EXCLUDED.node_type, attributes = EXCLUDED.attributes,
+            wealth = EXCLUDED.wealth, consciousness = EXCLUDED.consciousness,
+            organization_level = EXCLUDED.organization_level,
+            class_position = EXCLUDED.class_position,
+            population = EXCLUDED.population, profit_rate = EXCLUDED.profit_rate,
+            sector_type = EXCLUDED.sector_type, org_type = EXCLUDED.org_type,
+            class_character = EXCLUDED.class_character, cohesion = EXCLUDED.cohesion,
+            legal_standing = EXCLUDED.legal_standing,
+            is_institution = EXCLUDED.is_institution
+        """,
+    key=("session_id", "tick", "node_id"),
+)
+
+_EDGE_STATE = BulkTarget(
+    table="edge_state",
+    columns=(
+        "session_id",
+        "tick",
+        "source_id",
+        "target_id",
+        "edge_type",
+        "edge_mode",
+        "attributes",
+        "value_flow",
+        "tension",
+        "solidarity_strength",
+        "weight",
+    ),
+    on_conflict="""
+        ON CONFLICT (session_id, tick, source_id, target_id, edge_type) DO UPDATE SET
+            edge_mode = EXCLUDED.edge_mode, attributes = EXCLUDED.attributes,
+            value_flow = EXCLUDED.value_flow, tension = EXCLUDED.tension,
+            solidarity_strength = EXCLUDED.solidarity_strength,
+            weight = EXCLUDED.weight
+        """,
+    key=("session_id", "tick", "source_id", "target_id", "edge_type"),
+)
+
+# Delta-snapshot shapes of the same tables (delta_snapshots=True): the row
+# carries the changed keys only, plus removed keys / a tombstone flag.
+_NODE_STATE_DELTA = BulkTarget(
+    table="node_state",
+    columns=(*_NODE_STATE.columns, "removed_keys", "is_removed"),
+    on_conflict="""
+        ON CONFLICT (session_id, tick, node_id) DO UPDATE SET
+            node_type = EXCLUDED.node_type, attributes = EXCLUDED.attributes,
+            wealth = EXCLUDED.wealth, consciousness = EXCLUDED.consciousness,
+            organization_level = EXCLUDED.organization_level,
+            class_position = EXCLUDED.class_position,
+            population = EXCLUDED.population, profit_rate = EXCLUDED.profit_rate,
+            sector_type = EXCLUDED.sector_type, org_type = EXCLUDED.org_type,
+            class_character = EXCLUDED.class_character, cohesion = EXCLUDED.cohesion,
+            legal_standing = EXCLUDED.legal_standing,
+            is_institution = EXCLUDED.is_institution,
+            removed_keys = EXCLUDED.removed_keys, is_removed = EXCLUDED.is_removed
+        """,
+    key=_NODE_STATE.key,
+    stage_name="_copy_stage_node_state_delta",
+)
+
+_EDGE_STATE_DELTA = BulkTarget(
+    table="edge_state",
+    columns=(*_EDGE_STATE.columns, "removed_keys", "is_removed"),
+    on_conflict="""
+        ON CONFLICT (session_id, tick, source_id, target_id, edge_type) DO UPDATE SET
+            edge_mode = EXCLUDED.edge_mode, attributes = EXCLUDED.attributes,
+            value_flow = EXCLUDED.value_flow, tension = EXCLUDED.tension,
+            solidarity_strength = EXCLUDED.solidarity_strength,
+            weight = EXCLUDED.weight,
+            removed_keys = EXCLUDED.removed_keys, is_removed = EXCLUDED.is_removed
+        """,
+    key=_EDGE_STATE.key,
+    stage_name="_copy_stage_edge_state_delta",
+)
+
+#: Sessions whose last committed frame a delta-mode runtime keeps in memory
+#: as the base of the next tick's delta. A session evicted here simply writes
+#: its next tick as a checkpoint; infra bound, not a gameplay coefficient,
+#: hence no GameDefines.
+_DELTA_BASE_SESSIONS: Final[int] = 8
+
+#: ``graph.graph`` key stored as an append record, never as the full history:
+#: ``{"start": s, "lines": [...]}`` holds the lines appended since the
+#: session's previous persisted tick, ``s`` being the absolute position of
+#: the first one. See :meth:`PostgresRuntime._event_log_record`.
+_EVENT_LOG_KEY: Final[str] = "event_log"
+
+_HEX_STATE = BulkTarget(
+    table="hex_state",
+    columns=(
+        "session_id",
+        "tick",
+        "h3_index",
+        "constant_capital",
+        "variable_capital",
+        "surplus_value",
+        "employment",
+        "dept_shares",
+        "profit_rate",
+        "exploitation_rate",
+    ),
+    on_conflict="""
+        ON CONFLICT (session_id, tick, h3_index) DO UPDATE SET
+            constant_capital = EXCLUDED.constant_capital,
+            variable_capital = EXCLUDED.variable_capital,
+            surplus_value = EXCLUDED.surplus_value,
+            employment = EXCLUDED.employment, dept_shares = EXCLUDED.dept_shares,
+            profit_rate = EXCLUDED.profit_rate,
+            exploitation_rate = EXCLUDED.exploitation_rate
+        """,
+    key=("session_id", "tick", "h3_index"),
+)
+
+_TERRITORY_SNAPSHOT = BulkTarget(
+    table="territory_snapshot",
+    columns=(
+        "game_id",
+        "tick",
+        "county_fips",
+        "c_dept_i",
+        "v_dept_i",
+        "s_dept_i",
+        "c_dept_iia",
+        "v_dept_iia",
+        "s_dept_iia",
+        "c_dept_iib",
+        "v_dept_iib",
+        "s_dept_iib",
+        "c_dept_iii",
+        "v_dept_iii",
+        "s_dept_iii",
+        "profit_rate",
+        "exploitation_rate",
+        "occ",
+        "imperial_rent",
+        "g33_visibility",
+        "pop_bourgeoisie",
+        "pop_petit_bourgeoisie",
+        "pop_labor_aristocracy",
+        "pop_proletariat",
+        "pop_lumpenproletariat",
+        "pop_total",
+        "faction_finance_capital",
+        "faction_security_state",
+        "faction_settler_populist",
+        "heat",
+        "attributes",
+    ),
+    on_conflict="ON CONFLICT (game_id, tick, county_fips) DO NOTHING",
+)
+
+_CLASS_SNAPSHOT = BulkTarget(
+    table="class_snapshot",
+    columns=(
+        "game_id",
+        "tick",
+        "class_id",
+        "role",
+        "wealth",
+        "subsistence_threshold",
+        "population",
+        "inequality",
+        "organization",
+        "repression_faced",
+        "class_consciousness",
+        "national_identity",
+        "agitation",
+        "p_acquiescence",
+        "p_revolution",
+        "active",
+        "attributes",
+    ),
+    on_conflict="ON CONFLICT (game_id, tick, class_id) DO NOTHING",
+)
+
+# tick_event.event_id is SERIAL: no conflict clause can fire (see
+# persist_tick_events for how retries stay idempotent).
+_TICK_EVENT = BulkTarget(
+    table="tick_event",
+    columns=(
+        "game_id",
+        "tick",
+        "event_type",
+        "severity",
+        "source_id",
+        "target_id",
+        "county_fips",
+        "h3_index",
+        "summary",
+        "detail",
+    ),
+)
+
 
 def _is_json_serializable(value: Any) -> bool:
     """Predicate: can ``value`` round-trip through a plain ``json.dumps``?
@@ -63,18 +295,69 @@ def _is_json_serializable(value: Any) -> bool:
         return False
 
 
+def _graph_attrs_without_event_log(graph: BabylonGraph) -> dict[str, Any]:
+    """``graph.graph`` minus the event log, which is stored as a tail record."""
+    return {key: value for key, value in graph.graph.items() if key != _EVENT_LOG_KEY}
+
+
+def _row_delta(row: dict[str, Any], attrs_column: str) -> AttrDelta:
+    """Read one delta-mode ``node_state`` / ``edge_state`` / ``graph_metadata`` row."""
+    attrs = row[attrs_column]
+    return AttrDelta(
+        changed=attrs if isinstance(attrs, dict) else {},
+        removed=tuple(row.get("removed_keys") or ()),
+        is_removed=bool(row.get("is_removed", False)),
+    )
+
+
 class PostgresRuntime:
     """PostgreSQL persistence backend for the simulation engine.
 
     Implements both ``RuntimePersistence`` and ``PostgresRuntimeExtensions``.
     Uses connection pooling via psycopg-pool for concurrent session support.
 
+    Per-tick bulk writers (nodes, edges, hex state, territory/class
+    snapshots, tick events, the spec-062 envelope) switch from
+    ``executemany`` to ``COPY`` + ``INSERT ... SELECT`` once a batch
+    reaches ``_bulk_copy.COPY_THRESHOLD`` rows, with identical atomicity
+    and ``ON CONFLICT`` semantics.
+
+    With ``delta_snapshots=True``, :meth:`persist_tick` stores
+    attribute-level deltas with a full checkpoint every 52 ticks (see
+    ``_graph_delta``), and :meth:`hydrate_graph` replays checkpoint plus
+    deltas.
+
     Attributes:
         pool: The psycopg ConnectionPool instance.
     """
 
-    def __init__(self, pool: ConnectionPool[Connection[Any]]) -> None:
+    def __init__(
+        self,
+        pool: ConnectionPool[Connection[Any]],
+        *,
+        bulk_copy: bool = True,
+        delta_snapshots: bool = False,
+    ) -> None:
+        """Wrap a connection pool.
+
+        Args:
+            pool: psycopg connection pool.
+            bulk_copy: Allow the COPY path for large per-tick batches.
+                ``False`` keeps every write on ``executemany``.
+            delta_snapshots: Persist node/edge/graph-metadata snapshots as
+                attribute-level deltas against the previous tick, with
+                yearly checkpoints and a per-tick content hash in
+                ``graph_commit``. Ticks persisted full-frame (before the
+                switch, or by another runtime) still hydrate.
+        """
         self._pool = pool
+        self._bulk_copy = bulk_copy
+        self._delta_snapshots = delta_snapshots
+        self._delta_bases: OrderedDict[UUID, GraphFrame] = OrderedDict()
+        self._delta_bases_lock = threading.Lock()
+        # session -> (tick, event log length) of the last persisted tick.
+        self._event_log_marks: OrderedDict[UUID, tuple[int, int]] = OrderedDict()
+        self._event_log_marks_lock = threading.Lock()
 
     @property
     def pool(self) -> ConnectionPool[Connection[Any]]:
@@ -146,30 +429,299 @@ class PostgresRuntime:
             msg = "session_id is required for PostgresRuntime.persist_tick"
             raise ValueError(msg)
 
-        new_payload = self._canonical_payload(graph, events)
+        if self._delta_snapshots:
+            self._persist_tick_delta(tick, graph, events, session_id)
+            return
 
+        new_payload = self._canonical_payload(graph, events)
         # Spec 056 monotonic-idempotent check: is this (session, tick) already persisted?
+        with self._pool.connection() as conn, conn.cursor() as cur:
+            if self._tick_already_persisted(conn, cur, session_id, tick, new_payload):
+                return
+
+        event_log = graph.graph.get(_EVENT_LOG_KEY)
+        event_log_record = self._event_log_record(session_id, tick, event_log)
+        with self._pool.connection() as conn, conn.transaction():
+            self._persist_nodes(conn, session_id, tick, graph)
+            self._persist_edges(conn, session_id, tick, graph)
+            self._persist_graph_attrs(conn, session_id, tick, graph, event_log_record)
+            if events:
+                self._persist_events(conn, session_id, tick, events)
+        self._remember_event_log(session_id, tick, event_log)
+
+    def _tick_already_persisted(
+        self,
+        conn: Connection[Any],
+        cur: Any,
+        session_id: UUID,
+        tick: int,
+        new_payload: dict[str, Any],
+    ) -> bool:
+        """Spec 056 check against a full-frame tick already in ``node_state``.
+
+        Returns:
+            ``True`` when the stored tick equals ``new_payload`` (idempotent
+            retry), ``False`` when the tick is not yet persisted.
+
+        Raises:
+            MonotonicityViolationError: If the stored tick differs.
+        """
+        cur.execute(
+            "SELECT 1 FROM node_state WHERE session_id = %s AND tick = %s LIMIT 1",
+            (session_id, tick),
+        )
+        if cur.fetchone() is None:
+            return False
+        existing_payload = self._canonical_payload_for_tick(conn, session_id, tick)
+        if existing_payload == new_payload:
+            return True  # idempotent — same payload
+        raise MonotonicityViolationError(
+            tick=tick,
+            existing_payload=existing_payload,
+            attempted_payload=new_payload,
+        )
+
+    def _persist_tick_delta(
+        self,
+        tick: int,
+        graph: BabylonGraph,
+        events: list[dict[str, Any]] | None,
+        session_id: UUID,
+    ) -> None:
+        """``persist_tick`` for ``delta_snapshots=True``.
+
+        The graph is serialized once: :meth:`_graph_frame` yields both the
+        frame the delta is taken from and the canonical payload whose digest
+        is stored. The idempotency check compares ``graph_commit.content_hash``
+        (one row) instead of re-reading the tick; a tick persisted full-frame
+        by a non-delta runtime falls back to the row-level comparison. The
+        tick is written as a delta against this runtime's in-memory frame
+        of ``tick - 1``, or as a full checkpoint on a checkpoint tick or
+        when no such frame is held. The event log is append-only, so it is
+        never diffed: its appended tail rides on the tick's metadata row.
+        """
+        frame, new_payload = self._graph_frame(tick, graph, events)
+        digest = content_hash(new_payload)
         with self._pool.connection() as conn, conn.cursor() as cur:
             cur.execute(
-                "SELECT 1 FROM node_state WHERE session_id = %s AND tick = %s LIMIT 1",
+                "SELECT content_hash FROM graph_commit WHERE session_id = %s AND tick = %s",
                 (session_id, tick),
             )
-            if cur.fetchone() is not None:
-                existing_payload = self._canonical_payload_for_tick(conn, session_id, tick)
-                if existing_payload == new_payload:
+            row = cur.fetchone()
+            if row is not None:
+                if row[0] == digest:
                     return  # idempotent — same payload
                 raise MonotonicityViolationError(
                     tick=tick,
-                    existing_payload=existing_payload,
-                    attempted_payload=new_payload,
+                    existing_payload={"content_hash": row[0]},
+                    attempted_payload={"content_hash": digest},
                 )
+            if self._tick_already_persisted(conn, cur, session_id, tick, new_payload):
+                return
+
+        event_log = graph.graph.get(_EVENT_LOG_KEY)
+        event_log_record = self._event_log_record(session_id, tick, event_log)
+        previous = self._delta_base(session_id, tick - 1)
+        checkpoint = previous is None or is_checkpoint_tick(tick)
+        if checkpoint or previous is None:
+            previous = GraphFrame(tick=tick - 1, nodes={}, edges={}, extra={})
 
         with self._pool.connection() as conn, conn.transaction():
-            self._persist_nodes(conn, session_id, tick, graph)
-            self._persist_edges(conn, session_id, tick, graph)
-            self._persist_graph_attrs(conn, session_id, tick, graph)
+            self._persist_node_deltas(conn, session_id, tick, graph, frame, previous)
+            self._persist_edge_deltas(conn, session_id, tick, graph, frame, previous)
+            extra_delta = (
+                AttrDelta(changed=frame.extra)
+                if checkpoint
+                else diff_attrs(previous.extra, frame.extra)
+            )
+            if event_log_record is not None:
+                extra_delta = AttrDelta(
+                    changed={
+                        **(extra_delta.changed if extra_delta else {}),
+                        _EVENT_LOG_KEY: event_log_record,
+                    },
+                    removed=extra_delta.removed if extra_delta else (),
+                )
+            if extra_delta is not None:
+                conn.execute(
+                    """
+                    INSERT INTO graph_metadata (session_id, tick, extra, extra_removed_keys)
+                    VALUES (%s, %s, %s, %s)
+                    ON CONFLICT (session_id, tick) DO UPDATE SET
+                        extra = EXCLUDED.extra,
+                        extra_removed_keys = EXCLUDED.extra_removed_keys
+                    """,
+                    (
+                        session_id,
+                        tick,
+                        json.dumps(extra_delta.changed),
+                        list(extra_delta.removed),
+                    ),
+                )
             if events:
                 self._persist_events(conn, session_id, tick, events)
+            conn.execute(
+                "INSERT INTO graph_commit (session_id, tick, content_hash, is_checkpoint) "
+                "VALUES (%s, %s, %s, %s)",
+                (session_id, tick, digest, checkpoint),
+            )
+
+        self._remember_delta_base(session_id, frame)
+        self._remember_event_log(session_id, tick, event_log)
+
+    def _graph_frame(
+        self,
+        tick: int,
+        graph: BabylonGraph,
+        events: list[dict[str, Any]] | None,
+    ) -> tuple[GraphFrame, dict[str, Any]]:
+        """Serialize ``graph`` once, as the frame and the canonical payload.
+
+        Frame attributes are what the full-frame writers store; the payload
+        equals :meth:`_canonical_payload` ``(graph, events)``. The event log
+        is left out of ``extra``: it is stored as an append record
+        (:meth:`_event_log_record`), not diffed.
+        """
+        nodes: dict[str, dict[str, Any]] = {}
+        node_entries = []
+        for node_id, attrs in graph.nodes(data=True):
+            stored, text = self._serialize_attrs(attrs)
+            nodes[str(node_id)] = stored
+            node_type = attrs.get("_node_type", attrs.get("type", "unknown"))
+            node_entries.append((str(node_id), str(node_type), text))
+        edges: dict[EdgeKey, dict[str, Any]] = {}
+        edge_entries = []
+        for source, target, attrs in graph.edges(data=True):
+            edge_type = str(attrs.get("type", attrs.get("edge_type", "UNKNOWN")))
+            stored, text = self._serialize_attrs(attrs)
+            edges[(str(source), str(target), edge_type)] = stored
+            canonical_type = attrs.get("edge_type", attrs.get("type", "UNKNOWN"))
+            edge_entries.append((str(source), str(target), str(canonical_type), text))
+        frame = GraphFrame(
+            tick=tick,
+            nodes=nodes,
+            edges=edges,
+            extra=self._make_serializable(_graph_attrs_without_event_log(graph)),
+        )
+        payload = {
+            "nodes": sorted(node_entries),
+            "edges": sorted(edge_entries),
+            "events": sorted(canonical_event_json(event) for event in (events or [])),
+        }
+        return frame, payload
+
+    @classmethod
+    def _serialize_attrs(cls, attrs: dict[str, Any]) -> tuple[dict[str, Any], str]:
+        """One element's stored attributes and canonical JSON, from one dump.
+
+        The common all-JSON-native dict is dumped once, and that text is
+        the canonical form. Only a dict holding a value a plain dump rejects
+        takes :meth:`_make_serializable` plus a filtered dump, matching
+        :meth:`_canonical_payload`.
+        """
+        try:
+            return dict(attrs), json.dumps(attrs, sort_keys=True)
+        except (TypeError, ValueError):
+            plain = {k: v for k, v in attrs.items() if _is_json_serializable(v)}
+            return cls._make_serializable(attrs), json.dumps(plain, sort_keys=True)
+
+    def _delta_base(self, session_id: UUID, tick: int) -> GraphFrame | None:
+        """The in-memory frame committed at ``tick``, if this runtime holds it."""
+        with self._delta_bases_lock:
+            frame = self._delta_bases.get(session_id)
+        if frame is None or frame.tick != tick:
+            return None
+        return frame
+
+    def _remember_delta_base(self, session_id: UUID, frame: GraphFrame) -> None:
+        with self._delta_bases_lock:
+            self._delta_bases[session_id] = frame
+            self._delta_bases.move_to_end(session_id)
+            while len(self._delta_bases) > _DELTA_BASE_SESSIONS:
+                self._delta_bases.popitem(last=False)
+
+    def _event_log_record(
+        self,
+        session_id: UUID,
+        tick: int,
+        event_log: Sequence[str] | None,
+    ) -> dict[str, Any] | None:
+        """The ``graph_metadata.extra`` event-log entry to store at ``tick``.
+
+        The log only grows, so only the lines appended since this session's
+        previous persisted tick are stored, as ``{"start": s, "lines": [...]}``
+        (``s`` is the absolute position of the first line). ``None`` when
+        nothing was appended. A session this runtime holds no mark for — or
+        whose log is shorter than the mark (a fork) — stores the whole log
+        from ``start = 0``, which :meth:`_fold_event_log` also treats as the
+        point to start folding from.
+        """
+        if event_log is None:
+            return None
+        with self._event_log_marks_lock:
+            mark = self._event_log_marks.get(session_id)
+        start = 0
+        if mark is not None and mark[0] < tick and mark[1] <= len(event_log):
+            start = mark[1]
+        elif mark is not None:
+            mark = None
+        if isinstance(event_log, EventLog):
+            lines = event_log.since(start)
+        else:
+            lines = list(event_log[start:])
+        if not lines and mark is not None:
+            return None
+        return {"start": start, "lines": lines}
+
+    def _remember_event_log(
+        self, session_id: UUID, tick: int, event_log: Sequence[str] | None
+    ) -> None:
+        if event_log is None:
+            return
+        with self._event_log_marks_lock:
+            self._event_log_marks[session_id] = (tick, len(event_log))
+            self._event_log_marks.move_to_end(session_id)
+            while len(self._event_log_marks) > _DELTA_BASE_SESSIONS:
+                self._event_log_marks.popitem(last=False)
+
+    @staticmethod
+    def _fold_event_log(cur: Any, session_id: UUID, tick: int) -> EventLog | None:
+        """Rebuild the event log as of ``tick`` from its append records.
+
+        Folds every record from the latest one that restarts the log (a
+        ``start = 0`` record, or a plain array written before records
+        existed) up to ``tick``.
+
+        Args:
+            cur: ``dict_row`` cursor.
+            session_id: Session scope.
+            tick: Upper bound.
+
+        Returns:
+            The log, or ``None`` when no tick up to ``tick`` stored one.
+        """
+        cur.execute(
+            "SELECT extra -> 'event_log' AS record FROM graph_metadata "
+            "WHERE session_id = %s AND tick <= %s AND extra ? 'event_log' "
+            "AND tick >= COALESCE(("
+            "SELECT MAX(tick) FROM graph_metadata WHERE session_id = %s AND tick <= %s "
+            "AND (jsonb_typeof(extra -> 'event_log') = 'array' "
+            "OR extra -> 'event_log' ->> 'start' = '0')), 0) "
+            "ORDER BY tick",
+            (session_id, tick, session_id, tick),
+        )
+        rows = cur.fetchall()
+        if not rows:
+            return None
+        lines: list[str] = []
+        for row in rows:
+            record = row["record"]
+            if isinstance(record, list):
+                lines = list(record)
+            elif isinstance(record, dict):
+                del lines[int(record.get("start", 0)) :]
+                lines.extend(record.get("lines") or ())
+        return EventLog(lines)
 
     @staticmethod
     def _canonical_payload(
@@ -273,6 +825,11 @@ class PostgresRuntime:
     ) -> BabylonGraph:
         """Load a complete state snapshot from storage.
 
+        With ``delta_snapshots=True`` a session that has ``graph_commit``
+        rows is rebuilt as of ``tick`` (its latest commit at or before it)
+        by replaying the latest checkpoint at or before ``tick`` and every
+        delta after it; otherwise the stored full frame at ``tick`` is read.
+
         Args:
             tick: Tick to load, or None for latest.
             session_id: Required session scope.
@@ -289,6 +846,9 @@ class PostgresRuntime:
         graph = BabylonGraph()
 
         with self._pool.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+            if self._delta_snapshots and self._replay_graph_delta(cur, session_id, tick, graph):
+                return graph
+
             # Determine tick
             if tick is None:
                 cur.execute(
@@ -325,7 +885,8 @@ class PostgresRuntime:
             # Restore graph-LEVEL metadata (Design B round-trip). persist_tick
             # stashes the full ``graph.graph`` dict — institution_relations,
             # economy, state_finances, contradiction_frames, opposition_states,
-            # events, event_log — into graph_metadata.extra. Without this the
+            # events and the event log's append record — into
+            # graph_metadata.extra. Without this the
             # rehydrated graph loses that relational state and from_graph()
             # reconstructs a divergent WorldState, so a second resolve() persists
             # a mismatched payload → MonotonicityViolationError.
@@ -336,8 +897,12 @@ class PostgresRuntime:
             meta_row = cur.fetchone()
             extra = meta_row.get("extra") if isinstance(meta_row, dict) else None
             if isinstance(extra, dict):
+                extra.pop(_EVENT_LOG_KEY, None)
                 for meta_key, meta_value in extra.items():
                     graph.set_graph_attr(meta_key, meta_value)
+                event_log = self._fold_event_log(cur, session_id, tick)
+                if event_log is not None:
+                    graph.set_graph_attr(_EVENT_LOG_KEY, event_log)
 
         # Restore the loaded tick as graph-level metadata so bridge helpers
         # (engine_bridge._graph_tick reads graph.graph["tick"]) resolve the
@@ -347,6 +912,92 @@ class PostgresRuntime:
 
         return graph
 
+    @staticmethod
+    def _replay_graph_delta(
+        cur: Any,
+        session_id: UUID,
+        tick: int | None,
+        graph: BabylonGraph,
+    ) -> bool:
+        """Fold checkpoint + deltas into ``graph``, as of ``tick``.
+
+        Args:
+            cur: ``dict_row`` cursor.
+            session_id: Session scope.
+            tick: Upper bound, or ``None`` for the latest commit.
+            graph: Empty graph to populate.
+
+        Returns:
+            ``False`` (``graph`` untouched) when the session has no
+            delta-mode commit at or before ``tick`` — the caller reads full
+            frames instead.
+        """
+        if tick is None:
+            cur.execute(
+                "SELECT MAX(tick) FILTER (WHERE is_checkpoint) AS checkpoint_tick, "
+                "MAX(tick) AS as_of_tick FROM graph_commit WHERE session_id = %s",
+                (session_id,),
+            )
+        else:
+            cur.execute(
+                "SELECT MAX(tick) FILTER (WHERE is_checkpoint) AS checkpoint_tick, "
+                "MAX(tick) AS as_of_tick FROM graph_commit WHERE session_id = %s AND tick <= %s",
+                (session_id, tick),
+            )
+        row = cur.fetchone()
+        if row is None or row["checkpoint_tick"] is None:
+            return False
+        window = (session_id, row["checkpoint_tick"], row["as_of_tick"])
+
+        node_types: dict[str, str] = {}
+        nodes: dict[str, dict[str, Any]] = {}
+        cur.execute(
+            "SELECT node_id, node_type, attributes, removed_keys, is_removed FROM node_state "
+            "WHERE session_id = %s AND tick BETWEEN %s AND %s ORDER BY tick",
+            window,
+        )
+        for node_row in cur.fetchall():
+            apply_delta(nodes, node_row["node_id"], _row_delta(node_row, "attributes"))
+            node_types[node_row["node_id"]] = node_row["node_type"]
+
+        edges: dict[EdgeKey, dict[str, Any]] = {}
+        cur.execute(
+            "SELECT source_id, target_id, edge_type, attributes, removed_keys, is_removed "
+            "FROM edge_state WHERE session_id = %s AND tick BETWEEN %s AND %s ORDER BY tick",
+            window,
+        )
+        for edge_row in cur.fetchall():
+            key = (edge_row["source_id"], edge_row["target_id"], edge_row["edge_type"])
+            apply_delta(edges, key, _row_delta(edge_row, "attributes"))
+
+        # Rows with no ``extra`` were written by persist_graph_metadata alone:
+        # no graph-level change that tick.
+        metadata: dict[str, dict[str, Any]] = {}
+        cur.execute(
+            "SELECT extra, extra_removed_keys AS removed_keys FROM graph_metadata "
+            "WHERE session_id = %s AND tick BETWEEN %s AND %s AND extra IS NOT NULL "
+            "ORDER BY tick",
+            window,
+        )
+        for meta_row in cur.fetchall():
+            if isinstance(meta_row["extra"], dict):
+                meta_row["extra"].pop(_EVENT_LOG_KEY, None)
+            apply_delta(metadata, "extra", _row_delta(meta_row, "extra"))
+        event_log = PostgresRuntime._fold_event_log(cur, session_id, row["as_of_tick"])
+
+        for node_id, attrs in nodes.items():
+            attrs["_node_type"] = node_types[node_id]
+            graph.add_node(node_id, **attrs)
+        for (source, target, edge_type), attrs in edges.items():
+            attrs["edge_type"] = edge_type
+            graph.add_edge(source, target, **attrs)
+        for meta_key, meta_value in metadata.get("extra", {}).items():
+            graph.set_graph_attr(meta_key, meta_value)
+        if event_log is not None:
+            graph.set_graph_attr(_EVENT_LOG_KEY, event_log)
+        graph.set_graph_attr("tick", row["as_of_tick"])
+        return True
+
     def log_tick(
         self,
         tick: int,
@@ -599,39 +1250,27 @@ class PostgresRuntime:
         if not hex_states:
             return
 
+        rows = [
+            (
+                session_id,
+                tick,
+                h["h3_index"],
+                h.get("constant_capital", 0),
+                h.get("variable_capital", 0),
+                h.get("surplus_value", 0),
+                h.get("employment", 0),
+                h.get("dept_shares", [0, 0, 0, 0]),
+                h.get("profit_rate", 0),
+                h.get("exploitation_rate", 0),
+            )
+            for h in hex_states
+        ]
         with self._pool.connection() as conn, conn.cursor() as cur:
-            for i in range(0, len(hex_states), _BATCH_SIZE):
-                batch = hex_states[i : i + _BATCH_SIZE]
-                cur.executemany(
-                    """
-                        INSERT INTO hex_state
-                            (session_id, tick, h3_index, constant_capital, variable_capital,
-                             surplus_value, employment, dept_shares, profit_rate, exploitation_rate)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (session_id, tick, h3_index) DO UPDATE SET
-                            constant_capital = EXCLUDED.constant_capital,
-                            variable_capital = EXCLUDED.variable_capital,
-                            surplus_value = EXCLUDED.surplus_value,
-                            employment = EXCLUDED.employment, dept_shares = EXCLUDED.dept_shares,
-                            profit_rate = EXCLUDED.profit_rate,
-                            exploitation_rate = EXCLUDED.exploitation_rate
-                        """,
-                    [
-                        (
-                            session_id,
-                            tick,
-                            h["h3_index"],
-                            h.get("constant_capital", 0),
-                            h.get("variable_capital", 0),
-                            h.get("surplus_value", 0),
-                            h.get("employment", 0),
-                            h.get("dept_shares", [0, 0, 0, 0]),
-                            h.get("profit_rate", 0),
-                            h.get("exploitation_rate", 0),
-                        )
-                        for h in batch
-                    ],
-                )
+            if self._bulk_copy:
+                insert_rows(cur, _HEX_STATE, rows)
+                return
+            for i in range(0, len(rows), _BATCH_SIZE):
+                cur.executemany(_HEX_STATE.insert_sql, rows[i : i + _BATCH_SIZE])
 
     def persist_infrastructure_state(
         self,
@@ -1424,32 +2063,11 @@ class PostgresRuntime:
             )
             for t in territories
         ]
-        sql = """
-            INSERT INTO territory_snapshot
-                (game_id, tick, county_fips,
-                 c_dept_i, v_dept_i, s_dept_i,
-                 c_dept_iia, v_dept_iia, s_dept_iia,
-                 c_dept_iib, v_dept_iib, s_dept_iib,
-                 c_dept_iii, v_dept_iii, s_dept_iii,
-                 profit_rate, exploitation_rate, occ,
-                 imperial_rent, g33_visibility,
-                 pop_bourgeoisie, pop_petit_bourgeoisie,
-                 pop_labor_aristocracy, pop_proletariat,
-                 pop_lumpenproletariat, pop_total,
-                 faction_finance_capital, faction_security_state,
-                 faction_settler_populist, heat, attributes)
-            VALUES (%s, %s, %s,
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s)
-            ON CONFLICT (game_id, tick, county_fips) DO NOTHING
-            """
         if _cursor is not None:
-            _cursor.executemany(sql, rows)
+            insert_rows(_cursor, _TERRITORY_SNAPSHOT, rows, use_copy=self._bulk_copy)
             return
         with self._pool.connection() as conn, conn.cursor() as cur:
-            cur.executemany(sql, rows)
+            insert_rows(cur, _TERRITORY_SNAPSHOT, rows, use_copy=self._bulk_copy)
 
     def persist_org_snapshots(
         self,
@@ -1564,27 +2182,11 @@ class PostgresRuntime:
             )
             for c in classes
         ]
-        sql = """
-            INSERT INTO class_snapshot
-                (game_id, tick, class_id, role,
-                 wealth, subsistence_threshold, population, inequality,
-                 organization, repression_faced,
-                 class_consciousness, national_identity, agitation,
-                 p_acquiescence, p_revolution,
-                 active, attributes)
-            VALUES (%s, %s, %s, %s,
-                    %s, %s, %s, %s,
-                    %s, %s,
-                    %s, %s, %s,
-                    %s, %s,
-                    %s, %s)
-            ON CONFLICT (game_id, tick, class_id) DO NOTHING
-            """
         if _cursor is not None:
-            _cursor.executemany(sql, rows)
+            insert_rows(_cursor, _CLASS_SNAPSHOT, rows, use_copy=self._bulk_copy)
             return
         with self._pool.connection() as conn, conn.cursor() as cur:
-            cur.executemany(sql, rows)
+            insert_rows(cur, _CLASS_SNAPSHOT, rows, use_copy=self._bulk_copy)
 
     def query_class_snapshot_history(
         self,
@@ -2282,24 +2884,15 @@ class PostgresRuntime:
             )
             for e in events
         ]
-        sql = """
-            INSERT INTO tick_event
-                (game_id, tick, event_type, severity,
-                 source_id, target_id, county_fips, h3_index,
-                 summary, detail)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
         if _cursor is not None:
             if replace:
                 _cursor.execute(delete_sql, (game_id, tick))
-            if rows:
-                _cursor.executemany(sql, rows)
+            insert_rows(_cursor, _TICK_EVENT, rows, use_copy=self._bulk_copy)
             return
         with self._pool.connection() as conn, conn.cursor() as cur:
             if replace:
                 cur.execute(delete_sql, (game_id, tick))
-            if rows:
-                cur.executemany(sql, rows)
+            insert_rows(cur, _TICK_EVENT, rows, use_copy=self._bulk_copy)
 
     def persist_full_tick(
         self,
@@ -2689,27 +3282,7 @@ class PostgresRuntime:
 
         if rows:
             with conn.cursor() as cur:
-                cur.executemany(
-                    """
-                    INSERT INTO node_state
-                        (session_id, tick, node_id, node_type, attributes,
-                         wealth, consciousness, organization_level, class_position,
-                         population, profit_rate, sector_type,
-                         org_type, class_character, cohesion, legal_standing, is_institution)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (session_id, tick, node_id) DO UPDATE SET
-                        node_type = EXCLUDED.node_type, attributes = EXCLUDED.attributes,
-                        wealth = EXCLUDED.wealth, consciousness = EXCLUDED.consciousness,
-                        organization_level = EXCLUDED.organization_level,
-                        class_position = EXCLUDED.class_position,
-                        population = EXCLUDED.population, profit_rate = EXCLUDED.profit_rate,
-                        sector_type = EXCLUDED.sector_type, org_type = EXCLUDED.org_type,
-                        class_character = EXCLUDED.class_character, cohesion = EXCLUDED.cohesion,
-                        legal_standing = EXCLUDED.legal_standing,
-                        is_institution = EXCLUDED.is_institution
-                    """,
-                    rows,
-                )
+                insert_rows(cur, _NODE_STATE, rows, use_copy=self._bulk_copy)
 
     def _persist_edges(
         self,
@@ -2741,20 +3314,94 @@ class PostgresRuntime:
 
         if rows:
             with conn.cursor() as cur:
-                cur.executemany(
-                    """
-                    INSERT INTO edge_state
-                        (session_id, tick, source_id, target_id, edge_type, edge_mode,
-                         attributes, value_flow, tension, solidarity_strength, weight)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (session_id, tick, source_id, target_id, edge_type) DO UPDATE SET
-                        edge_mode = EXCLUDED.edge_mode, attributes = EXCLUDED.attributes,
-                        value_flow = EXCLUDED.value_flow, tension = EXCLUDED.tension,
-                        solidarity_strength = EXCLUDED.solidarity_strength,
-                        weight = EXCLUDED.weight
-                    """,
-                    rows,
+                insert_rows(cur, _EDGE_STATE, rows, use_copy=self._bulk_copy)
+
+    def _persist_node_deltas(
+        self,
+        conn: Connection[Any],
+        session_id: UUID,
+        tick: int,
+        graph: BabylonGraph,
+        frame: GraphFrame,
+        previous: GraphFrame,
+    ) -> None:
+        """Persist changed/new nodes and tombstones for a delta-mode tick.
+
+        Promoted columns always reflect the node's full current state, so
+        typed-column queries stay meaningful on delta rows.
+        """
+        deltas = diff_frames(previous.nodes, frame.nodes)
+        if not deltas:
+            return
+        rows: list[tuple[Any, ...]] = []
+        for node_id, attrs in graph.nodes(data=True):
+            delta = deltas.pop(str(node_id), None)
+            if delta is None:
+                continue
+            node_type = attrs.get("type", attrs.get("_node_type", "unknown"))
+            rows.append(
+                (
+                    session_id,
+                    tick,
+                    str(node_id),
+                    node_type,
+                    json.dumps(delta.changed),
+                    *self._extract_promoted_columns(node_type, attrs),
+                    list(delta.removed),
+                    False,
                 )
+            )
+        for node_id in deltas:  # what is left are tombstones
+            last = previous.nodes[node_id]
+            node_type = last.get("type", last.get("_node_type", "unknown"))
+            rows.append((session_id, tick, node_id, node_type, "{}", *([None] * 12), [], True))
+
+        with conn.cursor() as cur:
+            insert_rows(cur, _NODE_STATE_DELTA, rows, use_copy=self._bulk_copy)
+
+    def _persist_edge_deltas(
+        self,
+        conn: Connection[Any],
+        session_id: UUID,
+        tick: int,
+        graph: BabylonGraph,
+        frame: GraphFrame,
+        previous: GraphFrame,
+    ) -> None:
+        """Persist changed/new edges and tombstones for a delta-mode tick."""
+        deltas = diff_frames(previous.edges, frame.edges)
+        if not deltas:
+            return
+        rows: list[tuple[Any, ...]] = []
+        for source, target, attrs in graph.edges(data=True):
+            edge_type = str(attrs.get("type", attrs.get("edge_type", "UNKNOWN")))
+            delta = deltas.pop((str(source), str(target), edge_type), None)
+            if delta is None:
+                continue
+            rows.append(
+                (
+                    session_id,
+                    tick,
+                    str(source),
+                    str(target),
+                    edge_type,
+                    attrs.get("edge_mode"),
+                    json.dumps(delta.changed),
+                    attrs.get("value_flow"),
+                    attrs.get("tension"),
+                    attrs.get("solidarity_strength"),
+                    attrs.get("weight"),
+                    list(delta.removed),
+                    False,
+                )
+            )
+        for source, target, edge_type in deltas:  # tombstones
+            rows.append(
+                (session_id, tick, source, target, edge_type, None, "{}", *([None] * 4), [], True)
+            )
+
+        with conn.cursor() as cur:
+            insert_rows(cur, _EDGE_STATE_DELTA, rows, use_copy=self._bulk_copy)
 
     def _persist_graph_attrs(
         self,
@@ -2762,6 +3409,7 @@ class PostgresRuntime:
         session_id: UUID,
         tick: int,
         graph: BabylonGraph,
+        event_log_record: dict[str, Any] | None = None,
     ) -> None:
         """Persist graph-LEVEL metadata (``graph.graph``) for a tick.
 
@@ -2778,6 +3426,8 @@ class PostgresRuntime:
         ``extra`` is touched, so the observer-driven
         :meth:`persist_graph_metadata` (economy / state_finances /
         tick_dynamics columns) and this writer never clobber one another.
+        ``event_log`` is replaced by ``event_log_record`` (its appended tail),
+        so the history is not rewritten every tick.
 
         Args:
             conn: Open connection (runs inside :meth:`persist_tick`'s
@@ -2787,8 +3437,12 @@ class PostgresRuntime:
             tick: The tick being persisted.
             graph: Full simulation graph; ``graph.graph`` supplies the
                 graph-level metadata dict.
+            event_log_record: From :meth:`_event_log_record`; omitted from
+                ``extra`` when ``None``.
         """
-        metadata = self._make_serializable(dict(graph.graph))
+        metadata = self._make_serializable(_graph_attrs_without_event_log(graph))
+        if event_log_record is not None:
+            metadata[_EVENT_LOG_KEY] = event_log_record
         conn.execute(
             """
             INSERT INTO graph_metadata (session_id, tick, extra)
@@ -9,7 +9,8 @@ Design:
 - :func:`persist_tick_atomic` wraps every INSERT into the four dynamic_*
   table families in a single ``with conn.transaction():`` block. INSERT
   statements use ``ON CONFLICT ... DO NOTHING`` so re-running the same
-  envelope after a crash is idempotent.
+  envelope after a crash is idempotent. Large row families take the
+  ``_bulk_copy`` COPY path inside that same transaction.
 - :func:`get_last_committed_tick` returns the highest tick for which a
   hex_state row exists (since the envelope is atomic, ``dynamic_hex_state``
   is sufficient — every committed envelope writes at least one hex row).
@@ -25,119 +26,134 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+from babylon.persistence.postgres_runtime._bulk_copy import BulkTarget, insert_rows
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
     from babylon.persistence.envelope import PerTickTransactionEnvelope
     from babylon.persistence.postgres_runtime._legacy import PostgresRuntime
 
 
-_HEX_INSERT = """
-INSERT INTO dynamic_hex_state (
-    session_id, tick, h3_index,
-    county_fips, state_fips, region_id,
-    c, v, s, k,
-    biocapacity_stock, energy_stock, raw_material_stock,
-    internet_access_pct, surveillance_coupling
-) VALUES (
-    %(session_id)s, %(tick)s, %(h3_index)s,
-    %(county_fips)s, %(state_fips)s, %(region_id)s,
-    %(c)s, %(v)s, %(s)s, %(k)s,
-    %(biocapacity_stock)s, %(energy_stock)s, %(raw_material_stock)s,
-    %(internet_access_pct)s, %(surveillance_coupling)s
+_HEX_STATE = BulkTarget(
+    table="dynamic_hex_state",
+    columns=(
+        "session_id",
+        "tick",
+        "h3_index",
+        "county_fips",
+        "state_fips",
+        "region_id",
+        "c",
+        "v",
+        "s",
+        "k",
+        "biocapacity_stock",
+        "energy_stock",
+        "raw_material_stock",
+        "internet_access_pct",
+        "surveillance_coupling",
+    ),
+    on_conflict="ON CONFLICT (session_id, tick, h3_index) DO NOTHING",
 )
-ON CONFLICT (session_id, tick, h3_index) DO NOTHING
-"""
 
-_EXTERNAL_INSERT = """
-INSERT INTO dynamic_external_node_state (
-    session_id, tick, node_id, kind,
-    phi_year_inflow, bilateral_trade_value, bilateral_trade_tons, erdi_ratio
-) VALUES (
-    %(session_id)s, %(tick)s, %(node_id)s, %(kind)s,
-    %(phi_year_inflow)s, %(bilateral_trade_value)s,
-    %(bilateral_trade_tons)s, %(erdi_ratio)s
+_EXTERNAL_NODE_STATE = BulkTarget(
+    table="dynamic_external_node_state",
+    columns=(
+        "session_id",
+        "tick",
+        "node_id",
+        "kind",
+        "phi_year_inflow",
+        "bilateral_trade_value",
+        "bilateral_trade_tons",
+        "erdi_ratio",
+    ),
+    on_conflict="ON CONFLICT (session_id, tick, node_id) DO NOTHING",
 )
-ON CONFLICT (session_id, tick, node_id) DO NOTHING
-"""
 
-_BOUNDARY_INSERT = """
-INSERT INTO boundary_flow_register (
-    session_id, tick,
-    source_node_id, source_kind,
-    dest_node_id, dest_kind,
-    flow_type, magnitude
-) VALUES (
-    %(session_id)s, %(tick)s,
-    %(source_node_id)s, %(source_kind)s,
-    %(dest_node_id)s, %(dest_kind)s,
-    %(flow_type)s, %(magnitude)s
+_BOUNDARY_REGISTER = BulkTarget(
+    table="boundary_flow_register",
+    columns=(
+        "session_id",
+        "tick",
+        "source_node_id",
+        "source_kind",
+        "dest_node_id",
+        "dest_kind",
+        "flow_type",
+        "magnitude",
+    ),
+    on_conflict=(
+        "ON CONFLICT (session_id, tick, source_node_id, dest_node_id, flow_type) DO NOTHING"
+    ),
 )
-ON CONFLICT (session_id, tick, source_node_id, dest_node_id, flow_type)
-DO NOTHING
-"""
 
-_AUDIT_INSERT = """
-INSERT INTO conservation_audit_log (
-    session_id, tick, scale, invariant_name,
-    computed_value, expected_value, residual, severity,
-    determinism_hash, created_at_utc
-) VALUES (
-    %(session_id)s, %(tick)s, %(scale)s, %(invariant_name)s,
-    %(computed_value)s, %(expected_value)s, %(residual)s, %(severity)s,
-    %(determinism_hash)s, %(created_at_utc)s
+_AUDIT_LOG = BulkTarget(
+    table="conservation_audit_log",
+    columns=(
+        "session_id",
+        "tick",
+        "scale",
+        "invariant_name",
+        "computed_value",
+        "expected_value",
+        "residual",
+        "severity",
+        "determinism_hash",
+        "created_at_utc",
+    ),
+    on_conflict="ON CONFLICT (session_id, tick, scale, invariant_name) DO NOTHING",
 )
-ON CONFLICT (session_id, tick, scale, invariant_name) DO NOTHING
-"""
 
 
 # Spec-065: per-tick county-resolution subsystem state inserts.
-_CONSCIOUSNESS_INSERT = """
-INSERT INTO dynamic_consciousness_state (
-    session_id, tick, county_fips,
-    p_acquiescence, p_revolution,
-    ideology_r, ideology_l, ideology_f
-) VALUES (
-    %(session_id)s, %(tick)s, %(county_fips)s,
-    %(p_acquiescence)s, %(p_revolution)s,
-    %(ideology_r)s, %(ideology_l)s, %(ideology_f)s
+_CONSCIOUSNESS_STATE = BulkTarget(
+    table="dynamic_consciousness_state",
+    columns=(
+        "session_id",
+        "tick",
+        "county_fips",
+        "p_acquiescence",
+        "p_revolution",
+        "ideology_r",
+        "ideology_l",
+        "ideology_f",
+    ),
+    on_conflict="ON CONFLICT (session_id, tick, county_fips) DO NOTHING",
 )
-ON CONFLICT (session_id, tick, county_fips) DO NOTHING
-"""
 
-_DEMOGRAPHICS_INSERT = """
-INSERT INTO dynamic_demographics_state (
-    session_id, tick, county_fips, population
-) VALUES (
-    %(session_id)s, %(tick)s, %(county_fips)s, %(population)s
+_DEMOGRAPHICS_STATE = BulkTarget(
+    table="dynamic_demographics_state",
+    columns=("session_id", "tick", "county_fips", "population"),
+    on_conflict="ON CONFLICT (session_id, tick, county_fips) DO NOTHING",
 )
-ON CONFLICT (session_id, tick, county_fips) DO NOTHING
-"""
 
-_EMPLOYMENT_INSERT = """
-INSERT INTO dynamic_employment_state (
-    session_id, tick, county_fips, employment_proxy
-) VALUES (
-    %(session_id)s, %(tick)s, %(county_fips)s, %(employment_proxy)s
+_EMPLOYMENT_STATE = BulkTarget(
+    table="dynamic_employment_state",
+    columns=("session_id", "tick", "county_fips", "employment_proxy"),
+    on_conflict="ON CONFLICT (session_id, tick, county_fips) DO NOTHING",
 )
-ON CONFLICT (session_id, tick, county_fips) DO NOTHING
-"""
 
 # Spec-065 T080: per-tick dyadic relationship state (migration 0024).
 # Empty in spec-065 first cut (WorldState.relationships unused); fills
 # naturally when spec-066 wires ContradictionSystem + SolidaritySystem
 # through the bridged engine.
-_RELATIONSHIP_INSERT = """
-INSERT INTO dynamic_relationship_state (
-    session_id, tick,
-    source_node_id, target_node_id, edge_type,
-    tension, solidarity
-) VALUES (
-    %(session_id)s, %(tick)s,
-    %(source_node_id)s, %(target_node_id)s, %(edge_type)s,
-    %(tension)s, %(solidarity)s
+_RELATIONSHIP_STATE = BulkTarget(
+    table="dynamic_relationship_state",
+    columns=(
+        "session_id",
+        "tick",
+        "source_node_id",
+        "target_node_id",
+        "edge_type",
+        "tension",
+        "solidarity",
+    ),
+    on_conflict=(
+        "ON CONFLICT (session_id, tick, source_node_id, target_node_id, edge_type) DO NOTHING"
+    ),
 )
-ON CONFLICT (session_id, tick, source_node_id, target_node_id, edge_type)
-DO NOTHING
-"""
 
 # Spec-089 S1a: per-tick commit marker + queryable III.7 hash chain.
 # Written inside the envelope transaction so "marker present" ≡ "tick
@@ -295,49 +311,28 @@ def persist_tick_atomic(
             writes the real marker. Skipped gracefully on pre-0029
             databases.
     """
-    with self._pool.connection() as conn, conn.transaction():
-        if envelope.hex_state_rows:
-            conn.cursor().executemany(
-                _HEX_INSERT,
-                [_hex_row_dict(r) for r in envelope.hex_state_rows],
-            )
-        if envelope.external_node_rows:
-            conn.cursor().executemany(
-                _EXTERNAL_INSERT,
-                [_external_row_dict(r) for r in envelope.external_node_rows],
-            )
-        if envelope.boundary_register_rows:
-            conn.cursor().executemany(
-                _BOUNDARY_INSERT,
-                [_boundary_row_dict(r) for r in envelope.boundary_register_rows],
-            )
-        if envelope.audit_log_rows:
-            conn.cursor().executemany(
-                _AUDIT_INSERT,
-                [_audit_row_dict(r) for r in envelope.audit_log_rows],
-            )
+    # Fixed order; each family goes through COPY once it is large enough.
+    batches: tuple[tuple[BulkTarget, Callable[[Any], dict[str, Any]], Sequence[Any]], ...] = (
+        (_HEX_STATE, _hex_row_dict, envelope.hex_state_rows),
+        (_EXTERNAL_NODE_STATE, _external_row_dict, envelope.external_node_rows),
+        (_BOUNDARY_REGISTER, _boundary_row_dict, envelope.boundary_register_rows),
+        (_AUDIT_LOG, _audit_row_dict, envelope.audit_log_rows),
         # Spec-065: per-tick county-resolution subsystem state rows.
-        if envelope.consciousness_state_rows:
-            conn.cursor().executemany(
-                _CONSCIOUSNESS_INSERT,
-                [_consciousness_row_dict(r) for r in envelope.consciousness_state_rows],
-            )
-        if envelope.demographics_state_rows:
-            conn.cursor().executemany(
-                _DEMOGRAPHICS_INSERT,
-                [_demographics_row_dict(r) for r in envelope.demographics_state_rows],
-            )
-        if envelope.employment_state_rows:
-            conn.cursor().executemany(
-                _EMPLOYMENT_INSERT,
-                [_employment_row_dict(r) for r in envelope.employment_state_rows],
-            )
+        (_CONSCIOUSNESS_STATE, _consciousness_row_dict, envelope.consciousness_state_rows),
+        (_DEMOGRAPHICS_STATE, _demographics_row_dict, envelope.demographics_state_rows),
+        (_EMPLOYMENT_STATE, _employment_row_dict, envelope.employment_state_rows),
         # Spec-065 T080: per-tick dyadic relationship state.
-        if envelope.relationship_state_rows:
-            conn.cursor().executemany(
-                _RELATIONSHIP_INSERT,
-                [_relationship_row_dict(r) for r in envelope.relationship_state_rows],
-            )
+        (_RELATIONSHIP_STATE, _relationship_row_dict, envelope.relationship_state_rows),
+    )
+    with self._pool.connection() as conn, conn.transaction():
+        for target, to_params, envelope_rows in batches:
+            if envelope_rows:
+                insert_rows(
+                    conn.cursor(),
+                    target,
+                    [target.row(to_params(r)) for r in envelope_rows],
+                    use_copy=self._bulk_copy,
+                )
         # Spec-089 S1a: the commit marker rides the same transaction.
         if write_commit_marker:
             has_table = conn.execute("SELECT to_regclass('tick_commit')").fetchone()
@@ -3,8 +3,8 @@
 Defines tables across 10 layers:
 
 1. Game Management (3): game_session, game_turn, action_result
-2. Simulation State (10): node_state, edge_state, graph_metadata,
-   community_state, community_membership, contradiction_field,
+2. Simulation State (11): node_state, edge_state, graph_metadata,
+   graph_commit, community_state, community_membership, contradiction_field,
    edge_curvature, simulation_event, tick_log, tick_summary
 3. Spatial (3): hex_cell, hex_state, hex_terrain_state
 3b. R8 Reference (2): hex_r8_reference, hex_r8_linear_features_reference
@@ -243,6 +243,10 @@ CREATE TABLE IF NOT EXISTS node_state (
     cohesion        FLOAT,
     legal_standing  VARCHAR(16),
     is_institution  BOOLEAN,
+    -- Delta snapshots (PostgresRuntime(delta_snapshots=True)): on a
+    -- non-checkpoint tick ``attributes`` holds only the changed keys.
+    removed_keys    TEXT[],
+    is_removed      BOOLEAN NOT NULL DEFAULT FALSE,
     PRIMARY KEY (session_id, tick, node_id)
 )
 """
@@ -260,6 +264,8 @@ CREATE TABLE IF NOT EXISTS edge_state (
     tension         FLOAT,
     solidarity_strength FLOAT,
     weight          FLOAT,
+    removed_keys    TEXT[],
+    is_removed      BOOLEAN NOT NULL DEFAULT FALSE,
     PRIMARY KEY (session_id, tick, source_id, target_id, edge_type)
 )
 """
@@ -272,10 +278,39 @@ CREATE TABLE IF NOT EXISTS graph_metadata (
     state_finances  JSONB NOT NULL DEFAULT '{}'::jsonb,
     tick_dynamics   JSONB,
     extra           JSONB,
+    extra_removed_keys TEXT[],
     PRIMARY KEY (session_id, tick)
 )
 """
 
+# One row per tick persisted with PostgresRuntime(delta_snapshots=True),
+# written in the same transaction as its node/edge/metadata rows. A delta tick
+# may write no node_state rows at all, so this (not MAX(node_state.tick)) is
+# the commit marker; content_hash answers the monotonic-idempotent re-persist
+# check without re-reading the tick; is_checkpoint anchors as-of replay.
+GRAPH_COMMIT_DDL = """
+CREATE TABLE IF NOT EXISTS graph_commit (
+    session_id      UUID NOT NULL REFERENCES game_session(id) ON DELETE CASCADE,
+    tick            INTEGER NOT NULL CHECK (tick >= 0),
+    content_hash    CHAR(64) NOT NULL,
+    is_checkpoint   BOOLEAN NOT NULL,
+    created_at      TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (session_id, tick)
+)
+"""
+
+# Idempotent column heals for databases whose node_state / edge_state /
+# graph_metadata predate delta snapshots (same pattern as
+# HEX_CELL_MIGRATIONS_DDL; migrations/0040 carries them for migration-only
+# appliers).
+GRAPH_DELTA_MIGRATIONS_DDL: list[str] = [
+    "ALTER TABLE node_state ADD COLUMN IF NOT EXISTS removed_keys TEXT[]",
+    "ALTER TABLE node_state ADD COLUMN IF NOT EXISTS is_removed BOOLEAN NOT NULL DEFAULT FALSE",
+    "ALTER TABLE edge_state ADD COLUMN IF NOT EXISTS removed_keys TEXT[]",
+    "ALTER TABLE edge_state ADD COLUMN IF NOT EXISTS is_removed BOOLEAN NOT NULL DEFAULT FALSE",
+    "ALTER TABLE graph_metadata ADD COLUMN IF NOT EXISTS extra_removed_keys TEXT[]",
+]
+
 COMMUNITY_STATE_DDL = """
 CREATE TABLE IF NOT EXISTS community_state (
     session_id      UUID NOT NULL REFERENCES game_session(id) ON DELETE CASCADE,
@@ -1274,6 +1309,8 @@ POSTGRES_SCHEMA_DDL: list[str] = [
     NODE_STATE_DDL,
     EDGE_STATE_DDL,
     GRAPH_METADATA_DDL,
+    *GRAPH_DELTA_MIGRATIONS_DDL,
+    GRAPH_COMMIT_DDL,
     COMMUNITY_STATE_DDL,
     COMMUNITY_MEMBERSHIP_DDL,
     CONTRADICTION_FIELD_DDL,
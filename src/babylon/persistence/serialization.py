@@ -17,8 +17,10 @@ from datetime import date, datetime
 from typing import Any
 from uuid import UUID
 
+from babylon.models.event_log import EventLog
 
-def json_default(obj: object) -> str:
+
+def json_default(obj: object) -> str | list[str]:
     """Fallback serializer for ``json.dumps`` — handles datetime/date/UUID.
 
     Args:
@@ -26,7 +28,9 @@ def json_default(obj: object) -> str:
 
     Returns:
         ISO-8601 string for :class:`~datetime.datetime` /
-        :class:`~datetime.date`, ``str(obj)`` for :class:`~uuid.UUID`.
+        :class:`~datetime.date`, ``str(obj)`` for :class:`~uuid.UUID`, and
+        the plain line list for an :class:`~babylon.models.event_log.EventLog`
+        (the append-only view ``to_graph`` stores as ``event_log``).
 
     Raises:
         TypeError: For any other non-serializable type.
@@ -37,6 +41,8 @@ def json_default(obj: object) -> str:
         return obj.isoformat()
     if isinstance(obj, UUID):
         return str(obj)
+    if isinstance(obj, EventLog):
+        return list(obj)
     raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
@@ -21,6 +21,9 @@ from babylon.models.entities.consciousness import TernaryConsciousness
 from babylon.models.types import Probability
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from babylon.models.entities.social_class import SocialClass
     from babylon.models.world_state import WorldState
 
 __all__ = [
@@ -106,6 +109,8 @@ def _ideology_to_ternary(
 def aggregate_survival_for_county(
     world: WorldState,
     county_fips: str,
+    *,
+    entities: Iterable[SocialClass] | None = None,
 ) -> tuple[float, float, int]:
     """Population-weighted means of ``(p_acquiescence, p_revolution)``.
 
@@ -119,6 +124,10 @@ def aggregate_survival_for_county(
     Args:
         world:        Current in-memory WorldState.
         county_fips:  5-digit US county FIPS (e.g., ``"26163"`` for Wayne).
+        entities:     Candidate entities to scan instead of
+                      ``world.entities.values()`` — e.g. a
+                      :class:`~babylon.projection.index.ProjectionIndex`
+                      county bucket. Still filtered by ``county_fips``.
 
     Returns:
         ``(mean_p_acquiescence, mean_p_revolution, total_population)``.
@@ -133,7 +142,8 @@ def aggregate_survival_for_county(
     sum_p_acq_weighted = 0.0
     sum_p_rev_weighted = 0.0
 
-    for entity in world.entities.values():
+    candidates = world.entities.values() if entities is None else entities
+    for entity in candidates:
         if entity.county_fips != county_fips:
             continue
         pop = int(entity.population)
@@ -154,6 +164,8 @@ def aggregate_survival_for_county(
 def aggregate_consciousness_for_county(
     world: WorldState,
     county_fips: str,
+    *,
+    entities: Iterable[SocialClass] | None = None,
 ) -> TernaryConsciousness:
     """Population-weighted ``(r, l, f)`` over entities in a county.
 
@@ -171,6 +183,9 @@ def aggregate_consciousness_for_county(
     Args:
         world:        Current in-memory WorldState.
         county_fips:  5-digit US county FIPS.
+        entities:     Candidate entities to scan instead of
+                      ``world.entities.values()``; see
+                      :func:`aggregate_survival_for_county`.
 
     Returns:
         :class:`TernaryConsciousness` with simplex invariant
@@ -186,7 +201,8 @@ def aggregate_consciousness_for_county(
     sum_l_weighted = 0.0
     sum_f_weighted = 0.0
 
-    for entity in world.entities.values():
+    candidates = world.entities.values() if entities is None else entities
+    for entity in candidates:
         if entity.county_fips != county_fips:
             continue
         pop = int(entity.population)
@@ -62,11 +62,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from babylon.models.enums.topology import EdgeType, NodeType
 from babylon.projection.aggregation import (
     aggregate_consciousness_for_county,
     aggregate_survival_for_county,
 )
+from babylon.projection.index import ProjectionIndex
 from babylon.projection.view_models import (
     ClassComposition,
     ConsciousnessSimplex,
@@ -75,61 +75,18 @@ from babylon.projection.view_models import (
 
 if TYPE_CHECKING:
     from babylon.kernel.graph_protocol import GraphProtocol
-    from babylon.models.graph import GraphNode
     from babylon.models.world_state import WorldState
 
 __all__ = ["project_county"]
 
 
-def _resolve_territory(graph: GraphProtocol, county_fips: str) -> GraphNode | None:
-    """Find the territory node carrying ``county_fips``, deterministically.
-
-    :param graph: The post-tick graph.
-    :param county_fips: Five-digit county FIPS code.
-    :returns: The matching territory node, or ``None`` when no territory
-        carries the code. When several match (a county spanning bridge-minted
-        territories), the lexicographically-first node id wins — a documented
-        deterministic tie-break, revisited when multi-territory counties
-        become real.
-    """
-    matches = [
-        node
-        for node in graph.query_nodes(node_type=NodeType.TERRITORY)
-        if node.attributes.get("county_fips") == county_fips
-    ]
-    if not matches:
-        return None
-    return min(matches, key=lambda node: node.id)
-
-
-def _single_claimant(graph: GraphProtocol, territory_id: str) -> str | None:
-    """The sovereign claiming a territory, or ``None`` if unclaimed/contested.
-
-    :param graph: The post-tick graph.
-    :param territory_id: The territory node id.
-    :returns: The claiming sovereign's node id when exactly one CLAIMS edge
-        targets the territory; ``None`` for zero claims (unclaimed) or more
-        than one (contested — a contested county has no *single* sovereign,
-        and projecting one silently would erase the contest).
-    """
-    claimants = sorted(
-        {
-            edge.source_id
-            for edge in graph.query_edges(edge_type=EdgeType.CLAIMS)
-            if edge.target_id == territory_id
-        }
-    )
-    if len(claimants) == 1:
-        return claimants[0]
-    return None
-
-
 def project_county(
     county_fips: str,
     *,
     graph: GraphProtocol,
     world: WorldState,
     tick: int,
+    index: ProjectionIndex | None = None,
 ) -> CountyView:
     """Project one county's post-tick state into a :class:`CountyView`.
 
@@ -141,22 +98,29 @@ def project_county(
     :param world: The committed post-tick world state (entity collection).
     :param tick: The committed tick this dossier is projected from — becomes
         the dossier's ``verified_tick`` staleness anchor.
+    :param index: This tick's :class:`~babylon.projection.index.ProjectionIndex`
+        when the caller projects many counties from the same ``(graph,
+        world)``; built on the spot when omitted. Territory resolution
+        (lexicographically-first node id among territories sharing a FIPS)
+        and claimant resolution go through it.
     :returns: The frozen, validated county dossier. Every unattributed or
         withheld quantity is ``None``.
     :raises pydantic.ValidationError: when a present source value violates
         its constrained type, or a present ``tick_class_distribution`` is
         malformed — a wrong value fails loud, only a *missing* one is absence.
     """
-    territory = _resolve_territory(graph, county_fips)
+    if index is None:
+        index = ProjectionIndex.build(graph, world)
+    territory = index.territory(county_fips)
     attrs: dict[str, Any] = dict(territory.attributes) if territory else {}
 
-    attributed = any(
-        entity.county_fips == county_fips and int(entity.population) > 0
-        for entity in world.entities.values()
-    )
+    entities = index.entities_in(county_fips)
+    attributed = any(int(entity.population) > 0 for entity in entities)
     if attributed:
-        p_acq, p_rev, population = aggregate_survival_for_county(world, county_fips)
-        ternary = aggregate_consciousness_for_county(world, county_fips)
+        p_acq, p_rev, population = aggregate_survival_for_county(
+            world, county_fips, entities=entities
+        )
+        ternary = aggregate_consciousness_for_county(world, county_fips, entities=entities)
         consciousness: ConsciousnessSimplex | None = ConsciousnessSimplex(
             revolutionary=ternary.r,
             liberal=ternary.l,
@@ -187,5 +151,5 @@ def project_county(
         p_revolution=survival[1],
         bifurcation_score=attrs.get("tick_bifurcation_score"),
         habitability=attrs.get("habitability"),
-        sovereign_id=_single_claimant(graph, territory.id) if territory else None,
+        sovereign_id=index.single_claimant(territory.id) if territory else None,
     )
@@ -0,0 +1,185 @@
+"""Per-tick lookup index shared by every ``project_*`` read-model.
+
+Each projector resolves its subject against the same three relations: which
+territory carries a county FIPS, which sovereigns CLAIM a territory, and
+which entities are attributed to a county. Resolved per call, every one of
+those is a full scan — territory nodes, CLAIMS edges, ``world.entities`` —
+so a nationwide bake (every county, then every state, then the nation)
+costs ``O(counties × (territories + claims + entities))`` per tick.
+
+:class:`ProjectionIndex` makes each relation one pass. Build it once from the
+committed post-tick ``(graph, world)`` pair and hand it to every projector
+for that tick (``index=``); a projector called without one builds its own,
+so a single ad-hoc projection costs what it always did. The index holds
+references to the graph's nodes and the world's entities, never copies —
+it is valid only for the tick it was built from.
+
+Tie-breaks are the projectors' own, preserved verbatim:
+:meth:`ProjectionIndex.territory` (county, social class, the incremental
+baker) picks the lexicographically-smallest node id among territories
+sharing a FIPS, while :meth:`ProjectionIndex.territories_in_state` keeps
+graph query order with the last territory winning, exactly as
+:mod:`babylon.projection.state` always resolved it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from babylon.models.enums.topology import EdgeType, NodeType
+
+if TYPE_CHECKING:
+    from babylon.kernel.graph_protocol import GraphProtocol
+    from babylon.models.entities.social_class import SocialClass
+    from babylon.models.graph import GraphNode
+    from babylon.models.world_state import WorldState
+
+__all__ = ["ProjectionIndex"]
+
+
+class ProjectionIndex:
+    """Territory, claim, and attribution lookups for one committed tick.
+
+    :param territories_by_fips: county FIPS -> every territory node carrying
+        it, in graph query order.
+    :param claimants_by_target: CLAIMS target node id -> distinct claiming
+        source ids.
+    :param claims_by_source: CLAIMS source node id -> claimed target ids, in
+        edge query order.
+    :param territory_ids: every territory node id.
+    :param entities_by_fips: county FIPS -> the entities attributed to it,
+        in ``world.entities`` order.
+    """
+
+    __slots__ = (
+        "_claimants_by_target",
+        "_claims_by_source",
+        "_entities_by_fips",
+        "_territories_by_fips",
+        "_territory_ids",
+    )
+
+    def __init__(
+        self,
+        *,
+        territories_by_fips: dict[str, list[GraphNode]],
+        claimants_by_target: dict[str, set[str]],
+        claims_by_source: dict[str, list[str]],
+        territory_ids: frozenset[str],
+        entities_by_fips: dict[str, list[SocialClass]],
+    ) -> None:
+        self._territories_by_fips = territories_by_fips
+        self._claimants_by_target = claimants_by_target
+        self._claims_by_source = claims_by_source
+        self._territory_ids = territory_ids
+        self._entities_by_fips = entities_by_fips
+
+    @classmethod
+    def build(cls, graph: GraphProtocol, world: WorldState) -> ProjectionIndex:
+        """Index a committed post-tick ``(graph, world)`` pair in one pass each.
+
+        :param graph: The committed post-tick graph.
+        :param world: The committed post-tick world state.
+        :returns: The index for this tick.
+        """
+        territories_by_fips: dict[str, list[GraphNode]] = {}
+        territory_ids: set[str] = set()
+        for node in graph.query_nodes(node_type=NodeType.TERRITORY):
+            territory_ids.add(node.id)
+            county_fips = node.attributes.get("county_fips")
+            if county_fips is not None:
+                territories_by_fips.setdefault(county_fips, []).append(node)
+
+        claimants_by_target: dict[str, set[str]] = {}
+        claims_by_source: dict[str, list[str]] = {}
+        for edge in graph.query_edges(edge_type=EdgeType.CLAIMS):
+            claimants_by_target.setdefault(edge.target_id, set()).add(edge.source_id)
+            claims_by_source.setdefault(edge.source_id, []).append(edge.target_id)
+
+        entities_by_fips: dict[str, list[SocialClass]] = {}
+        for entity in world.entities.values():
+            if entity.county_fips is not None:
+                entities_by_fips.setdefault(entity.county_fips, []).append(entity)
+
+        return cls(
+            territories_by_fips=territories_by_fips,
+            claimants_by_target=claimants_by_target,
+            claims_by_source=claims_by_source,
+            territory_ids=frozenset(territory_ids),
+            entities_by_fips=entities_by_fips,
+        )
+
+    def territory(self, county_fips: str) -> GraphNode | None:
+        """The territory node carrying ``county_fips``, deterministically.
+
+        :param county_fips: Five-digit county FIPS code.
+        :returns: The matching territory node, or ``None`` when no territory
+            carries the code. When several match (a county spanning
+            bridge-minted territories), the lexicographically-first node id
+            wins.
+        """
+        matches = self._territories_by_fips.get(county_fips)
+        if not matches:
+            return None
+        return min(matches, key=lambda node: node.id)
+
+    def territory_fips_codes(self) -> tuple[str, ...]:
+        """Every county FIPS some territory carries, sorted."""
+        return tuple(sorted(self._territories_by_fips))
+
+    def territories_in_state(self, state_fips: str) -> dict[str, GraphNode]:
+        """Every territory under ``state_fips``, keyed by its own county FIPS.
+
+        :param state_fips: The two-digit state FIPS to match.
+        :returns: county FIPS -> territory node; where several territories
+            share a FIPS the last in graph query order wins.
+        """
+        return {
+            county_fips: nodes[-1]
+            for county_fips, nodes in self._territories_by_fips.items()
+            if county_fips[:2] == state_fips
+        }
+
+    def single_claimant(self, territory_id: str) -> str | None:
+        """The sovereign claiming a territory, or ``None`` if unclaimed/contested.
+
+        :param territory_id: The territory node id.
+        :returns: The claiming sovereign's node id when exactly one distinct
+            source CLAIMS the territory; ``None`` for zero claims (unclaimed)
+            or more than one (contested — a contested county has no *single*
+            sovereign, and projecting one silently would erase the contest).
+        """
+        claimants = self._claimants_by_target.get(territory_id)
+        if claimants is None or len(claimants) != 1:
+            return None
+        (only,) = claimants
+        return only
+
+    def territory_claimants(self) -> tuple[str, ...]:
+        """Every distinct source CLAIMing at least one territory node, sorted."""
+        claimants: set[str] = set()
+        for target_id, sources in self._claimants_by_target.items():
+            if target_id in self._territory_ids:
+                claimants |= sources
+        return tuple(sorted(claimants))
+
+    def claimed_by(self, source_id: str) -> tuple[str, ...]:
+        """Every node id ``source_id`` CLAIMS, in edge query order.
+
+        :param source_id: The claiming node's id (a sovereign).
+        :returns: The claimed target ids — empty when it claims nothing.
+        """
+        return tuple(self._claims_by_source.get(source_id, ()))
+
+    def entities_in(self, county_fips: str) -> tuple[SocialClass, ...]:
+        """Every entity attributed to ``county_fips``, in ``world.entities`` order.
+
+        :param county_fips: Five-digit county FIPS code.
+        :returns: The attributed entities, regardless of population — callers
+            apply their own ``population > 0`` rule.
+        """
+        return tuple(self._entities_by_fips.get(county_fips, ()))
+
+    def entity_fips_codes(self) -> tuple[str, ...]:
+        """Every county FIPS at least one entity is attributed to, sorted."""
+        return tuple(sorted(self._entities_by_fips))
@@ -78,11 +78,12 @@ from __future__ import annotations
 from collections.abc import Callable, Mapping, Sequence
 from typing import TYPE_CHECKING, Final
 
-from babylon.models.enums.topology import EdgeType, NodeType
+from babylon.models.enums.topology import NodeType
 from babylon.projection.aggregation import (
     aggregate_consciousness_for_county,
     aggregate_survival_for_county,
 )
+from babylon.projection.index import ProjectionIndex
 from babylon.projection.view_models import (
     ClassComposition,
     ConsciousnessSimplex,
@@ -135,6 +136,7 @@ def _population_by_fips(world: WorldState) -> dict[str, int]:
 
 def _national_survival(
     world: WorldState,
+    index: ProjectionIndex,
     population_by_fips: Mapping[str, int],
 ) -> tuple[float | None, float | None]:
     """Population-weighted P(S|A)/P(S|R), combined across every attributed county.
@@ -144,6 +146,7 @@ def _national_survival(
     per-entity weighting math.
 
     :param world: The post-tick world state.
+    :param index: This tick's projection index (per-county entity buckets).
     :param population_by_fips: The nationwide population-by-county mapping
         from :func:`_population_by_fips`.
     :returns: ``(mean_p_acquiescence, mean_p_revolution)``, or ``(None,
@@ -155,7 +158,9 @@ def _national_survival(
     sum_acquiescence = 0.0
     sum_revolution = 0.0
     for fips, population in population_by_fips.items():
-        p_acquiescence, p_revolution, _ = aggregate_survival_for_county(world, fips)
+        p_acquiescence, p_revolution, _ = aggregate_survival_for_county(
+            world, fips, entities=index.entities_in(fips)
+        )
         sum_acquiescence += p_acquiescence * population
         sum_revolution += p_revolution * population
     return (sum_acquiescence / total_population, sum_revolution / total_population)
@@ -163,6 +168,7 @@ def _national_survival(
 
 def _national_consciousness(
     world: WorldState,
+    index: ProjectionIndex,
     population_by_fips: Mapping[str, int],
 ) -> ConsciousnessSimplex | None:
     """Population-weighted consciousness simplex, combined across every attributed county.
@@ -172,6 +178,7 @@ def _national_consciousness(
     the ideology-to-ternary bridge mapping.
 
     :param world: The post-tick world state.
+    :param index: This tick's projection index (per-county entity buckets).
     :param population_by_fips: The nationwide population-by-county mapping
         from :func:`_population_by_fips`.
     :returns: The nationwide ternary simplex, or ``None`` if no county
@@ -184,7 +191,7 @@ def _national_consciousness(
     sum_l = 0.0
     sum_f = 0.0
     for fips, population in population_by_fips.items():
-        ternary = aggregate_consciousness_for_county(world, fips)
+        ternary = aggregate_consciousness_for_county(world, fips, entities=index.entities_in(fips))
         sum_r += ternary.r * population
         sum_l += ternary.l * population
         sum_f += ternary.f * population
@@ -279,24 +286,17 @@ def _territory_rollup(
     )
 
 
-def _national_sovereign(graph: GraphProtocol) -> str | None:
+def _national_sovereign(index: ProjectionIndex) -> str | None:
     """The single sovereign claiming every territory nationwide, or ``None``.
 
-    :param graph: The post-tick graph.
+    :param index: This tick's projection index.
     :returns: The claiming sovereign's node id when every CLAIMS edge
         targeting a territory node comes from the same sovereign; ``None``
         for zero claims nationwide (unclaimed) or claims from more than one
         distinct sovereign (a balkanized/contested nation has no single
         ruler, and projecting one silently would erase the fragmentation).
     """
-    territory_ids = {node.id for node in graph.query_nodes(node_type=NodeType.TERRITORY)}
-    claimants = sorted(
-        {
-            edge.source_id
-            for edge in graph.query_edges(edge_type=EdgeType.CLAIMS)
-            if edge.target_id in territory_ids
-        }
-    )
+    claimants = index.territory_claimants()
     if len(claimants) == 1:
         return claimants[0]
     return None
@@ -309,6 +309,7 @@ def project_national(
     world: WorldState,
     tick: int,
     national_aggregate: NationalValueAggregate | None = None,
+    index: ProjectionIndex | None = None,
 ) -> NationalView:
     """Project the whole nation's post-tick state into a :class:`NationalView`.
 
@@ -325,6 +326,9 @@ def project_national(
         injection, not runtime discovery). ``None`` when the caller has no
         Postgres session (e.g. a fixture-fed harvest run); every
         value-composition field then projects as honest absence.
+    :param index: This tick's :class:`~babylon.projection.index.ProjectionIndex`
+        when the caller also projects counties/states from the same
+        ``(graph, world)``; built on the spot when omitted.
     :returns: The frozen, validated national dossier.
     :raises ValueError: if ``national_aggregate`` is given but its
         ``national_id`` or ``tick`` does not match the arguments — a
@@ -348,13 +352,15 @@ def project_national(
             )
             raise ValueError(msg)
 
+    if index is None:
+        index = ProjectionIndex.build(graph, world)
     population_by_fips = _population_by_fips(world)
     total_population = sum(population_by_fips.values())
     class_composition, median_wage, legitimacy, bifurcation_score = _territory_rollup(
         graph, population_by_fips
     )
-    consciousness = _national_consciousness(world, population_by_fips)
-    p_acquiescence, p_revolution = _national_survival(world, population_by_fips)
+    consciousness = _national_consciousness(world, index, population_by_fips)
+    p_acquiescence, p_revolution = _national_survival(world, index, population_by_fips)
 
     return NationalView(
         national_id=national_id,
@@ -368,7 +374,7 @@ def project_national(
         p_acquiescence=p_acquiescence,
         p_revolution=p_revolution,
         bifurcation_score=bifurcation_score,
-        sovereign_id=_national_sovereign(graph),
+        sovereign_id=_national_sovereign(index),
         c_sum=national_aggregate.c_sum if national_aggregate is not None else None,
         v_sum=national_aggregate.v_sum if national_aggregate is not None else None,
         s_sum=national_aggregate.s_sum if national_aggregate is not None else None,
@@ -71,6 +71,7 @@ from typing import TYPE_CHECKING, Any
 
 from babylon.models.enums.topology import NodeType
 from babylon.projection.aggregation import _ideology_to_ternary
+from babylon.projection.index import ProjectionIndex
 from babylon.projection.view_models import (
     ClassComposition,
     ConsciousnessSimplex,
@@ -100,25 +101,22 @@ def _resolve_class_node(graph: GraphProtocol, class_id: str) -> GraphNode | None
     return node
 
 
-def _resolve_county_composition(graph: GraphProtocol, county_fips: str) -> ClassComposition | None:
+def _resolve_county_composition(
+    index: ProjectionIndex, county_fips: str
+) -> ClassComposition | None:
     """The containing county's class-share breakdown, for nesting context.
 
-    :param graph: The post-tick graph.
+    :param index: This tick's projection index.
     :param county_fips: Five-digit county FIPS code to resolve a territory for.
     :returns: The territory's :class:`ClassComposition`, or ``None`` when no
         territory carries ``county_fips`` or it has no
         ``tick_class_distribution`` attribute yet. Several territories
-        sharing a FIPS (a documented deterministic tie-break, mirroring
-        ``county.py``) resolve to the lexicographically-first node id.
+        sharing a FIPS resolve exactly as ``project_county`` does
+        (:meth:`~babylon.projection.index.ProjectionIndex.territory`).
     """
-    matches = [
-        node
-        for node in graph.query_nodes(node_type=NodeType.TERRITORY)
-        if node.attributes.get("county_fips") == county_fips
-    ]
-    if not matches:
+    territory = index.territory(county_fips)
+    if territory is None:
         return None
-    territory = min(matches, key=lambda node: node.id)
     distribution = territory.attributes.get("tick_class_distribution")
     if not distribution:
         return None
@@ -131,6 +129,7 @@ def project_social_class(
     graph: GraphProtocol,
     world: WorldState,
     tick: int,
+    index: ProjectionIndex | None = None,
 ) -> SocialClassView:
     """Project one social class's post-tick state into a :class:`SocialClassView`.
 
@@ -147,6 +146,10 @@ def project_social_class(
         gap can never silently mask an absent field with a defaulted one.
     :param tick: The committed tick this dossier is projected from — becomes
         the dossier's ``verified_tick`` staleness anchor.
+    :param index: This tick's :class:`~babylon.projection.index.ProjectionIndex`
+        when the caller projects many classes from the same ``(graph,
+        world)``; built on the spot (only if the class has a county) when
+        omitted.
     :returns: The frozen, validated social-class dossier. Every unattributed
         or absent quantity is ``None``.
     :raises pydantic.ValidationError: when a present source value violates
@@ -169,9 +172,11 @@ def project_social_class(
         consciousness = None
 
     county_fips = attrs.get("county_fips")
-    county_class_composition = (
-        _resolve_county_composition(graph, county_fips) if county_fips else None
-    )
+    county_class_composition: ClassComposition | None = None
+    if county_fips:
+        if index is None:
+            index = ProjectionIndex.build(graph, world)
+        county_class_composition = _resolve_county_composition(index, county_fips)
 
     return SocialClassView(
         class_id=class_id,
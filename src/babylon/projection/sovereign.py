@@ -2,8 +2,8 @@
 
 Assembles a :class:`~babylon.projection.view_models.SovereignView` dossier
 from the post-tick graph's ``sovereign`` node (spec-070). Sovereign is the
-CLAIMS-edge claimant :func:`babylon.projection.county._single_claimant`
-already resolves for a county's ``sovereign_id`` field; this module is what
+CLAIMS-edge claimant :meth:`babylon.projection.index.ProjectionIndex.
+single_claimant` already resolves for a county's ``sovereign_id`` field; this module is what
 makes a county page's ``[[sovereign/<id>]]`` wikilink resolve to a real page,
 plus the reverse direction — every county a sovereign claims, listed as
 ``[[county/<fips>]]`` backlinks.
@@ -34,7 +34,7 @@ world it already holds.
    * - ``claimed_county_fips``
      - Derived: the ``county_fips`` of every territory reached by an
        outgoing CLAIMS edge from this sovereign — the *reverse* of
-       ``project_county._single_claimant``, which walks CLAIMS edges from a
+       ``ProjectionIndex.single_claimant``, which walks CLAIMS edges into a
        territory to find its (single) claimant.
 
 Absence discipline (Constitution III.11): a sovereign id with no matching
@@ -68,7 +68,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
-from babylon.models.enums.topology import EdgeType, NodeType
+from babylon.models.enums.topology import NodeType
+from babylon.projection.index import ProjectionIndex
 from babylon.projection.vault.render import sovereign_statblock_rows
 from babylon.projection.view_models import SovereignView
 
@@ -83,7 +84,7 @@ __all__ = ["project_sovereign", "sovereign_statblocks"]
 def _resolve_sovereign(graph: GraphProtocol, sovereign_id: str) -> GraphNode | None:
     """Look up the sovereign node by its stable id.
 
-    Unlike ``county.py``'s ``_resolve_territory`` (which matches on the
+    Unlike ``ProjectionIndex.territory`` (which matches on the
     ``county_fips`` *attribute* because "county" isn't a node id), a
     sovereign's node id already *is* its stable identity — a direct lookup.
 
@@ -121,16 +122,19 @@ def _county_fips_of(graph: GraphProtocol, territory_id: str | None) -> str | Non
     return county_fips if isinstance(county_fips, str) else None
 
 
-def _claimed_county_fips(graph: GraphProtocol, sovereign_id: str) -> tuple[str, ...]:
+def _claimed_county_fips(
+    graph: GraphProtocol, index: ProjectionIndex, sovereign_id: str
+) -> tuple[str, ...]:
     """The county FIPS of every territory this sovereign CLAIMS.
 
-    The reverse of ``project_county._single_claimant``: that function walks
-    CLAIMS edges *from* a territory to find its (single) claimant; this one
+    The reverse of ``ProjectionIndex.single_claimant``: that walks CLAIMS
+    edges *into* a territory to find its (single) claimant; this one
     walks CLAIMS edges *from* a sovereign to find every territory it claims,
     resolved to the stable ``county_fips`` identity a county page is
     addressed by, never the raw territory node id.
 
     :param graph: The post-tick graph.
+    :param index: This tick's projection index (CLAIMS edges by source).
     :param sovereign_id: The claiming sovereign's node id.
     :returns: Sorted, de-duplicated county FIPS codes claimed by this
         sovereign — empty when the sovereign claims nothing (a real,
@@ -138,10 +142,8 @@ def _claimed_county_fips(graph: GraphProtocol, sovereign_id: str) -> tuple[str,
         sovereign node itself does not exist).
     """
     claimed: set[str] = set()
-    for edge in graph.query_edges(edge_type=EdgeType.CLAIMS):
-        if edge.source_id != sovereign_id:
-            continue
-        county_fips = _county_fips_of(graph, edge.target_id)
+    for target_id in index.claimed_by(sovereign_id):
+        county_fips = _county_fips_of(graph, target_id)
         if county_fips is not None:
             claimed.add(county_fips)
     return tuple(sorted(claimed))
@@ -153,6 +155,7 @@ def project_sovereign(
     graph: GraphProtocol,
     world: WorldState,
     tick: int,
+    index: ProjectionIndex | None = None,
 ) -> SovereignView:
     """Project one sovereign's post-tick state into a :class:`SovereignView`.
 
@@ -162,24 +165,32 @@ def project_sovereign(
 
     :param sovereign_id: The sovereign's node id (e.g. ``"SOV_USA_FED"``).
     :param graph: The committed post-tick graph.
-    :param world: Unused — every ``SovereignView`` field is graph-node
-        sourced (spec-070's ``Sovereign`` carries no world-entity
-        aggregation the way county population/survival/consciousness do).
-        Accepted anyway for signature parity with the Lane P
-        ``project_<kind>(id, *, graph, world, tick)`` recipe every sibling
-        projector (``project_county`` et al.) shares.
+    :param world: Only used to build a missing ``index`` — every
+        ``SovereignView`` field is graph-node sourced (spec-070's
+        ``Sovereign`` carries no world-entity aggregation the way county
+        population/survival/consciousness do). Accepted for signature parity
+        with the Lane P ``project_<kind>(id, *, graph, world, tick)`` recipe
+        every sibling projector (``project_county`` et al.) shares.
     :param tick: The committed tick this dossier is projected from —
         becomes the dossier's ``verified_tick`` staleness anchor.
+    :param index: This tick's :class:`~babylon.projection.index.ProjectionIndex`
+        when the caller projects many sovereigns from the same ``(graph,
+        world)``; built on the spot (only for an existing sovereign) when
+        omitted.
     :returns: The frozen, validated sovereign dossier. Every unattributed
         or nonexistent quantity is ``None``.
     :raises pydantic.ValidationError: when a present source value violates
         its constrained type — a wrong value fails loud, only a *missing*
         one is absence.
     """
-    del world  # unused: see docstring above.
     node = _resolve_sovereign(graph, sovereign_id)
     attrs: dict[str, Any] = dict(node.attributes) if node else {}
     capital_territory_id = attrs.get("capital_territory_id")
+    claimed_county_fips: tuple[str, ...] | None = None
+    if node:
+        if index is None:
+            index = ProjectionIndex.build(graph, world)
+        claimed_county_fips = _claimed_county_fips(graph, index, sovereign_id)
 
     return SovereignView(
         sovereign_id=sovereign_id,
@@ -193,7 +204,7 @@ def project_sovereign(
         capital_county_fips=_county_fips_of(graph, capital_territory_id),
         founded_tick=attrs.get("founded_tick"),
         dissolved_tick=attrs.get("dissolved_tick"),
-        claimed_county_fips=_claimed_county_fips(graph, sovereign_id) if node else None,
+        claimed_county_fips=claimed_county_fips,
     )
 
 
@@ -221,7 +232,7 @@ def sovereign_statblocks(
     importing that type alias.
 
     :param graph: The live post-tick graph the caller already holds.
-    :param world: Unused; see :func:`project_sovereign`. Accepted for
+    :param world: Passed through to :func:`project_sovereign`. Accepted for
         signature parity with the other Lane P statblock-provider factories.
     :param tick: The tick this provider's projections are verified as of.
     :returns: A provider callable: for a ``"sovereign/<id>"`` subject whose
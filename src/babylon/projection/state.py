@@ -54,7 +54,7 @@ combination rule is projected and recorded here:
        the same attribute).
    * - ``sovereign_id``
      - The single sovereign iff *every* territory in the state resolves
-       (:func:`babylon.projection.county._single_claimant`, reused) to the
+       (:meth:`babylon.projection.index.ProjectionIndex.single_claimant`, shared) to the
        identical non-``None`` claimant; any disagreement, any
        unclaimed/contested territory, or a state with no territory at all
        projects ``None`` — the state-level generalization of county's own
@@ -68,14 +68,13 @@ projects that field as ``None`` too — never a defaulted zero.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Final, cast
+from typing import TYPE_CHECKING, Final
 
-from babylon.models.enums.topology import NodeType
 from babylon.projection.aggregation import (
     aggregate_consciousness_for_county,
     aggregate_survival_for_county,
 )
-from babylon.projection.county import _single_claimant
+from babylon.projection.index import ProjectionIndex
 from babylon.projection.view_models import (
     ClassComposition,
     ConsciousnessSimplex,
@@ -95,63 +94,31 @@ __all__ = ["project_state", "state_statblocks"]
 _DEMO_STATE_SUBJECT: Final[str] = "state/26"
 
 
-def _in_state(county_fips: str | None, state_fips: str) -> bool:
-    """Whether a county FIPS code's 2-digit state prefix matches ``state_fips``.
-
-    :param county_fips: a 5-digit county FIPS, or ``None`` (unattributed).
-    :param state_fips: the 2-digit state FIPS being projected.
-    :returns: ``True`` iff ``county_fips`` is present and its prefix matches.
-    """
-    return county_fips is not None and county_fips[:2] == state_fips
-
-
-def _territories_by_county_fips(graph: GraphProtocol, state_fips: str) -> dict[str, GraphNode]:
-    """Every territory node under ``state_fips``, keyed by its own county FIPS.
-
-    :param graph: the post-tick graph.
-    :param state_fips: the 2-digit state FIPS to match.
-    :returns: a mapping from county FIPS to the territory node claiming it,
-        for every territory whose ``county_fips`` falls under this state.
-    """
-    result: dict[str, GraphNode] = {}
-    for node in graph.query_nodes(node_type=NodeType.TERRITORY):
-        county_fips = node.attributes.get("county_fips")
-        if not _in_state(county_fips, state_fips):
-            continue
-        result[cast(str, county_fips)] = node
-    return result
-
-
-def _counties_in_state(graph: GraphProtocol, world: WorldState, state_fips: str) -> tuple[str, ...]:
+def _counties_in_state(index: ProjectionIndex, state_fips: str) -> tuple[str, ...]:
     """Every county FIPS attributable to ``state_fips``, deterministically ordered.
 
     Unions the territory-node source with the world-entity source, mirroring
     ``project_county``'s own honesty that entity-sourced fields survive a
     county with no territory node yet.
 
-    :param graph: the post-tick graph.
-    :param world: the post-tick world state.
+    :param index: this tick's projection index.
     :param state_fips: the 2-digit state FIPS to match.
     :returns: county FIPS codes, sorted for deterministic iteration.
     """
-    from_territories: set[str] = set(_territories_by_county_fips(graph, state_fips))
-    from_entities: set[str] = set()
-    for entity in world.entities.values():
-        county_fips = entity.county_fips
-        if not _in_state(county_fips, state_fips):
-            continue
-        from_entities.add(cast(str, county_fips))
-    return tuple(sorted(from_territories | from_entities))
+    codes = set(index.territory_fips_codes()) | set(index.entity_fips_codes())
+    return tuple(sorted(fips for fips in codes if fips[:2] == state_fips))
 
 
 def _rollup_survival_and_consciousness(
     world: WorldState,
+    index: ProjectionIndex,
     county_fips_codes: tuple[str, ...],
     survival_by_county: dict[str, tuple[float, float, int]],
 ) -> tuple[int | None, float | None, float | None, ConsciousnessSimplex | None]:
     """Population-weighted survival + consciousness across every county.
 
     :param world: the post-tick world state.
+    :param index: this tick's projection index.
     :param county_fips_codes: every county FIPS in the state.
     :param survival_by_county: each county's precomputed
         ``(p_acquiescence, p_revolution, population)`` triple.
@@ -169,7 +136,9 @@ def _rollup_survival_and_consciousness(
         total_population += pop
         p_acq_weighted += p_acq * pop
         p_rev_weighted += p_rev * pop
-        ternary = aggregate_consciousness_for_county(world, county_fips)
+        ternary = aggregate_consciousness_for_county(
+            world, county_fips, entities=index.entities_in(county_fips)
+        )
         r_weighted += ternary.r * pop
         l_weighted += ternary.l * pop
         f_weighted += ternary.f * pop
@@ -287,17 +256,17 @@ def _sum_territory_attribute(territories: dict[str, GraphNode], attribute: str)
     return sum(values) if values else None
 
 
-def _rollup_sovereign(graph: GraphProtocol, territories: dict[str, GraphNode]) -> str | None:
+def _rollup_sovereign(index: ProjectionIndex, territories: dict[str, GraphNode]) -> str | None:
     """The single sovereign iff every territory in the state agrees.
 
-    :param graph: the post-tick graph.
+    :param index: this tick's projection index.
     :param territories: county FIPS -> territory node, for this state.
     :returns: the shared claimant id, or ``None`` if the state has no
         territory, or its territories disagree, or any is unclaimed/contested.
     """
     if not territories:
         return None
-    claimants = {_single_claimant(graph, territory.id) for territory in territories.values()}
+    claimants = {index.single_claimant(territory.id) for territory in territories.values()}
     if len(claimants) == 1:
         (only,) = claimants
         return only
@@ -310,6 +279,7 @@ def project_state(
     graph: GraphProtocol,
     world: WorldState,
     tick: int,
+    index: ProjectionIndex | None = None,
 ) -> StateView:
     """Project every county under ``state_fips`` into one :class:`StateView`.
 
@@ -323,6 +293,9 @@ def project_state(
     :param world: The committed post-tick world state (entity collection).
     :param tick: The committed tick this dossier is projected from — becomes
         the dossier's ``verified_tick`` staleness anchor.
+    :param index: This tick's :class:`~babylon.projection.index.ProjectionIndex`
+        when the caller projects several states (or their counties) from the
+        same ``(graph, world)``; built on the spot when omitted.
     :returns: The frozen, validated state dossier. Every unattributed or
         withheld quantity is ``None``.
     :raises pydantic.ValidationError: when a present source value violates
@@ -330,15 +303,19 @@ def project_state(
         any territory in the state is malformed — a wrong value fails loud,
         only a *missing* one is absence.
     """
-    territories = _territories_by_county_fips(graph, state_fips)
-    county_fips_codes = _counties_in_state(graph, world, state_fips)
+    if index is None:
+        index = ProjectionIndex.build(graph, world)
+    territories = index.territories_in_state(state_fips)
+    county_fips_codes = _counties_in_state(index, state_fips)
     survival_by_county = {
-        county_fips: aggregate_survival_for_county(world, county_fips)
+        county_fips: aggregate_survival_for_county(
+            world, county_fips, entities=index.entities_in(county_fips)
+        )
         for county_fips in county_fips_codes
     }
 
     population, p_acquiescence, p_revolution, consciousness = _rollup_survival_and_consciousness(
-        world, county_fips_codes, survival_by_county
+        world, index, county_fips_codes, survival_by_county
     )
 
     return StateView(
@@ -361,7 +338,7 @@ def project_state(
         bifurcation_score=_pop_weighted_territory_mean(
             territories, county_fips_codes, survival_by_county, "tick_bifurcation_score"
         ),
-        sovereign_id=_rollup_sovereign(graph, territories),
+        sovereign_id=_rollup_sovereign(index, territories),
     )
 
 
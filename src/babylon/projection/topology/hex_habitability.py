@@ -77,13 +77,10 @@ class HexHabitabilityCell(BaseModel):
 def _territory_by_county_fips(graph: GraphProtocol, county_fips: str) -> GraphNode | None:
     """Resolve the territory node carrying ``county_fips``, deterministically.
 
-    Mirrors :func:`babylon.projection.county._resolve_territory`'s
+    Mirrors :meth:`babylon.projection.index.ProjectionIndex.territory`'s
     lexicographically-smallest tie-break for the (currently unseeded)
-    multi-territory-per-county case. A small module-local copy rather than
-    reaching into ``county.py``'s private helper, matching this codebase's
-    existing per-module resolver convention (:mod:`babylon.projection.
-    social_class` and :mod:`babylon.projection.state` each carry their own
-    equivalent instead of sharing one).
+    multi-territory-per-county case. A small module-local copy: this
+    resolver has a graph but no world, so it cannot build the index.
 
     :param graph: The live post-tick graph.
     :param county_fips: Five-digit county FIPS code.
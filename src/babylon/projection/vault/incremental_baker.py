@@ -85,6 +85,7 @@ from babylon.projection.community import project_community
 from babylon.projection.county import project_county
 from babylon.projection.economy import project_economy
 from babylon.projection.field_state import project_field_state
+from babylon.projection.index import ProjectionIndex
 from babylon.projection.industry import project_industry
 from babylon.projection.institution import project_institution
 from babylon.projection.national import project_national
@@ -186,15 +187,26 @@ class IncrementalArchiveTickBaker:
     def on_tick_committed(self, *, tick: int, world: Any, graph: Any) -> None:
         """Re-project and re-render only the entities dirty this tick.
 
+        The dirty-snapshot comparison and every re-projection share one
+        :class:`~babylon.projection.index.ProjectionIndex` built for the tick.
+
         :param tick: The committed tick number.
         :param world: The post-tick world state.
         :param graph: The post-tick engine graph.
         """
+        index = ProjectionIndex.build(graph, world)
         pages: dict[str, str] = {}
 
-        county_dirty_raw = self._bake_counties(tick=tick, world=world, graph=graph, pages=pages)
+        county_dirty_raw = self._bake_counties(
+            tick=tick, world=world, graph=graph, index=index, pages=pages
+        )
         self._bake_rollups(
-            tick=tick, world=world, graph=graph, pages=pages, county_dirty_raw=county_dirty_raw
+            tick=tick,
+            world=world,
+            graph=graph,
+            index=index,
+            pages=pages,
+            county_dirty_raw=county_dirty_raw,
         )
         self._bake_simple_kind(
             kind="organization",
@@ -219,7 +231,9 @@ class IncrementalArchiveTickBaker:
         self._bake_simple_kind(
             kind="sovereign",
             node_type=NodeType.SOVEREIGN,
-            project_fn=lambda sid: project_sovereign(sid, graph=graph, world=world, tick=tick),
+            project_fn=lambda sid: project_sovereign(
+                sid, graph=graph, world=world, tick=tick, index=index
+            ),
             render_fn=lambda view: render_sovereign(view, verified_tick=tick),
             path_fn=lambda sid: f"sovereign/{sid}.md",
             budget=self._budgets.sovereign,
@@ -240,7 +254,9 @@ class IncrementalArchiveTickBaker:
         self._bake_simple_kind(
             kind="social_class",
             node_type=NodeType.SOCIAL_CLASS,
-            project_fn=lambda cid: project_social_class(cid, graph=graph, world=world, tick=tick),
+            project_fn=lambda cid: project_social_class(
+                cid, graph=graph, world=world, tick=tick, index=index
+            ),
             render_fn=lambda view: render_social_class(view, verified_tick=tick),
             path_fn=lambda cid: f"social_class/{cid}.md",
             budget=self._budgets.social_class,
@@ -254,7 +270,13 @@ class IncrementalArchiveTickBaker:
         self._materializer.bake_tick(pages, tick=tick)
 
     def _bake_counties(
-        self, *, tick: int, world: Any, graph: Any, pages: dict[str, str]
+        self,
+        *,
+        tick: int,
+        world: Any,
+        graph: Any,
+        index: ProjectionIndex,
+        pages: dict[str, str],
     ) -> list[str]:
         """Bake dirty counties; returns the FULL raw dirty set (pre-budget).
 
@@ -264,7 +286,7 @@ class IncrementalArchiveTickBaker:
         rollup dirty, because those rollups read the live graph directly,
         not the county's cached page (see the module docstring).
         """
-        territory_snapshots = _territory_snapshots_by_county_fips(graph)
+        territory_snapshots = _territory_snapshots_by_county_fips(index)
         dirty_raw: list[str] = []
         for fips in self._county_fips:
             snapshot = territory_snapshots.get(fips, {})
@@ -272,7 +294,7 @@ class IncrementalArchiveTickBaker:
                 dirty_raw.append(fips)
 
         for fips in _clamp(dirty_raw, self._budgets.county):
-            view = project_county(fips, graph=graph, world=world, tick=tick)
+            view = project_county(fips, graph=graph, world=world, tick=tick, index=index)
             pages[f"county/{fips}.md"] = render_county(view, verified_tick=tick)
             self._tracker.record_baked("county", fips, territory_snapshots.get(fips, {}))
         return dirty_raw
@@ -283,6 +305,7 @@ class IncrementalArchiveTickBaker:
         tick: int,
         world: Any,
         graph: Any,
+        index: ProjectionIndex,
         pages: dict[str, str],
         county_dirty_raw: list[str],
     ) -> None:
@@ -296,13 +319,15 @@ class IncrementalArchiveTickBaker:
         state_prefixes = sorted({fips[:2] for fips in self._county_fips})
         state_dirty = [p for p in state_prefixes if self._pending.is_dirty("state", p)]
         for prefix in _clamp(state_dirty, self._budgets.state):
-            state = project_state(prefix, graph=graph, world=world, tick=tick)
+            state = project_state(prefix, graph=graph, world=world, tick=tick, index=index)
             pages[f"state/{prefix}.md"] = render_state(state, verified_tick=tick)
             self._pending.clear("state", prefix)
 
         national_dirty = [_NATIONAL_ID] if self._pending.is_dirty("national", _NATIONAL_ID) else []
         for national_id in _clamp(national_dirty, self._budgets.national):
-            national = project_national(national_id, graph=graph, world=world, tick=tick)
+            national = project_national(
+                national_id, graph=graph, world=world, tick=tick, index=index
+            )
             pages[f"national/{national_id}.md"] = render_national(national, verified_tick=tick)
             self._pending.clear("national", national_id)
 
@@ -398,32 +423,23 @@ class IncrementalArchiveTickBaker:
         self._materializer.bake_community(view, tick=tick)
 
 
-def _territory_snapshots_by_county_fips(graph: Any) -> dict[str, dict[str, Any]]:
+def _territory_snapshots_by_county_fips(index: ProjectionIndex) -> dict[str, dict[str, Any]]:
     """Every territory's attribute snapshot, keyed by its ``county_fips``.
 
-    ONE ``O(#territories)`` pass over the graph per tick — the substrate
-    this module's whole per-county-tick cost bound rests on. Calling
-    :mod:`babylon.projection.county`'s private ``_resolve_territory`` once
-    per county here (as the full-bake loop's own per-county
-    ``project_county`` call does internally) would be
-    ``O(counties × territories)``, silently reintroducing at the
-    snapshot-comparison layer the exact quadratic blowup this baker exists
-    to eliminate at the projection layer — so this precomputes the whole
-    map once instead, applying :func:`~babylon.projection.county.
-    project_county`'s own deterministic tie-break (lexicographically
-    smallest node id wins a shared ``county_fips``) without importing that
-    private helper (mirrors :mod:`babylon.projection.social_class`'s own
-    documented choice to duplicate its territory lookup rather than reach
-    into a sibling module's private surface).
+    Read off the tick's :class:`~babylon.projection.index.ProjectionIndex`
+    — ONE ``O(#territories)`` pass over the graph per tick, the substrate
+    this module's whole per-county-tick cost bound rests on. Resolving each
+    county with its own territory scan would be ``O(counties ×
+    territories)``, silently reintroducing at the snapshot-comparison layer
+    the exact quadratic blowup this baker exists to eliminate at the
+    projection layer. The index applies ``project_county``'s own
+    deterministic tie-break (lexicographically smallest node id wins a
+    shared ``county_fips``), so the snapshot compared is always the
+    territory the county page is projected from.
     """
-    winning_node_id: dict[str, str] = {}
     snapshot_by_fips: dict[str, dict[str, Any]] = {}
-    for node in graph.query_nodes(node_type=NodeType.TERRITORY.value):
-        fips = node.attributes.get("county_fips")
-        if fips is None:
-            continue
-        current_winner = winning_node_id.get(fips)
-        if current_winner is None or node.id < current_winner:
-            winning_node_id[fips] = node.id
-            snapshot_by_fips[fips] = dict(node.attributes)
+    for fips in index.territory_fips_codes():
+        territory = index.territory(fips)
+        if territory is not None:
+            snapshot_by_fips[fips] = dict(territory.attributes)
     return snapshot_by_fips
@@ -19,6 +19,7 @@ from babylon.projection.county import project_county
 from babylon.projection.economy import project_economy
 from babylon.projection.faction import project_faction
 from babylon.projection.field_state import project_field_state
+from babylon.projection.index import ProjectionIndex
 from babylon.projection.industry import project_industry
 from babylon.projection.institution import project_institution
 from babylon.projection.national import project_national
@@ -109,9 +110,10 @@ class CountyTickBaker:
         :param world: The post-tick world state.
         :param graph: The post-tick engine graph.
         """
+        index = ProjectionIndex.build(graph, world)
         pages: dict[str, str] = {}
         for fips in self._county_fips:
-            view = project_county(fips, graph=graph, world=world, tick=tick)
+            view = project_county(fips, graph=graph, world=world, tick=tick, index=index)
             pages[f"county/{view.county_fips}.md"] = render_county(view, verified_tick=tick)
         self._materializer.bake_tick(pages, tick=tick)
 
@@ -151,18 +153,24 @@ class ArchiveTickBaker:
     def on_tick_committed(self, *, tick: int, world: Any, graph: Any) -> None:
         """Project and bake every enumerable kind for one committed tick.
 
+        One :class:`~babylon.projection.index.ProjectionIndex` is built per
+        tick and shared by every projector that resolves territories, claims
+        or county attribution, so the county/state/national rollup is linear
+        in the graph rather than ``O(counties × entities)``.
+
         :param tick: The committed tick number.
         :param world: The post-tick world state.
         :param graph: The post-tick engine graph.
         """
+        index = ProjectionIndex.build(graph, world)
         pages: dict[str, str] = {}
         for fips in self._county_fips:
-            county = project_county(fips, graph=graph, world=world, tick=tick)
+            county = project_county(fips, graph=graph, world=world, tick=tick, index=index)
             pages[f"county/{fips}.md"] = render_county(county, verified_tick=tick)
         for state_fips in sorted({fips[:2] for fips in self._county_fips}):
-            state = project_state(state_fips, graph=graph, world=world, tick=tick)
+            state = project_state(state_fips, graph=graph, world=world, tick=tick, index=index)
             pages[f"state/{state_fips}.md"] = render_state(state, verified_tick=tick)
-        national = project_national(_NATIONAL_ID, graph=graph, world=world, tick=tick)
+        national = project_national(_NATIONAL_ID, graph=graph, world=world, tick=tick, index=index)
         pages[f"national/{_NATIONAL_ID}.md"] = render_national(national, verified_tick=tick)
         economy = project_economy(_ECONOMY_ID, graph=graph, world=world, tick=tick)
         pages[f"economy/{_ECONOMY_ID}.md"] = render_economy(economy, verified_tick=tick)
@@ -179,7 +187,9 @@ class ArchiveTickBaker:
                 institution, verified_tick=tick
             )
         for sovereign_id in _node_ids(graph, NodeType.SOVEREIGN):
-            sovereign = project_sovereign(sovereign_id, graph=graph, world=world, tick=tick)
+            sovereign = project_sovereign(
+                sovereign_id, graph=graph, world=world, tick=tick, index=index
+            )
             pages[f"sovereign/{sovereign_id}.md"] = render_sovereign(sovereign, verified_tick=tick)
         for faction_id in _node_ids(graph, NodeType.FACTION):
             faction = project_faction(faction_id, graph=graph, world=world, tick=tick)
@@ -188,7 +198,9 @@ class ArchiveTickBaker:
             industry = project_industry(industry_id, graph=graph, world=world, tick=tick)
             pages[f"industry/{industry_id}.md"] = render_industry(industry, verified_tick=tick)
         for class_id in _node_ids(graph, NodeType.SOCIAL_CLASS):
-            social_class = project_social_class(class_id, graph=graph, world=world, tick=tick)
+            social_class = project_social_class(
+                class_id, graph=graph, world=world, tick=tick, index=index
+            )
             pages[f"social_class/{class_id}.md"] = render_social_class(
                 social_class, verified_tick=tick
             )
@@ -545,7 +545,7 @@ class SovereignView(BaseModel):
     """A sovereign dossier — the projected read-model for one sovereign authority.
 
     Program 24 P2 WO-20: sovereign is the CLAIMS-edge claimant
-    :func:`~babylon.projection.county.project_county`'s ``_single_claimant``
+    :meth:`~babylon.projection.index.ProjectionIndex.single_claimant`
     already resolves for a county's ``sovereign_id`` field; this view is what
     a county page's ``[[sovereign/<id>]]`` wikilink resolves to.
 
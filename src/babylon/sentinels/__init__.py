@@ -13,7 +13,9 @@ to other earned invariants (determinism of the tick; round-trip conservation of
 
 - :mod:`babylon.sentinels.base` — :class:`~babylon.sentinels.base.SentinelCheckError`
   and the two-tier (gating / advisory) :func:`~babylon.sentinels.base.run_sensor`
-  runner with its 0/1/2 exit-code contract.
+  runner with its 0/1/2 exit-code contract, and
+  :func:`~babylon.sentinels.base.run_sensors`, which runs many sensors
+  concurrently in one process.
 - :mod:`babylon.sentinels.exemptions` — the ONE dated, owner-approved
   :class:`~babylon.sentinels.exemptions.SentinelExemption` record and its
   exact-tuple :func:`~babylon.sentinels.exemptions.is_exempt` matcher, used
@@ -26,7 +28,7 @@ Layer 0.5 (same rank as :mod:`babylon.config`): importable everywhere below the
 engine; imports nothing above :mod:`babylon.models`.
 """
 
-from babylon.sentinels.base import SentinelCheckError, run_sensor
+from babylon.sentinels.base import SentinelCheckError, run_sensor, run_sensors
 from babylon.sentinels.exemptions import SentinelExemption, is_exempt, stale_exemptions
 
 __all__ = [
@@ -34,5 +36,6 @@ __all__ = [
     "SentinelExemption",
     "is_exempt",
     "run_sensor",
+    "run_sensors",
     "stale_exemptions",
 ]
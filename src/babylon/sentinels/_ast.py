@@ -6,13 +6,20 @@ to live in the always-on dev fast-gate. These helpers are the common primitives
 (module-level literal extraction, call-site scanning) each sensor's ``checks``
 module builds on; a missing or unparseable source raises
 :class:`~babylon.sentinels.base.SentinelCheckError` (exit 2) rather than a silent
-empty result.
+empty result. Every helper reads through :func:`parse_module`, whose
+content-hash cache means each source file is parsed once per process (and,
+with :func:`enable_disk_parse_cache`, once per edit across processes).
 """
 
 from __future__ import annotations
 
 import ast
+import hashlib
+import os
+import pickle
 import re
+import sys
+import tempfile
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Final
@@ -34,14 +41,7 @@ def literal_str_tuple(path: Path, var_name: str) -> tuple[str, ...]:
     :raises SentinelCheckError: If the file is missing, unparseable, the name is
         absent, or its value is not a tuple/list literal.
     """
-    try:
-        source = path.read_text(encoding="utf-8")
-    except OSError as exc:
-        raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    try:
-        tree = ast.parse(source, filename=str(path))
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    tree = parse_module(path)
 
     for node in tree.body:
         targets: list[ast.expr]
@@ -79,12 +79,7 @@ def literal_dict_keys(path: Path, var_name: str) -> tuple[str, ...]:
     :raises SentinelCheckError: If the file is missing/unparseable, the name is
         absent, or its value is not a dict literal.
     """
-    try:
-        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    except OSError as exc:
-        raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    tree = parse_module(path)
 
     for node in tree.body:
         targets: list[ast.expr]
@@ -379,12 +374,7 @@ def tick_write_set(path: Path) -> set[str]:
     :returns: The set of ``tick_*`` attribute names written.
     :raises SentinelCheckError: If the source is missing or unparseable.
     """
-    try:
-        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    except OSError as exc:
-        raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    tree = parse_module(path)
 
     keys: set[str] = set()
     for node in ast.walk(tree):
@@ -412,12 +402,7 @@ def eventtype_names_in_module(path: Path) -> set[str]:
     :returns: The set of referenced ``EventType`` member names.
     :raises SentinelCheckError: If the source is missing or unparseable.
     """
-    try:
-        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    except OSError as exc:
-        raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    tree = parse_module(path)
 
     names: set[str] = set()
     for node in ast.walk(tree):
@@ -430,25 +415,99 @@ def eventtype_names_in_module(path: Path) -> set[str]:
     return names
 
 
+#: Parsed modules keyed by the SHA-256 of their source bytes. Shared by every
+#: sensor in the process (``sentinel_check.py all`` runs them concurrently over
+#: it), so a file is parsed once however many sensors read it; an edited file
+#: hashes to a new key. Trees are shared — callers must treat them as read-only.
+_PARSE_CACHE: dict[str, ast.Module] = {}
+
+#: Optional on-disk pickle cache directory (:func:`enable_disk_parse_cache`).
+_disk_cache_dir: Path | None = None
+
+
+def enable_disk_parse_cache(directory: Path | None) -> None:
+    """Also cache parsed modules as pickles under ``directory`` (``None`` disables).
+
+    Entries are keyed by source hash and interpreter cache tag, so a stale or
+    foreign-version pickle is never read. The cache is best-effort: an
+    unreadable entry is re-parsed and an unwritable directory is ignored.
+
+    :param directory: Cache directory (created on first write), or ``None``.
+    """
+    global _disk_cache_dir
+    _disk_cache_dir = directory
+
+
+def clear_parse_cache() -> None:
+    """Drop every in-memory parsed module (the on-disk cache is left alone)."""
+    _PARSE_CACHE.clear()
+
+
+def _disk_cache_path(key: str) -> Path | None:
+    if _disk_cache_dir is None:
+        return None
+    return _disk_cache_dir / f"{sys.implementation.cache_tag}-{key}.pickle"
+
+
+def _load_disk_tree(key: str) -> ast.Module | None:
+    cache_path = _disk_cache_path(key)
+    if cache_path is None or not cache_path.is_file():
+        return None
+    try:
+        tree = pickle.loads(cache_path.read_bytes())  # noqa: S301 - our own cache
+    except Exception:  # noqa: BLE001 - a corrupt entry is just a cache miss
+        return None
+    return tree if isinstance(tree, ast.Module) else None
+
+
+def _store_disk_tree(key: str, tree: ast.Module) -> None:
+    cache_path = _disk_cache_path(key)
+    if cache_path is None:
+        return
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, delete=False) as tmp:
+            tmp.write(pickle.dumps(tree, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp.name, cache_path)
+    except (OSError, RecursionError, pickle.PicklingError):
+        return
+
+
 def parse_module(path: Path) -> ast.Module:
     """Read and parse ``path`` with :mod:`ast`, failing loudly on either error.
 
-    The single shared entry point for the U7 sensors: a missing or unparseable
+    The single shared entry point for the sensors: a missing or unparseable
     source is an *infrastructure* failure (exit 2), never an empty result that
-    would read as a clean pass (Constitution III.11).
+    would read as a clean pass (Constitution III.11). Parses are cached by
+    source content hash (see :data:`_PARSE_CACHE`), so the returned tree is
+    shared and must not be mutated.
 
     :param path: Source file to parse.
     :returns: The parsed module.
     :raises SentinelCheckError: If the file cannot be read or cannot be parsed.
     """
     try:
-        source = path.read_text(encoding="utf-8")
+        raw = path.read_bytes()
     except OSError as exc:
         raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    try:
-        return ast.parse(source, filename=str(path))
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    key = hashlib.sha256(raw).hexdigest()
+    tree = _PARSE_CACHE.get(key)
+    if tree is not None:
+        return tree
+
+    tree = _load_disk_tree(key)
+    if tree is None:
+        try:
+            source = raw.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
+        try:
+            tree = ast.parse(source, filename=str(path))
+        except SyntaxError as exc:
+            raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+        _store_disk_tree(key, tree)
+    _PARSE_CACHE[key] = tree
+    return tree
 
 
 def referenced_names(path: Path) -> set[str]:
@@ -710,12 +769,7 @@ def node_type_uses(path: Path) -> list[NodeTypeUse]:
         so callers get a deterministic order (Constitution III.7).
     :raises SentinelCheckError: If the file is missing or unparseable.
     """
-    try:
-        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    except OSError as exc:
-        raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    tree = parse_module(path)
 
     uses: list[NodeTypeUse] = []
     for node in ast.walk(tree):
@@ -843,12 +897,7 @@ def graph_node_attribute_reads(path: Path, banned: frozenset[str]) -> list[Attri
     :returns: ``(lineno, attribute)`` pairs, sorted.
     :raises SentinelCheckError: If the file is missing or unparseable.
     """
-    try:
-        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    except OSError as exc:
-        raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    tree = parse_module(path)
 
     bound_names = _node_payload_bound_names(tree)
     reads: list[AttributeRead] = []
@@ -905,12 +954,7 @@ def add_node_attribute_stamps(path: Path) -> list[NodeAttributeStamp]:
         reported (they select the type, not a field on it).
     :raises SentinelCheckError: If the file is missing or unparseable.
     """
-    try:
-        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    except OSError as exc:
-        raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    tree = parse_module(path)
 
     stamps: list[NodeAttributeStamp] = []
     for call_node in ast.walk(tree):
@@ -1101,12 +1145,7 @@ def edge_source_type_uses(path: Path) -> list[EdgeSourceUse]:
     :returns: ``(lineno, edge_type, source_node_type)`` triples, sorted.
     :raises SentinelCheckError: If the file is missing or unparseable.
     """
-    try:
-        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    except OSError as exc:
-        raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    tree = parse_module(path)
 
     bindings = _local_source_type_bindings(tree)
     uses: list[EdgeSourceUse] = []
@@ -169,6 +169,16 @@ _ROWS: Final[tuple[ConnectionDisposition, ...]] = (
             "is the correct, intended behavior here, not an absence bug."
         ),
     ),
+    ConnectionDisposition(
+        file="src/babylon/intelligence/rag/embedding_store.py",
+        disposition="creates_own_store",
+        reason=(
+            "EmbeddingStore.__init__ creates the persistent embedding-cache SQLite file at "
+            "~line 55 -- a content-addressed cache of vectors the RAG pipeline computed "
+            "itself, never immutable reference data. A missing file is an empty cache, so "
+            "creation-on-first-use is the correct, intended behavior here."
+        ),
+    ),
     ConnectionDisposition(
         file="src/babylon/persistence/postgres_initialization.py",
         disposition="declared_debt",
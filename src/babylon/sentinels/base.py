@@ -7,6 +7,8 @@ is instance #1; determinism and round-trip conservation are its siblings. This
 module holds what every sentinel reuses — the infrastructure-failure error type
 and the two-tier (gating / advisory) check runner with its exit-code contract —
 so a new sensor is a registry + a handful of check functions, nothing more.
+:func:`run_sensors` runs many sensors in one process (``sentinel_check.py
+all``) without changing any sensor's own exit code.
 
 Dependency-light **by design** (layer 0.5, same rank as :mod:`babylon.config`):
 importable by ``engine``, ``domain``, ``web.game.*`` and ``tools/*`` alike;
@@ -17,7 +19,9 @@ import-linter contract in ``pyproject.toml``.
 from __future__ import annotations
 
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
 
 #: A single check: returns its violation/finding strings (empty == clean).
 Check = Callable[[], list[str]]
@@ -25,6 +29,14 @@ Check = Callable[[], list[str]]
 #: ``(human-readable label, check)`` pairs, the unit a runner iterates.
 LabelledCheck = tuple[str, Check]
 
+#: A sensor's CLI entry point: ``main(argv)`` returning its 0/1/2 exit code.
+SensorMain = Callable[[list[str] | None], int]
+
+#: Where :func:`run_sensor` writes: ``None`` prints straight to stdout/stderr;
+#: :func:`run_sensors` installs a per-sensor ``(is_stderr, line)`` buffer so
+#: concurrently running sensors never interleave their lines.
+_OUTPUT: ContextVar[list[tuple[bool, str]] | None] = ContextVar("sentinel_output", default=None)
+
 
 class SentinelCheckError(RuntimeError):
     """A sensor could not run — source missing or unparseable (exit 2, not 1).
@@ -60,17 +72,64 @@ def run_sensor(
     try:
         for label, check in gating:
             for violation in check():
-                print(f"{name} VIOLATION [{label}]: {violation}", file=sys.stderr)
+                _emit(f"{name} VIOLATION [{label}]: {violation}", stderr=True)
                 exit_code = 1
         advisory_count = 0
         for label, check in advisory:
             for finding in check():
-                print(f"{name} ADVISORY [{label}]: {finding}", file=sys.stderr)
+                _emit(f"{name} ADVISORY [{label}]: {finding}", stderr=True)
                 advisory_count += 1
     except SentinelCheckError as exc:
-        print(f"{name} ERROR: {exc}", file=sys.stderr)
+        _emit(f"{name} ERROR: {exc}", stderr=True)
         return 2
 
     if exit_code == 0:
-        print(summary(advisory_count))
+        _emit(summary(advisory_count), stderr=False)
     return exit_code
+
+
+def _emit(line: str, *, stderr: bool) -> None:
+    buffer = _OUTPUT.get()
+    if buffer is None:
+        print(line, file=sys.stderr if stderr else sys.stdout)
+    else:
+        buffer.append((stderr, line))
+
+
+def _run_buffered(main: SensorMain) -> tuple[int, list[tuple[bool, str]]]:
+    buffer: list[tuple[bool, str]] = []
+    _OUTPUT.set(buffer)
+    return main([]), buffer
+
+
+def run_sensors(sensors: Mapping[str, SensorMain], *, workers: int | None = None) -> int:
+    """Run several sensors concurrently in this process; return the worst exit code.
+
+    Every sensor keeps its own :func:`run_sensor` exit code; they only share
+    the process, so the static sensors share :mod:`babylon.sentinels._ast`'s
+    parse cache instead of each re-parsing the same files. Each sensor's
+    output is buffered and printed whole, in ``sensors`` order, once all have
+    finished.
+
+    :param sensors: ``name -> main`` for each sensor to run (argv ``[]``).
+    :param workers: Thread count; defaults to one per sensor.
+    :returns: The maximum exit code (0 clean / 1 gating / 2 infrastructure).
+    """
+    if not sensors:
+        return 0
+    with ThreadPoolExecutor(max_workers=workers or len(sensors)) as pool:
+        futures = {
+            name: pool.submit(copy_context().run, _run_buffered, main)
+            for name, main in sensors.items()
+        }
+        outcomes = {name: future.result() for name, future in futures.items()}
+
+    for _code, lines in outcomes.values():
+        for stderr, line in lines:
+            print(line, file=sys.stderr if stderr else sys.stdout)
+    codes = [code for code, _lines in outcomes.values()]
+    print(
+        f"SENTINELS: {len(codes)} sensors — {codes.count(0)} clean, "
+        f"{codes.count(1)} gating, {codes.count(2)} infrastructure failures."
+    )
+    return max(codes)
@@ -43,7 +43,7 @@ import csv
 import sys
 from pathlib import Path
 
-from babylon.sentinels._ast import referenced_names, returned_dict_keys
+from babylon.sentinels._ast import parse_module, referenced_names, returned_dict_keys
 from babylon.sentinels.base import LabelledCheck, SentinelCheckError, run_sensor
 from babylon.sentinels.coverage.catalog import (
     CatalogTable,
@@ -77,14 +77,7 @@ def module_class_names(path: Path) -> set[str]:
     :raises SentinelCheckError: If the file is missing or unparseable (an
         infrastructure failure, never swallowed into a false pass).
     """
-    try:
-        source = path.read_text(encoding="utf-8")
-    except OSError as exc:
-        raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    try:
-        tree = ast.parse(source, filename=str(path))
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    tree = parse_module(path)
     return {node.name for node in tree.body if isinstance(node, ast.ClassDef)}
 
 
@@ -103,14 +96,7 @@ def module_level_names(path: Path) -> set[str]:
     :raises SentinelCheckError: If the file is missing or unparseable (an
         infrastructure failure, never swallowed into a false pass).
     """
-    try:
-        source = path.read_text(encoding="utf-8")
-    except OSError as exc:
-        raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    try:
-        tree = ast.parse(source, filename=str(path))
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    tree = parse_module(path)
 
     names: set[str] = set()
     for node in tree.body:
@@ -39,6 +39,7 @@ import ast
 import re
 from pathlib import Path
 
+from babylon.sentinels._ast import parse_module
 from babylon.sentinels.base import SentinelCheckError
 from babylon.sentinels.seam.provenance import _KNOWN_NORMALISATIONS, _NORMALISED_INTO
 
@@ -72,12 +73,7 @@ def _parse(path: Path) -> ast.Module:
     :raises SentinelCheckError: If the file is missing or unparseable — an
         infrastructure failure (exit 2), never swallowed into a false pass.
     """
-    try:
-        return ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    except OSError as exc:
-        raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    return parse_module(path)
 
 
 def _canonical_path(raw: str) -> str:
@@ -32,6 +32,7 @@ import ast
 import re
 from pathlib import Path
 
+from babylon.sentinels._ast import parse_module
 from babylon.sentinels.base import SentinelCheckError
 
 #: Repo root (this file is ``<root>/src/babylon/sentinels/seam/provenance.py``).
@@ -87,12 +88,7 @@ def _emitted_property_keys(path: Path, func_name: str) -> set[str]:
         function or its ``properties`` dict cannot be found (a moved emitter must
         fail loud, never silently report an empty — hence non-vacuous).
     """
-    try:
-        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    except OSError as exc:
-        raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    tree = parse_module(path)
 
     for node in ast.walk(tree):
         if not (isinstance(node, ast.FunctionDef) and node.name == func_name):
@@ -131,12 +127,7 @@ def _group_key_map_values(path: Path, func_name: str, var_name: str) -> set[str]
         optimisation detail, so its absence is not itself a hard failure).
     :raises SentinelCheckError: If the source is missing or unparseable.
     """
-    try:
-        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    except OSError as exc:
-        raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    tree = parse_module(path)
 
     for node in ast.walk(tree):
         if not (isinstance(node, ast.FunctionDef) and node.name == func_name):
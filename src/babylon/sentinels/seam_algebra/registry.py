@@ -875,14 +875,14 @@ WALLCLOCK_REGISTRY: Final[tuple[WallclockCallSite, ...]] = (
     WallclockCallSite(
         name="run_manifest_wallclock_start",
         def_file="src/babylon/engine/headless_runner/runner.py",
-        line=1188,
+        line=1212,
         wallclock_call="datetime.now",
         artifact="build_manifest() non_deterministic_inputs.wallclock_start",
     ),
     WallclockCallSite(
         name="run_manifest_wallclock_end",
         def_file="src/babylon/engine/headless_runner/runner.py",
-        line=1430,
+        line=1455,
         wallclock_call="datetime.now",
         artifact="build_manifest() non_deterministic_inputs.wallclock_end",
     ),
@@ -967,7 +967,7 @@ WALLCLOCK_EXEMPTIONS: Final[tuple[SentinelExemption, ...]] = (
     SentinelExemption(
         key=("wallclock", "run_manifest_wallclock_start"),
         reason=(
-            "engine/headless_runner/runner.py:1188 reads datetime.now(UTC) into "
+            "engine/headless_runner/runner.py:1212 reads datetime.now(UTC) into "
             "wallclock_start, fed to build_manifest()'s non_deterministic_inputs (engine/"
             "headless_runner/manifest.py). PROVEN excluded from the byte-identity "
             "contract by construction: input_hash(deterministic_inputs) takes ONLY the "
@@ -987,7 +987,7 @@ WALLCLOCK_EXEMPTIONS: Final[tuple[SentinelExemption, ...]] = (
     SentinelExemption(
         key=("wallclock", "run_manifest_wallclock_end"),
         reason=(
-            "engine/headless_runner/runner.py:1430 reads datetime.now(UTC) into "
+            "engine/headless_runner/runner.py:1455 reads datetime.now(UTC) into "
             "wallclock_end -- the sibling half of run_manifest_wallclock_start above; "
             "same grounded exclusion (non_deterministic_inputs is unreachable from "
             "input_hash's own parameter list, and manifest.py's docstring already "
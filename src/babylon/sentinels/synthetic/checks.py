@@ -37,7 +37,8 @@ import ast
 import sys
 from pathlib import Path
 
-from babylon.sentinels.base import LabelledCheck, SentinelCheckError, run_sensor
+from babylon.sentinels._ast import parse_module
+from babylon.sentinels.base import LabelledCheck, run_sensor
 from babylon.sentinels.synthetic.registry import SYNTHETIC_SOURCES, SyntheticSource
 
 #: Repo root (this file is ``<root>/src/babylon/sentinels/synthetic/checks.py``).
@@ -52,14 +53,7 @@ def _parse(path: Path) -> ast.Module:
     :raises SentinelCheckError: If the file is missing or unparseable — an
         infrastructure failure, never swallowed into a false pass.
     """
-    try:
-        source = path.read_text(encoding="utf-8")
-    except OSError as exc:
-        raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    try:
-        return ast.parse(source, filename=str(path))
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    return parse_module(path)
 
 
 def _body_names(body: list[ast.stmt]) -> set[str]:
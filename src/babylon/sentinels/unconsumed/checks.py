@@ -65,6 +65,7 @@ from collections.abc import Iterator
 from pathlib import Path
 from typing import Final
 
+from babylon.sentinels._ast import parse_module
 from babylon.sentinels.base import LabelledCheck, SentinelCheckError, run_sensor
 from babylon.sentinels.exemptions import is_exempt
 from babylon.sentinels.unconsumed.registry import (
@@ -123,14 +124,7 @@ def _parse(path: Path) -> ast.Module:
     :raises SentinelCheckError: If the file is missing or unparseable — an
         infrastructure failure, never swallowed into a false pass.
     """
-    try:
-        source = path.read_text(encoding="utf-8")
-    except OSError as exc:
-        raise SentinelCheckError(f"cannot read {path}: {exc}") from exc
-    try:
-        return ast.parse(source, filename=str(path))
-    except SyntaxError as exc:
-        raise SentinelCheckError(f"cannot parse {path}: {exc}") from exc
+    return parse_module(path)
 
 
 def _production_files(roots: tuple[str, ...] = PRODUCTION_ROOTS) -> Iterator[Path]:
@@ -2,11 +2,22 @@
 
 Extracted from inmemory_adapter to reduce class size.
 Provides node and edge querying and counting functionality.
+
+Typed lookups go through the ``_node_items`` / ``_edge_items`` hooks. The
+fallbacks here scan the backing graph; :class:`~babylon.topology.graph.BabylonGraph`
+overrides them with its per-type indexes, making typed queries and counts
+O(matching). ``iter_nodes`` / ``iter_edges`` are the zero-copy read path:
+read-only views of the live payloads, no ``GraphNode``/``GraphEdge``
+construction. ``iter_in_edges`` / ``iter_out_edges`` are the same read
+restricted to one node's incident edges (``_in_edge_items`` /
+``_out_edge_items`` hooks; BabylonGraph answers them from its adjacency
+mirrors in O(degree)).
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -31,6 +42,106 @@ class QueryMixin:
 
     _graph: CompatGraph
 
+    def _node_items(self, node_type: str | None) -> Iterable[tuple[str, dict[str, Any]]]:
+        """Live ``(id, payload)`` pairs of ``node_type`` (falsy = all), by scan."""
+        nodes = self._graph.nodes
+        for node_id in nodes:
+            data = nodes[node_id]
+            if node_type and data.get("_node_type", "unknown") != node_type:
+                continue
+            yield node_id, data
+
+    def _edge_items(self, edge_type: str | None) -> Iterable[tuple[str, str, dict[str, Any]]]:
+        """Live ``(source, target, payload)`` triples of ``edge_type``, by scan."""
+        for source, target, data in self._graph.edges(data=True):
+            if edge_type and data.get("_edge_type", "unknown") != edge_type:
+                continue
+            yield source, target, data
+
+    def _in_edge_items(
+        self, node_id: str, edge_type: str | None
+    ) -> Iterable[tuple[str, str, dict[str, Any]]]:
+        """Live triples of ``edge_type`` (falsy = all) entering ``node_id``, by scan."""
+        for source, target, data in self._edge_items(edge_type):
+            if target == node_id:
+                yield source, target, data
+
+    def _out_edge_items(
+        self, node_id: str, edge_type: str | None
+    ) -> Iterable[tuple[str, str, dict[str, Any]]]:
+        """Live triples of ``edge_type`` (falsy = all) leaving ``node_id``, by scan."""
+        for source, target, data in self._edge_items(edge_type):
+            if source == node_id:
+                yield source, target, data
+
+    def iter_nodes(self, node_type: str | None = None) -> Iterator[tuple[str, Mapping[str, Any]]]:
+        """Zero-copy node read: ``(id, payload)`` pairs in iteration order.
+
+        Payloads are read-only views of the live attribute dicts (the
+        ``_node_type`` key included) — nothing is copied and no model is
+        built. Write through ``update_node`` or ``nodes[id]`` instead.
+
+        Args:
+            node_type: Filter by node type (None = all types).
+
+        Yields:
+            ``(node_id, read-only payload)`` pairs.
+        """
+        for node_id, data in self._node_items(node_type):
+            yield node_id, MappingProxyType(data)
+
+    def iter_edges(
+        self, edge_type: str | None = None
+    ) -> Iterator[tuple[str, str, Mapping[str, Any]]]:
+        """Zero-copy edge read: ``(source, target, payload)`` in iteration order.
+
+        Args:
+            edge_type: Filter by edge type (None = all types).
+
+        Yields:
+            ``(source_id, target_id, read-only payload)`` triples.
+        """
+        for source, target, data in self._edge_items(edge_type):
+            yield source, target, MappingProxyType(data)
+
+    def iter_in_edges(
+        self, node_id: str, edge_type: str | None = None
+    ) -> Iterator[tuple[str, str, Mapping[str, Any]]]:
+        """Zero-copy read of the edges entering ``node_id``.
+
+        Same triples, in the same relative order, as filtering
+        :meth:`iter_edges` on ``target == node_id``. An absent node has
+        no edges.
+
+        Args:
+            node_id: The target node.
+            edge_type: Filter by edge type (None = all types).
+
+        Yields:
+            ``(source_id, node_id, read-only payload)`` triples.
+        """
+        for source, target, data in self._in_edge_items(node_id, edge_type):
+            yield source, target, MappingProxyType(data)
+
+    def iter_out_edges(
+        self, node_id: str, edge_type: str | None = None
+    ) -> Iterator[tuple[str, str, Mapping[str, Any]]]:
+        """Zero-copy read of the edges leaving ``node_id``.
+
+        Same triples, in the same relative order, as filtering
+        :meth:`iter_edges` on ``source == node_id``. An absent node has
+        no edges.
+
+        Args:
+            node_id: The source node.
+            edge_type: Filter by edge type (None = all types).
+
+        Yields:
+            ``(node_id, target_id, read-only payload)`` triples.
+        """
+        for source, target, data in self._out_edge_items(node_id, edge_type):
+            yield source, target, MappingProxyType(data)
+
     def query_nodes(
         self,
         node_type: str | None = None,
@@ -47,18 +158,13 @@ class QueryMixin:
         Yields:
             Matching GraphNode models.
         """
-        for node_id in self._graph.nodes:
-            data = dict(self._graph.nodes[node_id])
-            n_type = data.pop("_node_type", "unknown")
-
-            # Type filter
-            if node_type and n_type != node_type:
-                continue
-
-            # Attribute filter
-            if attributes and not all(data.get(k) == v for k, v in attributes.items()):
+        for node_id, payload in self._node_items(node_type):
+            # Attribute filter (before copying: most candidates fail it)
+            if attributes and not all(payload.get(k) == v for k, v in attributes.items()):
                 continue
 
+            data = dict(payload)
+            n_type = data.pop("_node_type", "unknown")
             node = GraphNode(id=node_id, node_type=n_type, attributes=data)
 
             # Predicate filter
@@ -85,22 +191,18 @@ class QueryMixin:
         Yields:
             Matching GraphEdge models.
         """
-        for source, target, data in self._graph.edges(data=True):
-            data_copy = dict(data)
-            e_type = data_copy.pop("_edge_type", "unknown")
-            data_copy.pop("edge_type", None)
-            weight = data_copy.pop("weight", 1.0)
-
-            # Type filter
-            if edge_type and e_type != edge_type:
-                continue
-
-            # Weight filters
+        for source, target, data in self._edge_items(edge_type):
+            # Weight filters (before copying)
+            weight = data.get("weight", 1.0)
             if min_weight is not None and weight < min_weight:
                 continue
             if max_weight is not None and weight > max_weight:
                 continue
 
+            data_copy = dict(data)
+            e_type = data_copy.pop("_edge_type", "unknown")
+            data_copy.pop("edge_type", None)
+            data_copy.pop("weight", None)
             edge = GraphEdge(
                 source_id=source,
                 target_id=target,
@@ -126,9 +228,7 @@ class QueryMixin:
         """
         if node_type is None:
             return self._graph.number_of_nodes()
-        return sum(
-            1 for n in self._graph.nodes if self._graph.nodes[n].get("_node_type") == node_type
-        )
+        return sum(1 for _ in self._node_items(node_type))
 
     def count_edges(self, edge_type: str | None = None) -> int:
         """Count edges, optionally by type.
@@ -141,6 +241,4 @@ class QueryMixin:
         """
         if edge_type is None:
             return self._graph.number_of_edges()
-        return sum(
-            1 for _, _, data in self._graph.edges(data=True) if data.get("_edge_type") == edge_type
-        )
+        return sum(1 for _ in self._edge_items(edge_type))
@@ -0,0 +1,330 @@
+"""Cached, component-incremental centrality for Sparrow network analysis.
+
+:func:`~babylon.ooda.attention.sparrow.analyze_network` used to run exact
+betweenness/closeness (O(V·E) each) and articulation points over the whole
+observed graph on every call, and its callers capped the graph at 1000
+nodes to keep that affordable. :class:`CentralityService` removes the cap
+two ways:
+
+* **Component-incremental cache.** Betweenness and articulation points of a
+  node depend only on its connected component, so results are cached per
+  component, keyed by the component's content (sorted node ids + sorted
+  edges) — never by graph identity, since callers rebuild their observed
+  subgraph every call. When a few SOLIDARITY edges change between ticks,
+  only the components they touch are recomputed; every other component is
+  a cache hit. Raw (unnormalized) betweenness is cached and normalized
+  against the current graph size at assembly, so a component's entry
+  stays valid when other components grow or vanish.
+* **Pivot-sampled betweenness (Brandes–Pich).** A component above
+  ``exact_max_nodes`` is estimated from ``pivots`` single-source
+  dependency accumulations instead of one per node, the sum scaled by
+  ``n / k``. Pivots are drawn with ``random.Random(seed)`` from the sorted
+  node ids and adjacency is walked in sorted order, so the estimate is a
+  pure function of the component's content (Constitution III.7). The
+  Hoeffding bound with a union bound over nodes gives the reported
+  ``betweenness_error``: every normalized score is within it of the exact
+  value with probability at least ``confidence``. Closeness of a large
+  connected graph is estimated from the same pivot distances
+  (Eppstein–Wang); it carries no separate bound.
+
+Components at or below ``exact_max_nodes`` use the exact rustworkx
+algorithms, same as :mod:`babylon.topology.graph_algorithms`.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Final
+
+import rustworkx as rx
+
+from babylon.topology import graph_algorithms as ga
+from babylon.topology.graph import BabylonUGraph
+
+__all__ = ["CentralityResult", "CentralityService"]
+
+_EXACT_MAX_NODES: Final[int] = 1000
+_PIVOTS: Final[int] = 256
+_CONFIDENCE: Final[float] = 0.95
+_MAX_CACHED_COMPONENTS: Final[int] = 4096
+
+_ComponentKey = tuple[tuple[str, ...], tuple[tuple[str, str], ...]]
+
+
+@dataclass(frozen=True)
+class CentralityResult:
+    """Centrality of one undirected graph, every mapping key-sorted by id.
+
+    Attributes:
+        degree: Degree centrality, ``deg / (n - 1)``.
+        betweenness: Normalized betweenness; empty for graphs of <= 1 node.
+        closeness: Closeness centrality, or ``None`` unless the graph is
+            connected with more than one node.
+        articulation_points: Cut vertices.
+        betweenness_error: Half-width of the simultaneous confidence band
+            on every betweenness score; ``0.0`` when all of it is exact.
+        sampled: True when any component was pivot-sampled.
+    """
+
+    degree: dict[str, float]
+    betweenness: dict[str, float]
+    closeness: dict[str, float] | None
+    articulation_points: frozenset[str]
+    betweenness_error: float = 0.0
+    sampled: bool = False
+
+
+@dataclass
+class _ComponentEntry:
+    """Cached per-component results, independent of the enclosing graph."""
+
+    raw_betweenness: dict[str, float]
+    raw_error: float
+    sampled: bool
+    articulation_points: frozenset[str]
+    # Per-node sum of distances from the pivots (sampled components only).
+    pivot_distance_sums: dict[str, int] | None = None
+    pivot_count: int = 0
+    # Filled on first request: only wanted when the component IS the graph.
+    closeness: dict[str, float] | None = None
+
+
+class CentralityService:
+    """Content-keyed centrality cache with pivot sampling for large components.
+
+    Safe to share across threads and runs: every cached value is a pure
+    function of a component's content and the service's settings.
+
+    Args:
+        exact_max_nodes: Largest component computed exactly.
+        pivots: Pivot sources per sampled component.
+        seed: Pivot-sampling seed.
+        confidence: Probability the reported ``betweenness_error`` band
+            holds for every node simultaneously, in ``(0, 1)``.
+        max_cached_components: LRU bound on cached component entries.
+
+    Raises:
+        ValueError: If ``pivots < 1`` or ``confidence`` is outside ``(0, 1)``.
+    """
+
+    def __init__(
+        self,
+        *,
+        exact_max_nodes: int = _EXACT_MAX_NODES,
+        pivots: int = _PIVOTS,
+        seed: int = 0,
+        confidence: float = _CONFIDENCE,
+        max_cached_components: int = _MAX_CACHED_COMPONENTS,
+    ) -> None:
+        if pivots < 1:
+            raise ValueError(f"pivots must be >= 1, got {pivots}")
+        if not 0.0 < confidence < 1.0:
+            raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+        self._exact_max_nodes = exact_max_nodes
+        self._pivots = pivots
+        self._seed = seed
+        self._confidence = confidence
+        self._max_cached = max_cached_components
+        self._cache: OrderedDict[_ComponentKey, _ComponentEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Component lookups answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Component lookups that had to be computed."""
+        return self._misses
+
+    def analyze(self, graph: BabylonUGraph) -> CentralityResult:
+        """Degree, betweenness, closeness and cut vertices of ``graph``.
+
+        Args:
+            graph: Undirected graph (Sparrow's ``to_undirected`` projection).
+
+        Returns:
+            The graph's :class:`CentralityResult`.
+        """
+        n = graph.number_of_nodes()
+        if n == 0:
+            return CentralityResult(
+                degree={}, betweenness={}, closeness=None, articulation_points=frozenset()
+            )
+        degree = ga.degree_centrality(graph)
+        if n == 1:
+            return CentralityResult(
+                degree=degree, betweenness={}, closeness=None, articulation_points=frozenset()
+            )
+
+        # rustworkx's undirected normalization: raw / ((n - 1)(n - 2)), none
+        # at n <= 2 (where every raw score is 0 anyway).
+        scale = 1.0 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+        betweenness: dict[str, float] = {}
+        articulation: set[str] = set()
+        error = 0.0
+        sampled = False
+        entries = [
+            self._entry(_component_key(graph, component)) for component in ga.component_sets(graph)
+        ]
+        for entry in entries:
+            for node_id, raw in entry.raw_betweenness.items():
+                betweenness[node_id] = raw * scale
+            articulation |= entry.articulation_points
+            error = max(error, entry.raw_error * scale)
+            sampled = sampled or entry.sampled
+
+        closeness: dict[str, float] | None = None
+        if len(entries) == 1:
+            entry = entries[0]
+            if entry.closeness is None:
+                entry.closeness = _closeness(entry, graph)
+            closeness = entry.closeness
+
+        return CentralityResult(
+            degree=degree,
+            betweenness=dict(sorted(betweenness.items())),
+            closeness=closeness,
+            articulation_points=frozenset(articulation),
+            betweenness_error=error,
+            sampled=sampled,
+        )
+
+    # ── cache ─────────────────────────────────────────────────────────────
+
+    def _entry(self, key: _ComponentKey) -> _ComponentEntry:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return entry
+            self._misses += 1
+        entry = self._compute(key)
+        with self._lock:
+            self._cache[key] = entry
+            while len(self._cache) > self._max_cached:
+                self._cache.popitem(last=False)
+        return entry
+
+    # ── per-component computation ─────────────────────────────────────────
+
+    def _compute(self, key: _ComponentKey) -> _ComponentEntry:
+        nodes, _ = key
+        component = _component_graph(key)
+        articulation = frozenset(ga.articulation_point_set(component))
+        if len(nodes) <= self._exact_max_nodes:
+            # normalized=False halves undirected raw scores; undo it exactly.
+            raw = rx.betweenness_centrality(component.core, normalized=False)
+            return _ComponentEntry(
+                raw_betweenness={
+                    component.id_of(index): float(value) * 2.0 for index, value in raw.items()
+                },
+                raw_error=0.0,
+                sampled=False,
+                articulation_points=articulation,
+            )
+        estimate, distance_sums = self._sample(key)
+        n_c = len(nodes)
+        k = min(self._pivots, n_c)
+        # One pivot's scaled dependency n_c * delta_s(v) lies in [0, n_c(n_c - 2)].
+        failure = 1.0 - self._confidence
+        raw_error = n_c * (n_c - 2) * math.sqrt(math.log(2.0 * n_c / failure) / (2.0 * k))
+        return _ComponentEntry(
+            raw_betweenness=estimate,
+            raw_error=raw_error,
+            sampled=True,
+            articulation_points=articulation,
+            pivot_distance_sums=distance_sums,
+            pivot_count=k,
+        )
+
+    def _sample(self, key: _ComponentKey) -> tuple[dict[str, float], dict[str, int]]:
+        """Brandes–Pich pivot estimate of raw betweenness, plus pivot distance sums."""
+        nodes, edges = key
+        adjacency: dict[str, list[str]] = {node_id: [] for node_id in nodes}
+        for u, v in edges:
+            if u != v:
+                adjacency[u].append(v)
+                adjacency[v].append(u)
+        for neighbors in adjacency.values():
+            neighbors.sort()
+        k = min(self._pivots, len(nodes))
+        pivots = random.Random(self._seed).sample(nodes, k)
+        dependency = dict.fromkeys(nodes, 0.0)
+        distance_sums = dict.fromkeys(nodes, 0)
+        for source in pivots:
+            _accumulate(adjacency, source, dependency, distance_sums)
+        factor = len(nodes) / k
+        return {node_id: value * factor for node_id, value in dependency.items()}, distance_sums
+
+
+def _accumulate(
+    adjacency: dict[str, list[str]],
+    source: str,
+    dependency: dict[str, float],
+    distance_sums: dict[str, int],
+) -> None:
+    """One Brandes single-source pass (unweighted), added into the running sums."""
+    sigma: dict[str, int] = {source: 1}
+    dist: dict[str, int] = {source: 0}
+    preds: dict[str, list[str]] = {source: []}
+    order: list[str] = []
+    queue = deque([source])
+    while queue:
+        v = queue.popleft()
+        order.append(v)
+        for w in adjacency[v]:
+            if w not in dist:
+                dist[w] = dist[v] + 1
+                sigma[w] = 0
+                preds[w] = []
+                queue.append(w)
+            if dist[w] == dist[v] + 1:
+                sigma[w] += sigma[v]
+                preds[w].append(v)
+    delta = dict.fromkeys(order, 0.0)
+    for w in reversed(order):
+        for v in preds[w]:
+            delta[v] += sigma[v] / sigma[w] * (1.0 + delta[w])
+        if w != source:
+            dependency[w] += delta[w]
+        distance_sums[w] += dist[w]
+
+
+def _closeness(entry: _ComponentEntry, graph: BabylonUGraph) -> dict[str, float]:
+    """Closeness of a connected ``graph`` whose only component is ``entry``."""
+    if entry.pivot_distance_sums is None:
+        return ga.closeness_centrality(graph)
+    # Eppstein–Wang: n / k times the pivot distance sum estimates the
+    # distance sum over every node.
+    n = graph.number_of_nodes()
+    factor = n / entry.pivot_count
+    return {
+        node_id: (n - 1) / (total * factor) if total > 0 else 0.0
+        for node_id, total in sorted(entry.pivot_distance_sums.items())
+    }
+
+
+def _component_key(graph: BabylonUGraph, component: set[str]) -> _ComponentKey:
+    """Content key of one component: sorted ids and sorted ``u <= v`` edges."""
+    nodes = tuple(sorted(component))
+    edges = sorted((u, v) for u in nodes for v in graph.neighbors(u) if u <= v)
+    return nodes, tuple(edges)
+
+
+def _component_graph(key: _ComponentKey) -> BabylonUGraph:
+    nodes, edges = key
+    component = BabylonUGraph()
+    for node_id in nodes:
+        component.add_node(node_id)
+    for u, v in edges:
+        component.add_edge(u, v)
+    return component
@@ -19,6 +19,9 @@ Internal structure:
   with reference semantics.
 * ``_adj`` / ``_pred`` — per-source insertion-ordered adjacency mirrors;
   ``edges(data=True)`` iterates them in NetworkX's exact order.
+* ``_nodes_by_type`` / ``_edges_by_type`` — per-type id indexes kept in
+  iteration order (via ``_node_seq`` / ``_edge_seq`` insertion stamps), so
+  typed queries and counts cost O(matching) rather than O(graph).
 
 Normalization: node types live under ``_node_type`` only (no raw reader
 of the public key exists outside the graph layer). Edge payloads carry
@@ -84,6 +87,22 @@ class _GraphCore:
         self._adj: dict[str, dict[str, None]] = {}
         self._pred: dict[str, dict[str, None]] = {}
         self._graph_attrs: dict[str, Any] = {}
+        # Type indexes. Each id is filed under the type it had when last
+        # (re)indexed; queries re-check the live payload, so a type key
+        # written straight into a payload dict can never yield a false
+        # match (it only goes unseen by its NEW type until reindexed).
+        self._seq = 0
+        self._node_seq: dict[str, int] = {}
+        self._edge_seq: dict[tuple[str, str], int] = {}
+        self._node_type_of: dict[str, Any] = {}
+        self._edge_type_of: dict[tuple[str, str], Any] = {}
+        self._nodes_by_type: dict[Any, dict[str, None]] = {}
+        self._edges_by_type: dict[Any, dict[tuple[str, str], None]] = {}
+        self._unsorted_node_types: set[Any] = set()
+        self._unsorted_edge_types: set[Any] = set()
+        # Bumped on every node/edge insert or delete (never on payload
+        # edits) so derived structures can cache against it.
+        self._topology_version = 0
         # Compat seam: mixins and legacy `getattr(graph, "_graph", graph)`
         # unwraps reach the backing store through `_graph`; we ARE it.
         self._graph: Any = self
@@ -136,6 +155,10 @@ class _GraphCore:
         self._node_payload[node_id] = payload
         self._adj[node_id] = {}
         self._pred[node_id] = {}
+        self._seq += 1
+        self._node_seq[node_id] = self._seq
+        self._file_node(node_id)
+        self._topology_version += 1
 
     def _ensure_node(self, node_id: str) -> None:
         if node_id not in self._ids:
@@ -149,9 +172,15 @@ class _GraphCore:
             self._pred[target][source] = None
         else:
             self._adj[target][source] = None
+        self._seq += 1
+        self._edge_seq[(source, target)] = self._seq
+        self._file_edge((source, target))
+        self._topology_version += 1
 
     def _delete_edge(self, key: tuple[str, str]) -> None:
         source, target = key
+        self._unfile_edge(key)
+        del self._edge_seq[key]
         del self._edge_payload[key]
         self._adj[source].pop(target, None)
         if self._DIRECTED:
@@ -159,6 +188,133 @@ class _GraphCore:
         else:
             self._adj[target].pop(source, None)
         self._core.remove_edge(self._ids[source], self._ids[target])
+        self._topology_version += 1
+
+    # ── type indexes (iteration-ordered; see class docstring) ────────────
+
+    def _node_order(self, node_id: str) -> int:
+        return self._node_seq[node_id]
+
+    def _edge_order(self, key: tuple[str, str]) -> tuple[int, int]:
+        # Directed iteration is source-major (node order), then per-source
+        # adjacency order; undirected iteration is stored-key order.
+        if self._DIRECTED:
+            return (self._node_seq[key[0]], self._edge_seq[key])
+        return (0, self._edge_seq[key])
+
+    def _file_node(self, node_id: str) -> None:
+        node_type = self._node_payload[node_id].get("_node_type", "unknown")
+        self._node_type_of[node_id] = node_type
+        bucket = self._nodes_by_type.setdefault(node_type, {})
+        if bucket and self._node_seq[next(reversed(bucket))] > self._node_seq[node_id]:
+            self._unsorted_node_types.add(node_type)
+        bucket[node_id] = None
+
+    def _unfile_node(self, node_id: str) -> None:
+        node_type = self._node_type_of.pop(node_id)
+        bucket = self._nodes_by_type[node_type]
+        del bucket[node_id]
+        if not bucket:
+            del self._nodes_by_type[node_type]
+            self._unsorted_node_types.discard(node_type)
+
+    def _refile_node(self, node_id: str) -> None:
+        """Re-file a node whose ``_node_type`` may have changed in place."""
+        if self._node_payload[node_id].get("_node_type", "unknown") != self._node_type_of[node_id]:
+            self._unfile_node(node_id)
+            self._file_node(node_id)
+
+    def _file_edge(self, key: tuple[str, str]) -> None:
+        edge_type = self._edge_payload[key].get("_edge_type", "unknown")
+        self._edge_type_of[key] = edge_type
+        bucket = self._edges_by_type.setdefault(edge_type, {})
+        if bucket and self._edge_order(next(reversed(bucket))) > self._edge_order(key):
+            self._unsorted_edge_types.add(edge_type)
+        bucket[key] = None
+
+    def _unfile_edge(self, key: tuple[str, str]) -> None:
+        edge_type = self._edge_type_of.pop(key)
+        bucket = self._edges_by_type[edge_type]
+        del bucket[key]
+        if not bucket:
+            del self._edges_by_type[edge_type]
+            self._unsorted_edge_types.discard(edge_type)
+
+    def _refile_edge(self, key: tuple[str, str]) -> None:
+        """Re-file an edge whose ``_edge_type`` may have changed in place."""
+        if self._edge_payload[key].get("_edge_type", "unknown") != self._edge_type_of[key]:
+            self._unfile_edge(key)
+            self._file_edge(key)
+
+    def _sort_node_bucket(self, node_type: Any) -> None:
+        bucket = self._nodes_by_type[node_type]
+        ordered = sorted(bucket, key=self._node_order)
+        bucket.clear()
+        bucket.update(dict.fromkeys(ordered))
+        self._unsorted_node_types.discard(node_type)
+
+    def _sort_edge_bucket(self, edge_type: Any) -> None:
+        bucket = self._edges_by_type[edge_type]
+        ordered = sorted(bucket, key=self._edge_order)
+        bucket.clear()
+        bucket.update(dict.fromkeys(ordered))
+        self._unsorted_edge_types.discard(edge_type)
+
+    def sort_type_indexes(self) -> None:
+        """Put every type index in iteration order now rather than on first query.
+
+        A typed query re-sorts its bucket in place when inserts arrived out of
+        order, so reads are not safe to share across threads until this has
+        run. Call it before handing one graph to concurrent readers.
+        """
+        for node_type in list(self._unsorted_node_types):
+            self._sort_node_bucket(node_type)
+        for edge_type in list(self._unsorted_edge_types):
+            self._sort_edge_bucket(edge_type)
+
+    def _node_items(self, node_type: str | None) -> Iterable[tuple[str, NodePayload]]:
+        """Live ``(id, payload)`` pairs, optionally of one type, in iteration order.
+
+        Overrides the scanning fallback in :class:`QueryMixin`. Typed
+        lookups read the type index (O(matching)) and return a snapshot
+        list, so callers may mutate the graph while consuming it.
+        """
+        if not node_type:
+            return self._node_payload.items()
+        bucket = self._nodes_by_type.get(node_type)
+        if not bucket:
+            return []
+        if node_type in self._unsorted_node_types:
+            self._sort_node_bucket(node_type)
+        payloads = self._node_payload
+        return [
+            (node_id, payloads[node_id])
+            for node_id in bucket
+            if payloads[node_id].get("_node_type", "unknown") == node_type
+        ]
+
+    def _edge_items(self, edge_type: str | None) -> Iterable[tuple[str, str, EdgePayload]]:
+        """Live ``(source, target, payload)`` triples, optionally of one type.
+
+        Same contract as :meth:`_node_items`; edges come back in
+        ``edges(data=True)`` order.
+        """
+        if not edge_type:
+            return [
+                (source, target, self._edge_payload[(source, target)])
+                for source, target in self._iter_edge_pairs()
+            ]
+        bucket = self._edges_by_type.get(edge_type)
+        if not bucket:
+            return []
+        if edge_type in self._unsorted_edge_types:
+            self._sort_edge_bucket(edge_type)
+        payloads = self._edge_payload
+        return [
+            (source, target, payloads[(source, target)])
+            for source, target in bucket
+            if payloads[(source, target)].get("_edge_type", "unknown") == edge_type
+        ]
 
     # ── node CRUD (dual signature: protocol positional / nx keyword) ─────
 
@@ -177,6 +333,8 @@ class _GraphCore:
         existing = self._node_payload.get(node_id)
         if existing is not None:
             existing.update(payload)
+            if "_node_type" in payload:
+                self._refile_node(node_id)
             return
         self._insert_node(node_id, payload)
 
@@ -200,6 +358,8 @@ class _GraphCore:
         for target in list(self._adj[node_id]):
             key = self._stored_edge_key(node_id, target)
             if key is not None:
+                self._unfile_edge(key)
+                del self._edge_seq[key]
                 del self._edge_payload[key]
             if self._DIRECTED:
                 self._pred[target].pop(node_id, None)
@@ -207,14 +367,20 @@ class _GraphCore:
                 self._adj[target].pop(node_id, None)
         if self._DIRECTED:
             for source in list(self._pred[node_id]):
-                self._edge_payload.pop((source, node_id), None)
+                if (source, node_id) in self._edge_payload:
+                    self._unfile_edge((source, node_id))
+                    del self._edge_seq[(source, node_id)]
+                    del self._edge_payload[(source, node_id)]
                 self._adj[source].pop(node_id, None)
             del self._pred[node_id]
         del self._adj[node_id]
+        self._unfile_node(node_id)
+        del self._node_seq[node_id]
         index = self._ids.pop(node_id)
         del self._index_to_id[index]
         del self._node_payload[node_id]
         self._core.remove_node(index)
+        self._topology_version += 1
 
     def remove_nodes_from(self, nodes: Iterable[str]) -> None:
         """nx-style bulk removal; silently skips missing nodes."""
@@ -244,6 +410,8 @@ class _GraphCore:
         key = self._stored_edge_key(source, target)
         if key is not None:
             self._edge_payload[key].update(payload)
+            if "_edge_type" in payload:
+                self._refile_edge(key)
             return
         self._ensure_node(source)
         self._ensure_node(target)
@@ -392,6 +560,15 @@ class _GraphCore:
         """
         return {target: self._edge_payload_of(node_id, target) for target in self._adj[node_id]}
 
+    @property
+    def topology_version(self) -> int:
+        """Counter bumped on every node/edge insert or removal.
+
+        Payload edits never bump it, so sparse operators and other derived
+        structures can be cached against ``(graph, topology_version)``.
+        """
+        return self._topology_version
+
     def index_of(self, node_id: str) -> int:
         """Return the rustworkx index for a node id (algorithm seam)."""
         return self._ids[node_id]
@@ -625,6 +802,46 @@ class BabylonGraph(_GraphCore, AggregationMixin, QueryMixin):
             ]
         return [(source, node_id) for source in self._pred[node_id]]
 
+    def _in_edge_items(
+        self, node_id: str, edge_type: str | None
+    ) -> Iterable[tuple[str, str, EdgePayload]]:
+        """Live in-edges of ``node_id``, optionally of one type, in O(in-degree).
+
+        Overrides the scanning fallback in :class:`QueryMixin`. ``_pred``
+        is in edge-insertion order, but iteration order is source-major,
+        so sources are re-sorted by node order (one edge per source pair).
+        Returns a snapshot list, like :meth:`_edge_items`.
+        """
+        sources = self._pred.get(node_id)
+        if not sources:
+            return []
+        payloads = self._edge_payload
+        return [
+            (source, node_id, payloads[(source, node_id)])
+            for source in sorted(sources, key=self._node_order)
+            if not edge_type
+            or payloads[(source, node_id)].get("_edge_type", "unknown") == edge_type
+        ]
+
+    def _out_edge_items(
+        self, node_id: str, edge_type: str | None
+    ) -> Iterable[tuple[str, str, EdgePayload]]:
+        """Live out-edges of ``node_id``, optionally of one type, in O(out-degree).
+
+        ``_adj[node_id]`` is already in iteration order. Returns a snapshot
+        list, like :meth:`_edge_items`.
+        """
+        targets = self._adj.get(node_id)
+        if not targets:
+            return []
+        payloads = self._edge_payload
+        return [
+            (node_id, target, payloads[(node_id, target)])
+            for target in targets
+            if not edge_type
+            or payloads[(node_id, target)].get("_edge_type", "unknown") == edge_type
+        ]
+
     def to_undirected(self) -> BabylonUGraph:
         """Undirected projection with copied payload dicts.
 
@@ -643,6 +860,7 @@ class BabylonGraph(_GraphCore, AggregationMixin, QueryMixin):
                 existing = undirected._edge_payload[key]
                 existing.clear()
                 existing.update(payload)
+                undirected._refile_edge(key)
         undirected._graph_attrs = dict(self._graph_attrs)
         return undirected
 
@@ -667,6 +885,8 @@ class BabylonGraph(_GraphCore, AggregationMixin, QueryMixin):
         if payload is None:
             raise KeyError(f"Node '{node_id}' does not exist")
         payload.update(attributes)
+        if "_node_type" in attributes:
+            self._refile_node(node_id)
 
     def get_edge(self, source: str, target: str, edge_type: str) -> GraphEdge | None:
         """Retrieve an edge as a :class:`GraphEdge` if its type matches."""
@@ -700,6 +920,8 @@ class BabylonGraph(_GraphCore, AggregationMixin, QueryMixin):
         if payload.get("_edge_type") != edge_type:
             raise KeyError(f"Edge ({source}, {target}) exists but type is not '{edge_type}'")
         payload.update(attributes)
+        if "_edge_type" in attributes:
+            self._refile_edge(key)
 
     # ── GraphProtocol: traversal ──────────────────────────────────────────
 
@@ -147,6 +147,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
 from typing import Final, Protocol, runtime_checkable
 from uuid import UUID, uuid4
 
@@ -573,8 +574,12 @@ class PacedDriverHandle(Protocol):
         """Resolve exactly one further tick (the Unit C2 binding's seam)."""
         ...
 
-    def run_until_paused(self) -> Sequence[TickOutcome]:
-        """Advance repeatedly until an autopause or the endgame lock."""
+    def run_until_paused(
+        self, *, on_tick: Callable[[TickOutcome], None] | None = None
+    ) -> Sequence[TickOutcome]:
+        """Advance repeatedly until an autopause or the endgame lock,
+        handing each resolved tick's outcome to ``on_tick`` (on the
+        driver's own thread) as soon as it lands."""
         ...
 
     def acknowledge_pause(self) -> None:
@@ -739,6 +744,63 @@ def _honest_target_id(subject: str | None, candidate_target_ids: tuple[str, ...]
     return entity_id if entity_id in candidate_target_ids else None
 
 
+@dataclass(frozen=True)
+class _PostTickViews:
+    """Every campaign read the post-tick fan-out paints, resolved together
+    off the event loop (:func:`_prefetch_post_tick_views`).
+
+    ``dashboard_view``/``subject_view``/``read_page`` each re-project live
+    graph state — at national scope seconds of work between them — so
+    :meth:`ArchiveApp._refresh_after_tick` paints from this bundle instead
+    of calling them on the UI thread. Pure data: nothing here touches a
+    widget.
+
+    :param known_subjects: the vault's baked subject set.
+    :param dashboard: :meth:`CampaignHandle.dashboard_view`'s result.
+    :param endgame: :meth:`CampaignHandle.endgame_status`'s result.
+    :param verb_plate: :meth:`CampaignHandle.verb_plate_view`'s result.
+    :param subject_views: one :meth:`CampaignHandle.subject_view` result per
+        id pinned when the prefetch started (``None`` kept — the rail's own
+        "no longer resolvable" row).
+    :param subject: the subject shown when the prefetch started, if any.
+    :param page: ``subject``'s page (``None`` for an absent one).
+    """
+
+    known_subjects: frozenset[str]
+    dashboard: EconomyView | None
+    endgame: EndgameStatus | None
+    verb_plate: VerbPlateView | None
+    subject_views: Mapping[str, ProjectionRecord | None]
+    subject: str | None
+    page: str | None
+
+
+def _prefetch_post_tick_views(
+    campaign: CampaignHandle,
+    pages: PageSource,
+    pinned_ids: Sequence[str],
+    subject: str | None,
+) -> _PostTickViews:
+    """Resolve one committed tick's :class:`_PostTickViews` — safe to run on
+    a worker thread (campaign reads only, no widget access).
+
+    :param campaign: the live campaign that just committed a tick.
+    :param pages: the app's page source (the campaign's ``read_page``).
+    :param pinned_ids: the watchlist's pins, in rail order.
+    :param subject: the currently-shown subject, if any.
+    :returns: the bundle :meth:`ArchiveApp._refresh_after_tick` paints.
+    """
+    return _PostTickViews(
+        known_subjects=campaign.known_subjects(),
+        dashboard=campaign.dashboard_view(),
+        endgame=campaign.endgame_status(),
+        verb_plate=campaign.verb_plate_view(),
+        subject_views={subject_id: campaign.subject_view(subject_id) for subject_id in pinned_ids},
+        subject=subject,
+        page=pages(subject) if subject is not None else None,
+    )
+
+
 def _sample_page_source(subject: str) -> str | None:
     """Serve the built-in sample dossier and nothing else — honestly.
 
@@ -1200,6 +1262,10 @@ class ArchiveApp(App[None]):
         ``None`` forever in the no-``driver_factory`` boot path (``t``
         then falls back to calling :attr:`campaign` directly, unchanged
         from before this unit)."""
+        self._tick_in_flight = False
+        """``True`` while a ``t``/``r`` worker is resolving ticks off the
+        event loop — the app-level twin of :attr:`PacedDriverHandle.busy`
+        that also covers the driverless ``t`` path."""
         self._tutorial_progress: TutorialProgress | None = None
         """This campaign's tutorial-progress seam (Unit U4) — ``None``
         until :attr:`campaign` boots AND ``tutorial_progress_factory``
@@ -1551,7 +1617,7 @@ class ArchiveApp(App[None]):
         else:
             self.query_one(f"#{view}").focus()
 
-    def _refresh_dashboard(self) -> None:
+    def _refresh_dashboard(self, views: _PostTickViews | None = None) -> None:
         """Render the dashboard pane's live :class:`EconomyView` (Program 24 P2)
         and its HUD strip (Program 24 P4) — the tick/horizon counter, the five
         endgame axis progress bars, and the paced driver's lock/pause state.
@@ -1567,14 +1633,17 @@ class ArchiveApp(App[None]):
         (Constitution III.11: never a blank or fabricated repaint) whenever
         their own accessor returns ``None`` — one pane's absence never blocks
         the other's live repaint.
+
+        :param views: a post-tick prefetch to paint from instead of calling
+            the campaign on the event loop (:meth:`_refresh_after_tick`).
         """
         if self.campaign is None:
             return
         dashboard = self.query_one(DashboardView)
-        view = self.campaign.dashboard_view()
+        view = views.dashboard if views is not None else self.campaign.dashboard_view()
         if view is not None:
             dashboard.render_economy(view)
-        status = self.campaign.endgame_status()
+        status = views.endgame if views is not None else self.campaign.endgame_status()
         if status is not None:
             driver = self.driver
             dashboard.render_hud(
@@ -1588,7 +1657,7 @@ class ArchiveApp(App[None]):
                 pause_summary=driver.pause_summary if driver is not None else None,
             )
 
-    def _refresh_action_bar(self) -> None:
+    def _refresh_action_bar(self, views: _PostTickViews | None = None) -> None:
         """Render the bottom action bar's live verb plate (Program 24 P5) — the
         player's first real write-path onto the world.
 
@@ -1608,10 +1677,13 @@ class ArchiveApp(App[None]):
         header the old ``Panel(title=...)`` used to carry, now CSS chrome
         (see :mod:`babylon.tui.app`'s own CSS comment) — so the two always
         repaint together, never one stale against the other.
+
+        :param views: a post-tick prefetch to paint from instead of calling
+            the campaign on the event loop (:meth:`_refresh_after_tick`).
         """
         if self.campaign is None:
             return
-        view = self.campaign.verb_plate_view()
+        view = views.verb_plate if views is not None else self.campaign.verb_plate_view()
         if view is not None:
             bar = self.query_one("#action-bar", Static)
             bar.update(render_verb_plate(view))
@@ -1669,8 +1741,9 @@ class ArchiveApp(App[None]):
         behavior), so the rail is left exactly as it last rendered — either the
         boot-time honest "the wire is quiet" fence (Constitution III.11) when no
         tick has ever produced an event, or the prior history when it has. Called
-        with ONE tick's events from :meth:`action_advance_tick`, and with every
-        tick's events (concatenated, in order) from a ``run_until_paused`` batch.
+        with ONE tick's events from :meth:`action_advance_tick`, and once per
+        tick, as each lands, while a ``run_until_paused`` batch streams
+        (:meth:`_paint_streamed_tick`).
 
         Unit "chronicle-row-nav-salience" (shell-interconnect): the rail is a
         row-addressable :class:`~textual.widgets.OptionList` now (was a plain
@@ -1718,7 +1791,11 @@ class ArchiveApp(App[None]):
             return self.campaign.subject_view(subject_id)
         return self._subject_views.get(subject_id)
 
-    def _populate_watchlist_options(self, rail: OptionList) -> None:
+    def _populate_watchlist_options(
+        self,
+        rail: OptionList,
+        prefetched: Mapping[str, ProjectionRecord | None] | None = None,
+    ) -> None:
         """Fill ``rail`` with one :class:`~textual.widgets.option_list.Option`
         per :func:`~babylon.tui.watchlist.watchlist_rows` row (Unit
         "watchlist-row-nav", shell-interconnect) — shared by :meth:`compose`'s
@@ -1747,16 +1824,25 @@ class ArchiveApp(App[None]):
             explicitly (never queried internally) so :meth:`compose` can call
             this before the widget is even mounted, exactly as the old
             ``Static(render_watchlist(...))`` constructor argument did.
+        :param prefetched: views already resolved off the event loop, keyed
+            by pinned id; an id pinned since that prefetch started resolves
+            live as before.
         """
+        prefetched = prefetched or {}
         views_by_id = {
             subject_id: view
             for subject_id in self.watchlist.pinned_ids
-            if (view := self._resolve_subject_view(subject_id)) is not None
+            if (
+                view := prefetched[subject_id]
+                if subject_id in prefetched
+                else self._resolve_subject_view(subject_id)
+            )
+            is not None
         }
         for entity_id, text in watchlist_rows(self.watchlist.pinned_ids, views_by_id):
             rail.add_option(Option(text, id=entity_id, disabled=entity_id is None))
 
-    def _refresh_watchlist(self) -> None:
+    def _refresh_watchlist(self, views: _PostTickViews | None = None) -> None:
         """Repaint the right rail from :attr:`watchlist` (Program 24 P6).
 
         Stacks one :func:`~babylon.tui.peek.peek` ``depth=0`` stat-plate row
@@ -1792,11 +1878,14 @@ class ArchiveApp(App[None]):
         :meth:`~babylon.tui.campaign_menu.LobbyScreen._reload` already keeps
         its own highlight sane across a rebuild, so a live tick refresh never
         yanks the player's cursor off the row they were on.
+
+        :param views: a post-tick prefetch whose subject views to paint
+            instead of resolving every pin on the event loop.
         """
         rail = self.query_one("#watchlist-rail", OptionList)
         previous = rail.highlighted
         rail.clear_options()
-        self._populate_watchlist_options(rail)
+        self._populate_watchlist_options(rail, views.subject_views if views is not None else None)
         if self.watchlist.pinned_ids:
             rail.highlighted = min(previous or 0, rail.option_count - 1)
         rail.border_title = watchlist_title(self.watchlist.pinned_ids)
@@ -2011,7 +2100,9 @@ class ArchiveApp(App[None]):
         """
         return make_parser_factory(self._resolver)()
 
-    def _refresh_known_entities(self, campaign: CampaignHandle) -> None:
+    def _refresh_known_entities(
+        self, campaign: CampaignHandle, subjects: frozenset[str] | None = None
+    ) -> None:
         """Recompute :attr:`known_entities`/``_resolver`` from the live
         campaign's vault, IF the baked subject set actually changed (Unit
         U1). Pages bake once per committed tick, so most ticks contribute
@@ -2019,8 +2110,11 @@ class ArchiveApp(App[None]):
         unnecessary resolver rebuild.
 
         :param campaign: the live campaign to re-scan.
+        :param subjects: its already-scanned subject set (a post-tick
+            prefetch), skipping the re-scan here.
         """
-        subjects = campaign.known_subjects()
+        if subjects is None:
+            subjects = campaign.known_subjects()
         if subjects == self.known_entities:
             return
         self.known_entities = subjects
@@ -2049,7 +2143,14 @@ class ArchiveApp(App[None]):
         crumbs = self.nav.trail.entries[-_BREADCRUMB_DISPLAY:]
         bar.first(Label).update(" › ".join(crumbs))
 
-    async def _navigate(self, subject: str, *, record: bool = True, reveal: bool = True) -> None:
+    async def _navigate(
+        self,
+        subject: str,
+        *,
+        record: bool = True,
+        reveal: bool = True,
+        views: _PostTickViews | None = None,
+    ) -> None:
         """Show ``subject``'s page (or its loud absence page).
 
         Unit "navigate-pane-couple" (shell-interconnect): before this fix, every
@@ -2071,8 +2172,13 @@ class ArchiveApp(App[None]):
             jumplist and trail) or a jumplist walk (already recorded).
         :param reveal: whether to switch ``#main`` to the Wiki pane so this
             update is actually visible.
+        :param views: a post-tick prefetch; its page is used when it was
+            read for this same ``subject``.
         """
-        page = self._pages(subject)
+        if views is not None and views.subject == subject:
+            page = views.page
+        else:
+            page = self._pages(subject)
         document = page if page is not None else _absence_page(subject)
         # Unit "peek-hover-wire" (shell-interconnect): a page swap retires
         # whatever wikilink the overlay/cursor last referred to — a stale
@@ -2099,7 +2205,9 @@ class ArchiveApp(App[None]):
             self._focus_current_surface()
         self._refresh_tutorial_progress()
 
-    async def _refresh_after_tick(self, chronicle: Sequence[ChronicleEvent]) -> None:
+    async def _refresh_after_tick(
+        self, chronicle: Sequence[ChronicleEvent], views: _PostTickViews | None = None
+    ) -> None:
         """Bundle the six post-tick pane refreshes shared by
         :meth:`action_advance_tick`/:meth:`action_run_until_paused` (Unit
         "post-tick-fanout", shell-interconnect).
@@ -2131,23 +2239,58 @@ class ArchiveApp(App[None]):
         OUTSIDE this bundle — each caller still updates its own status line
         first, then calls :meth:`_refresh_tutorial_progress` last, unchanged.
 
+        Both tick paths hand in a :class:`_PostTickViews` prefetched on a
+        worker thread (:meth:`_prefetch_after_tick`), so this bundle only
+        paints; with ``views=None`` each refresh reads the campaign itself.
+
         :param chronicle: this tick's (or run-until-paused batch's)
             chronicle events, in order — threaded straight through to
             :meth:`_refresh_chronicle`.
+        :param views: the post-tick prefetch to paint from, if any.
         """
         if self.campaign is not None:
-            self._refresh_known_entities(self.campaign)
-        self._refresh_dashboard()
-        self._refresh_action_bar()
+            self._refresh_known_entities(
+                self.campaign, views.known_subjects if views is not None else None
+            )
+        self._refresh_dashboard(views)
+        self._refresh_action_bar(views)
         self._refresh_chronicle(chronicle)
-        self._refresh_watchlist()
+        self._refresh_watchlist(views)
         subject = self.nav.current
         if subject is not None:
             # reveal=False: refresh the currently-shown subject's dossier
             # content in place — never yank a player parked on the
             # Dashboard/Map/Topology pane back to the Wiki pane just
             # because a tick advanced (``_navigate``'s own docstring).
-            await self._navigate(subject, record=False, reveal=False)
+            await self._navigate(subject, record=False, reveal=False, views=views)
+
+    async def _prefetch_after_tick(self) -> _PostTickViews | None:
+        """Resolve :func:`_prefetch_post_tick_views` on a worker thread for
+        the pins and subject showing NOW (after the tick committed), so a
+        pin or jump made while the tick ran is already reflected.
+
+        :returns: the prefetch, or ``None`` with no live :attr:`campaign`.
+        """
+        if self.campaign is None:
+            return None
+        return await asyncio.to_thread(
+            _prefetch_post_tick_views,
+            self.campaign,
+            self._pages,
+            self.watchlist.pinned_ids,
+            self.nav.current,
+        )
+
+    def _paint_streamed_tick(self, result: TickOutcome) -> None:
+        """Paint one tick streamed out of a running ``r`` (its chronicle and
+        a progress status line) — the cheap per-tick slice of
+        :meth:`_refresh_after_tick`; the projection-heavy panes repaint
+        once when the run stops.
+
+        :param result: the tick just resolved on the driver's thread.
+        """
+        self._refresh_chronicle(result.chronicle)
+        self.query_one("#status", Label).update(f"status: running — tick {result.tick}")
 
     async def action_jump_back(self) -> None:
         """``[`` (alias ``Ctrl-O``): walk back one jumplist step, if there is one.
@@ -2182,6 +2325,7 @@ class ArchiveApp(App[None]):
                 "status: at the jumplist end — nothing further forward"
             )
 
+    @work()
     async def action_advance_tick(self) -> None:
         """``t``: advance the live campaign one tick (Program v1.0.0 Unit
         C2; routed through :attr:`driver` when Unit C3 wired one).
@@ -2215,11 +2359,23 @@ class ArchiveApp(App[None]):
         plus the dossier's own in-place repaint and (issue #281's fix) the
         watchlist rail's, now live in one shared :meth:`_refresh_after_tick`
         helper — see its own docstring for the exact call order preserved.
+
+        A Textual worker, like ``r``: the tick itself (engine, persistence,
+        vault bake) and then the post-tick projection reads
+        (:meth:`_prefetch_after_tick`) both run via :func:`asyncio.to_thread`,
+        so the UI keeps rendering and taking input for the seconds a
+        national-scope tick takes; only the final paint runs on the event
+        loop. A second ``t`` (or ``r``) while one is in flight refuses on
+        :attr:`_tick_in_flight` — with or without a driver.
         """
         status = self.query_one("#status", Label)
         if self.campaign is None:
             status.update("status: no live campaign attached — nothing to advance")
             return
+        if self._tick_in_flight:
+            status.update("status: a tick is already in progress — please wait")
+            return
+        advance: Callable[[], TickOutcome]
         if self.driver is not None:
             if self.driver.locked:
                 status.update(f"status: campaign ended — {self.driver.lock_reason}")
@@ -2233,10 +2389,16 @@ class ArchiveApp(App[None]):
             if self.driver.busy:
                 status.update("status: a run is already in progress — please wait")
                 return
-            result: TickOutcome = self.driver.advance_once()
+            advance = self.driver.advance_once
         else:
-            result = self.campaign.advance_tick()
-        await self._refresh_after_tick(result.chronicle)
+            advance = self.campaign.advance_tick
+        self._tick_in_flight = True
+        try:
+            result = await asyncio.to_thread(advance)
+            views = await self._prefetch_after_tick()
+        finally:
+            self._tick_in_flight = False
+        await self._refresh_after_tick(result.chronicle, views)
         paused_marker = " [PAUSED]" if result.paused else ""
         status.update(f"status: tick {result.tick}{paused_marker}")
         self._refresh_tutorial_progress()
@@ -2277,6 +2439,12 @@ class ArchiveApp(App[None]):
         :meth:`action_advance_tick`'s own :meth:`_refresh_after_tick` bundle —
         see that method's docstring for the exact call order preserved,
         including the watchlist-rail fix (issue #281).
+
+        Streams: each tick's chronicle and a ``running — tick N`` status line
+        paint as the driver resolves it (``on_tick``, marshalled back with
+        :meth:`~textual.app.App.call_from_thread`), instead of one repaint
+        after the whole run; the dashboard/action bar/watchlist/dossier then
+        repaint once from an off-loop prefetch when the run stops.
         """
         status = self.query_one("#status", Label)
         if self.driver is None:
@@ -2291,13 +2459,21 @@ class ArchiveApp(App[None]):
                 "— press 'a' to acknowledge"
             )
             return
-        if self.driver.busy:
+        if self.driver.busy or self._tick_in_flight:
             status.update("status: a run is already in progress — please wait")
             return
-        results = await asyncio.to_thread(self.driver.run_until_paused)
+        self._tick_in_flight = True
+        try:
+            results = await asyncio.to_thread(
+                self.driver.run_until_paused,
+                on_tick=lambda result: self.call_from_thread(self._paint_streamed_tick, result),
+            )
+            views = await self._prefetch_after_tick()
+        finally:
+            self._tick_in_flight = False
         last = results[-1]
-        chronicle = tuple(event for result in results for event in result.chronicle)
-        await self._refresh_after_tick(chronicle)
+        # The chronicle already streamed tick by tick (_paint_streamed_tick).
+        await self._refresh_after_tick((), views)
         if self.driver.locked:
             status.update(
                 f"status: ran to tick {last.tick} — campaign ended ({self.driver.lock_reason})"
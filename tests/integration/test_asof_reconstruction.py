@@ -4,7 +4,9 @@ Drives a seeded-random sparse write history through the REAL persistence
 path (``select_hex_rows_for_emission`` → ``persist_tick_atomic``) while
 maintaining the dense frame in memory, then asserts ``v_hex_state_asof``
 reproduces the dense frame exactly at every committed tick — including
-ticks where nothing was written.
+ticks where nothing was written. The checkpoint-bounded single-tick read
+``hex_state_asof(session, tick)`` (migration 0041) must agree with it
+across a checkpoint boundary.
 """
 
 from __future__ import annotations
@@ -30,6 +32,7 @@ _H3S = [
     "872a91051ffffff",
 ]
 _TICKS = 8  # small but crosses several no-write ticks
+_CHECKPOINT_SPAN_TICKS = 60  # past the tick-52 checkpoint
 
 
 @pytest.fixture(scope="module")
@@ -58,41 +61,49 @@ def _row(session: Any, tick: int, h3: str, v: float, k: float) -> DynamicHexStat
     )
 
 
-def test_asof_view_reproduces_dense_frame_at_every_tick(migrated_pool: Any) -> None:
-    rng = random.Random(42)
-    session = uuid4()
-    ensure_session_partitions(pool=migrated_pool, session_id=session)
-
+def _persist_sparse_history(
+    pool: Any, session: Any, ticks: int
+) -> dict[int, dict[str, tuple[float, float]]]:
+    """Persist a seeded-random sparse history; return the dense ground truth."""
     from babylon.persistence.postgres_runtime import PostgresRuntime
 
-    runtime = PostgresRuntime(pool=migrated_pool)
+    rng = random.Random(42)
+    runtime = PostgresRuntime(pool=pool)
 
     # In-memory ground truth: (v, k) per hex per tick.
     dense: dict[int, dict[str, tuple[float, float]]] = {}
     values: dict[str, tuple[float, float]] = dict.fromkeys(_H3S, (10.0, 100.0))
     last_emitted: dict[str, tuple[float, ...]] = {}
 
-    try:
-        for tick in range(_TICKS):
-            # Randomly mutate a random subset of hexes (possibly none).
-            for h3 in _H3S:
-                if tick > 0 and rng.random() < 0.35:
-                    v, k = values[h3]
-                    values[h3] = (round(v + rng.random(), 6), round(k + rng.random(), 6))
-            dense[tick] = dict(values)
-
-            frame = [_row(session, tick, h3, *values[h3]) for h3 in _H3S]
-            emitted = select_hex_rows_for_emission(
-                tick=tick, candidate_rows=frame, last_emitted=last_emitted
-            )
-            runtime.persist_tick_atomic(
-                PerTickTransactionEnvelope(
-                    session_id=session,
-                    tick=tick,
-                    hex_state_rows=emitted,
-                    determinism_hash=f"{tick:064d}"[:64],
-                )
+    for tick in range(ticks):
+        # Randomly mutate a random subset of hexes (possibly none).
+        for h3 in _H3S:
+            if tick > 0 and rng.random() < 0.35:
+                v, k = values[h3]
+                values[h3] = (round(v + rng.random(), 6), round(k + rng.random(), 6))
+        dense[tick] = dict(values)
+
+        frame = [_row(session, tick, h3, *values[h3]) for h3 in _H3S]
+        emitted = select_hex_rows_for_emission(
+            tick=tick, candidate_rows=frame, last_emitted=last_emitted
+        )
+        runtime.persist_tick_atomic(
+            PerTickTransactionEnvelope(
+                session_id=session,
+                tick=tick,
+                hex_state_rows=emitted,
+                determinism_hash=f"{tick:064d}"[:64],
             )
+        )
+    return dense
+
+
+def test_asof_view_reproduces_dense_frame_at_every_tick(migrated_pool: Any) -> None:
+    session = uuid4()
+    ensure_session_partitions(pool=migrated_pool, session_id=session)
+
+    try:
+        dense = _persist_sparse_history(migrated_pool, session, _TICKS)
 
         # Reconstruction must equal the dense ground truth at EVERY tick.
         with migrated_pool.connection() as conn:
@@ -119,3 +130,32 @@ def test_asof_view_reproduces_dense_frame_at_every_tick(migrated_pool: Any) -> N
         assert n is not None and int(n[0]) < _TICKS * len(_H3S)
     finally:
         drop_session_partitions(pool=migrated_pool, session_id=session)
+
+
+def test_checkpoint_bounded_read_matches_dense_frame_across_a_checkpoint(
+    migrated_pool: Any,
+) -> None:
+    session = uuid4()
+    ensure_session_partitions(pool=migrated_pool, session_id=session)
+
+    try:
+        dense = _persist_sparse_history(migrated_pool, session, _CHECKPOINT_SPAN_TICKS)
+
+        with migrated_pool.connection() as conn:
+            for tick in range(_CHECKPOINT_SPAN_TICKS):
+                rows = conn.execute(
+                    "SELECT h3_index, v, k, written_at_tick FROM hex_state_asof(%s, %s)",
+                    (str(session), tick),
+                ).fetchall()
+                frame = {str(h3): (float(v), float(k)) for h3, v, k, _written in rows}
+                assert frame == dense[tick], f"tick {tick} diverged"
+                if tick >= 52:
+                    assert min(int(row[3]) for row in rows) >= 52, "read crossed its checkpoint"
+
+            uncommitted = conn.execute(
+                "SELECT count(*) FROM hex_state_asof(%s, %s)",
+                (str(session), _CHECKPOINT_SPAN_TICKS),
+            ).fetchone()
+        assert uncommitted is not None and int(uncommitted[0]) == 0
+    finally:
+        drop_session_partitions(pool=migrated_pool, session_id=session)
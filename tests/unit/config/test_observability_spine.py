@@ -77,7 +77,13 @@ ENGINE_HOT_PATH_LOGGING_BASELINE: frozenset[str] = frozenset(
         "engine/headless_runner/lodes_hydration.py",
         "engine/headless_runner/runner.py",
         "engine/headless_runner/storage_probe.py",
+        # Write-behind persister beside runner.py: logs a writer failure it
+        # must not raise over an exception already unwinding the tick loop.
+        "engine/headless_runner/write_behind.py",
         "engine/hydration/reference.py",
+        # Warm-start scenario cache: startup plumbing beside reference.py,
+        # warns on unreadable/unwritable entries instead of failing silently.
+        "engine/hydration/warm_start.py",
         "engine/observer_adapter.py",
         "engine/observers/causal.py",
         "engine/observers/economic.py",
@@ -86,6 +92,9 @@ ENGINE_HOT_PATH_LOGGING_BASELINE: frozenset[str] = frozenset(
         "engine/optimization/bayesian.py",
         "engine/scenarios/_legacy.py",
         "engine/simulation_engine.py",
+        # Resident-graph stepping API: repeats simulation_engine.step()'s
+        # insolvent-state warning so both paths log the same line.
+        "engine/simulation_session.py",
         "engine/simulation/_legacy.py",
         "engine/systems/community.py",
         "engine/systems/contradiction_field.py",
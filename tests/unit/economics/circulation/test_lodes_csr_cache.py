@@ -0,0 +1,150 @@
+"""Contract tests for the LODES columnar parse + on-disk CSR cache (Spec 063).
+
+Synthetic gzip fixtures (a five-block crosswalk, one Michigan OD year) stand
+in for the real dataset: the columnar parse must apply the row-loop filter
+exactly, and a cached year must rebuild bit-identically without touching the
+crosswalk again.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import logging
+from pathlib import Path
+
+import h3
+import numpy as np
+import pytest
+
+from babylon.domain.economics import lodes_commute_matrix
+from babylon.domain.economics.lodes_commute_matrix import LODESCommuteMatrixLoader
+from babylon.domain.economics.node_kinds import NodeKind
+
+pytestmark = [pytest.mark.unit]
+
+pytest.importorskip("pyarrow")
+
+# Two in-area blocks on one hex, one on another, one out of area, one unmapped.
+_DETROIT = (42.3314, -83.0458)
+_DEARBORN = (42.3223, -83.1763)
+_LANSING = (42.7325, -84.5555)
+_HEX_A = h3.latlng_to_cell(*_DETROIT, 7)
+_HEX_B = h3.latlng_to_cell(*_DEARBORN, 7)
+_BLOCKS = {
+    "261635001001000": _DETROIT,
+    "261635001001001": _DETROIT,
+    "261635002002000": _DEARBORN,
+    "260650001001000": _LANSING,
+}
+
+
+def _write_gz_csv(path: Path, header: list[str], rows: list[list[object]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, mode="wt", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _fixture(tmp_path: Path) -> tuple[Path, Path]:
+    lodes_root = tmp_path / "lodes"
+    crosswalk = lodes_root / "us_xwalk.csv.gz"
+    _write_gz_csv(
+        crosswalk,
+        ["tabblk2020", "blklatdd", "blklondd"],
+        [[block, lat, lng] for block, (lat, lng) in _BLOCKS.items()],
+    )
+    _write_gz_csv(
+        lodes_root / "od" / "mi_od_main_JT00_2010.csv.gz",
+        ["w_geocode", "h_geocode", "S000"],
+        [
+            ["261635002002000", "261635001001000", 4],  # A -> B
+            ["261635002002000", "261635001001001", 3],  # A -> B (same hex pair)
+            ["260650001001000", "261635001001000", 2],  # A -> out of area
+            ["999999999999999", "261635002002000", 5],  # B -> unmapped block
+            ["261635001001000", "260650001001000", 7],  # out-of-area home: dropped
+            ["261635001001000", "261635002002000", 0],  # zero workers: dropped
+        ],
+    )
+    return lodes_root, crosswalk
+
+
+def _loader(lodes_root: Path, crosswalk: Path, cache_dir: Path) -> LODESCommuteMatrixLoader:
+    return LODESCommuteMatrixLoader(
+        lodes_root=lodes_root,
+        crosswalk_path=crosswalk,
+        study_area_hexes=frozenset([_HEX_A, _HEX_B]),
+        study_area_states=frozenset(["26"]),
+        cache_dir=cache_dir,
+    )
+
+
+def test_columnar_parse_matches_row_filter(tmp_path: Path) -> None:
+    lodes_root, crosswalk = _fixture(tmp_path)
+    matrix = _loader(lodes_root, crosswalk, tmp_path / "cache").load_year(2010)
+
+    dense = matrix.matrix.toarray()
+    pairs = {
+        (origin, dest): dense[row, matrix.dest_to_col[dest]]
+        for origin, row in matrix.origin_hex_to_row.items()
+        for dest in matrix.dest_to_col
+        if dense[row, matrix.dest_to_col[dest]]
+    }
+    assert pairs == {
+        (_HEX_A, _HEX_B): 7.0,
+        (_HEX_A, "rest_of_usa"): 2.0,
+        (_HEX_B, "rest_of_usa"): 5.0,
+    }
+    kinds = dict(zip(matrix.dest_node_id_by_col, matrix.dest_kind_by_col, strict=True))
+    assert kinds == {_HEX_B: NodeKind.HEX, "rest_of_usa": NodeKind.EXTERNAL}
+
+
+def test_cached_year_rebuilds_identically_without_the_crosswalk(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    lodes_root, crosswalk = _fixture(tmp_path)
+    built = _loader(lodes_root, crosswalk, tmp_path / "cache").load_year(2010)
+
+    def _no_crosswalk(self: LODESCommuteMatrixLoader) -> dict[str, str]:
+        raise AssertionError("cache hit must not rebuild the block->hex map")
+
+    monkeypatch.setattr(LODESCommuteMatrixLoader, "_build_block_to_hex_map", _no_crosswalk)
+    cached = _loader(lodes_root, crosswalk, tmp_path / "cache").load_year(2010)
+
+    assert cached.origin_hex_to_row == built.origin_hex_to_row
+    assert cached.dest_node_id_by_col == built.dest_node_id_by_col
+    assert cached.dest_kind_by_col == built.dest_kind_by_col
+    assert np.array_equal(cached.matrix.toarray(), built.matrix.toarray())
+    assert np.array_equal(cached.row_sums, built.row_sums)
+
+
+def test_changed_input_misses_the_cache(tmp_path: Path) -> None:
+    lodes_root, crosswalk = _fixture(tmp_path)
+    first = _loader(lodes_root, crosswalk, tmp_path / "cache")
+    first.load_year(2010)
+    entry = first._cache_entry(2010)
+
+    _write_gz_csv(
+        lodes_root / "od" / "mi_od_main_JT00_2010.csv.gz",
+        ["w_geocode", "h_geocode", "S000"],
+        [["261635002002000", "261635001001000", 1]],
+    )
+    second = _loader(lodes_root, crosswalk, tmp_path / "cache")
+
+    assert second._cache_entry(2010) != entry
+    assert second.load_year(2010).matrix.sum() == 1.0
+
+
+def test_unwritable_cache_is_logged_and_skipped(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    lodes_root, crosswalk = _fixture(tmp_path)
+    cache_dir = tmp_path / "file-not-dir"
+    cache_dir.write_bytes(b"")
+
+    with caplog.at_level(logging.WARNING, logger=lodes_commute_matrix.__name__):
+        matrix = _loader(lodes_root, crosswalk, cache_dir).load_year(2010)
+
+    assert matrix.matrix.sum() == 14.0
+    assert "not written" in caplog.text
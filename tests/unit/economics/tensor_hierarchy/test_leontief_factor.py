@@ -0,0 +1,170 @@
+"""Unit tests for the cached Leontief LU factorization.
+
+Feature: 025-tensor-hierarchy
+
+Factored solves must agree with ``np.linalg.inv``; a repeated (year, A)
+must be a cache hit while a changed A under the same year is not; a
+Sherman–Morrison–Woodbury update must agree with refactoring the
+perturbed matrix.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from babylon.domain.economics.tensor_hierarchy.inter_industry import DefaultLeontiefComputer
+from babylon.domain.economics.tensor_hierarchy.leontief_factor import (
+    LeontiefFactor,
+    LeontiefFactorCache,
+)
+from babylon.domain.economics.tensor_hierarchy.production_chain_rent import (
+    ProductionChainDecomposer,
+)
+from babylon.domain.economics.tensor_hierarchy.types import (
+    ImportShareVector,
+    InterIndustryFlow,
+    IOTableType,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.math]
+
+
+def _productive(n: int, seed: int = 0) -> np.ndarray:
+    """Random A with every column sum 0.8 (Hawkins-Simon holds)."""
+    rng = np.random.default_rng(seed)
+    a_matrix = rng.random((n, n))
+    return np.asarray(0.8 * a_matrix / a_matrix.sum(axis=0))
+
+
+class TestLeontiefFactor:
+    def test_inverse_matches_numpy(self) -> None:
+        a_matrix = _productive(6)
+        factor = LeontiefFactor(a_matrix)
+        np.testing.assert_allclose(
+            factor.inverse(), np.linalg.inv(np.eye(6) - a_matrix), atol=1e-12
+        )
+        assert factor.inverse() is factor.inverse()
+        assert not factor.inverse().flags.writeable
+
+    def test_batch_solve_matches_inverse(self) -> None:
+        a_matrix = _productive(5)
+        demand = np.random.default_rng(1).random((5, 3))
+        factor = LeontiefFactor(a_matrix)
+        expected = np.linalg.inv(np.eye(5) - a_matrix)
+
+        np.testing.assert_allclose(factor.solve(demand), expected @ demand, atol=1e-12)
+        np.testing.assert_allclose(factor.solve(demand[:, 0]), expected @ demand[:, 0])
+        np.testing.assert_allclose(
+            factor.solve_transpose(demand[:, 0]), demand[:, 0] @ expected, atol=1e-12
+        )
+
+    def test_singular_raises(self) -> None:
+        with pytest.raises(np.linalg.LinAlgError):
+            LeontiefFactor(np.array([[0.5, 0.5], [0.5, 0.5]]))
+
+    def test_rejects_non_square(self) -> None:
+        with pytest.raises(ValueError, match="square"):
+            LeontiefFactor(np.zeros((2, 3)))
+
+
+class TestWoodburyUpdate:
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {(2, 1): 0.0},  # one cell
+            {(0, 3): 0.0, (4, 3): 0.05, (1, 3): 0.0},  # one column (sanction)
+            {(2, j): 0.01 for j in range(6)},  # one row (tariff)
+            {(0, 0): 0.1, (5, 2): 0.0, (3, 4): 0.2},  # scattered
+        ],
+    )
+    def test_matches_refactorization(self, changes: dict[tuple[int, int], float]) -> None:
+        a_matrix = _productive(6, seed=2)
+        perturbed = a_matrix.copy()
+        for (i, j), value in changes.items():
+            perturbed[i, j] = value
+        demand = np.random.default_rng(3).random((6, 2))
+        update = LeontiefFactor(a_matrix).perturbed(changes)
+        exact = LeontiefFactor(perturbed)
+
+        assert update.rank <= len(changes)
+        np.testing.assert_allclose(update.solve(demand), exact.solve(demand), atol=1e-10)
+        np.testing.assert_allclose(
+            update.solve_transpose(demand), exact.solve_transpose(demand), atol=1e-10
+        )
+
+    def test_no_op_change_is_rank_zero(self) -> None:
+        a_matrix = _productive(4)
+        update = LeontiefFactor(a_matrix).perturbed({(1, 2): float(a_matrix[1, 2])})
+        demand = np.ones(4)
+        assert update.rank == 0
+        np.testing.assert_allclose(update.solve(demand), LeontiefFactor(a_matrix).solve(demand))
+
+    def test_out_of_range_change(self) -> None:
+        with pytest.raises(IndexError):
+            LeontiefFactor(_productive(3)).perturbed({(3, 0): 0.0})
+
+
+class TestLeontiefFactorCache:
+    def test_same_year_and_matrix_hits(self) -> None:
+        cache = LeontiefFactorCache()
+        a_matrix = _productive(4)
+        first = cache.factor(2021, a_matrix)
+        assert cache.factor(2021, a_matrix.copy()) is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_changed_matrix_or_year_misses(self) -> None:
+        cache = LeontiefFactorCache()
+        a_matrix = _productive(4)
+        cache.factor(2021, a_matrix)
+        changed = a_matrix.copy()
+        changed[0, 0] += 1e-9
+        cache.factor(2021, changed)
+        cache.factor(2022, a_matrix)
+        assert (cache.hits, cache.misses) == (0, 3)
+
+    def test_lru_bound(self) -> None:
+        cache = LeontiefFactorCache(max_entries=1)
+        a_matrix = _productive(3)
+        cache.factor(2021, a_matrix)
+        cache.factor(2022, a_matrix)
+        cache.factor(2021, a_matrix)
+        assert cache.hits == 0
+
+    def test_singular_is_not_cached(self) -> None:
+        cache = LeontiefFactorCache()
+        singular = np.array([[0.5, 0.5], [0.5, 0.5]])
+        for _ in range(2):
+            with pytest.raises(np.linalg.LinAlgError):
+                cache.factor(2021, singular)
+        assert cache.misses == 2
+
+
+class TestCallersShareFactors:
+    def test_computer_reuses_factorization(self) -> None:
+        cache = LeontiefFactorCache()
+        computer = DefaultLeontiefComputer(cache=cache)
+        flow = InterIndustryFlow(
+            year=2021,
+            table_type=IOTableType.USE,
+            industries=["A", "B", "C"],
+            coefficients=_productive(3),
+        )
+        first = computer.compute_inverse(flow)
+        second = computer.compute_inverse(flow)
+        np.testing.assert_array_equal(first.inverse_matrix, second.inverse_matrix)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_decomposer_reuses_factorization(self) -> None:
+        cache = LeontiefFactorCache()
+        decomposer = ProductionChainDecomposer(cache=cache)
+        flow = InterIndustryFlow(
+            year=2022, industries=["1", "2"], table_type="USE", coefficients=_productive(2)
+        )
+        shares = ImportShareVector(year=2022, industries=["1", "2"], shares=np.array([0.2, 0.5]))
+        for _ in range(3):
+            decomposed = decomposer.decompose(flow, shares)
+        np.testing.assert_allclose(
+            decomposed.L_d, np.linalg.inv(np.eye(2) - decomposed.A_d), atol=1e-12
+        )
+        assert (cache.hits, cache.misses) == (2, 1)
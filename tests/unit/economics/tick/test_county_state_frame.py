@@ -0,0 +1,91 @@
+"""Tests for the struct-of-arrays county frame behind Step 3a.
+
+Feature: 017-simulation-tick-dynamics
+
+``_build_county_frame`` must produce exactly the states the per-county
+model loop produced: bulk ``*_many`` source lookups and the scalar fallback
+agree, an absent county-year keeps its carried value, and the frame
+round-trips through materialized models.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import pytest
+
+from babylon.domain.economics.tick.frame import CountyStateFrame, lookup_many
+from babylon.domain.economics.tick.system import TickDynamicsSystem
+from babylon.engine.services import ServiceContainer
+from tests.unit.economics.tick.conftest import WAYNE_FIPS
+
+pytestmark = [pytest.mark.unit]
+
+OAKLAND_FIPS = "26125"
+_RATES = {WAYNE_FIPS: 0.102}
+
+
+class _ScalarUnemploymentSource:
+    def get_county_unemployment_rate(self, fips: str, year: int) -> float | None:
+        return _RATES.get(fips)
+
+
+class _BulkUnemploymentSource:
+    def __init__(self) -> None:
+        self.bulk_calls = 0
+
+    def get_county_unemployment_rate(self, fips: str, year: int) -> float | None:
+        raise AssertionError("bulk lookup must not fall back to per-county calls")
+
+    def get_county_unemployment_rate_many(self, fips: Sequence[str], year: int) -> np.ndarray:
+        self.bulk_calls += 1
+        return np.array([_RATES.get(code, np.nan) for code in fips])
+
+
+def test_lookup_many_prefers_bulk_and_matches_scalar_fallback() -> None:
+    fips = [WAYNE_FIPS, OAKLAND_FIPS]
+    bulk = _BulkUnemploymentSource()
+
+    bulk_values = lookup_many(bulk, "get_county_unemployment_rate", fips, 2011)
+    scalar_values = lookup_many(
+        _ScalarUnemploymentSource(), "get_county_unemployment_rate", fips, 2011
+    )
+
+    assert bulk.bulk_calls == 1
+    np.testing.assert_array_equal(bulk_values, scalar_values)
+    assert np.isnan(scalar_values[1])
+
+
+def test_bulk_source_feeds_frame_and_absent_rows_keep_default() -> None:
+    services = ServiceContainer.create(unemployment_source=_BulkUnemploymentSource())
+
+    states = TickDynamicsSystem()._compute_county_states(
+        2011, [WAYNE_FIPS, OAKLAND_FIPS], services, None
+    )
+
+    assert states[WAYNE_FIPS].unemployment_rate == pytest.approx(0.102)
+    assert states[OAKLAND_FIPS].unemployment_rate == pytest.approx(0.05)
+
+
+def test_frame_round_trips_through_models() -> None:
+    system = TickDynamicsSystem()
+    services = ServiceContainer.create(unemployment_source=_ScalarUnemploymentSource())
+    states = system._compute_county_states(2011, [WAYNE_FIPS, OAKLAND_FIPS], services, None)
+
+    frame = CountyStateFrame.from_states(states)
+
+    assert frame.fips == (WAYNE_FIPS, OAKLAND_FIPS)
+    assert frame.to_states() == states
+
+
+def test_next_year_carries_previous_state_forward() -> None:
+    system = TickDynamicsSystem()
+    services = ServiceContainer.create()
+    first = system._compute_county_states(2011, [WAYNE_FIPS], services, None)
+    first[WAYNE_FIPS] = first[WAYNE_FIPS].model_copy(update={"median_wage": 24.5})
+
+    frame = system._build_county_frame(2012, [WAYNE_FIPS], services, first)
+
+    assert frame.median_wage[0] == 24.5
+    assert frame.class_distribution[0].year == 2012
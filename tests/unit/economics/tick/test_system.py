@@ -20,6 +20,7 @@ from babylon.domain.economics.distribution.types import SurplusValueDistribution
 from babylon.domain.economics.dynamics.types import ClassDistribution
 from babylon.domain.economics.reserve_army.types import ReserveArmyState
 from babylon.domain.economics.tensor import NoDataSentinel
+from babylon.domain.economics.tick.frame import CountyStateFrame
 from babylon.domain.economics.tick.graph_bridge import read_national_financial_state_from_graph
 from babylon.domain.economics.tick.system import (
     DEFAULT_V_REPRODUCTION,
@@ -1833,9 +1834,10 @@ class TestDerivePrecarity:
             lumpenproletariat_share=0.20,
         )
         county = _make_county(class_distribution=dist, unemployment_rate=0.05)
-        states = {WAYNE_FIPS: county}
+        frame = CountyStateFrame.from_states({WAYNE_FIPS: county})
 
-        result = system._derive_precarity(states)
+        system._derive_precarity(frame)
+        result = frame.to_states()
 
         # u6 = unemployment_rate + lumpenproletariat_share = 0.05 + 0.20 = 0.25
         assert result[WAYNE_FIPS].u6_rate == pytest.approx(0.25)
@@ -1853,9 +1855,10 @@ class TestDerivePrecarity:
             lumpenproletariat_share=0.15,
         )
         county = _make_county(class_distribution=dist, unemployment_rate=0.053)
-        states = {WAYNE_FIPS: county}
+        frame = CountyStateFrame.from_states({WAYNE_FIPS: county})
 
-        result = system._derive_precarity(states)
+        system._derive_precarity(frame)
+        result = frame.to_states()
 
         c = result[WAYNE_FIPS]
         # u6 = 0.053 + 0.15 = 0.203
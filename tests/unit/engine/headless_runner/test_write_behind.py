@@ -0,0 +1,163 @@
+"""Unit tests for the write-behind tick persister (``--write-behind``).
+
+Pins the pipeline's contract without Postgres: commits land in submission
+(tick) order, the queue bounds uncommitted ticks, a failed commit stops all
+later commits and surfaces on the engine thread, and post-commit callbacks
+fire only after their tick's commit. The ``_tick_loop`` case checks the
+pipelined loop commits exactly the ticks a synchronous loop would.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from babylon.engine.headless_runner.models import SimulationRunConfig
+from babylon.engine.headless_runner.runner import _tick_loop
+from babylon.engine.headless_runner.write_behind import WriteBehindPersister
+
+pytestmark = [pytest.mark.unit]
+
+
+_SESSION_ID = UUID("00000000-0000-0000-0000-000000000066")
+
+
+def _prepared(tick: int) -> Any:
+    return SimpleNamespace(tick=tick)
+
+
+class TestWriteBehindPersister:
+    """Ordering, back-pressure and failure semantics of the writer thread."""
+
+    def test_commits_in_submission_order_then_callbacks(self) -> None:
+        journal: list[str] = []
+
+        with WriteBehindPersister(lambda p: journal.append(f"commit:{p.tick}"), depth=2) as wb:
+            for tick in range(1, 6):
+                wb.submit(_prepared(tick), lambda t=tick: journal.append(f"observe:{t}"))
+
+        assert journal == [f"{kind}:{t}" for t in range(1, 6) for kind in ("commit", "observe")]
+        assert wb.last_committed_tick == 5
+
+    def test_submit_blocks_when_queue_full(self) -> None:
+        release = threading.Event()
+        started = threading.Event()
+
+        def commit(prepared: Any) -> None:
+            started.set()
+            release.wait()
+
+        wb = WriteBehindPersister(commit, depth=1)
+        wb.submit(_prepared(1))  # taken by the writer, blocks in commit
+        started.wait()
+        wb.submit(_prepared(2))  # fills the one-slot queue
+
+        blocked = threading.Thread(target=wb.submit, args=(_prepared(3),))
+        blocked.start()
+        blocked.join(timeout=0.2)
+        assert blocked.is_alive()
+
+        release.set()
+        blocked.join()
+        wb.close()
+        assert wb.last_committed_tick == 3
+
+    def test_failure_stops_later_commits_and_reraises(self) -> None:
+        committed: list[int] = []
+
+        def commit(prepared: Any) -> None:
+            if prepared.tick == 2:
+                raise ConnectionError("pool lost")
+            committed.append(prepared.tick)
+
+        wb = WriteBehindPersister(commit, depth=4)
+        for tick in (1, 2, 3, 4):
+            wb.submit(_prepared(tick))
+
+        with pytest.raises(ConnectionError, match="pool lost"):
+            wb.drain()
+        assert committed == [1]
+        assert wb.last_committed_tick == 1
+        with pytest.raises(ConnectionError):
+            wb.submit(_prepared(5))
+        with pytest.raises(ConnectionError):
+            wb.close()
+
+    def test_unwinding_exception_wins_over_writer_failure(self) -> None:
+        def commit(prepared: Any) -> None:
+            raise ConnectionError("pool lost")
+
+        with pytest.raises(KeyError), WriteBehindPersister(commit, depth=1) as wb:
+            wb.submit(_prepared(1))
+            raise KeyError("engine failure")
+
+    def test_depth_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match="depth"):
+            WriteBehindPersister(lambda _p: None, depth=0)
+
+
+class _PipelineBridge:
+    """Fake bridge exposing both the synchronous and split persist paths."""
+
+    def __init__(self) -> None:
+        self.committed: list[tuple[int, str]] = []
+        self.event_capture: Any = None
+        self.auditor: Any = None
+
+    def persist_tick(
+        self,
+        world: Any,
+        tick: int,
+        determinism_hash: str,
+        opposition_states: Any = None,
+    ) -> None:
+        self.commit_tick(self.prepare_tick(world, tick, determinism_hash, opposition_states))
+
+    def prepare_tick(
+        self,
+        world: Any,  # noqa: ARG002
+        tick: int,
+        determinism_hash: str,
+        opposition_states: Any = None,  # noqa: ARG002
+    ) -> Any:
+        return SimpleNamespace(tick=tick, determinism_hash=determinism_hash)
+
+    def commit_tick(self, prepared: Any) -> None:
+        self.committed.append((prepared.tick, prepared.determinism_hash))
+
+    def poll_endgame(self, world: Any, tick: int) -> Any:  # noqa: ARG002
+        return None
+
+
+def _config(write_behind_depth: int) -> SimulationRunConfig:
+    return SimulationRunConfig(
+        ticks=6,
+        scope_fips=frozenset({"26163"}),
+        external_node_ids=frozenset(),
+        output_dir=Path("/tmp/write_behind_test"),
+        write_behind_depth=write_behind_depth,
+    )
+
+
+def test_pipelined_tick_loop_commits_same_ticks_as_synchronous() -> None:
+    results = {}
+    for depth in (0, 2):
+        bridge = _PipelineBridge()
+        ticks_completed, endgame = _tick_loop(
+            bridge=bridge,  # type: ignore[arg-type]
+            world=object(),
+            runtime=None,
+            session_id=_SESSION_ID,
+            config=_config(depth),
+            per_tick_durations=[],
+        )
+        assert (ticks_completed, endgame) == (6, None)
+        results[depth] = bridge.committed
+
+    assert results[2] == results[0]
+    assert [tick for tick, _ in results[2]] == [0, 1, 2, 3, 4, 5]
@@ -315,6 +315,33 @@ class TestAutoCheckpointerGetLatest:
 
         assert result is None
 
+    def test_compressed_checkpoints_rotate_and_load(
+        self,
+        tmp_path: Path,
+        sample_world_state: WorldState,
+        sample_config: SimulationConfig,
+    ) -> None:
+        """compressed=True writes .ckpt files that rotate and load like JSON ones."""
+        from babylon.engine.history.auto_checkpoint import AutoCheckpointer
+        from babylon.engine.history.io import load_checkpoint
+        from babylon.engine.history.models import CheckpointConfig
+
+        config = CheckpointConfig(compressed=True, max_checkpoints=1)
+        checkpointer = AutoCheckpointer(config, base_dir=tmp_path)
+
+        checkpointer.force_checkpoint(sample_world_state, sample_config)
+        time.sleep(0.01)  # Ensure different mtime on fast systems
+        latest_path = checkpointer.force_checkpoint(
+            sample_world_state.model_copy(update={"tick": 10}),
+            sample_config,
+        )
+        checkpointer.rotate_checkpoints()
+
+        assert latest_path.suffix == ".ckpt"
+        assert list(checkpointer.checkpoint_dir.iterdir()) == [latest_path]
+        assert checkpointer.get_latest_checkpoint() == latest_path
+        assert load_checkpoint(latest_path).state.tick == 10
+
 
 # =============================================================================
 # CHECKPOINTED STEP WRAPPER TESTS
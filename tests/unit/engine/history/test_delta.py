@@ -0,0 +1,193 @@
+"""Tests for babylon.engine.history.delta and the delta-encoded stack.
+
+A delta must rebuild its target document exactly, and a stack built by
+push_state must hold one full snapshot (the newest) with every older
+state recoverable through undo and get_state_at_tick — including after
+truncation and pruning cut a delta chain.
+"""
+
+from typing import Any
+
+import pytest
+
+from babylon.models import WorldState
+
+
+def _advance(state: WorldState, tick: int) -> WorldState:
+    """A state one step later: log grows, one entity's wealth changes."""
+    entity_id = sorted(state.entities)[tick % len(state.entities)]
+    entity = state.entities[entity_id].model_copy(update={"wealth": 0.01 * tick})
+    return state.model_copy(
+        update={
+            "tick": tick,
+            "entities": {**state.entities, entity_id: entity},
+            "event_log": state.event_log.extended([f"tick {tick}"]),
+        }
+    )
+
+
+def _history(sample_world_state: WorldState, ticks: int) -> list[WorldState]:
+    states = [sample_world_state]
+    for tick in range(1, ticks):
+        states.append(_advance(states[-1], tick))
+    return states
+
+
+# =============================================================================
+# DOCUMENT DIFF TESTS
+# =============================================================================
+
+
+@pytest.mark.topology
+class TestDiffDocuments:
+    """diff_documents/apply_delta should round-trip JSON documents."""
+
+    @pytest.mark.parametrize(
+        ("base", "target"),
+        [
+            ({"a": 1, "m": {"x": 1}}, {"a": 2, "m": {"x": 1}}),
+            ({"m": {"x": 1, "y": 2}}, {"m": {"y": 3, "z": None}}),
+            ({"log": ["a", "b"]}, {"log": ["a", "b", "c"]}),
+            ({"log": ["a", "b", "c"]}, {"log": ["a"]}),
+            ({"log": ["a", "b"]}, {"log": ["x", "b"]}),
+            ({"opt": None}, {"opt": {"k": 1}}),
+        ],
+    )
+    def test_apply_rebuilds_target(self, base: dict[str, Any], target: dict[str, Any]) -> None:
+        """Applying the delta to its base yields the target."""
+        from babylon.engine.history.delta import apply_delta, diff_documents
+
+        assert apply_delta(base, diff_documents(base, target)) == target
+
+    def test_equal_documents_have_empty_delta(self) -> None:
+        """No change encodes as an empty delta."""
+        from babylon.engine.history.delta import diff_documents
+
+        assert diff_documents({"a": [1], "m": {"x": 1}}, {"a": [1], "m": {"x": 1}}) == {}
+
+    def test_appended_log_stores_only_the_tail(self) -> None:
+        """An append-only list costs its new items, not its whole length."""
+        from babylon.engine.history.delta import diff_documents
+
+        delta = diff_documents({"log": list(range(1000))}, {"log": list(range(1001))})
+
+        assert delta == {"lists": {"log": {"keep": 1000, "tail": [1000]}}}
+
+    def test_apply_does_not_mutate_base(self) -> None:
+        """apply_delta returns a new document."""
+        from babylon.engine.history.delta import apply_delta, diff_documents
+
+        base = {"m": {"x": 1}, "log": ["a"]}
+        apply_delta(base, diff_documents(base, {"m": {"y": 2}, "log": ["a", "b"]}))
+
+        assert base == {"m": {"x": 1}, "log": ["a"]}
+
+    def test_state_document_round_trip(self, sample_world_state: WorldState) -> None:
+        """A WorldState survives state_document/document_state."""
+        from babylon.engine.history.delta import document_state, state_document
+
+        assert document_state(state_document(sample_world_state)) == sample_world_state
+
+
+# =============================================================================
+# DELTA-ENCODED STACK TESTS
+# =============================================================================
+
+
+@pytest.mark.topology
+class TestDeltaEncodedStack:
+    """push_state should keep one full snapshot plus reverse deltas."""
+
+    def test_only_newest_entry_is_full(self, sample_world_state: WorldState) -> None:
+        """Older entries are stored as HistoryDelta."""
+        from babylon.engine.history.models import HistoryDelta, HistoryEntry, HistoryStack
+        from babylon.engine.history.stack import push_state
+
+        stack = HistoryStack()
+        for state in _history(sample_world_state, 5):
+            stack = push_state(stack, state)
+
+        assert all(isinstance(entry, HistoryDelta) for entry in stack.entries[:-1])
+        assert isinstance(stack.entries[-1], HistoryEntry)
+
+    def test_each_push_dumps_one_state(
+        self, sample_world_state: WorldState, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The newest entry keeps its document, so a push dumps only the new state."""
+        from babylon.engine.history import models
+        from babylon.engine.history.models import HistoryStack
+        from babylon.engine.history.stack import push_state
+
+        dumped: list[int] = []
+
+        def counting_document(state: WorldState) -> dict[str, Any]:
+            dumped.append(state.tick)
+            return state.model_dump(mode="json")
+
+        monkeypatch.setattr(models, "state_document", counting_document)
+        stack = HistoryStack()
+        for state in _history(sample_world_state, 5):
+            stack = push_state(stack, state)
+
+        assert sorted(dumped) == [0, 1, 2, 3, 4]
+
+    def test_every_tick_is_recoverable(self, sample_world_state: WorldState) -> None:
+        """get_state_at_tick and undo rebuild the pushed states exactly."""
+        from babylon.engine.history.models import HistoryStack
+        from babylon.engine.history.stack import get_state_at_tick, push_state, undo
+
+        states = _history(sample_world_state, 6)
+        stack = HistoryStack()
+        for state in states:
+            stack = push_state(stack, state)
+
+        for state in states:
+            assert get_state_at_tick(stack, state.tick) == state
+        for expected in reversed(states[:-1]):
+            stack, previous = undo(stack)
+            assert previous == expected
+
+    def test_truncation_reanchors_the_current_entry(self, sample_world_state: WorldState) -> None:
+        """Pushing after undo rebuilds the current entry before dropping the future."""
+        from babylon.engine.history.models import HistoryStack
+        from babylon.engine.history.stack import get_state_at_tick, push_state, undo
+
+        states = _history(sample_world_state, 5)
+        stack = HistoryStack()
+        for state in states:
+            stack = push_state(stack, state)
+        stack, _ = undo(stack)
+        stack, _ = undo(stack)
+
+        branch = _advance(states[2], 50)
+        stack = push_state(stack, branch)
+
+        assert [entry.tick for entry in stack.entries] == [0, 1, 2, 50]
+        for state in [*states[:3], branch]:
+            assert get_state_at_tick(stack, state.tick) == state
+
+    def test_pruning_keeps_protected_states_recoverable(
+        self, sample_world_state: WorldState
+    ) -> None:
+        """A protected delta whose successor is pruned becomes a full snapshot."""
+        from babylon.engine.history.models import HistoryEntry, HistoryStack
+        from babylon.engine.history.stack import get_state_at_tick, push_state
+
+        states = _history(sample_world_state, 8)
+        stack = HistoryStack(max_depth=3, protected_ticks=frozenset({1}))
+        for state in states:
+            stack = push_state(stack, state)
+
+        assert [entry.tick for entry in stack.entries] == [1, 6, 7]
+        assert isinstance(stack.entries[0], HistoryEntry)
+        for tick in (1, 6, 7):
+            assert get_state_at_tick(stack, tick) == states[tick]
+
+    def test_stack_rejects_delta_as_newest_entry(self) -> None:
+        """A delta chain must end at a full snapshot."""
+        from pydantic import ValidationError
+
+        from babylon.engine.history.models import HistoryDelta, HistoryStack
+
+        with pytest.raises(ValidationError):
+            HistoryStack(entries=[HistoryDelta(tick=0, delta={})], current_index=0)
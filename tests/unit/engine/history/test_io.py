@@ -483,3 +483,110 @@ class TestAtomicWrites:
         # Content should be valid
         content = file_path.read_text()
         assert "original content" not in content
+
+
+# =============================================================================
+# BINARY FORMAT TESTS
+# =============================================================================
+
+
+@pytest.mark.ledger
+class TestBinaryCheckpoints:
+    """A .ckpt path selects the versioned, zstd-compressed binary format."""
+
+    def test_checkpoint_round_trip(
+        self,
+        tmp_path: Path,
+        sample_world_state: WorldState,
+        sample_config: SimulationConfig,
+    ) -> None:
+        """A binary checkpoint loads back equal to its JSON twin."""
+        from babylon.engine.history.io import BINARY_MAGIC, load_checkpoint, save_checkpoint
+
+        binary = save_checkpoint(
+            sample_world_state, sample_config, tmp_path / "cp.ckpt", description="bin"
+        )
+        result = load_checkpoint(binary)
+
+        assert binary.read_bytes().startswith(BINARY_MAGIC)
+        assert result.state == sample_world_state
+        assert result.config == sample_config
+        assert result.metadata.description == "bin"
+
+    def test_state_round_trip(self, tmp_path: Path, sample_world_state: WorldState) -> None:
+        """save_state/load_state support the binary format too."""
+        from babylon.engine.history.io import load_state, save_state
+
+        path = save_state(sample_world_state, tmp_path / "state.ckpt")
+
+        assert load_state(path) == sample_world_state
+
+    def test_listing_reads_binary_headers(
+        self,
+        tmp_path: Path,
+        sample_world_state: WorldState,
+        sample_config: SimulationConfig,
+    ) -> None:
+        """list_checkpoints and validate_checkpoint_file accept binary checkpoints."""
+        from babylon.engine.history.io import (
+            list_checkpoints,
+            save_checkpoint,
+            save_state,
+            validate_checkpoint_file,
+        )
+
+        save_checkpoint(sample_world_state, sample_config, tmp_path / "a.ckpt")
+        save_checkpoint(sample_world_state, sample_config, tmp_path / "b.json")
+        save_state(sample_world_state, tmp_path / "state.ckpt")
+
+        listed = sorted(path.name for path, _ in list_checkpoints(tmp_path))
+
+        assert listed == ["a.ckpt", "b.json"]
+        assert validate_checkpoint_file(tmp_path / "a.ckpt")
+        assert not validate_checkpoint_file(tmp_path / "state.ckpt")
+
+    def test_flipped_payload_byte_is_corruption(
+        self,
+        tmp_path: Path,
+        sample_world_state: WorldState,
+        sample_config: SimulationConfig,
+    ) -> None:
+        """A damaged payload fails decompression or the content hash."""
+        from babylon.engine.history.io import (
+            CheckpointCorruptedError,
+            load_checkpoint,
+            save_checkpoint,
+        )
+
+        path = save_checkpoint(sample_world_state, sample_config, tmp_path / "cp.ckpt")
+        data = bytearray(path.read_bytes())
+        data[-8] ^= 0xFF
+        path.write_bytes(bytes(data))
+
+        with pytest.raises(CheckpointCorruptedError):
+            load_checkpoint(path)
+
+    def test_truncated_header_is_corruption(self, tmp_path: Path) -> None:
+        """A file cut inside the header is corrupted, not a crash."""
+        from babylon.engine.history.io import (
+            BINARY_MAGIC,
+            CheckpointCorruptedError,
+            load_checkpoint,
+        )
+
+        path = tmp_path / "cp.ckpt"
+        path.write_bytes(BINARY_MAGIC + b"\x00\x00")
+
+        with pytest.raises(CheckpointCorruptedError):
+            load_checkpoint(path)
+
+    def test_state_file_is_not_a_checkpoint(
+        self, tmp_path: Path, sample_world_state: WorldState
+    ) -> None:
+        """Loading a binary state as a checkpoint is a schema error."""
+        from babylon.engine.history.io import CheckpointSchemaError, load_checkpoint, save_state
+
+        path = save_state(sample_world_state, tmp_path / "state.ckpt")
+
+        with pytest.raises(CheckpointSchemaError):
+            load_checkpoint(path)
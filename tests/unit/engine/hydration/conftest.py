@@ -0,0 +1,112 @@
+"""Shared fixtures for the reference-hydration unit tests.
+
+``reference_db`` is a small reference database: the spec-086 QCEW
+dimensions (``tests/fixtures/qcew/orm.py``) plus 6-digit and sector fact
+rows and H3 claims for a few counties, in a fresh in-memory NormalizedBase
+schema. Every ``get_reference_session()`` reads it for the test's duration.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import h3
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session, sessionmaker
+from tests.fixtures.qcew.orm import COUNTIES, INDUSTRIES, YEARS, seed_qcew_dims
+
+from babylon.engine.hydration import reference
+from babylon.reference import database as reference_database
+
+#: Counties with QCEW rows; the other seeded counties have none.
+DATA_FIPS: tuple[str, ...] = ("26163", "26099", "46102")
+#: Seeded counties without QCEW rows.
+EMPTY_FIPS: tuple[str, ...] = tuple(fips for fips, _, _ in COUNTIES if fips not in DATA_FIPS)
+#: Years with QCEW rows (2010 is seeded in dim_time but has none).
+DATA_YEARS: tuple[int, ...] = (2015, 2024)
+
+_COUNTY_IDS = {fips: i for i, (fips, _, _) in enumerate(COUNTIES, start=1)}
+_INDUSTRY_IDS = {code: i for i, (code, _) in enumerate(INDUSTRIES, start=1)}
+_TIME_IDS = {year: i for i, year in enumerate(YEARS, start=1)}
+#: (ownership_id, wage premium): Private and Local Government rows per industry.
+_OWNERSHIPS = ((5, 0), (4, 2_500))
+_SECTORS = {"31-33": ("336", "337"), "54": ("541",)}
+
+
+def insert_fact(session: Session, county_id: int, industry_id: int, **row: Any) -> None:
+    """Insert one ``fact_qcew_annual`` row (defaults: Private ownership, 2024)."""
+    params = {"ownership_id": 5, "time_id": _TIME_IDS[2024], **row}
+    session.execute(
+        text(
+            "INSERT INTO fact_qcew_annual (county_id, industry_id, ownership_id, time_id,"
+            " employment, total_wages_usd, is_imputed) VALUES (:county_id, :industry_id,"
+            " :ownership_id, :time_id, :employment, :wages, 0)"
+        ),
+        {"county_id": county_id, "industry_id": industry_id, **params},
+    )
+
+
+def _seed_facts(session: Session) -> None:
+    leaves = [code for code, level in INDUSTRIES if level == 6]
+    for c, fips in enumerate(DATA_FIPS):
+        for year in DATA_YEARS:
+            sector_totals: dict[str, tuple[int, float]] = {}
+            for k, code in enumerate(leaves):
+                for ownership_id, premium in _OWNERSHIPS:
+                    employment = 40 * (k + 1) + 13 * c + ownership_id
+                    avg_wage = 31_000 + 4_700 * ((k * 5 + c) % 7) + premium + (year - 2015) * 90
+                    wages = float(employment * avg_wage)
+                    insert_fact(
+                        session,
+                        _COUNTY_IDS[fips],
+                        _INDUSTRY_IDS[code],
+                        ownership_id=ownership_id,
+                        time_id=_TIME_IDS[year],
+                        employment=employment,
+                        wages=wages,
+                    )
+                    sector = next(s for s, prefixes in _SECTORS.items() if code[:3] in prefixes)
+                    emp, total = sector_totals.get(sector, (0, 0.0))
+                    sector_totals[sector] = (emp + employment, total + wages)
+            for sector, (employment, wages) in sector_totals.items():
+                insert_fact(
+                    session,
+                    _COUNTY_IDS[fips],
+                    _INDUSTRY_IDS[sector],
+                    time_id=_TIME_IDS[year],
+                    employment=employment,
+                    wages=wages,
+                )
+        for n in range(2):
+            session.execute(
+                text(
+                    "INSERT INTO bridge_county_h3 (h3_index, county_id, resolution)"
+                    " VALUES (:h3, :county, 5)"
+                ),
+                {"h3": h3.latlng_to_cell(40.0 + c, -90.0 + n, 5), "county": _COUNTY_IDS[fips]},
+            )
+
+
+@pytest.fixture
+def reference_db(
+    reference_sqlite_session_factory: sessionmaker[Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> sessionmaker[Session]:
+    """Seeded reference DB behind every ``get_reference_session()``; returns its factory."""
+    factory = reference_sqlite_session_factory
+    with factory() as session:
+        seed_qcew_dims(session)
+        _seed_facts(session)
+        session.commit()
+
+    @contextmanager
+    def _session() -> Iterator[Session]:
+        with factory() as session:
+            yield session
+
+    monkeypatch.setattr(reference_database, "get_reference_session", _session)
+    monkeypatch.setattr(reference, "get_reference_session", _session)
+    return factory
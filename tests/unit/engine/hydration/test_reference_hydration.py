@@ -0,0 +1,236 @@
+"""Equivalence tests for the set-based reference hydration.
+
+The bulk readers replaced per-county round-trips; each must return exactly
+what the per-county path did: prefetched QCEW rows equal an unprefetched
+fetch (past the 500-county chunk boundary too), the NumPy wage-ladder
+percentiles equal the running-sum crossings, the ``hydrate_*_bulk``
+functions fall back per county as the single-county ones did, and
+``Simulation._hydrate_scenario`` reads everything over one session.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from sqlalchemy import text
+from sqlalchemy.orm import Session, sessionmaker
+from tests.unit.engine.hydration.conftest import DATA_FIPS, DATA_YEARS, EMPTY_FIPS, insert_fact
+
+from babylon.config.defines import GameDefines
+from babylon.domain.economics.adapters import SQLiteQCEWSource
+from babylon.domain.economics.department_mapper import DepartmentMapper
+from babylon.engine.hydration import reference
+from babylon.engine.simulation import Simulation
+from babylon.formulas.constants import HOURS_PER_YEAR
+from babylon.reference import database as reference_database
+
+pytestmark = pytest.mark.unit
+
+_ALL_FIPS = [*DATA_FIPS, *EMPTY_FIPS, "99999"]
+
+
+def _running_sum_percentiles(
+    totals: reference._QcewTotals, ladder: tuple[np.ndarray, np.ndarray]
+) -> dict[str, float]:
+    """The per-row crossing loop the NumPy ladder replaced."""
+    cumulative = 0.0
+    percentiles: dict[str, float] = {}
+    for employment, wages in zip(*ladder, strict=True):
+        cumulative += float(employment)
+        pct = cumulative / totals.employment
+        avg_wage = float(wages) / float(employment) / HOURS_PER_YEAR
+        for name, q in reference._WAGE_PERCENTILES:
+            if name not in percentiles and pct >= q:
+                percentiles[name] = avg_wage
+    return percentiles
+
+
+class TestQcewPrefetch:
+    @pytest.mark.parametrize("year", [2010, *DATA_YEARS])
+    def test_prefetch_matches_per_county_fetch(
+        self, reference_db: sessionmaker[Session], year: int
+    ) -> None:
+        with reference_db() as session:
+            cold = SQLiteQCEWSource(session)
+            warm = SQLiteQCEWSource(session)
+            warm.prefetch(_ALL_FIPS, year)
+            with patch.object(session, "execute", side_effect=AssertionError("queried")):
+                prefetched = {fips: warm.fetch_county_wages(fips, year) for fips in _ALL_FIPS}
+            expected = {fips: cold.fetch_county_wages(fips, year) for fips in _ALL_FIPS}
+
+        assert prefetched == expected
+        assert any(prefetched.values()) == (year in DATA_YEARS)
+
+    def test_chunks_past_500_counties(self, reference_db: sessionmaker[Session]) -> None:
+        fips_codes = [f"27{i:03d}" for i in range(601)]
+        with reference_db() as session:
+            for i, fips in enumerate(fips_codes, start=100):
+                session.execute(
+                    text(
+                        "INSERT INTO dim_county (county_id, fips, state_id, county_fips,"
+                        " county_name) VALUES (:id, :fips, 1, :short, 'County')"
+                    ),
+                    {"id": i, "fips": fips, "short": fips[2:]},
+                )
+                insert_fact(session, i, 6, employment=i, wages=1000.0 * i)
+            session.commit()
+
+            source = SQLiteQCEWSource(session)
+            source.prefetch(fips_codes, 2024)
+            totals = reference._qcew_county_totals(session, fips_codes, 2024)
+            ladders = reference._qcew_wage_ladders(session, fips_codes, 2024)
+            expected = {
+                fips: SQLiteQCEWSource(session).fetch_county_wages(fips, 2024)
+                for fips in fips_codes
+            }
+
+        assert {fips: source.fetch_county_wages(fips, 2024) for fips in fips_codes} == expected
+        assert set(totals) == set(ladders) == set(fips_codes)
+        assert totals["27600"] == reference._QcewTotals(employment=700.0, wages=700_000.0)
+
+
+class TestWageLadders:
+    def test_ladders_ascend_by_average_wage_and_sum_to_totals(
+        self, reference_db: sessionmaker[Session]
+    ) -> None:
+        with reference_db() as session:
+            totals = reference._qcew_county_totals(session, _ALL_FIPS, 2024)
+            ladders = reference._qcew_wage_ladders(session, _ALL_FIPS, 2024)
+
+        assert set(totals) == set(ladders) == set(DATA_FIPS)
+        for fips, (employment, wages) in ladders.items():
+            assert np.all(np.diff(wages / employment) >= 0)
+            assert employment.sum() == totals[fips].employment
+            assert wages.sum() == pytest.approx(totals[fips].wages)
+
+    def test_percentiles_match_running_sum_on_seeded_counties(
+        self, reference_db: sessionmaker[Session]
+    ) -> None:
+        with reference_db() as session:
+            totals = reference._qcew_county_totals(session, DATA_FIPS, 2024)
+            ladders = reference._qcew_wage_ladders(session, DATA_FIPS, 2024)
+
+        for fips in DATA_FIPS:
+            expected = _running_sum_percentiles(totals[fips], ladders[fips])
+            assert reference._wage_percentiles(totals[fips], ladders[fips]) == expected
+            assert len(expected) == 4
+
+    def test_exact_boundary_crossings(self) -> None:
+        ladder = (np.array([15.0, 35.0, 40.0, 9.0, 1.0]), np.array([1.0, 2.0, 3.0, 4.0, 5.0]))
+        totals = reference._QcewTotals(employment=100.0, wages=0.0)
+        assert reference._wage_percentiles(totals, ladder) == _running_sum_percentiles(
+            totals, ladder
+        )
+
+    @given(
+        rows=st.lists(
+            st.tuples(
+                st.integers(min_value=1, max_value=100_000),
+                st.floats(min_value=1.0, max_value=1e9, allow_nan=False),
+            ),
+            min_size=1,
+            max_size=40,
+        ),
+        extra=st.integers(min_value=0, max_value=1_000),
+    )
+    def test_percentiles_match_running_sum(self, rows: list[tuple[int, float]], extra: int) -> None:
+        employment = np.array([float(e) for e, _ in rows])
+        ladder = (employment, np.array([w for _, w in rows]))
+        # The totals may exceed the ladder (rows the ladder query filters out).
+        totals = reference._QcewTotals(employment=float(employment.sum()) + extra, wages=1.0)
+        assert reference._wage_percentiles(totals, ladder) == _running_sum_percentiles(
+            totals, ladder
+        )
+
+
+class TestBulkFallbacks:
+    def test_bulk_matches_single_county(self, reference_db: sessionmaker[Session]) -> None:
+        class_shares = reference.hydrate_class_shares_bulk(_ALL_FIPS, 2024)
+        economy = reference.hydrate_economy_constants_bulk(_ALL_FIPS, 2024)
+        reserve = reference.hydrate_reserve_army_bulk(_ALL_FIPS, 2024)
+
+        for fips in _ALL_FIPS:
+            assert class_shares[fips] == reference.hydrate_class_shares(fips, 2024)
+            assert economy[fips] == reference.hydrate_economy_constants(fips, 2024)
+            assert reserve[fips] == reference.hydrate_reserve_army(fips, 2024)
+
+    def test_counties_without_data_fall_back(self, reference_db: sessionmaker[Session]) -> None:
+        class_shares = reference.hydrate_class_shares_bulk(_ALL_FIPS, 2024)
+        economy = reference.hydrate_economy_constants_bulk(_ALL_FIPS, 2024)
+        reserve = reference.hydrate_reserve_army_bulk(_ALL_FIPS, 2024)
+
+        for fips in DATA_FIPS:
+            assert class_shares[fips] != reference._CLASS_SHARE_FALLBACK
+            assert set(economy[fips]) == {"extraction_efficiency", "shadow_wage_hourly"}
+            assert reserve[fips] == {"sigmoid_r0": 0.05}
+        for fips in [*EMPTY_FIPS, "99999"]:
+            assert class_shares[fips] == reference._CLASS_SHARE_FALLBACK
+            assert economy[fips] == {}
+            assert reserve[fips] == {}
+
+    def test_unreadable_database_falls_back_for_every_county(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        @contextmanager
+        def _missing() -> Iterator[Session]:
+            raise FileNotFoundError("no reference DB")
+            yield  # pragma: no cover
+
+        monkeypatch.setattr(reference, "get_reference_session", _missing)
+
+        assert reference.hydrate_class_shares_bulk(DATA_FIPS, 2024) == dict.fromkeys(
+            DATA_FIPS, reference._CLASS_SHARE_FALLBACK
+        )
+        assert reference.hydrate_economy_constants_bulk(DATA_FIPS, 2024) == {
+            fips: {} for fips in DATA_FIPS
+        }
+        assert reference.hydrate_reserve_army_bulk(DATA_FIPS, 2024) == {
+            fips: {} for fips in DATA_FIPS
+        }
+
+
+class TestHydrateScenario:
+    def test_one_session_one_mapping_parse(self, reference_db: sessionmaker[Session]) -> None:
+        fips_codes = list(DATA_FIPS[:2])
+        opened: list[Session] = []
+        read_session = reference_database.get_reference_session
+
+        @contextmanager
+        def _counting() -> Iterator[Session]:
+            with read_session() as session:
+                opened.append(session)
+                yield session
+
+        parse = DepartmentMapper.from_yaml
+        with (
+            patch.object(reference_database, "get_reference_session", _counting),
+            patch.object(reference, "get_reference_session", _counting),
+            patch.object(DepartmentMapper, "from_yaml", side_effect=parse) as from_yaml,
+        ):
+            scenario = Simulation._hydrate_scenario(fips_codes, 2024, GameDefines(), [2015, 2024])
+
+        assert len(opened) == 1
+        assert from_yaml.call_count == 1
+        assert set(scenario.territories) == set(fips_codes)
+        assert {key for key, _ in scenario.tensors.items()} == {
+            (fips, year) for fips in fips_codes for year in (2015, 2024)
+        }
+
+    def test_matches_the_standalone_hydrators(self, reference_db: sessionmaker[Session]) -> None:
+        fips_codes = list(DATA_FIPS[:2])
+        scenario = Simulation._hydrate_scenario(fips_codes, 2024, GameDefines(), [2024])
+
+        territories, hexes = reference.hydrate_territories(fips_codes, 2024)
+        economy = reference.hydrate_economy_constants(fips_codes[0], 2024)
+
+        assert scenario.territories == territories
+        assert scenario.hexes == hexes
+        assert scenario.industries == reference.hydrate_industry_hyperedges(fips_codes, 2024)
+        assert scenario.defines.economy.extraction_efficiency == economy["extraction_efficiency"]
+        assert scenario.defines.economy.shadow_wage_hourly == economy["shadow_wage_hourly"]
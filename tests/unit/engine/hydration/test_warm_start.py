@@ -0,0 +1,194 @@
+"""Unit tests for the warm-start hydrated-scenario cache.
+
+An entry is addressed by the reference DB bytes, the scenario config, the
+defines and the hydration code: changing any one must address a new entry,
+a stored scenario must round-trip (tensor sentinels included) and a corrupt
+or unwritable entry must be logged and treated as a miss.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import babylon
+from babylon.config.defines import GameDefines
+from babylon.domain.economics.tensor import DepartmentRow, NoDataSentinel, ValueTensor4x3
+from babylon.domain.economics.tensor_registry import TensorRegistry
+from babylon.engine.hydration import warm_start
+from babylon.engine.hydration.warm_start import (
+    HydratedScenario,
+    WarmStartCache,
+    reference_db_digest,
+    scenario_key,
+)
+from babylon.models.snapshots import HexState, TerritoryState
+
+pytestmark = pytest.mark.unit
+
+
+def _tensor(fips: str = "26163", year: int = 2022) -> ValueTensor4x3:
+    dept = DepartmentRow(c=100.0, v=50.0, s=25.0)
+    return ValueTensor4x3(
+        fips_code=fips,
+        year=year,
+        dept_I=dept,
+        dept_IIa=dept,
+        dept_IIb=dept,
+        dept_III=dept,
+        naics_granularity=0.85,
+        excluded_wages=0.0,
+    )
+
+
+def _scenario() -> HydratedScenario:
+    return HydratedScenario(
+        territories={
+            "26163": TerritoryState(
+                territory_id="26163",
+                controlling_polity="26163",
+                hex_claims=frozenset({"872ab2590ffffff"}),
+                tick=0,
+                profit_rate=0.06,
+                equilibrium_r=0.06,
+            )
+        },
+        hexes={"872ab2590ffffff": HexState(h3_index="872ab2590ffffff")},
+        industries={},
+        defines=GameDefines(),
+        tensors={
+            ("26163", 2022): _tensor(),
+            ("26125", 2022): NoDataSentinel("26125", 2022, "no QCEW rows"),
+        },
+    )
+
+
+def _defines_with(**economy: float) -> GameDefines:
+    defines = GameDefines()
+    return defines.model_copy(update={"economy": defines.economy.model_copy(update=economy)})
+
+
+def _key(**overrides: Any) -> str:
+    inputs: dict[str, Any] = {
+        "reference_digest": "a" * 64,
+        "fips_codes": ["26163", "26125"],
+        "year": 2022,
+        "years": None,
+        "defines": GameDefines(),
+    }
+    inputs.update(overrides)
+    return scenario_key(**inputs)
+
+
+def test_key_is_stable() -> None:
+    assert _key() == _key()
+
+
+@pytest.mark.parametrize(
+    "override",
+    [
+        {"reference_digest": "b" * 64},
+        {"fips_codes": ["26125", "26163"]},  # primary county changes
+        {"year": 2021},
+        {"years": [2022]},
+        {"defines": _defines_with(extraction_efficiency=0.123)},
+    ],
+)
+def test_any_changed_input_addresses_a_new_entry(override: dict[str, Any]) -> None:
+    assert _key(**override) != _key()
+
+
+def test_code_changes_address_a_new_entry(monkeypatch: pytest.MonkeyPatch) -> None:
+    before = _key()
+    monkeypatch.setattr(warm_start, "hydration_code_digest", lambda: "0" * 64)
+    assert _key() != before
+
+    monkeypatch.undo()
+    monkeypatch.setattr(babylon, "__version__", "999.0.0")
+    assert _key() != before
+
+
+def test_reference_digest_follows_file_content(tmp_path: Path) -> None:
+    db = tmp_path / "ref.sqlite"
+    db.write_bytes(b"one")
+    first = reference_db_digest(db)
+    assert reference_db_digest(db) == first
+    db.write_bytes(b"other")
+    assert reference_db_digest(db) != first
+
+
+def test_put_get_round_trip(tmp_path: Path) -> None:
+    cache = WarmStartCache(tmp_path / "cache", reference_db=tmp_path / "ref.sqlite")
+    assert cache.get(_key()) is None
+
+    cache.put(_key(), _scenario())
+
+    assert cache.get(_key()) == _scenario()
+
+
+def test_corrupt_entry_reads_as_a_logged_miss(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    cache = WarmStartCache(tmp_path)
+    cache.put(_key(), _scenario())
+    (tmp_path / f"{_key()}.pickle").write_bytes(b"not a pickle")
+
+    with caplog.at_level(logging.WARNING, logger=warm_start.__name__):
+        assert cache.get(_key()) is None
+    assert "unreadable" in caplog.text
+
+
+def test_unwritable_root_skips_the_write_with_a_warning(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    root = tmp_path / "file-not-dir"
+    root.write_bytes(b"")
+    cache = WarmStartCache(root)
+
+    with caplog.at_level(logging.WARNING, logger=warm_start.__name__):
+        cache.put(_key(), _scenario())
+    assert "not written" in caplog.text
+
+
+def test_tensors_restore_into_a_registry() -> None:
+    registry = TensorRegistry()
+    _scenario().restore_tensors(registry)
+
+    assert registry.get("26163", 2022) == _tensor()
+    assert registry.get("26125", 2022) == NoDataSentinel("26125", 2022, "no QCEW rows")
+    assert HydratedScenario.capture_tensors(registry, ["26163", "26125"], [2022, 1999]) == (
+        _scenario().tensors
+    )
+
+
+def test_from_sqlite_hit_skips_hydration(
+    reference_db: Any, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from babylon.engine.simulation import Simulation
+
+    reference_file = tmp_path / "reference.sqlite"
+    reference_file.write_bytes(b"reference")
+    cache = WarmStartCache(tmp_path / "warm", reference_db=reference_file)
+    fips_codes = ["26163", "26099"]
+    defines = GameDefines()
+
+    cold = Simulation.from_sqlite(fips_codes, year=2024, defines=defines, warm_start=cache)
+
+    def _no_hydration(*args: Any, **kwargs: Any) -> HydratedScenario:
+        raise AssertionError("a warm-start hit must not hydrate")
+
+    monkeypatch.setattr(Simulation, "_hydrate_scenario", staticmethod(_no_hydration))
+    warm = Simulation.from_sqlite(fips_codes, year=2024, defines=defines, warm_start=cache)
+
+    warm_snapshot, cold_snapshot = warm.get_snapshot(), cold.get_snapshot()
+    assert warm_snapshot.territories == cold_snapshot.territories
+    assert warm_snapshot.hexes == cold_snapshot.hexes
+    assert warm.current_state.industries == cold.current_state.industries
+    assert warm.defines == cold.defines
+    assert cold.tensor_registry is not None and warm.tensor_registry is not None
+    assert HydratedScenario.capture_tensors(
+        warm.tensor_registry, fips_codes, [2024]
+    ) == HydratedScenario.capture_tensors(cold.tensor_registry, fips_codes, [2024])
@@ -82,3 +82,33 @@ class TestResultDeterminism:
         record_b = build_repro_record(second, scope_name=_SCENARIO, max_ticks=_MAX_TICKS)
         assert record_a.defines_hash == record_b.defines_hash
         assert record_a == record_b
+
+
+class TestForkedRepro:
+    """A forked trial's record names the tick its overrides took effect."""
+
+    def test_unforked_record_diverges_at_zero(self) -> None:
+        first, _ = _run_twice(GameDefines())
+        record = build_repro_record(first, scope_name=_SCENARIO, max_ticks=_MAX_TICKS)
+        assert record.diverge_at == 0
+
+    def test_forked_sweep_records_diverge_at(self) -> None:
+        from babylon.engine.optimization.sweep import sweep_1d
+
+        forked, unforked = (
+            sweep_1d(
+                "economy.extraction_efficiency",
+                [0.6],
+                max_ticks=_MAX_TICKS,
+                seed=_SEED,
+                backend="in_memory",
+                scenario=_SCENARIO,
+                fork_at=fork_at,
+            )[0]
+            for fork_at in (2, 0)
+        )
+
+        assert forked.repro.diverge_at == 2
+        assert unforked.repro.diverge_at == 0
+        assert forked.repro.defines_hash == unforked.repro.defines_hash
+        assert forked.repro != unforked.repro
@@ -0,0 +1,157 @@
+"""Behavioral contract: trial scheduling never changes trial results.
+
+:class:`~babylon.engine.optimization.scheduler.TrialScheduler` may run a
+batch inline or across worker processes, finishing trials in any order; the
+results must come back in spec order and equal a sequential run's
+(Constitution III.7). Monte Carlo seeds must be fixed before dispatch.
+A ``diverge_at`` schedule must give the same result however the batch is
+grouped: forked from a shared prefix or run alone.
+
+Uses ``backend="in_memory"`` exclusively — no Postgres required.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from babylon.config.defines import GameDefines
+from babylon.engine.optimization import runner_api
+from babylon.engine.optimization.backends.in_memory import run_in_memory, snapshot_in_memory
+from babylon.engine.optimization.monte_carlo import run_trials
+from babylon.engine.optimization.params import inject_parameter
+from babylon.engine.optimization.scheduler import (
+    TrialScheduler,
+    TrialSettings,
+    TrialSpec,
+    _plan_units,
+    build_defines,
+)
+
+_SETTINGS = TrialSettings(max_ticks=5, backend="in_memory")
+
+_SPECS = [
+    TrialSpec(seed=2010),
+    TrialSpec(seed=7, overrides=(("economy.base_subsistence", 0.1),)),
+    TrialSpec(seed=2010, overrides=(("economy.extraction_efficiency", 0.6),)),
+]
+
+
+def test_overrides_apply_in_order_last_wins() -> None:
+    spec = TrialSpec(
+        seed=1,
+        overrides=(("economy.base_subsistence", 0.1), ("economy.base_subsistence", 0.2)),
+    )
+    expected = inject_parameter(GameDefines(), "economy.base_subsistence", 0.2)
+    assert build_defines(GameDefines(), spec) == expected
+
+
+def test_inline_map_matches_direct_runs() -> None:
+    with TrialScheduler(GameDefines(), _SETTINGS) as scheduler:
+        results = scheduler.map(_SPECS)
+
+    expected = [
+        runner_api.run(
+            build_defines(GameDefines(), spec),
+            seed=spec.seed,
+            max_ticks=_SETTINGS.max_ticks,
+            backend="in_memory",
+        )
+        for spec in _SPECS
+    ]
+    assert results == expected
+
+
+def test_pool_map_matches_inline_in_spec_order() -> None:
+    with TrialScheduler(GameDefines(), _SETTINGS) as scheduler:
+        sequential = scheduler.map(_SPECS)
+    seen: list[int] = []
+    with TrialScheduler(GameDefines(), _SETTINGS, workers=2) as scheduler:
+        parallel = scheduler.map(_SPECS, on_result=lambda index, _: seen.append(index))
+
+    assert parallel == sequential
+    assert sorted(seen) == [0, 1, 2]
+
+
+def test_monte_carlo_seeds_independent_of_workers() -> None:
+    sequential, _ = run_trials(
+        3, GameDefines(), max_ticks=3, base_seed=42, backend="in_memory", progress=False
+    )
+    parallel, _ = run_trials(
+        3,
+        GameDefines(),
+        max_ticks=3,
+        base_seed=42,
+        backend="in_memory",
+        progress=False,
+        workers=2,
+    )
+    assert parallel == sequential
+
+
+def test_workers_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="workers"):
+        TrialScheduler(GameDefines(), _SETTINGS, workers=0)
+
+
+def test_forks_from_one_snapshot_match_full_run() -> None:
+    defines = GameDefines()
+    prefix = snapshot_in_memory(defines, seed=2010, tick=2)
+    full = run_in_memory(defines, seed=2010, max_ticks=5)
+
+    assert run_in_memory(defines, seed=2010, max_ticks=5, start_from=prefix) == full
+    assert run_in_memory(defines, seed=2010, max_ticks=5, start_from=prefix) == full
+
+
+def test_snapshot_must_match_trial() -> None:
+    prefix = snapshot_in_memory(GameDefines(), seed=2010, tick=2)
+    with pytest.raises(ValueError, match="cannot seed"):
+        run_in_memory(GameDefines(), seed=7, max_ticks=5, start_from=prefix)
+    with pytest.raises(ValueError, match="cannot seed"):
+        run_in_memory(GameDefines(), seed=2010, max_ticks=1, start_from=prefix)
+
+
+def test_plan_units_groups_by_seed_and_divergence() -> None:
+    specs = [
+        TrialSpec(seed=1, diverge_at=3),
+        TrialSpec(seed=2, diverge_at=3),
+        TrialSpec(seed=1, diverge_at=3),
+        TrialSpec(seed=1),
+        TrialSpec(seed=1, diverge_at=3),
+    ]
+    assert _plan_units(specs, chunks=1) == [(0, 2, 4), (1,), (3,)]
+    assert _plan_units(specs, chunks=2) == [(0, 2), (1,), (3,), (4,)]
+
+
+def test_diverge_at_schedules_overrides_after_the_prefix() -> None:
+    spec = TrialSpec(seed=2010, overrides=(("economy.extraction_efficiency", 0.6),), diverge_at=2)
+    prefix = snapshot_in_memory(GameDefines(), seed=2010, tick=2)
+    expected = run_in_memory(
+        build_defines(GameDefines(), spec), seed=2010, max_ticks=5, start_from=prefix
+    )
+
+    with TrialScheduler(GameDefines(), _SETTINGS) as scheduler:
+        assert scheduler.run(spec) == expected
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_shared_prefix_map_matches_lone_runs(workers: int) -> None:
+    specs = [
+        TrialSpec(seed=2010, overrides=(("economy.extraction_efficiency", 0.6),), diverge_at=2),
+        TrialSpec(seed=2010, diverge_at=2),
+        TrialSpec(seed=7, diverge_at=2),
+    ]
+    with TrialScheduler(GameDefines(), _SETTINGS) as scheduler:
+        lone = [scheduler.run(spec) for spec in specs]
+    with TrialScheduler(GameDefines(), _SETTINGS, workers=workers) as scheduler:
+        forked = scheduler.map(specs)
+
+    assert forked == lone
+
+
+def test_diverge_at_requires_a_snapshot_backend() -> None:
+    headless = TrialSettings(max_ticks=5, backend="headless")
+    with (
+        TrialScheduler(GameDefines(), headless) as scheduler,
+        pytest.raises(ValueError, match="diverge_at"),
+    ):
+        scheduler.map([TrialSpec(seed=1), TrialSpec(seed=1, diverge_at=3)])
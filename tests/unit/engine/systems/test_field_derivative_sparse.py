@@ -0,0 +1,92 @@
+"""Sparse-operator path of FieldDerivativeSystem vs the scalar neighbor scan.
+
+On a BabylonGraph the Laplacians and gradients are computed from cached CSR
+operators. The contract pinned here: Laplacians match the scalar scan to
+within ``SPARSE_LAPLACIAN_ABS_TOL``, gradients match exactly and in edge
+order, and the cached operators are rebuilt only when topology changes.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from babylon.engine.systems.field_derivative import (
+    SPARSE_LAPLACIAN_ABS_TOL,
+    _scalar_edge_gradients,
+    _scalar_laplacians,
+    _sparse_edge_gradients,
+    _sparse_laplacians,
+)
+from babylon.topology.graph import BabylonGraph
+from babylon.topology.sparse_operators import graph_operators
+
+pytestmark = [pytest.mark.unit]
+
+_FIELDS = ["atomization", "exploitation"]
+
+
+def _random_graph(seed: int, n_nodes: int = 60, n_edges: int = 240) -> BabylonGraph:
+    """Mixed graph: some nodes lack fields, some carry one, plus self-loops."""
+    rng = random.Random(seed)
+    graph = BabylonGraph()
+    for i in range(n_nodes):
+        node_type = "social_class" if i % 5 else "territory"
+        fields = {name: rng.random() for name in _FIELDS if rng.random() < 0.9}
+        if i % 7 == 0:
+            fields = {}
+        graph.add_node(f"N{i:03d}", node_type, contradiction_fields=fields)
+    for _ in range(n_edges):
+        source = f"N{rng.randrange(n_nodes):03d}"
+        target = f"N{rng.randrange(n_nodes):03d}"
+        graph.add_edge(source, target, "solidarity", infrastructure_weight=rng.uniform(0, 3))
+    return graph
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("edge_weight_attr", [None, "infrastructure_weight", "weight"])
+def test_laplacians_match_scalar_scan(seed: int, edge_weight_attr: str | None) -> None:
+    graph = _random_graph(seed)
+    # The scalar scan requires every contributing neighbor to carry every
+    # field (its weight list is shared across fields), so give them all.
+    for _, payload in graph.nodes(data=True):
+        if payload["contradiction_fields"]:
+            payload["contradiction_fields"] = {
+                name: payload["contradiction_fields"].get(name, 0.5) for name in _FIELDS
+            }
+
+    scalar = _scalar_laplacians(graph, _FIELDS, edge_weight_attr)
+    sparse = _sparse_laplacians(graph, _FIELDS, edge_weight_attr)
+
+    assert list(sparse) == list(scalar)
+    for node_id, expected in scalar.items():
+        for name in _FIELDS:
+            assert sparse[node_id][name] == pytest.approx(
+                expected[name], abs=SPARSE_LAPLACIAN_ABS_TOL
+            )
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_gradients_match_scalar_scan_exactly(seed: int) -> None:
+    graph = _random_graph(seed)
+    assert _sparse_edge_gradients(graph, _FIELDS) == _scalar_edge_gradients(graph, _FIELDS)
+
+
+def test_isolated_node_laplacian_is_zero() -> None:
+    graph = BabylonGraph()
+    graph.add_node("C1", "social_class", contradiction_fields={"exploitation": -0.4})
+    assert _sparse_laplacians(graph, ["exploitation"]) == {"C1": {"exploitation": 0.0}}
+
+
+def test_operators_cached_until_topology_changes() -> None:
+    graph = _random_graph(0, n_nodes=10, n_edges=20)
+    operators = graph_operators(graph)
+
+    graph.update_node("N001", contradiction_fields={"exploitation": 0.9})
+    assert graph_operators(graph) is operators
+
+    graph.add_edge("N001", "N_NEW", "solidarity")
+    rebuilt = graph_operators(graph)
+    assert rebuilt is not operators
+    assert rebuilt.edge_keys == tuple(graph.edges())
@@ -26,7 +26,7 @@ Design Principles:
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from typing import TYPE_CHECKING, Any, Literal, Protocol
 
 import pytest
@@ -341,6 +341,28 @@ class MockGraphAdapter:
         """Count edges stub."""
         return 0
 
+    def iter_nodes(self, node_type: str | None = None) -> Iterator[tuple[str, Mapping[str, Any]]]:
+        """Iterate nodes stub."""
+        return iter([])
+
+    def iter_edges(
+        self, edge_type: str | None = None
+    ) -> Iterator[tuple[str, str, Mapping[str, Any]]]:
+        """Iterate edges stub."""
+        return iter([])
+
+    def iter_in_edges(
+        self, node_id: str, edge_type: str | None = None
+    ) -> Iterator[tuple[str, str, Mapping[str, Any]]]:
+        """Iterate in-edges stub."""
+        return iter([])
+
+    def iter_out_edges(
+        self, node_id: str, edge_type: str | None = None
+    ) -> Iterator[tuple[str, str, Mapping[str, Any]]]:
+        """Iterate out-edges stub."""
+        return iter([])
+
     def aggregate(
         self,
         target: Literal["nodes", "edges"],
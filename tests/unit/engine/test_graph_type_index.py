@@ -0,0 +1,229 @@
+"""Per-type node/edge indexes and the zero-copy read path of BabylonGraph.
+
+Typed ``query_nodes``/``query_edges``/``count_*`` read per-type indexes
+instead of scanning the graph. The contract pinned here: indexed results
+equal a full scan in the SAME order (constitution III.7) under arbitrary
+add/remove/retype churn, ``iter_nodes``/``iter_edges`` expose live
+payloads read-only without copying, and ``iter_in_edges``/``iter_out_edges``
+equal the filtered ``iter_edges`` scan.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from babylon.topology.graph import BabylonGraph, BabylonUGraph
+
+pytestmark = [pytest.mark.unit, pytest.mark.topology]
+
+
+def _scan_nodes(graph: BabylonGraph, node_type: str) -> list[str]:
+    return [n for n, d in graph.nodes(data=True) if d.get("_node_type") == node_type]
+
+
+def _scan_edges(graph: BabylonGraph, edge_type: str) -> list[tuple[str, str]]:
+    return [(u, v) for u, v, d in graph.edges(data=True) if d.get("_edge_type") == edge_type]
+
+
+class TestTypedQueries:
+    """Typed queries read the index but behave exactly like the scan."""
+
+    def test_query_nodes_by_type_in_insertion_order(self) -> None:
+        graph = BabylonGraph()
+        for node_id, node_type in [
+            ("T1", "territory"),
+            ("C2", "social_class"),
+            ("C1", "social_class"),
+        ]:
+            graph.add_node(node_id, node_type)
+        assert [n.id for n in graph.query_nodes(node_type="social_class")] == ["C2", "C1"]
+        assert graph.count_nodes("social_class") == 2
+        assert graph.count_nodes("organization") == 0
+
+    def test_retype_via_merge_keeps_global_order(self) -> None:
+        graph = BabylonGraph()
+        for node_id in ("A", "B", "C"):
+            graph.add_node(node_id, "territory")
+        graph.add_node("D", "social_class")
+        graph.add_node("A", "social_class")  # merge retypes A, filed before D
+        assert [n.id for n in graph.query_nodes(node_type="social_class")] == ["A", "D"]
+        assert [n.id for n in graph.query_nodes(node_type="territory")] == ["B", "C"]
+
+    def test_edges_follow_source_major_order(self) -> None:
+        graph = BabylonGraph()
+        for node_id in ("T1", "T2", "T3"):
+            graph.add_node(node_id, "territory")
+        graph.add_edge("T3", "T1", "adjacency")
+        graph.add_edge("T1", "T2", "adjacency")
+        assert [(e.source_id, e.target_id) for e in graph.query_edges(edge_type="adjacency")] == [
+            ("T1", "T2"),
+            ("T3", "T1"),
+        ]
+        assert graph.count_edges("adjacency") == 2
+
+    def test_direct_payload_retype_never_false_matches(self) -> None:
+        graph = BabylonGraph()
+        graph.add_node("C1", "social_class")
+        graph.nodes["C1"]["_node_type"] = "community"
+        assert graph.count_nodes("social_class") == 0
+        graph.update_node("C1", _node_type="community")
+        assert [n.id for n in graph.query_nodes(node_type="community")] == ["C1"]
+
+    def test_update_edge_retype_refiles(self) -> None:
+        graph = BabylonGraph()
+        graph.add_edge("A", "B", "exploitation")
+        graph.update_edge("A", "B", "exploitation", _edge_type="solidarity")
+        assert graph.count_edges("exploitation") == 0
+        assert graph.count_edges("solidarity") == 1
+
+    def test_sort_type_indexes_leaves_typed_reads_pure(self) -> None:
+        graph = BabylonGraph()
+        for node_id in ("T1", "T2", "T3"):
+            graph.add_node(node_id, "territory")
+        graph.add_edge("T2", "T3", "solidarity")
+        graph.add_edge("T1", "T3", "solidarity")  # iterates before T2's edge
+        assert graph._unsorted_edge_types == {"solidarity"}
+
+        graph.sort_type_indexes()
+        bucket = list(graph._edges_by_type["solidarity"])
+
+        assert not graph._unsorted_edge_types
+        assert bucket == _scan_edges(graph, "solidarity") == [("T1", "T3"), ("T2", "T3")]
+        graph.query_edges(edge_type="solidarity")
+        assert list(graph._edges_by_type["solidarity"]) == bucket
+
+    def test_remove_node_unfiles_incident_edges(self) -> None:
+        graph = BabylonGraph()
+        graph.add_edge("A", "B", "wages")
+        graph.add_edge("B", "C", "wages")
+        graph.remove_node("B")
+        assert graph.count_edges("wages") == 0
+        graph.add_edge("C", "B", "wages")
+        assert [(e.source_id, e.target_id) for e in graph.query_edges(edge_type="wages")] == [
+            ("C", "B")
+        ]
+
+    def test_undirected_collapse_refiles(self) -> None:
+        graph = BabylonGraph()
+        graph.add_edge("A", "B", "solidarity")
+        graph.add_edge("B", "A", "exploitation")
+        undirected = graph.to_undirected()
+        assert isinstance(undirected, BabylonUGraph)
+        assert list(undirected._edge_items("exploitation")) == [
+            ("A", "B", undirected.get_edge_data("A", "B"))
+        ]
+        assert list(undirected._edge_items("solidarity")) == []
+
+
+class TestZeroCopyViews:
+    """iter_nodes/iter_edges expose live payloads read-only."""
+
+    def test_iter_nodes_is_live_and_read_only(self) -> None:
+        graph = BabylonGraph()
+        graph.add_node("C1", "social_class", wealth=1.0)
+        ((node_id, payload),) = list(graph.iter_nodes("social_class"))
+        assert node_id == "C1"
+        graph.update_node("C1", wealth=2.0)
+        assert payload["wealth"] == 2.0
+        with pytest.raises(TypeError):
+            payload["wealth"] = 3.0  # type: ignore[index]
+
+    def test_iter_edges_matches_query_edges(self) -> None:
+        graph = BabylonGraph()
+        graph.add_edge("A", "B", "wages", weight=0.5, value_flow=3.0)
+        graph.add_edge("B", "C", "tribute", weight=0.1)
+        viewed = [(u, v, p["value_flow"]) for u, v, p in graph.iter_edges("wages")]
+        assert viewed == [("A", "B", 3.0)]
+        assert len(list(graph.iter_edges())) == len(list(graph.query_edges())) == 2
+
+
+class TestIncidentEdges:
+    """iter_in_edges/iter_out_edges read adjacency, not the edge list."""
+
+    def test_in_edges_follow_source_major_order(self) -> None:
+        graph = BabylonGraph()
+        for node_id in ("A", "B", "C", "T"):
+            graph.add_node(node_id, "social_class")
+        graph.add_edge("C", "T", "solidarity")  # inserted first, iterated last
+        graph.add_edge("A", "T", "solidarity")
+        graph.add_edge("B", "T", "wages")
+        assert [u for u, _, _ in graph.iter_in_edges("T", "solidarity")] == ["A", "C"]
+        assert [u for u, _, _ in graph.iter_in_edges("T")] == ["A", "B", "C"]
+
+    def test_out_edges_are_typed_and_live(self) -> None:
+        graph = BabylonGraph()
+        graph.add_edge("P", "C", "exploitation", tension=0.1)
+        graph.add_edge("P", "D", "wages")
+        ((source, target, payload),) = list(graph.iter_out_edges("P", "exploitation"))
+        assert (source, target) == ("P", "C")
+        graph.update_edge("P", "C", "exploitation", tension=0.4)
+        assert payload["tension"] == 0.4
+        with pytest.raises(TypeError):
+            payload["tension"] = 0.0  # type: ignore[index]
+
+    def test_absent_node_has_no_edges(self) -> None:
+        graph = BabylonGraph()
+        assert list(graph.iter_in_edges("missing")) == []
+        assert list(graph.iter_out_edges("missing", "wages")) == []
+
+
+# ─── Hypothesis model test ────────────────────────────────────────────────
+
+_POOL = [f"n{i}" for i in range(6)]
+_TYPES = ["social_class", "territory", "organization"]
+_EDGE_TYPES = ["wages", "tenancy"]
+
+_ops = st.lists(
+    st.one_of(
+        st.tuples(st.just("add_node"), st.sampled_from(_POOL), st.sampled_from(_TYPES)),
+        st.tuples(st.just("remove_node"), st.sampled_from(_POOL)),
+        st.tuples(
+            st.just("add_edge"),
+            st.sampled_from(_POOL),
+            st.sampled_from(_POOL),
+            st.sampled_from(_EDGE_TYPES),
+        ),
+        st.tuples(st.just("remove_edge"), st.sampled_from(_POOL), st.sampled_from(_POOL)),
+    ),
+    max_size=50,
+)
+
+
+class TestTypeIndexModel:
+    """Arbitrary bounded churn: indexed typed results == full scan, in order."""
+
+    @settings(max_examples=150, deadline=None)
+    @given(ops=_ops)
+    def test_index_matches_scan_under_churn(self, ops: list[tuple[Any, ...]]) -> None:
+        graph = BabylonGraph()
+        for op in ops:
+            if op[0] == "add_node":
+                graph.add_node(op[1], op[2])
+            elif op[0] == "remove_node":
+                if op[1] in graph:
+                    graph.remove_node(op[1])
+            elif op[0] == "add_edge":
+                graph.add_edge(op[1], op[2], op[3])
+            elif op[0] == "remove_edge" and graph.has_edge(op[1], op[2]):
+                graph.remove_edge(op[1], op[2])
+
+        for node_type in _TYPES:
+            assert [n for n, _ in graph.iter_nodes(node_type)] == _scan_nodes(graph, node_type)
+            assert graph.count_nodes(node_type) == len(_scan_nodes(graph, node_type))
+        for edge_type in _EDGE_TYPES:
+            assert [(u, v) for u, v, _ in graph.iter_edges(edge_type)] == _scan_edges(
+                graph, edge_type
+            )
+            assert graph.count_edges(edge_type) == len(_scan_edges(graph, edge_type))
+            scanned = _scan_edges(graph, edge_type)
+            for node_id in graph:
+                assert [(u, v) for u, v, _ in graph.iter_in_edges(node_id, edge_type)] == [
+                    (u, v) for u, v in scanned if v == node_id
+                ]
+                assert [(u, v) for u, v, _ in graph.iter_out_edges(node_id, edge_type)] == [
+                    (u, v) for u, v in scanned if u == node_id
+                ]
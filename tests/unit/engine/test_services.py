@@ -260,3 +260,27 @@ class TestServiceContainer:
             mock_metrics.increment.assert_called_once_with("test")
         finally:
             container.database.close()
+
+    def test_reset_transients_clears_tick_history_only(self) -> None:
+        """reset_transients() drops the tick's events but keeps run-scoped state."""
+        from babylon.engine.services import ServiceContainer
+        from babylon.kernel.event_bus import Event
+
+        container = ServiceContainer.create()
+        received: list[Event] = []
+
+        try:
+            container.event_bus.subscribe("test", received.append)
+            container.event_bus.publish(Event(type="test", tick=0, payload={}))
+            container.economics_fallbacks.record_melt_unavailable()
+            registry = container.opposition_registry
+
+            container.reset_transients()
+            container.event_bus.publish(Event(type="test", tick=1, payload={}))
+
+            assert [event.tick for event in container.event_bus.get_history()] == [1]
+            assert len(received) == 2
+            assert container.economics_fallbacks.melt_unavailable == 1
+            assert container.opposition_registry is registry
+        finally:
+            container.database.close()
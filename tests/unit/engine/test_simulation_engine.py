@@ -282,3 +282,31 @@ class TestCostChecking:
         assert "USA" in new_state.state_finances
         assert new_state.state_finances["USA"].treasury == 500.0
         assert new_state.state_finances["USA"].police_budget == 30.0
+
+
+# =============================================================================
+# RUN-SCOPED SERVICE CONTAINER
+# =============================================================================
+
+
+class TestRunScopedServices:
+    """A container reused across step() calls matches a fresh one per tick."""
+
+    def test_reused_container_matches_per_tick_container(
+        self, two_node_state: WorldState, config: SimulationConfig
+    ) -> None:
+        from babylon.config.defines import GameDefines
+        from babylon.engine.services import ServiceContainer
+
+        defines = GameDefines.load_default()
+        services = ServiceContainer.create(config, defines)
+        fresh, reused = two_node_state, two_node_state
+        fresh_ctx: dict[str, object] = {}
+        reused_ctx: dict[str, object] = {}
+
+        for _ in range(3):
+            fresh = step(fresh, config, fresh_ctx, defines)
+            reused = step(reused, config, reused_ctx, defines, services=services)
+            assert reused.events == fresh.events
+
+        assert reused.model_dump(mode="json") == fresh.model_dump(mode="json")
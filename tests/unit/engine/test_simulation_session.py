@@ -0,0 +1,116 @@
+"""Resident-graph SimulationSession parity with the step() round-trip path.
+
+The session keeps one BabylonGraph across ticks and re-canonicalizes only
+touched payloads; every materialized state must equal what the pure
+``state = step(state, ...)`` loop produces (Constitution III.7).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from babylon.engine.scenarios import (
+    create_high_tension_scenario,
+    create_imperial_circuit_scenario,
+)
+from babylon.engine.simulation_engine import step
+from babylon.engine.simulation_session import SimulationSession
+from babylon.models import SimulationConfig, WorldState
+
+pytestmark = pytest.mark.unit
+
+_TICKS = 12  # crosses no annual boundary; parity is per-tick, so short suffices
+
+
+def _step_loop(state: WorldState, config: Any, defines: Any, ticks: int) -> list[dict[str, Any]]:
+    ctx: dict[str, Any] = {}
+    dumps: list[dict[str, Any]] = []
+    for _ in range(ticks):
+        state = step(state, config, persistent_context=ctx, defines=defines)
+        dumps.append(state.model_dump(mode="json"))
+    return dumps
+
+
+class TestRoundTripParity:
+    """Every tick's materialized state equals the round-trip path's."""
+
+    @pytest.mark.parametrize(
+        "factory",
+        [create_imperial_circuit_scenario, create_high_tension_scenario],
+        ids=["imperial_circuit", "high_tension"],
+    )
+    def test_each_tick_matches_step_loop(self, factory: Any) -> None:
+        scenario = factory()
+        state, config = scenario[0], scenario[1]
+        defines = scenario[2] if len(scenario) > 2 else None
+        expected = _step_loop(state, config, defines, _TICKS)
+
+        session = SimulationSession(state, config, persistent_context={}, defines=defines)
+        for tick_index in range(_TICKS):
+            session.step()
+            assert session.materialize().model_dump(mode="json") == expected[tick_index], (
+                f"resident-graph divergence at tick {tick_index + 1}"
+            )
+
+    def test_persistent_context_matches_step_loop(self) -> None:
+        state, config, defines = create_imperial_circuit_scenario()
+        ctx_step: dict[str, Any] = {}
+        for _ in range(_TICKS):
+            state = step(state, config, persistent_context=ctx_step, defines=defines)
+
+        initial, _, _ = create_imperial_circuit_scenario()
+        ctx_session: dict[str, Any] = {}
+        SimulationSession(initial, config, persistent_context=ctx_session, defines=defines).run(
+            _TICKS
+        )
+
+        assert ctx_session == ctx_step
+
+
+class TestMaterialization:
+    """Lazy materialization and checkpoint ticks."""
+
+    def test_initial_materialize_is_the_initial_state(self) -> None:
+        state, config, defines = create_imperial_circuit_scenario()
+        session = SimulationSession(state, config, defines=defines)
+        assert session.materialize() is state
+        assert session.tick == state.tick
+
+    def test_materialize_is_cached_between_steps(self) -> None:
+        state, config, defines = create_imperial_circuit_scenario()
+        session = SimulationSession(state, config, defines=defines)
+        session.step()
+        assert session.materialize() is session.materialize()
+
+    def test_checkpoint_callback_fires_on_interval(self) -> None:
+        state, config, defines = create_imperial_circuit_scenario()
+        seen: list[int] = []
+        session = SimulationSession(
+            state,
+            config,
+            defines=defines,
+            checkpoint_every=3,
+            on_checkpoint=lambda world: seen.append(world.tick),
+        )
+        session.run(7)
+        assert seen == [3, 6]
+
+    def test_non_positive_checkpoint_interval_rejected(self) -> None:
+        state, config, defines = create_imperial_circuit_scenario()
+        with pytest.raises(ValueError, match="checkpoint_every"):
+            SimulationSession(state, config, defines=defines, checkpoint_every=0)
+
+
+class TestInertState:
+    """An empty world short-circuits exactly like step()."""
+
+    def test_empty_state_only_bumps_tick(self) -> None:
+        empty = WorldState(tick=4)
+        session = SimulationSession(empty, SimulationConfig())
+        final = session.run(3)
+        assert session.graph is None
+        assert final == step(
+            step(step(empty, SimulationConfig()), SimulationConfig()), SimulationConfig()
+        )
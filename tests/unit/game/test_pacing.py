@@ -486,6 +486,20 @@ class TestRunUntilPaused:
 
         assert sleeper.calls == []
 
+    def test_on_tick_streams_each_outcome_with_its_gate_state_already_updated(self) -> None:
+        advancer = _FakeAdvancer(
+            [_FakeOutcome(tick=1), _FakeOutcome(tick=2, paused=True), _FakeOutcome(tick=3)]
+        )
+        driver = PacedTickDriver(advancer, starting_tick=0)
+        streamed: list[tuple[int, bool]] = []
+
+        results = driver.run_until_paused(
+            on_tick=lambda r: streamed.append((r.tick, driver.awaiting_ack))
+        )
+
+        assert streamed == [(1, False), (2, True)]
+        assert [r.tick for r in results] == [1, 2]
+
 
 # --------------------------------------------------------------------------- #
 # paced_driver_for_session — the real Unit C1 glue, real EndgameDetector.     #
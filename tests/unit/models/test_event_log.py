@@ -0,0 +1,96 @@
+"""Append-only EventLog views over a shared, segmented EventStore."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+from pathlib import Path
+
+import pytest
+
+from babylon.models import WorldState
+from babylon.models.event_log import EventLog, EventStore
+
+pytestmark = pytest.mark.unit
+
+
+class TestViews:
+    """Extending a view shares the store and never mutates older views."""
+
+    def test_extending_the_tip_shares_the_store(self) -> None:
+        log = EventLog(["a"])
+        longer = log.extended(["b", "c"])
+        assert longer.store is log.store
+        assert list(log) == ["a"]
+        assert list(longer) == ["a", "b", "c"]
+        assert longer.since(log.cursor) == ["b", "c"]
+
+    def test_extending_a_stale_view_forks(self) -> None:
+        base = EventLog(["a"])
+        first = base.extended(["b"])
+        second = base.extended(["x"])
+        assert second.store is not base.store
+        assert list(first) == ["a", "b"]
+        assert list(second) == ["a", "x"]
+
+    def test_fork_shares_sealed_segments(self) -> None:
+        store = EventStore(segment_size=2)
+        base = EventLog(["a", "b", "c"], store=store)
+        fork = EventLog._view(store, 3).extended([])  # tip: no fork
+        assert fork.store is store
+        stale = EventLog._view(store, 2).extended(["z"])
+        assert stale.store._sealed[0] is store._sealed[0]
+        assert list(stale) == ["a", "b", "z"]
+        assert list(base) == ["a", "b", "c"]
+
+    def test_sequence_protocol_matches_list(self) -> None:
+        lines = [f"Tick {i}" for i in range(10)]
+        log = EventLog(lines, store=EventStore(segment_size=3))
+        assert len(log) == 10
+        assert log[-1] == "Tick 9"
+        assert log[-4:] == lines[-4:]
+        assert log[::3] == lines[::3]
+        assert "Tick 5" in log
+        assert log == lines
+        with pytest.raises(IndexError):
+            log[10]
+
+    def test_non_positive_segment_size_rejected(self) -> None:
+        with pytest.raises(ValueError, match="segment_size"):
+            EventStore(segment_size=0)
+
+
+class TestSpill:
+    """Sealed segments beyond the resident budget live on disk."""
+
+    def test_spilled_segments_read_back(self, tmp_path: Path) -> None:
+        store = EventStore(segment_size=2, spill_dir=tmp_path, resident_segments=1)
+        lines = [f"line {i}" for i in range(9)]
+        log = EventLog(lines, store=store)
+        assert any(isinstance(segment, Path) for segment in store._sealed)
+        assert list(log) == lines
+        assert log[1] == "line 1"
+        assert log[3:7] == lines[3:7]
+
+
+class TestSerialization:
+    """The view round-trips as a plain list of strings."""
+
+    def test_world_state_json_round_trip(self) -> None:
+        state = WorldState(event_log=["a", "b"])
+        assert isinstance(state.event_log, EventLog)
+        dumped = state.model_dump(mode="json")
+        assert dumped["event_log"] == ["a", "b"]
+        assert WorldState.model_validate(dumped) == state
+        assert WorldState.model_validate_json(state.model_dump_json()) == state
+
+    def test_pickle_and_copy(self) -> None:
+        log = EventLog(["a", "b"])
+        assert pickle.loads(pickle.dumps(log)) == log
+        assert copy.deepcopy(log) is log
+
+    def test_add_event_leaves_original_state_unchanged(self) -> None:
+        state = WorldState(event_log=["a"])
+        updated = state.add_event("b")
+        assert list(state.event_log) == ["a"]
+        assert list(updated.event_log) == ["a", "b"]
@@ -34,9 +34,10 @@ class TestNoRawDynamicHexState:
             sql, _ = queries.build_series_query(scope, _SID, "USA", 0, 10)
             assert "dynamic_hex_state" not in sql
 
-    def test_hex_query_uses_asof_view(self) -> None:
+    def test_hex_query_uses_checkpoint_bounded_asof_read(self) -> None:
         sql, _ = queries.build_hex_query(_SID, 3, None, None, 10)
-        assert "v_hex_state_asof" in sql
+        assert "FROM hex_state_asof(%s, %s)" in sql
+        assert "v_hex_state_asof" not in sql
         assert "dynamic_hex_state" not in sql
 
 
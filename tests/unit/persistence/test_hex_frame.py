@@ -0,0 +1,96 @@
+"""Unit tests for the columnar hex frame (spec-089 S1b).
+
+:class:`HexFrame` replaces the bridge's per-tick ``model_copy`` of every
+template row; each consumer must see exactly what the row list gave it —
+same delta selection, same determinism hash.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from uuid import UUID
+
+import numpy as np
+import pytest
+
+from babylon.persistence.conservation_audit import compute_determinism_hash
+from babylon.persistence.delta import select_hex_frame_for_emission, select_hex_rows_for_emission
+from babylon.persistence.hex_frame import HexFrame
+from babylon.persistence.hex_state import DynamicHexState
+
+pytestmark = [pytest.mark.unit]
+
+_SESSION = UUID("01234567-89ab-cdef-0123-456789abcdef")
+_H3_A = "872a91055ffffff"
+_H3_B = "872a9105bffffff"
+
+
+def _row(h3: str = _H3_A, tick: int = 0, v: float = 2.0) -> DynamicHexState:
+    return DynamicHexState(
+        session_id=_SESSION,
+        tick=tick,
+        h3_index=h3,
+        county_fips="26163",
+        state_fips="26",
+        region_id="midwest",
+        c=1.0,
+        v=v,
+        s=3.0,
+        k=4.0,
+        biocapacity_stock=5.0,
+        energy_stock=6.0,
+        raw_material_stock=7.0,
+        internet_access_pct=0.5,
+        surveillance_coupling=0.25,
+    )
+
+
+class TestHexFrameRoundTrip:
+    def test_rows_round_trip(self) -> None:
+        rows = [_row(_H3_B), _row(_H3_A, v=0.1)]
+        assert HexFrame.from_rows(rows).rows() == rows
+
+    def test_at_tick_restamps_without_copying(self) -> None:
+        frame = HexFrame.from_rows([_row()])
+        later = frame.at_tick(9)
+        assert later.values is frame.values
+        assert later.rows() == [_row(tick=9)]
+
+    def test_empty_rows_rejected(self) -> None:
+        with pytest.raises(ValueError, match="at least one row"):
+            HexFrame.from_rows([])
+
+    def test_save_load_is_memory_mapped(self, tmp_path: Path) -> None:
+        frame = HexFrame.from_rows([_row(_H3_A), _row(_H3_B, v=8.0)])
+        mapped = frame.save(tmp_path / "frame")
+        assert isinstance(mapped.values, np.memmap)
+        assert mapped.rows() == frame.rows()
+
+
+class TestSelectHexFrameForEmission:
+    def test_matches_row_selection_tick_by_tick(self) -> None:
+        template = HexFrame.from_rows([_row(_H3_A), _row(_H3_B)])
+        changed = HexFrame.from_rows([_row(_H3_A, v=99.0), _row(_H3_B)])
+        last_rows: dict[str, tuple[float, ...]] = {}
+        last_values: np.ndarray | None = None
+        for tick, source in [(0, template), (1, template), (2, changed), (3, changed)]:
+            frame = source.at_tick(tick)
+            expected = select_hex_rows_for_emission(
+                tick=tick, candidate_rows=frame.rows(), last_emitted=last_rows
+            )
+            emit, last_values = select_hex_frame_for_emission(frame=frame, last_emitted=last_values)
+            assert frame.rows(emit) == expected
+
+    def test_checkpoint_tick_emits_full_frame_even_if_unchanged(self) -> None:
+        frame = HexFrame.from_rows([_row()])
+        _, last = select_hex_frame_for_emission(frame=frame, last_emitted=None)
+        emit, _ = select_hex_frame_for_emission(frame=frame.at_tick(52), last_emitted=last)
+        assert emit.tolist() == [0]
+
+
+class TestFrameConsumersAreByteIdentical:
+    def test_determinism_hash_matches_rows(self) -> None:
+        frame = HexFrame.from_rows([_row(_H3_B, tick=3), _row(_H3_A, tick=3, v=0.1)])
+        assert compute_determinism_hash(
+            tick=3, rng_seed=42, hex_rows=frame
+        ) == compute_determinism_hash(tick=3, rng_seed=42, hex_rows=frame.rows())
@@ -0,0 +1,130 @@
+"""Unit tests for the COPY bulk writer behind PostgresRuntime (mocked psycopg).
+
+Below ``COPY_THRESHOLD`` rows the writer keeps ``executemany``; at or above
+it, rows are COPY-staged and moved with one ``INSERT ... SELECT`` carrying
+the same ``ON CONFLICT`` clause, inside a (nested) transaction. Upserts
+collapse duplicate keys last-wins first, as row-by-row ``executemany`` would.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+
+from babylon.persistence.postgres_runtime import PostgresRuntime
+from babylon.persistence.postgres_runtime._bulk_copy import (
+    COPY_THRESHOLD,
+    BulkTarget,
+    insert_rows,
+)
+
+pytestmark = [pytest.mark.unit]
+
+_TARGET = BulkTarget(
+    table="hex_state",
+    columns=("session_id", "tick", "h3_index", "profit_rate"),
+    on_conflict=(
+        "ON CONFLICT (session_id, tick, h3_index) DO UPDATE SET profit_rate = EXCLUDED.profit_rate"
+    ),
+    key=("session_id", "tick", "h3_index"),
+)
+
+
+@pytest.fixture()
+def cursor() -> MagicMock:
+    """Mock cursor whose connection supports ``transaction()`` and ``copy()``."""
+    cur = MagicMock()
+    cur.__enter__ = MagicMock(return_value=cur)
+    cur.__exit__ = MagicMock(return_value=False)
+    cur.transactions = []
+
+    @contextmanager
+    def transaction() -> Any:
+        cur.transactions.append("open")
+        yield
+        cur.transactions.append("closed")
+
+    cur.connection.transaction = transaction
+    copy = MagicMock()
+    cur.copy.return_value.__enter__ = MagicMock(return_value=copy)
+    cur.copy.return_value.__exit__ = MagicMock(return_value=False)
+    cur.copy_handle = copy
+    return cur
+
+
+def _rows(n: int) -> list[tuple[Any, ...]]:
+    return [("sid", 1, f"h{i}", float(i)) for i in range(n)]
+
+
+def test_small_batch_uses_executemany(cursor: MagicMock) -> None:
+    insert_rows(cursor, _TARGET, _rows(3))
+
+    sql, rows = cursor.executemany.call_args[0]
+    assert sql.startswith("INSERT INTO hex_state (session_id, tick, h3_index, profit_rate)")
+    assert "ON CONFLICT (session_id, tick, h3_index) DO UPDATE" in sql
+    assert rows == _rows(3)
+    cursor.copy.assert_not_called()
+
+
+def test_large_batch_copies_into_stage_then_inserts(cursor: MagicMock) -> None:
+    insert_rows(cursor, _TARGET, _rows(COPY_THRESHOLD))
+
+    cursor.executemany.assert_not_called()
+    assert cursor.transactions == ["open", "closed"]
+    statements = [call[0][0] for call in cursor.execute.call_args_list]
+    assert statements[0].startswith("CREATE TEMP TABLE IF NOT EXISTS _copy_stage_hex_state")
+    assert cursor.copy.call_args[0][0] == (
+        "COPY _copy_stage_hex_state (session_id, tick, h3_index, profit_rate) FROM STDIN"
+    )
+    assert cursor.copy_handle.write_row.call_count == COPY_THRESHOLD
+    assert (
+        "SELECT session_id, tick, h3_index, profit_rate FROM _copy_stage_hex_state"
+        in (statements[1])
+    )
+    assert _TARGET.on_conflict in statements[1]
+    assert statements[2] == "TRUNCATE _copy_stage_hex_state"
+
+
+def test_upsert_batch_collapses_duplicate_keys_last_wins(cursor: MagicMock) -> None:
+    rows = [*_rows(COPY_THRESHOLD), ("sid", 1, "h0", 99.0)]
+    insert_rows(cursor, _TARGET, rows)
+
+    written = [call[0][0] for call in cursor.copy_handle.write_row.call_args_list]
+    assert len(written) == COPY_THRESHOLD
+    assert ("sid", 1, "h0", 99.0) in written
+    assert ("sid", 1, "h0", 0.0) not in written
+
+
+def test_use_copy_false_forces_executemany(cursor: MagicMock) -> None:
+    insert_rows(cursor, _TARGET, _rows(COPY_THRESHOLD), use_copy=False)
+
+    cursor.copy.assert_not_called()
+    assert len(cursor.executemany.call_args[0][1]) == COPY_THRESHOLD
+
+
+def test_runtime_routes_large_class_snapshots_through_copy(cursor: MagicMock) -> None:
+    classes = [{"class_id": f"C{i}", "role": "proletariat"} for i in range(COPY_THRESHOLD)]
+    runtime = PostgresRuntime(MagicMock())
+
+    runtime.persist_class_snapshots(UUID(int=1), 3, classes, _cursor=cursor)
+
+    cursor.executemany.assert_not_called()
+    assert cursor.copy_handle.write_row.call_count == COPY_THRESHOLD
+    assert (
+        "ON CONFLICT (game_id, tick, class_id) DO NOTHING"
+        in (cursor.execute.call_args_list[1][0][0])
+    )
+
+
+def test_runtime_bulk_copy_disabled_keeps_executemany(cursor: MagicMock) -> None:
+    classes = [{"class_id": f"C{i}", "role": "proletariat"} for i in range(COPY_THRESHOLD)]
+    runtime = PostgresRuntime(MagicMock(), bulk_copy=False)
+
+    runtime.persist_class_snapshots(UUID(int=1), 3, classes, _cursor=cursor)
+
+    cursor.copy.assert_not_called()
+    assert "INSERT INTO class_snapshot" in cursor.executemany.call_args[0][0]
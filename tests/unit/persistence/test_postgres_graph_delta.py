@@ -0,0 +1,271 @@
+"""Unit tests for delta-encoded graph snapshots (mocked psycopg).
+
+With ``delta_snapshots=True``, ``PostgresRuntime.persist_tick`` writes only
+changed attribute keys (plus removed keys and tombstones) against the
+previous tick, a full checkpoint when it has no base frame or every 52
+ticks, and one ``graph_commit`` content hash per tick that answers the
+monotonic-idempotent re-persist check. ``hydrate_graph`` replays the latest
+checkpoint plus its deltas into the same graph a full frame would give.
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+
+from babylon.models.event_log import EventLog
+from babylon.persistence.postgres_runtime import PostgresRuntime
+from babylon.persistence.postgres_runtime._graph_delta import (
+    TOMBSTONE,
+    AttrDelta,
+    apply_delta,
+    content_hash,
+    diff_attrs,
+    diff_frames,
+)
+from babylon.persistence.protocols import MonotonicityViolationError
+from babylon.topology.graph import BabylonGraph
+
+pytestmark = [pytest.mark.unit]
+
+_SID = UUID("12345678-1234-5678-1234-567812345678")
+
+
+@pytest.fixture()
+def cursor() -> MagicMock:
+    cur = MagicMock()
+    cur.__enter__ = MagicMock(return_value=cur)
+    cur.__exit__ = MagicMock(return_value=False)
+    cur.fetchone = MagicMock(return_value=None)
+    cur.fetchall = MagicMock(return_value=[])
+    return cur
+
+
+@pytest.fixture()
+def conn(cursor: MagicMock) -> MagicMock:
+    connection = MagicMock()
+    connection.cursor = MagicMock(return_value=cursor)
+
+    @contextmanager
+    def transaction() -> Any:
+        yield
+
+    connection.transaction = transaction
+    return connection
+
+
+@pytest.fixture()
+def runtime(conn: MagicMock) -> PostgresRuntime:
+    pool = MagicMock()
+
+    @contextmanager
+    def connection() -> Any:
+        yield conn
+
+    pool.connection = connection
+    return PostgresRuntime(pool, delta_snapshots=True)
+
+
+def _graph(wealth: float, *, flag: bool = True, with_b: bool = True) -> BabylonGraph:
+    graph = BabylonGraph()
+    attrs: dict[str, Any] = {"type": "SocialClass", "wealth": wealth}
+    if flag:
+        attrs["flag"] = True
+    graph.add_node("a", **attrs)
+    if with_b:
+        graph.add_node("b", type="SocialClass", wealth=1.0)
+        graph.add_edge("a", "b", type="EXPLOITATION", value_flow=2.0)
+    graph.set_graph_attr("economy", {"rate": 0.1})
+    return graph
+
+
+def _node_rows(cursor: MagicMock) -> list[tuple[Any, ...]]:
+    node_calls = [call for call in cursor.executemany.call_args_list if "node_state" in call[0][0]]
+    return list(node_calls[-1][0][1])
+
+
+class TestDiff:
+    def test_replaying_checkpoint_plus_delta_gives_current_frame(self) -> None:
+        before = {"a": {"x": 1, "y": 2}, "b": {"x": 0}}
+        after = {"a": {"x": 1, "z": 3}, "c": {}}
+
+        state: dict[str, dict[str, Any]] = {}
+        for key, delta in diff_frames({}, before).items():
+            apply_delta(state, key, delta)
+        for key, delta in diff_frames(before, after).items():
+            apply_delta(state, key, delta)
+
+        assert state == after
+
+    def test_delta_carries_only_changed_and_removed_keys(self) -> None:
+        assert diff_attrs({"x": 1, "y": 2}, {"x": 1, "y": 2}) is None
+        assert diff_attrs({"x": 1, "y": 2}, {"x": 5}) == AttrDelta(changed={"x": 5}, removed=("y",))
+        assert diff_frames({"gone": {}}, {}) == {"gone": TOMBSTONE}
+
+    def test_content_hash_ignores_key_order(self) -> None:
+        assert content_hash({"a": 1, "b": [2]}) == content_hash({"b": [2], "a": 1})
+        assert content_hash({"a": 1}) != content_hash({"a": 2})
+
+
+class TestPersistTickDelta:
+    def test_first_tick_is_a_full_checkpoint(
+        self, runtime: PostgresRuntime, cursor: MagicMock, conn: MagicMock
+    ) -> None:
+        runtime.persist_tick(tick=3, graph=_graph(5.0), session_id=_SID)
+
+        rows = _node_rows(cursor)
+        assert {row[2]: json.loads(row[4]) for row in rows} == {
+            "a": {"type": "SocialClass", "wealth": 5.0, "flag": True},
+            "b": {"type": "SocialClass", "wealth": 1.0},
+        }
+        commit = conn.execute.call_args_list[-1][0]
+        assert "INSERT INTO graph_commit" in commit[0]
+        assert commit[1][3] is True  # is_checkpoint
+
+    def test_next_tick_writes_changed_keys_and_tombstones_only(
+        self, runtime: PostgresRuntime, cursor: MagicMock, conn: MagicMock
+    ) -> None:
+        runtime.persist_tick(tick=3, graph=_graph(5.0), session_id=_SID)
+        cursor.executemany.reset_mock()
+        conn.execute.reset_mock()
+
+        runtime.persist_tick(tick=4, graph=_graph(6.0, flag=False, with_b=False), session_id=_SID)
+
+        rows = _node_rows(cursor)
+        assert [(row[2], json.loads(row[4]), row[-2], row[-1]) for row in rows] == [
+            ("a", {"wealth": 6.0}, ["flag"], False),
+            ("b", {}, [], True),
+        ]
+        assert rows[0][5] == 6.0  # promoted wealth reflects the full state
+        statements = [call[0][0] for call in conn.execute.call_args_list]
+        assert not any("graph_metadata" in sql for sql in statements)  # extra unchanged
+        assert conn.execute.call_args_list[-1][0][1][3] is False
+
+    def test_event_log_tail_is_written_without_other_extra_changes(
+        self, runtime: PostgresRuntime, conn: MagicMock
+    ) -> None:
+        graph = _graph(5.0)
+        graph.set_graph_attr("event_log", EventLog(["Tick 3: STRIKE"]))
+        runtime.persist_tick(tick=3, graph=graph, session_id=_SID)
+        conn.execute.reset_mock()
+
+        graph.set_graph_attr("event_log", graph.graph["event_log"].extended(["Tick 4: RIOT"]))
+        runtime.persist_tick(tick=4, graph=graph, session_id=_SID)
+
+        (metadata,) = [c[0][1] for c in conn.execute.call_args_list if "graph_metadata" in c[0][0]]
+        assert json.loads(metadata[2]) == {"event_log": {"start": 1, "lines": ["Tick 4: RIOT"]}}
+        assert metadata[3] == []
+
+    def test_frame_and_canonical_payload_come_from_one_serialization(
+        self, runtime: PostgresRuntime
+    ) -> None:
+        graph = _graph(5.0)
+        graph.nodes["b"]["seen_at"] = datetime(2026, 1, 1, tzinfo=UTC)
+        events = [{"event_type": "STRIKE", "tick": 3}]
+
+        frame, payload = runtime._graph_frame(3, graph, events)
+
+        assert payload == runtime._canonical_payload(graph, events)
+        assert frame.nodes["b"]["seen_at"] == "2026-01-01T00:00:00+00:00"
+        assert frame.nodes["a"] == {"type": "SocialClass", "wealth": 5.0, "flag": True}
+
+    def test_retry_compares_stored_hash_without_rereading_rows(
+        self, runtime: PostgresRuntime, cursor: MagicMock
+    ) -> None:
+        graph = _graph(5.0)
+        digest = content_hash(runtime._canonical_payload(graph, None))
+        cursor.fetchone.return_value = (digest,)
+
+        runtime.persist_tick(tick=3, graph=graph, session_id=_SID)
+
+        assert cursor.execute.call_count == 1
+        assert cursor.executemany.call_count == 0
+
+    def test_different_payload_for_committed_tick_raises(
+        self, runtime: PostgresRuntime, cursor: MagicMock
+    ) -> None:
+        cursor.fetchone.return_value = ("0" * 64,)
+
+        with pytest.raises(MonotonicityViolationError):
+            runtime.persist_tick(tick=3, graph=_graph(5.0), session_id=_SID)
+
+
+class TestHydrateGraphDelta:
+    def test_replays_checkpoint_and_deltas(
+        self, runtime: PostgresRuntime, cursor: MagicMock
+    ) -> None:
+        cursor.fetchone.return_value = {"checkpoint_tick": 52, "as_of_tick": 54}
+        cursor.fetchall.side_effect = [
+            [
+                {
+                    "node_id": "a",
+                    "node_type": "SocialClass",
+                    "attributes": {"wealth": 5.0, "flag": True},
+                    "removed_keys": [],
+                    "is_removed": False,
+                },
+                {
+                    "node_id": "b",
+                    "node_type": "SocialClass",
+                    "attributes": {"wealth": 1.0},
+                    "removed_keys": None,
+                    "is_removed": False,
+                },
+                {
+                    "node_id": "a",
+                    "node_type": "SocialClass",
+                    "attributes": {"wealth": 6.0},
+                    "removed_keys": ["flag"],
+                    "is_removed": False,
+                },
+                {
+                    "node_id": "b",
+                    "node_type": "SocialClass",
+                    "attributes": {},
+                    "removed_keys": [],
+                    "is_removed": True,
+                },
+            ],
+            [],
+            [
+                {
+                    "extra": {
+                        "economy": {"rate": 0.1},
+                        "event_log": {"start": 0, "lines": ["Tick 52: STRIKE"]},
+                    },
+                    "removed_keys": None,
+                }
+            ],
+            [{"record": {"start": 0, "lines": ["Tick 52: STRIKE"]}}],
+        ]
+
+        graph = runtime.hydrate_graph(tick=60, session_id=_SID)
+
+        assert graph.nodes["a"]["wealth"] == 6.0
+        assert "flag" not in graph.nodes["a"]
+        assert "b" not in graph.nodes
+        assert graph.graph["economy"] == {"rate": 0.1}
+        assert graph.graph["event_log"] == ["Tick 52: STRIKE"]
+        assert graph.graph["tick"] == 54
+        window = cursor.execute.call_args_list[1][0][1]
+        assert window == (_SID, 52, 54)
+
+    def test_session_without_delta_commits_reads_full_frames(
+        self, runtime: PostgresRuntime, cursor: MagicMock
+    ) -> None:
+        cursor.fetchone.side_effect = [{"checkpoint_tick": None, "as_of_tick": None}, None]
+        cursor.fetchall.side_effect = [
+            [{"node_id": "a", "node_type": "SocialClass", "attributes": {"wealth": 5.0}}],
+            [],
+        ]
+
+        graph = runtime.hydrate_graph(tick=2, session_id=_SID)
+
+        assert graph.nodes["a"]["wealth"] == 5.0
+        assert graph.graph["tick"] == 2
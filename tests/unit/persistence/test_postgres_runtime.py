@@ -22,6 +22,7 @@ from babylon.models.entities.organization import PoliticalFaction
 from babylon.models.entity_registry import PERIPHERY_WORKER_ID
 from babylon.models.enums import ClassCharacter, EventType, OrgType
 from babylon.models.enums.doctrine import DoctrineTag
+from babylon.models.event_log import EventLog
 from babylon.models.events import DoctrineTrapSprungEvent, UprisingEvent
 from babylon.models.world_state import WorldState
 from babylon.persistence.postgres_runtime import PostgresRuntime
@@ -748,6 +749,65 @@ class TestHydrateGraph:
         assert hydrated["nullable_field"] is None
 
 
+def _stored_extra(mock_conn: MagicMock) -> dict[str, Any]:
+    """The ``graph_metadata.extra`` written by the last ``persist_tick``."""
+    calls = [c for c in mock_conn.execute.call_args_list if "graph_metadata" in c[0][0]]
+    return dict(json.loads(calls[-1][0][1][2]))
+
+
+class TestEventLogTail:
+    """``event_log`` is stored as the tail appended since the last tick."""
+
+    def test_each_tick_stores_only_new_lines(
+        self,
+        runtime: PostgresRuntime,
+        session_id: UUID,
+        mock_conn: MagicMock,
+    ) -> None:
+        """The first tick stores the log from 0, later ticks only their tail."""
+        log = EventLog(["Tick 1: UPRISING", "Tick 1: STRIKE"])
+        graph = _build_graph()
+
+        graph.set_graph_attr("event_log", log)
+        runtime.persist_tick(tick=1, graph=graph, session_id=session_id)
+        assert _stored_extra(mock_conn)["event_log"] == {"start": 0, "lines": list(log)}
+
+        graph.set_graph_attr("event_log", log.extended(["Tick 2: RIOT"]))
+        runtime.persist_tick(tick=2, graph=graph, session_id=session_id)
+        assert _stored_extra(mock_conn)["event_log"] == {"start": 2, "lines": ["Tick 2: RIOT"]}
+
+        runtime.persist_tick(tick=3, graph=graph, session_id=session_id)
+        assert "event_log" not in _stored_extra(mock_conn)
+
+    def test_hydrate_folds_records_up_to_tick(
+        self,
+        runtime: PostgresRuntime,
+        session_id: UUID,
+        mock_cursor: MagicMock,
+    ) -> None:
+        """A legacy full list, then tail records, fold back into one log."""
+        mock_cursor.fetchone.return_value = {"extra": {"economy": {"rate": 0.1}}}
+        mock_cursor.fetchall.side_effect = [
+            [],
+            [],
+            [
+                {"record": ["Tick 1: UPRISING"]},
+                {"record": {"start": 1, "lines": ["Tick 2: STRIKE"]}},
+                {"record": {"start": 2, "lines": ["Tick 3: RIOT"]}},
+            ],
+        ]
+
+        graph = runtime.hydrate_graph(tick=3, session_id=session_id)
+
+        assert graph.graph["economy"] == {"rate": 0.1}
+        assert list(graph.graph["event_log"]) == [
+            "Tick 1: UPRISING",
+            "Tick 2: STRIKE",
+            "Tick 3: RIOT",
+        ]
+        assert isinstance(graph.graph["event_log"], EventLog)
+
+
 # ══════════════════════════════════════════════════════════════════════
 # T013: Extended persistence methods (graph_metadata, community, hex,
 #       infrastructure, contradiction)
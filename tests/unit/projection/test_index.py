@@ -0,0 +1,112 @@
+"""Contract tests for :class:`babylon.projection.index.ProjectionIndex`.
+
+One index per tick answers every projector's territory/claim/attribution
+lookup; sharing it must never change a dossier. Fixture-fed — no engine
+tick, no database.
+"""
+
+from __future__ import annotations
+
+from babylon.models.entities.social_class import IdeologicalProfile, SocialClass
+from babylon.models.enums import SocialRole
+from babylon.models.enums.topology import EdgeType, NodeType
+from babylon.models.world_state import WorldState
+from babylon.projection.county import project_county
+from babylon.projection.index import ProjectionIndex
+from babylon.projection.national import project_national
+from babylon.projection.social_class import project_social_class
+from babylon.projection.sovereign import project_sovereign
+from babylon.projection.state import project_state
+from babylon.topology import BabylonGraph
+
+WAYNE = "26163"
+OAKLAND = "26125"
+COOK = "17031"
+
+
+def _entity(eid: str, county_fips: str | None, population: int = 100) -> SocialClass:
+    return SocialClass(
+        id=eid,
+        name=f"Test {eid}",
+        role=SocialRole.PERIPHERY_PROLETARIAT,
+        wealth=1.0,
+        ideology=IdeologicalProfile(class_consciousness=0.4, national_identity=0.3),
+        p_acquiescence=0.6,
+        p_revolution=0.2,
+        population=population,
+        county_fips=county_fips,
+    )
+
+
+def _world() -> WorldState:
+    entities = [
+        _entity("C001", WAYNE, 300),
+        _entity("C002", WAYNE, 0),
+        _entity("C003", OAKLAND, 120),
+        _entity("C004", COOK, 80),
+        _entity("C005", None),
+    ]
+    return WorldState(entities={entity.id: entity for entity in entities})
+
+
+def _graph() -> BabylonGraph:
+    graph = BabylonGraph()
+    graph.add_node("T002", NodeType.TERRITORY, county_fips=WAYNE, tick_median_wage=20.0)
+    graph.add_node("T001", NodeType.TERRITORY, county_fips=WAYNE, tick_median_wage=19.0)
+    graph.add_node("T003", NodeType.TERRITORY, county_fips=OAKLAND, legitimation_index=0.6)
+    graph.add_node("T004", NodeType.TERRITORY, county_fips=COOK, tick_phi_hour=10.0)
+    graph.add_node("C001", NodeType.SOCIAL_CLASS, county_fips=WAYNE, population=300)
+    graph.add_node("SOV_USA", NodeType.SOVEREIGN, name="United States")
+    graph.add_node("SOV_ALT", NodeType.SOVEREIGN, name="Rival")
+    for territory_id in ("T001", "T002", "T003", "T004"):
+        graph.add_edge("SOV_USA", territory_id, EdgeType.CLAIMS)
+    graph.add_edge("SOV_ALT", "T004", EdgeType.CLAIMS)
+    return graph
+
+
+class TestLookups:
+    def test_territory_tie_breaks_on_smallest_node_id(self) -> None:
+        index = ProjectionIndex.build(_graph(), _world())
+        territory = index.territory(WAYNE)
+        assert territory is not None
+        assert territory.id == "T001"
+        assert index.territory("99999") is None
+
+    def test_claimants(self) -> None:
+        index = ProjectionIndex.build(_graph(), _world())
+        assert index.single_claimant("T001") == "SOV_USA"
+        assert index.single_claimant("T004") is None  # contested
+        assert index.territory_claimants() == ("SOV_ALT", "SOV_USA")
+        assert index.claimed_by("SOV_ALT") == ("T004",)
+        assert index.claimed_by("SOV_NONE") == ()
+
+    def test_entities_bucketed_by_county(self) -> None:
+        index = ProjectionIndex.build(_graph(), _world())
+        assert [entity.id for entity in index.entities_in(WAYNE)] == ["C001", "C002"]
+        assert index.entity_fips_codes() == (COOK, OAKLAND, WAYNE)
+        assert index.entities_in("99999") == ()
+
+
+class TestSharedIndexEquivalence:
+    def test_every_projector_matches_its_unindexed_call(self) -> None:
+        graph, world = _graph(), _world()
+        index = ProjectionIndex.build(graph, world)
+
+        for fips in (WAYNE, OAKLAND, COOK, "99999"):
+            assert project_county(
+                fips, graph=graph, world=world, tick=3, index=index
+            ) == project_county(fips, graph=graph, world=world, tick=3)
+        for state_fips in ("26", "17"):
+            assert project_state(
+                state_fips, graph=graph, world=world, tick=3, index=index
+            ) == project_state(state_fips, graph=graph, world=world, tick=3)
+        assert project_national(
+            "USA", graph=graph, world=world, tick=3, index=index
+        ) == project_national("USA", graph=graph, world=world, tick=3)
+        for sovereign_id in ("SOV_USA", "SOV_ALT"):
+            assert project_sovereign(
+                sovereign_id, graph=graph, world=world, tick=3, index=index
+            ) == project_sovereign(sovereign_id, graph=graph, world=world, tick=3)
+        assert project_social_class(
+            "C001", graph=graph, world=world, tick=3, index=index
+        ) == project_social_class("C001", graph=graph, world=world, tick=3)
@@ -0,0 +1,273 @@
+"""Tests for multi-input embedding requests and the persistent embedding store.
+
+A batch must go out as one request per planned chunk (bounded by
+``batch_size`` and the token budget), cached and duplicate contents must
+not be re-requested, and vectors persisted by one manager must be served
+to another without a request. Against a stub ``/v1/embeddings`` server, an
+Ollama batch must send one ``input`` array, be re-ordered by ``index`` and
+fail loudly on a short response.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from babylon.intelligence.rag.embedding_store import EmbeddingStore
+from babylon.intelligence.rag.embeddings import EmbeddingError, EmbeddingManager
+
+pytestmark = pytest.mark.unit
+
+
+@dataclass
+class _Chunk:
+    id: str
+    content: str
+    embedding: list[float] | None = None
+
+
+@pytest.fixture
+def mock_llm_config() -> MagicMock:
+    """OpenAI-compatible provider, which accepts an ``input`` array."""
+    with patch("babylon.intelligence.rag.embeddings.LLMConfig") as mock:
+        mock.validate_embeddings.return_value = None
+        mock.get_model_dimensions.return_value = 3
+        mock.BATCH_SIZE = 10
+        mock.is_ollama_embeddings.return_value = False
+        mock.EMBEDDING_MODEL = "test-model"
+        yield mock
+
+
+class _FakeApi:
+    """Records each multi-input request and returns one vector per input."""
+
+    def __init__(self) -> None:
+        self.requests: list[list[str]] = []
+
+    async def __call__(self, contents: Sequence[str]) -> list[list[float]]:
+        self.requests.append(list(contents))
+        return [[float(len(content)), 0.5, -1.0] for content in contents]
+
+
+def _manager(**kwargs: object) -> EmbeddingManager:
+    return EmbeddingManager(metrics=MagicMock(), **kwargs)  # type: ignore[arg-type]
+
+
+def _chunks(*contents: str) -> list[_Chunk]:
+    return [_Chunk(id=f"c{i}", content=content) for i, content in enumerate(contents)]
+
+
+@pytest.mark.usefixtures("mock_llm_config")
+class TestMultiInputRequests:
+    def test_one_request_per_batch_size_chunk(self) -> None:
+        manager = _manager(batch_size=4)
+        api = _FakeApi()
+        with patch.object(manager, "_generate_embeddings_api", new=api):
+            result = manager.embed_batch(_chunks(*(f"text {i}" for i in range(10))))
+
+        assert [len(request) for request in api.requests] == [4, 4, 2]
+        assert [chunk.embedding for chunk in result] == [[6.0, 0.5, -1.0]] * 10
+
+    def test_token_budget_closes_chunks_early(self) -> None:
+        manager = _manager(batch_size=100, max_batch_tokens=30)
+        api = _FakeApi()
+        long_text = " ".join(["word"] * 20)  # 26 estimated tokens
+        with patch.object(manager, "_generate_embeddings_api", new=api):
+            manager.embed_batch(_chunks(long_text, "a b", long_text + " x", "c d"))
+
+        assert [len(request) for request in api.requests] == [2, 2]
+
+    def test_cached_and_duplicate_contents_are_not_requested(self) -> None:
+        manager = _manager(batch_size=10)
+        api = _FakeApi()
+        with patch.object(manager, "_generate_embeddings_api", new=api):
+            manager.embed_batch(_chunks("alpha", "beta"))
+            result = manager.embed_batch(_chunks("alpha", "gamma", "gamma", "beta"))
+
+        assert api.requests == [["alpha", "beta"], ["gamma"]]
+        assert all(chunk.embedding is not None for chunk in result)
+
+    def test_failure_reports_partial_progress(self) -> None:
+        manager = _manager(batch_size=10)
+
+        async def failing(contents: Sequence[str]) -> list[list[float]]:
+            raise RuntimeError("upstream down")
+
+        with (
+            patch.object(manager, "_generate_embeddings_api", new=failing),
+            pytest.raises(EmbeddingError, match="0 objects were successfully embedded"),
+        ):
+            manager.embed_batch(_chunks("alpha"))
+
+    def test_empty_content_fails_the_batch(self) -> None:
+        with pytest.raises(EmbeddingError, match="empty content"):
+            _manager().embed_batch(_chunks("alpha", ""))
+
+
+@pytest.mark.usefixtures("mock_llm_config")
+class TestPersistentStore:
+    def test_second_manager_reads_the_store(self, tmp_path: Path) -> None:
+        db = tmp_path / "embeddings.sqlite"
+        first_api, second_api = _FakeApi(), _FakeApi()
+
+        first = _manager(store=EmbeddingStore(db))
+        with patch.object(first, "_generate_embeddings_api", new=first_api):
+            first.embed_batch(_chunks("alpha", "beta"))
+
+        # A fresh process: empty LRU, same store; only the edited chunk is embedded.
+        second = _manager(store=EmbeddingStore(db))
+        with patch.object(second, "_generate_embeddings_api", new=second_api):
+            result = second.embed_batch(_chunks("alpha", "beta, revised"))
+
+        assert first_api.requests == [["alpha", "beta"]]
+        assert second_api.requests == [["beta, revised"]]
+        assert result[0].embedding == [5.0, 0.5, -1.0]
+
+    def test_single_embed_uses_the_store(self, tmp_path: Path) -> None:
+        store = EmbeddingStore(tmp_path / "embeddings.sqlite")
+        manager = _manager(store=store)
+
+        async def generate(content: str) -> list[float]:
+            return [1.0, 2.0, 3.0]
+
+        with patch.object(manager, "_generate_embedding_api", new=generate):
+            manager.embed(_Chunk(id="c0", content="alpha"))
+
+        assert store.get_many("test-model", [manager._get_cache_key("alpha")]) == {
+            manager._get_cache_key("alpha"): [1.0, 2.0, 3.0]
+        }
+
+
+#: Shapes the stub's ``data`` list from the in-order response items.
+_Respond = Callable[[list[dict[str, Any]]], list[dict[str, Any]]]
+
+
+class _StubEmbeddingServer:
+    """An OpenAI-compatible ``/v1/embeddings`` stub recording each payload."""
+
+    def __init__(self) -> None:
+        self.payloads: list[dict[str, Any]] = []
+        self.respond: _Respond = lambda items: items
+
+    async def handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.payloads.append(payload)
+        items = [
+            {"object": "embedding", "index": i, "embedding": [float(len(text)), float(i)]}
+            for i, text in enumerate(payload["input"])
+        ]
+        return web.json_response({"object": "list", "data": self.respond(items)})
+
+
+@pytest_asyncio.fixture
+async def stub_server() -> AsyncIterator[tuple[_StubEmbeddingServer, str]]:
+    stub = _StubEmbeddingServer()
+    app = web.Application()
+    app.router.add_post("/v1/embeddings", stub.handle)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield stub, str(server.make_url("")).rstrip("/")
+    finally:
+        await server.close()
+
+
+@pytest.fixture
+def ollama_config(stub_server: tuple[_StubEmbeddingServer, str]) -> MagicMock:
+    """Ollama embeddings pointed at the stub server."""
+    _, base = stub_server
+    with patch("babylon.intelligence.rag.embeddings.LLMConfig") as mock:
+        mock.validate_embeddings.return_value = None
+        mock.get_model_dimensions.return_value = 2
+        mock.BATCH_SIZE = 10
+        mock.is_ollama_embeddings.return_value = True
+        mock.EMBEDDING_MODEL = "embeddinggemma:latest"
+        mock.get_embedding_headers.return_value = {"Content-Type": "application/json"}
+        mock.get_batch_embedding_url.return_value = f"{base}/v1/embeddings"
+        mock.REQUEST_TIMEOUT = 5.0
+        yield mock
+
+
+@pytest.mark.usefixtures("ollama_config")
+class TestOllamaBatchRequests:
+    @pytest.mark.asyncio
+    async def test_chunk_is_one_input_array_request(
+        self, stub_server: tuple[_StubEmbeddingServer, str]
+    ) -> None:
+        stub, _ = stub_server
+        manager = _manager(batch_size=2)
+        try:
+            result = await manager.aembed_batch(_chunks("alpha", "be", "gamma"))
+        finally:
+            await manager.close()
+
+        assert stub.payloads == [
+            {"input": ["alpha", "be"], "model": "embeddinggemma:latest"},
+            {"input": ["gamma"], "model": "embeddinggemma:latest"},
+        ]
+        assert [chunk.embedding for chunk in result] == [[5.0, 0.0], [2.0, 1.0], [5.0, 0.0]]
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_response_is_reordered_by_index(
+        self, stub_server: tuple[_StubEmbeddingServer, str]
+    ) -> None:
+        stub, _ = stub_server
+        stub.respond = lambda items: items[::-1]
+        manager = _manager()
+        try:
+            result = await manager.aembed_batch(_chunks("a", "bb", "ccc"))
+        finally:
+            await manager.close()
+
+        assert len(stub.payloads) == 1
+        assert [chunk.embedding for chunk in result] == [[1.0, 0.0], [2.0, 1.0], [3.0, 2.0]]
+
+    @pytest.mark.asyncio
+    async def test_short_response_fails_the_count_check(
+        self, stub_server: tuple[_StubEmbeddingServer, str]
+    ) -> None:
+        stub, _ = stub_server
+        stub.respond = lambda items: items[1:]
+        manager = _manager()
+        try:
+            with pytest.raises(EmbeddingError, match="returned 2 embeddings for 3 inputs"):
+                await manager.aembed_batch(_chunks("a", "bb", "ccc"))
+        finally:
+            await manager.close()
+
+        assert manager.cache_size == 0
+
+
+class TestEmbeddingStore:
+    def test_round_trip_is_keyed_by_model(self, tmp_path: Path) -> None:
+        store = EmbeddingStore(tmp_path / "nested" / "embeddings.sqlite")
+        store.put_many("model-a", {"h1": [0.25, -1.5], "h2": [3.0, 4.0]})
+
+        assert store.get_many("model-a", ["h1", "h2", "h3"]) == {
+            "h1": [0.25, -1.5],
+            "h2": [3.0, 4.0],
+        }
+        assert store.get_many("model-b", ["h1"]) == {}
+        assert len(store) == 2
+
+    def test_vectors_round_trip_exactly(self, tmp_path: Path) -> None:
+        store = EmbeddingStore(tmp_path / "embeddings.sqlite")
+        store.put_many("m", {"h": [0.1, 1 / 3]})
+
+        assert store.get_many("m", ["h"])["h"] == [0.1, 1 / 3]
+
+    def test_lookup_beyond_parameter_limit(self, tmp_path: Path) -> None:
+        store = EmbeddingStore(tmp_path / "embeddings.sqlite")
+        store.put_many("m", {f"h{i}": [float(i)] for i in range(1200)})
+
+        found = store.get_many("m", [f"h{i}" for i in range(1200)])
+        assert len(found) == 1200
+        assert found["h1199"] == [1199.0]
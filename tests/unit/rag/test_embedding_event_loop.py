@@ -20,6 +20,7 @@ from __future__ import annotations
 import asyncio
 import concurrent.futures
 import threading
+from collections.abc import Sequence
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -206,11 +207,11 @@ class TestEmbeddingManagerEventLoop:
         manager = EmbeddingManager()
         chunks = [DocumentChunk(id=f"test{i}", content=f"Test content {i}") for i in range(5)]
 
-        # Mock the API call
-        async def mock_generate(_content: str) -> list[float]:
-            return [0.1] * 768
+        # Mock the batch API call
+        async def mock_generate(contents: Sequence[str]) -> list[list[float]]:
+            return [[0.1] * 768 for _ in contents]
 
-        with patch.object(manager, "_generate_embedding_api", new=mock_generate):
+        with patch.object(manager, "_generate_embeddings_api", new=mock_generate):
             with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
                 future = executor.submit(manager.embed_batch, chunks)
                 try:
@@ -16,10 +16,12 @@ from babylon.models.enums.events import EventType
 from babylon.sentinels._ast import (
     all_dict_literal_str_items,
     attribute_is_none_guard_lines,
+    clear_parse_cache,
     conditional_literal_returns_by_enum_member,
     coupling_edges,
     declared_bindings,
     dict_get_call_lines,
+    enable_disk_parse_cache,
     frozenset_str_members,
     function_return_annotation_name,
     hasattr_guard_lines,
@@ -60,6 +62,36 @@ def test_parse_module_raises_on_syntax_error(tmp_path: Path) -> None:
         parse_module(target)
 
 
+def test_parse_module_caches_by_content(tmp_path: Path) -> None:
+    """Unchanged source is parsed once; an edit is re-parsed, never served stale."""
+    target = tmp_path / "cached.py"
+    target.write_text("X = 1\n", encoding="utf-8")
+    first = parse_module(target)
+    assert parse_module(target) is first
+
+    target.write_text("Y = 2\n", encoding="utf-8")
+    edited = parse_module(target)
+    assert edited is not first
+    assert isinstance(edited.body[0], ast.Assign)
+    assert ast.unparse(edited) == "Y = 2"
+
+
+def test_parse_module_disk_cache_survives_memory_clear(tmp_path: Path) -> None:
+    """With the disk cache on, a fresh process-cache reloads the pickled tree."""
+    target = tmp_path / "disk.py"
+    target.write_text("Z = (1, 2)\n", encoding="utf-8")
+    cache_dir = tmp_path / "ast-cache"
+    enable_disk_parse_cache(cache_dir)
+    try:
+        parse_module(target)
+        assert len(list(cache_dir.glob("*.pickle"))) == 1
+        clear_parse_cache()
+        assert ast.unparse(parse_module(target)) == "Z = (1, 2)"
+    finally:
+        enable_disk_parse_cache(None)
+        clear_parse_cache()
+
+
 def test_referenced_names_covers_names_attributes_keywords_and_strings(
     tmp_path: Path,
 ) -> None:
@@ -16,10 +16,13 @@ from __future__ import annotations
 
 import subprocess
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
+from babylon.sentinels.base import run_sensor, run_sensors
+
 pytestmark = pytest.mark.unit
 
 _REPO_ROOT = Path(__file__).resolve().parents[3]
@@ -80,6 +83,35 @@ def test_gate_coverage_sensor_is_dispatchable_and_gates() -> None:
     assert "Gate coverage" in result.stdout
 
 
+def test_all_runs_every_static_sensor_in_one_process() -> None:
+    """``all`` runs the static sensors together and reports each one's summary."""
+    result = _run("all")
+    assert result.returncode == 0, result.stderr
+    for expected_word in ("Liveness", "Coupling", "Data coverage", "Public surface"):
+        assert expected_word in result.stdout
+    assert "SENTINELS:" in result.stdout
+
+
+def test_run_sensors_keeps_per_sensor_codes_and_output(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Concurrent sensors print whole, in registry order; the worst code wins."""
+
+    def _sensor(name: str, gating: list[str]) -> Callable[[list[str] | None], int]:
+        def _main(argv: list[str] | None) -> int:  # noqa: ARG001
+            return run_sensor(name, (("g", lambda: gating),), (), lambda _n: f"{name} clean")
+
+        return _main
+
+    code = run_sensors({"a": _sensor("A", []), "b": _sensor("B", ["drift"])})
+
+    captured = capsys.readouterr()
+    assert code == 1
+    assert captured.out.splitlines()[0] == "A clean"
+    assert "B VIOLATION [g]: drift" in captured.err
+    assert "1 clean, 1 gating, 0 infrastructure failures" in captured.out
+
+
 def test_unknown_sensor_is_rejected() -> None:
     """An unregistered sensor name is refused by argparse, not silently ignored."""
     result = _run("no_such_sensor")
@@ -0,0 +1,130 @@
+"""Unit tests for the component-cached, pivot-sampled CentralityService.
+
+Exact components must agree with the plain graph_algorithms helpers; a
+changed component must be the only one recomputed; sampled betweenness
+must be seed-deterministic and inside its reported error band.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from babylon.topology import graph_algorithms as ga
+from babylon.topology.centrality import CentralityService
+from babylon.topology.graph import BabylonUGraph
+
+pytestmark = [pytest.mark.unit, pytest.mark.topology]
+
+
+def _path(graph: BabylonUGraph, prefix: str, length: int) -> None:
+    for i in range(length - 1):
+        graph.add_edge(f"{prefix}{i}", f"{prefix}{i + 1}")
+
+
+def _two_cells() -> BabylonUGraph:
+    graph = BabylonUGraph()
+    _path(graph, "a", 5)
+    for leaf in ("s1", "s2", "s3"):
+        graph.add_edge("hub", leaf)
+    return graph
+
+
+def _lattice(side: int) -> BabylonUGraph:
+    graph = BabylonUGraph()
+    for r in range(side):
+        for c in range(side):
+            if c + 1 < side:
+                graph.add_edge(f"{r}:{c}", f"{r}:{c + 1}")
+            if r + 1 < side:
+                graph.add_edge(f"{r}:{c}", f"{r + 1}:{c}")
+    return graph
+
+
+class TestExactComponents:
+    def test_matches_whole_graph_algorithms(self) -> None:
+        graph = _two_cells()
+        result = CentralityService().analyze(graph)
+
+        assert result.degree == ga.degree_centrality(graph)
+        assert result.betweenness == pytest.approx(ga.betweenness_centrality(graph))
+        assert list(result.betweenness) == sorted(result.betweenness)
+        assert result.articulation_points == ga.articulation_point_set(graph)
+        assert result.closeness is None  # two components
+        assert result.betweenness_error == 0.0
+        assert not result.sampled
+
+    def test_connected_graph_has_closeness(self) -> None:
+        graph = BabylonUGraph()
+        _path(graph, "p", 4)
+        result = CentralityService().analyze(graph)
+        assert result.closeness == pytest.approx(ga.closeness_centrality(graph))
+
+    def test_trivial_graphs(self) -> None:
+        service = CentralityService()
+        assert service.analyze(BabylonUGraph()).degree == {}
+        single = BabylonUGraph()
+        single.add_node("only")
+        result = service.analyze(single)
+        assert result.betweenness == {}
+        assert result.closeness is None
+
+
+class TestComponentCache:
+    def test_only_the_changed_component_is_recomputed(self) -> None:
+        service = CentralityService()
+        service.analyze(_two_cells())
+        assert (service.hits, service.misses) == (0, 2)
+
+        changed = _two_cells()
+        changed.add_edge("s1", "s2")  # rebuilt graph, one cell edited
+        result = service.analyze(changed)
+
+        assert (service.hits, service.misses) == (1, 3)
+        assert result.betweenness == pytest.approx(ga.betweenness_centrality(changed))
+
+    def test_cached_component_renormalizes_to_the_new_graph_size(self) -> None:
+        service = CentralityService()
+        service.analyze(_two_cells())
+        grown = _two_cells()
+        grown.add_edge("x", "y")  # new component; the old two are hits
+        result = service.analyze(grown)
+        assert service.hits == 2
+        assert result.betweenness == pytest.approx(ga.betweenness_centrality(grown))
+
+    def test_lru_bound(self) -> None:
+        service = CentralityService(max_cached_components=1)
+        service.analyze(_two_cells())
+        service.analyze(_two_cells())
+        assert service.hits == 0
+
+
+class TestPivotSampling:
+    def test_estimate_is_within_its_error_band(self) -> None:
+        graph = _lattice(8)
+        exact = ga.betweenness_centrality(graph)
+        result = CentralityService(exact_max_nodes=10, pivots=32, seed=7).analyze(graph)
+
+        assert result.sampled
+        assert result.betweenness_error > 0.0
+        assert set(result.betweenness) == set(exact)
+        assert max(abs(result.betweenness[n] - exact[n]) for n in exact) <= (
+            result.betweenness_error
+        )
+        assert result.articulation_points == ga.articulation_point_set(graph)
+        assert result.closeness is not None
+
+    def test_seeded_estimate_is_deterministic(self) -> None:
+        first = CentralityService(exact_max_nodes=10, pivots=16, seed=3).analyze(_lattice(6))
+        second = CentralityService(exact_max_nodes=10, pivots=16, seed=3).analyze(_lattice(6))
+        assert first == second
+
+    def test_every_node_as_pivot_is_exact(self) -> None:
+        graph = _lattice(4)
+        result = CentralityService(exact_max_nodes=1, pivots=16).analyze(graph)
+        assert result.betweenness == pytest.approx(ga.betweenness_centrality(graph))
+        assert result.closeness == pytest.approx(ga.closeness_centrality(graph))
+
+    @pytest.mark.parametrize("kwargs", [{"pivots": 0}, {"confidence": 1.0}])
+    def test_rejects_bad_settings(self, kwargs: dict[str, float]) -> None:
+        with pytest.raises(ValueError):
+            CentralityService(**kwargs)  # type: ignore[arg-type]
@@ -473,6 +473,7 @@ class TestActionBarStaysLiveAcrossTicks:
             assert calls_after_boot >= 1
 
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             body = _action_bar_text(app)
@@ -127,9 +127,14 @@ class _FakeDriver:
     def advance_once(self) -> _FakeTickOutcome:
         return self._script.pop(0)
 
-    def run_until_paused(self) -> list[_FakeTickOutcome]:
+    def run_until_paused(
+        self, *, on_tick: Callable[[_FakeTickOutcome], None] | None = None
+    ) -> list[_FakeTickOutcome]:
         results = list(self._script)
         self._script.clear()
+        for result in results:
+            if on_tick is not None:
+                on_tick(result)
         return results
 
     def acknowledge_pause(self) -> None:  # pragma: no cover - unused by these tests
@@ -220,6 +225,7 @@ class TestChronicleRailStaysQuietWithNoEvents:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             assert "the wire is quiet" in _rail_text(app)
@@ -236,6 +242,7 @@ class TestChronicleRailShowsLiveEvents:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             widget = app.query_one("#chronicle-rail", OptionList)
@@ -264,8 +271,10 @@ class TestChronicleRailShowsLiveEvents:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             plain = _rail_text(app)
@@ -281,8 +290,10 @@ class TestChronicleRailShowsLiveEvents:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
             await pilot.press("t")  # tick 2: genuinely no events
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             plain = _rail_text(app)
@@ -356,6 +367,7 @@ class TestRowAddressableChronicleOpensTheHighlightedRow:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             rail = app.query_one("#chronicle-rail", OptionList)
@@ -385,6 +397,7 @@ class TestRowAddressableChronicleOpensTheHighlightedRow:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             rail = app.query_one("#chronicle-rail", OptionList)
@@ -410,6 +423,7 @@ class TestRowAddressableChronicleOpensTheHighlightedRow:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
             before = app.nav.current
 
@@ -445,6 +459,7 @@ class TestRowAddressableChronicleOpensTheHighlightedRow:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             rail = app.query_one("#chronicle-rail", OptionList)
@@ -489,6 +504,7 @@ class TestChronicleSalienceComposition:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             plain = _rail_text(app)
@@ -517,6 +533,7 @@ class TestChronicleSalienceComposition:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             plain = _rail_text(app)
@@ -540,6 +557,7 @@ class TestChronicleAutopauseIndicator:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             rail = app.query_one("#chronicle-rail", OptionList)
@@ -561,6 +579,7 @@ class TestChronicleAutopauseIndicator:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             assert "AUTOPAUSE" not in _rail_text(app)
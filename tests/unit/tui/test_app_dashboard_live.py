@@ -231,6 +231,7 @@ class TestDashboardStaysLiveAcrossTicks:
             assert "+0.00" in before
 
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             after = str(app.query_one("#dashboard-body", Static).render())
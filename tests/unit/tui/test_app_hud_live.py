@@ -126,8 +126,13 @@ class _FakeDriver:
     def advance_once(self) -> _FakeTickOutcome:
         return self._campaign.advance_tick()
 
-    def run_until_paused(self) -> list[_FakeTickOutcome]:
-        return [self._campaign.advance_tick()]
+    def run_until_paused(
+        self, *, on_tick: Callable[[_FakeTickOutcome], None] | None = None
+    ) -> list[_FakeTickOutcome]:
+        result = self._campaign.advance_tick()
+        if on_tick is not None:
+            on_tick(result)
+        return [result]
 
     def acknowledge_pause(self) -> None:
         self.awaiting_ack = False
@@ -238,6 +243,7 @@ class TestHudStaysLiveAcrossTicks:
             assert "T+0/" in before
 
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             after = str(app.query_one("#dashboard-hud", Static).render())
@@ -232,6 +232,7 @@ class TestLobbyToCampaignShellFlow:
             await pilot.pause()
 
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             assert campaign.advance_calls == 1
@@ -244,6 +245,7 @@ class TestLobbyToCampaignShellFlow:
         app = ArchiveApp()
         async with app.run_test() as pilot:
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
             status = app.query_one("#status", Label)
             assert "no live campaign" in str(status.content)
@@ -319,6 +321,7 @@ class TestLiveVaultKnownEntities:
             # Simulate the vault baking a new page as part of this tick.
             campaign._pages["economy/USA"] = "# economy/USA\n"
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             assert "economy/USA" in app.known_entities
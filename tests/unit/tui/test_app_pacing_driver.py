@@ -11,12 +11,14 @@ the exact ``TestSeams``/lobby-flow idiom
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from uuid import UUID
 
 import pytest
 from textual.widgets import Label, OptionList
 
+from babylon.models.enums.events import EventType
 from babylon.projection.endgame import EndgameStatus
 from babylon.projection.verbs.view_models import VerbPlateView
 from babylon.projection.view_models import EconomyView, ProjectionRecord
@@ -107,7 +109,9 @@ class _FakeDriver:
             self.pause_summary = f"tick {result.tick}: some critical event"
         return result
 
-    def run_until_paused(self) -> list[_FakeTickOutcome]:
+    def run_until_paused(
+        self, *, on_tick: Callable[[_FakeTickOutcome], None] | None = None
+    ) -> list[_FakeTickOutcome]:
         self.run_calls += 1
         results = []
         while self._script:
@@ -116,6 +120,9 @@ class _FakeDriver:
             if result.paused:
                 self.awaiting_ack = True
                 self.pause_summary = f"tick {result.tick}: some critical event"
+            if on_tick is not None:
+                on_tick(result)
+            if result.paused:
                 break
         return results
 
@@ -237,6 +244,7 @@ class TestExplicitAdvanceThroughTheDriver:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot, app)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             assert driver.advance_calls == 1
@@ -253,6 +261,7 @@ class TestExplicitAdvanceThroughTheDriver:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot, app)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             assert driver.advance_calls == 0
@@ -270,6 +279,7 @@ class TestExplicitAdvanceThroughTheDriver:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot, app)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             assert driver.advance_calls == 0
@@ -289,12 +299,31 @@ class TestExplicitAdvanceThroughTheDriver:
         async with app.run_test() as pilot:
             await _boot_into_campaign_shell(pilot, app)
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             assert driver.advance_calls == 0
             status = app.query_one("#status", Label)
             assert "already in progress" in str(status.content)
 
+    @pytest.mark.asyncio
+    async def test_t_refuses_while_a_previous_tick_is_still_in_flight(self) -> None:
+        """``t`` runs as a worker now, so a second press can land while the
+        first tick is still resolving off the event loop."""
+        driver = _FakeDriver([_FakeTickOutcome(tick=1, paused=False)])
+        app, _campaign, _cid = _wired_app(driver)
+
+        async with app.run_test() as pilot:
+            await _boot_into_campaign_shell(pilot, app)
+            app._tick_in_flight = True
+            await pilot.press("t")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert driver.advance_calls == 0
+            status = app.query_one("#status", Label)
+            assert "a tick is already in progress" in str(status.content)
+
 
 class TestRunUntilPaused:
     @pytest.mark.asyncio
@@ -320,6 +349,27 @@ class TestRunUntilPaused:
             assert "tick 3" in str(status.content)
             assert "PAUSED" in str(status.content)
 
+    @pytest.mark.asyncio
+    async def test_r_streams_each_ticks_chronicle_exactly_once(self) -> None:
+        first = ChronicleEvent(tick=1, event_type=EventType.UPRISING, summary="first", data={})
+        second = ChronicleEvent(tick=2, event_type=EventType.UPRISING, summary="second", data={})
+        driver = _FakeDriver(
+            [
+                _FakeTickOutcome(tick=1, paused=False, chronicle=(first,)),
+                _FakeTickOutcome(tick=2, paused=True, chronicle=(second,)),
+            ]
+        )
+        app, _campaign, _cid = _wired_app(driver)
+
+        async with app.run_test() as pilot:
+            await _boot_into_campaign_shell(pilot, app)
+            await pilot.press("r")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert app._chronicle_history == (first, second)
+            assert app._tick_in_flight is False
+
     @pytest.mark.asyncio
     async def test_r_refuses_a_second_run_while_the_driver_is_already_busy(self) -> None:
         """The second worker Task must see :attr:`busy` and refuse rather
@@ -392,6 +442,7 @@ class TestAcknowledgePause:
             assert "acknowledged" in str(status.content)
 
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
             assert driver.advance_calls == 1
 
@@ -445,6 +496,7 @@ class TestAdvanceDoesNotClobberANonWikiPane:
             assert app.query_one("#main", ContentSwitcher).current == "dashboard"
 
             await pilot.press("t")
+            await app.workers.wait_for_complete()
             await pilot.pause()
 
             assert driver.advance_calls == 1
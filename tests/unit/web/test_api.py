@@ -654,6 +654,79 @@ class TestForceEndgameTestHookHeader:
         assert mock_bridge.resolve_tick.call_args.kwargs["force_endgame_test_hook"] is False
 
 
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestMapRevalidation:
+    """GET /map/ answers ``If-None-Match`` from the tile digest alone.
+
+    The ETag is ``metadata.tile_key`` (plus the lens), resolved by
+    ``get_map_snapshot_key`` before any snapshot is built; snapshots without
+    a key fall back to a hash of the body.
+    """
+
+    _KEY = "a" * 64
+
+    def _bridge(self, key: str | None) -> Any:
+        from unittest.mock import MagicMock
+
+        mock_bridge = MagicMock()
+        mock_bridge.get_map_snapshot_key.return_value = key
+        metadata: dict[str, Any] = {"tick": 3}
+        if key is not None:
+            metadata["tile_key"] = key
+        mock_bridge.get_map_snapshot.return_value = {
+            "type": "FeatureCollection",
+            "metadata": metadata,
+            "features": [],
+        }
+        return mock_bridge
+
+    def _get_map(self, mock_bridge: Any, *requests: dict[str, str]) -> list[Any]:
+        """Issue one GET /map/ per ``requests`` entry (query + headers)."""
+        import game.api
+
+        client, session = _make_recover_session("active")
+        game.api._bridge_instance = mock_bridge
+        try:
+            return [
+                client.get(f"/api/games/{session.id}/map/{req.pop('query', '')}", **req)
+                for req in requests
+            ]
+        finally:
+            game.api._bridge_instance = None
+
+    def test_etag_is_the_tile_key(self) -> None:
+        (response,) = self._get_map(self._bridge(self._KEY), {})
+
+        assert response.status_code == 200
+        assert response["ETag"] == f'"{self._KEY}"'
+
+    def test_lens_is_part_of_the_etag(self) -> None:
+        (response,) = self._get_map(self._bridge(self._KEY), {"query": "?lens=heat"})
+
+        assert response["ETag"] == f'"{self._KEY}.heat"'
+
+    def test_matching_key_skips_the_snapshot(self) -> None:
+        mock_bridge = self._bridge(self._KEY)
+
+        (response,) = self._get_map(mock_bridge, {"HTTP_IF_NONE_MATCH": f'"{self._KEY}"'})
+
+        assert response.status_code == 304
+        assert response["ETag"] == f'"{self._KEY}"'
+        mock_bridge.get_map_snapshot.assert_not_called()
+
+    def test_unkeyed_snapshot_falls_back_to_a_body_hash(self) -> None:
+        import hashlib
+
+        mock_bridge = self._bridge(None)
+
+        first, second = self._get_map(mock_bridge, {}, {"HTTP_IF_NONE_MATCH": '"stale"'})
+
+        assert first["ETag"] == f'"{hashlib.sha256(first.content).hexdigest()}"'
+        assert second.status_code == 200
+        assert mock_bridge.get_map_snapshot.call_count == 2
+
+
 @pytest.mark.unit
 @pytest.mark.django_db
 class TestScenarioList:
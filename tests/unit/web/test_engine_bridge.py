@@ -4202,6 +4202,34 @@ class TestGetMapHistory:
         assert list(result["frames"][0]["values"].keys()) == ["26099", "26163"]
         assert result["frames"][1]["values"] == {"26163": 0.2}
 
+    def test_diff_frames_carry_only_changed_counties(self) -> None:
+        mock_persistence = _make_mock_persistence()
+        mock_persistence.query_territory_snapshot_latest_tick.return_value = 2
+        mock_persistence.query_territory_snapshot_metric_frames.return_value = [
+            {"tick": 0, "county_fips": "26099", "heat": 0.05, "pop_total": 4000},
+            {"tick": 0, "county_fips": "26163", "heat": 0.1, "pop_total": 8000},
+            {"tick": 1, "county_fips": "26099", "heat": 0.05, "pop_total": 4000},
+            {"tick": 1, "county_fips": "26163", "heat": 0.2, "pop_total": 8000},
+            {"tick": 2, "county_fips": "26099", "heat": 0.05, "pop_total": 4000},
+            {"tick": 2, "county_fips": "26163", "heat": 0.2, "pop_total": 8000},
+        ]
+        bridge = EngineBridge(mock_persistence)
+
+        full = bridge.get_map_history(uuid.uuid4(), metric="heat")
+        result = bridge.get_map_history(uuid.uuid4(), metric="heat", diff=True)
+
+        assert result["diff"] is True
+        assert [f["values"] for f in result["frames"]] == [
+            {"26099": 0.05, "26163": 0.1},
+            {"26163": 0.2},
+            {},
+        ]
+        # Replaying the diffs in order reproduces every full frame.
+        replayed: dict[str, float | None] = {}
+        for diff_frame, full_frame in zip(result["frames"], full["frames"], strict=True):
+            replayed.update(diff_frame["values"])
+            assert replayed == full_frame["values"]
+
     def test_population_metric_reads_pop_total_column(self) -> None:
         mock_persistence = _make_mock_persistence()
         mock_persistence.query_territory_snapshot_latest_tick.return_value = 0
@@ -0,0 +1,143 @@
+"""Unit tests for the process-wide hydrated-graph cache.
+
+A committed ``(session, tick)`` graph is decoded once and shared — a hit is
+the cached object, never a copy — the cache stays within its element budget
+(LRU), and a session's entries drop on invalidation. The bridge resolves "latest" to a
+concrete tick before consulting the cache.
+"""
+
+from __future__ import annotations
+
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from babylon.topology.graph import BabylonGraph
+from game.graph_cache import HydratedGraphCache
+
+pytestmark = pytest.mark.unit
+
+_SID = uuid.UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
+_OTHER = uuid.UUID("bbbbbbbb-bbbb-cccc-dddd-eeeeeeeeeeee")
+
+
+def _graph(n_nodes: int, tick: int = 0) -> BabylonGraph:
+    graph = BabylonGraph()
+    for i in range(n_nodes):
+        graph.add_node(f"N{i}", "territory", heat=0.0)
+    graph.set_graph_attr("tick", tick)
+    return graph
+
+
+def test_hit_skips_load_and_does_not_copy() -> None:
+    cache = HydratedGraphCache()
+    load = MagicMock(return_value=_graph(2))
+
+    with patch.object(BabylonGraph, "copy", side_effect=AssertionError("hit copied")):
+        first = cache.get(_SID, 3, load)
+        second = cache.get(_SID, 3, load)
+
+    assert load.call_count == 1
+    assert first is second is load.return_value
+
+
+def test_lost_load_race_serves_the_cached_graph() -> None:
+    cache = HydratedGraphCache()
+    winner = _graph(2)
+
+    def _racing_load() -> BabylonGraph:
+        cache.get(_SID, 3, lambda: winner)
+        return _graph(2)
+
+    assert cache.get(_SID, 3, _racing_load) is winner
+
+
+def test_evicts_least_recently_used_within_element_budget() -> None:
+    cache = HydratedGraphCache(max_elements=5)
+    cache.get(_SID, 1, lambda: _graph(2))
+    cache.get(_SID, 2, lambda: _graph(2))
+    cache.get(_SID, 1, lambda: _graph(2))  # refresh tick 1
+    cache.get(_SID, 3, lambda: _graph(2))  # evicts tick 2
+
+    load = MagicMock(return_value=_graph(2))
+    cache.get(_SID, 1, load)
+    assert load.call_count == 0
+    cache.get(_SID, 2, load)
+    assert load.call_count == 1
+
+
+def test_oversized_graph_is_served_uncached() -> None:
+    cache = HydratedGraphCache(max_elements=1)
+    graph = cache.get(_SID, 1, lambda: _graph(3))
+    assert graph.number_of_nodes() == 3
+    assert len(cache) == 0
+
+
+def test_invalidate_drops_only_that_session() -> None:
+    cache = HydratedGraphCache()
+    cache.get(_SID, 1, lambda: _graph(1))
+    cache.get(_OTHER, 1, lambda: _graph(1))
+
+    cache.invalidate(_SID)
+
+    assert len(cache) == 1
+
+
+def _hydrated_graph() -> BabylonGraph:
+    """Edges filed out of source order, as hydration leaves them."""
+    graph = BabylonGraph()
+    for i in range(200):
+        graph.add_node(f"N{i}", "territory")
+    for i in range(199, 0, -1):
+        graph.add_edge(f"N{i}", f"N{i - 1}", "solidarity")
+        graph.add_node(f"C{i}", "social_class")
+    graph.add_node("N0", "social_class")  # retype: files N0 after the C nodes
+    return graph
+
+
+def test_concurrent_typed_reads_of_one_cached_graph() -> None:
+    cache = HydratedGraphCache()
+    graph = cache.get(_SID, 1, _hydrated_graph)
+    expected_edges = [(f"N{i}", f"N{i - 1}") for i in range(1, 200)]
+    expected_nodes = ["N0", *(f"C{i}" for i in range(199, 0, -1))]
+
+    def _read(_: int) -> tuple[list[tuple[str, str]], list[tuple[str, str]], list[str]]:
+        shared = cache.get(_SID, 1, _hydrated_graph)
+        return (
+            [(e.source_id, e.target_id) for e in shared.query_edges(edge_type="solidarity")],
+            [(source, target) for source, target, _ in shared.iter_edges("solidarity")],
+            [node_id for node_id, _ in shared.iter_nodes("social_class")],
+        )
+
+    # Reads of a shared graph must never re-sort an index in place.
+    with (
+        patch.object(BabylonGraph, "_sort_edge_bucket", side_effect=AssertionError("sorted")),
+        patch.object(BabylonGraph, "_sort_node_bucket", side_effect=AssertionError("sorted")),
+        ThreadPoolExecutor(max_workers=8) as pool,
+    ):
+        results = list(pool.map(_read, range(64)))
+
+    assert graph is cache.get(_SID, 1, _hydrated_graph)
+    assert all(result == (expected_edges, expected_edges, expected_nodes) for result in results)
+
+
+def test_max_elements_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="max_elements"):
+        HydratedGraphCache(max_elements=0)
+
+
+def test_bridge_resolves_latest_tick_before_caching() -> None:
+    from game.engine_bridge import EngineBridge
+
+    persistence = MagicMock()
+    persistence.hydrate_graph.return_value = _graph(2, tick=4)
+    bridge = EngineBridge(persistence, graph_cache=HydratedGraphCache())
+
+    with patch("game.engine_bridge._fetch_latest_graph_tick_from_pool", return_value=4):
+        bridge._hydrate_graph(_SID)
+        bridge._hydrate_graph(_SID)
+        bridge._hydrate_graph(_SID, tick=4)
+
+    persistence.hydrate_graph.assert_called_once_with(tick=4, session_id=_SID)
@@ -0,0 +1,117 @@
+"""Unit tests for the on-disk map tile store.
+
+A tile is a finished ``/map/`` snapshot addressed by a digest of every input
+it depends on: a changed fog state must address a different tile, a stored
+tile must round-trip byte-for-byte, and a session's tiles drop together on
+invalidation or once the store holds too many newer sessions. Store failures
+degrade to a miss.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from babylon.projection.fog.ledger import IntelLedger
+from game.map_tiles import MapTileStore, tile_key
+
+pytestmark = pytest.mark.unit
+
+_SID = uuid.UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
+_OTHER = uuid.UUID("bbbbbbbb-bbbb-cccc-dddd-eeeeeeeeeeee")
+
+_SNAPSHOT: dict[str, Any] = {
+    "type": "FeatureCollection",
+    "metadata": {"tick": 3, "zoom": "county"},
+    "features": [{"type": "Feature", "id": "26163", "geometry": None, "properties": {}}],
+}
+
+
+def _key(**overrides: Any) -> str:
+    inputs: dict[str, Any] = {
+        "session_id": _SID,
+        "tick": 3,
+        "zoom": "county",
+        "reach": frozenset({"T001", "T002"}),
+        "ledger": IntelLedger(),
+        "staleness_ticks": 4,
+        "unknown_ticks": 12,
+        "veil_tier": 1,
+    }
+    inputs.update(overrides)
+    return tile_key(**inputs)
+
+
+def test_key_is_stable_and_order_independent() -> None:
+    assert _key() == _key(reach=frozenset({"T002", "T001"}))
+
+
+@pytest.mark.parametrize(
+    "override",
+    [
+        {"tick": 4},
+        {"zoom": "state"},
+        {"reach": frozenset({"T001"})},
+        {"veil_tier": 2},
+        {"staleness_ticks": 5},
+        {"session_id": _OTHER},
+    ],
+)
+def test_any_changed_input_addresses_a_new_tile(override: dict[str, Any]) -> None:
+    assert _key(**override) != _key()
+
+
+def test_put_get_round_trip(tmp_path: Path) -> None:
+    store = MapTileStore(tmp_path)
+    assert store.get(_SID, _key()) is None
+
+    store.put(_SID, _key(), _SNAPSHOT)
+
+    assert store.get(_SID, _key()) == _SNAPSHOT
+    assert [p.suffixes for p in (tmp_path / str(_SID)).iterdir()] == [[".json", ".gz"]]
+
+
+def test_invalidate_drops_only_that_session(tmp_path: Path) -> None:
+    store = MapTileStore(tmp_path)
+    store.put(_SID, _key(), _SNAPSHOT)
+    store.put(_OTHER, _key(session_id=_OTHER), _SNAPSHOT)
+
+    store.invalidate(_SID)
+
+    assert store.get(_SID, _key()) is None
+    assert store.get(_OTHER, _key(session_id=_OTHER)) == _SNAPSHOT
+
+
+def test_corrupt_tile_reads_as_a_miss(tmp_path: Path) -> None:
+    store = MapTileStore(tmp_path)
+    store.put(_SID, _key(), _SNAPSHOT)
+    (tmp_path / str(_SID) / f"{_key()}.json.gz").write_bytes(b"not gzip")
+
+    assert store.get(_SID, _key()) is None
+
+
+def test_least_recently_written_sessions_age_out(tmp_path: Path) -> None:
+    store = MapTileStore(tmp_path, max_sessions=2)
+    sessions = [uuid.UUID(int=i) for i in range(3)]
+    for age, sid in enumerate(sessions[:2]):
+        store.put(sid, _key(session_id=sid), _SNAPSHOT)
+        os.utime(tmp_path / str(sid), (age, age))
+
+    store.put(sessions[0], _key(session_id=sessions[0], tick=4), _SNAPSHOT)  # no prune
+    assert len(list(tmp_path.iterdir())) == 2
+    os.utime(tmp_path / str(sessions[0]), (0, 0))
+
+    store.put(sessions[2], _key(session_id=sessions[2]), _SNAPSHOT)
+
+    assert store.get(sessions[0], _key(session_id=sessions[0])) is None
+    assert store.get(sessions[1], _key(session_id=sessions[1])) == _SNAPSHOT
+    assert store.get(sessions[2], _key(session_id=sessions[2])) == _SNAPSHOT
+
+
+def test_max_sessions_must_be_positive(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="max_sessions"):
+        MapTileStore(tmp_path, max_sessions=0)
@@ -542,6 +542,7 @@ _BRIDGE_PUBLIC_METHODS = [
     "create_game",
     "get_snapshot",
     "get_map_snapshot",
+    "get_map_snapshot_key",
     "get_available_actions",
     "submit_action",
     "resolve_tick",
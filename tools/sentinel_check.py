@@ -10,6 +10,12 @@ sentinel's ``main``. The check logic lives in the importable package
 Run: ``uv run python tools/sentinel_check.py seam --check``. Exit codes are
 the sentinel's own contract: 0 clean, 1 gating violations, 2 infrastructure
 failure (source missing/unparseable — never swallowed into a false pass).
+
+``sentinel_check.py all`` runs every static sensor concurrently in this one
+process (:func:`~babylon.sentinels.base.run_sensors`), so they share one AST
+parse cache; it exits with the worst sensor's code. The probe sensors (which
+run the engine, Django or the reference DB) stay per-invocation. ``--ast-cache``
+additionally persists parsed ASTs under ``.cache/sentinel-ast/`` across runs.
 """
 
 from __future__ import annotations
@@ -17,9 +23,12 @@ from __future__ import annotations
 import argparse
 import sys
 from collections.abc import Callable
+from pathlib import Path
 
+from babylon.sentinels._ast import enable_disk_parse_cache
 from babylon.sentinels.absence.checks import main as absence_main
 from babylon.sentinels.aggregation.checks import main as aggregation_intensive_main
+from babylon.sentinels.base import run_sensors
 from babylon.sentinels.coupling.checks import main as coupling_main
 from babylon.sentinels.coverage.checks import main as coverage_main
 from babylon.sentinels.dangling.checks import main as dangling_main
@@ -38,6 +47,9 @@ from babylon.sentinels.tutorial_coverage.checks import main as tutorial_coverage
 from babylon.sentinels.unconsumed.checks import main as unconsumed_main
 from babylon.sentinels.vocabulary.checks import main as vocabulary_main
 
+#: Default ``--ast-cache`` directory (git-ignored).
+_AST_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "sentinel-ast"
+
 
 def _catalog_main(argv: list[str] | None) -> int:
     """Route to the catalog DB probe (Program 21) — lazy import.
@@ -113,17 +125,15 @@ def _partition_main(argv: list[str] | None) -> int:
     return partition_main(argv)
 
 
-#: Registered sentinels: name -> its ``main(argv)`` entry point.
-_SENSORS: dict[str, Callable[[list[str] | None], int]] = {
+#: Static sentinels (pure AST/registry checks): name -> ``main(argv)``. These
+#: are what ``all`` runs together in one process.
+_STATIC_SENSORS: dict[str, Callable[[list[str] | None], int]] = {
     "absence": absence_main,
     "seam": seam_main,
     "seam-algebra": seam_algebra_main,
     "coverage": coverage_main,
     "gate-coverage": gate_coverage_main,
-    "gate-coverage-truth": _gate_coverage_truth_main,
-    "partition": _partition_main,
     "synthetic": synthetic_main,
-    "catalog": _catalog_main,
     "vocabulary": vocabulary_main,
     "inert": inert_main,
     "dangling": dangling_main,
@@ -132,33 +142,59 @@ _SENSORS: dict[str, Callable[[list[str] | None], int]] = {
     "formula_registration": formula_registration_main,
     "unconsumed": unconsumed_main,
     "masked_arithmetic": masked_arithmetic_main,
-    "aggregation": _aggregation_main,
     "aggregation-intensive": aggregation_intensive_main,
-    "fog": _fog_main,
     "liveness": liveness_main,
     "coupling": coupling_main,
     "surface": surface_main,
     "tutorial-coverage": tutorial_coverage_main,
 }
 
+#: Probe sentinels (lazy-imported; they run the engine, Django or the
+#: reference DB), dispatched one per invocation only.
+_PROBE_SENSORS: dict[str, Callable[[list[str] | None], int]] = {
+    "gate-coverage-truth": _gate_coverage_truth_main,
+    "partition": _partition_main,
+    "catalog": _catalog_main,
+    "aggregation": _aggregation_main,
+    "fog": _fog_main,
+}
+
+#: Registered sentinels: name -> its ``main(argv)`` entry point.
+_SENSORS: dict[str, Callable[[list[str] | None], int]] = {**_STATIC_SENSORS, **_PROBE_SENSORS}
+
 
 def main(argv: list[str] | None = None) -> int:
     """Route to the chosen sentinel's ``main`` and return its exit code.
 
-    :param argv: CLI args; first positional selects the sensor, ``--check`` is
-        the CI-mode alias forwarded to the sentinel (which always gates).
-    :returns: The selected sentinel's exit code (0 clean / 1 gating / 2 infra).
+    :param argv: CLI args; first positional selects the sensor (or ``all``),
+        ``--check`` is the CI-mode alias forwarded to the sentinel (which
+        always gates), ``--ast-cache`` enables the on-disk parse cache.
+    :returns: The selected sentinel's exit code (0 clean / 1 gating / 2 infra);
+        for ``all``, the worst static sensor's.
     """
     parser = argparse.ArgumentParser(
         description="Babylon Sentinels — run a declared-invariant sensor (VIII.12 / III.11).",
     )
-    parser.add_argument("sensor", choices=sorted(_SENSORS), help="which sentinel to run")
+    parser.add_argument(
+        "sensor",
+        choices=[*sorted(_SENSORS), "all"],
+        help="which sentinel to run ('all' = every static sensor, concurrently)",
+    )
     parser.add_argument(
         "--check",
         action="store_true",
         help="CI-mode alias; the sentinel always gates (exit 1 on violations).",
     )
+    parser.add_argument(
+        "--ast-cache",
+        action="store_true",
+        help=f"persist parsed ASTs across runs under {_AST_CACHE_DIR}",
+    )
     args = parser.parse_args(argv)
+    if args.ast_cache:
+        enable_disk_parse_cache(_AST_CACHE_DIR)
+    if args.sensor == "all":
+        return run_sensors(_STATIC_SENSORS)
     return _SENSORS[args.sensor](["--check"] if args.check else [])
 
 
@@ -126,6 +126,15 @@ DATABASE_ROUTERS = ["observatory.router.SimDatabaseRouter"]
 # Enabled by default here; production.py flips it off (development.py keeps On).
 OBSERVATORY_ENABLED = True
 
+# game.map_tiles: pre-serialized /map/ snapshots, shared by every worker.
+# Defaults under the git-ignored web/.cache/; BABYLON_MAP_TILE_DIR="" disables
+# the store (every request re-aggregates). The store keeps the most recently
+# written sessions only (MapTileStore max_sessions), so ended sessions' tiles
+# age out; deleting the directory is always safe.
+MAP_TILE_DIR = (
+    os.environ.get("BABYLON_MAP_TILE_DIR", str(BASE_DIR / ".cache" / "map_tiles")) or None
+)
+
 # --------------------------------------------------------------------------- #
 # Auth
 # --------------------------------------------------------------------------- #
@@ -9,8 +9,10 @@ per-process. In tests, patch ``game.api._bridge_instance``.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import uuid
+from pathlib import Path
 from typing import Any
 from uuid import UUID
 
@@ -20,6 +22,8 @@ from django.core.exceptions import ImproperlyConfigured
 from django.http import HttpRequest, HttpResponseBase, JsonResponse
 from django.shortcuts import get_object_or_404, render
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
@@ -106,15 +110,25 @@ def _get_bridge() -> Any:
 def init_bridge(persistence: Any) -> None:
     """Initialize the bridge singleton with a persistence layer.
 
-    Call this from Django's AppConfig.ready() or a management command.
+    Call this from Django's AppConfig.ready() or a management command. The
+    singleton gets a process-wide hydrated-graph cache, so concurrent
+    dashboard reads of the same tick share one decode, and — when
+    ``settings.MAP_TILE_DIR`` is set — an on-disk map tile store.
 
     Args:
         persistence: A RuntimePersistence-compatible object.
     """
     global _bridge_instance  # noqa: PLW0603
     from .engine_bridge import EngineBridge
-
-    _bridge_instance = EngineBridge(persistence)
+    from .graph_cache import HydratedGraphCache
+    from .map_tiles import MapTileStore
+
+    tile_dir = getattr(django_settings, "MAP_TILE_DIR", None)
+    _bridge_instance = EngineBridge(
+        persistence,
+        graph_cache=HydratedGraphCache(),
+        tile_store=MapTileStore(Path(tile_dir)) if tile_dir else None,
+    )
 
 
 # ---------------------------------------------------------------------- #
@@ -137,6 +151,41 @@ def _envelope(
     return JsonResponse(body, status=http_status)
 
 
+def _conditional_envelope(
+    request: Request,
+    data: Any,
+    tick: int | None = None,
+    session_id: str | None = None,
+    etag: str | None = None,
+) -> HttpResponseBase:
+    """:func:`_envelope` with a strong ETag.
+
+    A client revalidating with a matching ``If-None-Match`` gets an empty
+    304 instead of the body — the map endpoints' payloads are large and a
+    scrubber re-requests the same frames constantly. ``etag`` is a quoted
+    content digest known before the body was built (see
+    :func:`_not_modified`); without one, the serialized body is hashed.
+    """
+    response = _envelope(data, tick=tick, session_id=session_id)
+    if etag is None:
+        etag = quote_etag(hashlib.sha256(response.content).hexdigest())
+    response["ETag"] = etag
+    return _not_modified(request, etag) or response
+
+
+def _not_modified(request: Request, etag: str) -> HttpResponseBase | None:
+    """The 304 (or 412) that ``etag`` earns this request's preconditions, else None."""
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        response["ETag"] = etag
+    return response
+
+
+def _map_etag(tile_key: str, lens: str | None) -> str:
+    """Strong ETag for a ``/map/`` response: the tile digest plus the lens filter."""
+    return quote_etag(f"{tile_key}.{lens}" if lens else tile_key)
+
+
 def _error(message: str, http_status: int = 400) -> JsonResponse:
     """Return an error response envelope."""
     return JsonResponse(
@@ -501,7 +550,7 @@ DEFAULT_ZOOM = "county"
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
-def game_map(request: Request, game_id: str) -> JsonResponse:
+def game_map(request: Request, game_id: str) -> HttpResponseBase:
     """GET /api/games/{id}/map/ — Hex map state snapshot.
 
     Query parameters:
@@ -538,12 +587,22 @@ def game_map(request: Request, game_id: str) -> JsonResponse:
         )
 
     bridge = _get_bridge()
+    session_uuid = uuid.UUID(str(session.id))
+    # Revalidate against the tile digest before building anything: the key
+    # only needs the fog state, the snapshot needs every hex row.
+    key = bridge.get_map_snapshot_key(session_uuid, tick=tick, zoom=zoom)
+    if key is not None:
+        not_modified = _not_modified(request, _map_etag(key, lens))
+        if not_modified is not None:
+            return not_modified
+
     snapshot = bridge.get_map_snapshot(
-        uuid.UUID(str(session.id)),
+        session_uuid,
         tick=tick,
         _layer=lens,
         zoom=zoom,
     )
+    key = snapshot.get("metadata", {}).get("tile_key")
 
     if lens:
         # Filter properties to only include the requested layer metric plus identifying fields
@@ -569,16 +628,18 @@ def game_map(request: Request, game_id: str) -> JsonResponse:
             },
             "features": filtered_features,
         }
-    return _envelope(
+    return _conditional_envelope(
+        request,
         snapshot,
         tick=snapshot.get("metadata", {}).get("tick", session.current_tick),
         session_id=str(session.id),
+        etag=_map_etag(key, lens) if key else None,
     )
 
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
-def game_map_history(request: Request, game_id: str) -> JsonResponse:
+def game_map_history(request: Request, game_id: str) -> HttpResponseBase:
     """GET /api/games/{id}/map/history/ — per-tick map-metric replay frames.
 
     Program 17 Wave 3 (Backend-W3R3): the map lens scrubber's real data
@@ -597,6 +658,12 @@ def game_map_history(request: Request, game_id: str) -> JsonResponse:
             Default: a window ending at the latest committed tick, capped
             at ``EngineBridge``'s window cap (``capped: true`` in the
             response when the served range is narrower than requested).
+        diff (bool, optional): ``1``/``true`` serves frame diffs — every
+            frame after the first carries only the counties that changed
+            (``diff: true`` in the response).
+
+    Both map endpoints answer ``If-None-Match`` with 304 (see
+    :func:`_conditional_envelope`).
     """
     session = _get_session_or_none(game_id, request.user.id)
     if session is None:
@@ -627,9 +694,15 @@ def game_map_history(request: Request, game_id: str) -> JsonResponse:
     if from_tick is not None and to_tick is not None and from_tick > to_tick:
         return _error("from_tick must be <= to_tick", http_status=400)
 
+    diff = request.query_params.get("diff", "").lower() in ("1", "true")
+
     bridge = _get_bridge()
     data = bridge.get_map_history(
-        uuid.UUID(str(session.id)), metric=metric, from_tick=from_tick, to_tick=to_tick
+        uuid.UUID(str(session.id)),
+        metric=metric,
+        from_tick=from_tick,
+        to_tick=to_tick,
+        diff=diff,
     )
 
     error = data.get("error")
@@ -640,7 +713,9 @@ def game_map_history(request: Request, game_id: str) -> JsonResponse:
     if error == "not_replayable":
         return _error(data["message"], http_status=422)
 
-    return _envelope(data, tick=session.current_tick, session_id=str(session.id))
+    return _conditional_envelope(
+        request, data, tick=session.current_tick, session_id=str(session.id)
+    )
 
 
 # ---------------------------------------------------------------------- #
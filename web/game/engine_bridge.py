@@ -88,6 +88,8 @@ from .verb_copy import VERB_INELIGIBILITY_COPY
 if TYPE_CHECKING:
     from babylon.models.entities.relationship import Relationship
     from babylon.models.entities.territory import Territory
+    from game.graph_cache import HydratedGraphCache
+    from game.map_tiles import MapTileStore
     from game.narrative_service import NarrativeService
     from game.narrator import NarratorProvider
 
@@ -174,6 +176,30 @@ from babylon.projection.verbs.preview import (  # noqa: E402
 from babylon.projection.verbs.preview import VERB_TO_ACTION_TYPE  # noqa: E402
 
 
+def _map_history_frame_diffs(frames: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Reduce full map-history frames to frame diffs (first frame whole).
+
+    Every frame after the first keeps only the counties whose value differs
+    from the running state, so applying each frame's ``values`` with
+    ``dict.update`` in order reproduces the full frames exactly.
+    """
+    diffs: list[dict[str, Any]] = []
+    current: dict[str, float | None] = {}
+    for index, frame in enumerate(frames):
+        values = frame["values"]
+        if index == 0:
+            changed = values
+        else:
+            changed = {
+                county: value
+                for county, value in values.items()
+                if county not in current or current[county] != value
+            }
+        current.update(values)
+        diffs.append({**frame, "values": changed})
+    return diffs
+
+
 def _fetch_session_rng_seed_from_pool(pool: Any, session_id: UUID) -> int:
     """Read ``rng_seed`` from ``game_session`` (T080 / FR-024).
 
@@ -194,6 +220,34 @@ def _fetch_session_rng_seed_from_pool(pool: Any, session_id: UUID) -> int:
     return 0
 
 
+def _fetch_latest_graph_tick_from_pool(pool: Any, session_id: UUID) -> int | None:
+    """Read the latest persisted graph tick.
+
+    ``graph_commit`` marks every delta-snapshot tick (such a tick may write
+    no ``node_state`` row); ``node_state`` covers full-frame ticks. The same
+    tick ``hydrate_graph(tick=None)`` resolves to, without decoding
+    the graph — the graph cache's key for "latest". Returns ``None`` when the
+    backend has no pool, the session has no graph yet, or the read fails, so
+    the caller falls back to an uncached hydrate.
+    """
+    if pool is None:
+        return None
+    try:
+        with pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                "SELECT GREATEST("
+                "(SELECT MAX(tick) FROM graph_commit WHERE session_id = %s), "
+                "(SELECT MAX(tick) FROM node_state WHERE session_id = %s))",
+                (session_id, session_id),
+            )
+            row = cur.fetchone()
+            if row and row[0] is not None:
+                return int(row[0])
+    except Exception:  # noqa: BLE001 — non-fatal; hydrate uncached instead
+        logger.exception("Failed to read latest graph tick for session %s", session_id)
+    return None
+
+
 def _fetch_session_game_defines(persistence: BridgePersistence, session_id: UUID) -> GameDefines:
     """Read this session's GameDefines from its ``game_session`` row (C.13).
 
@@ -2215,6 +2269,9 @@ class EngineBridge:
 
     Holds a reference to the persistence layer and provides methods
     that orchestrate create → hydrate → step → persist → snapshot cycles.
+    With a ``graph_cache``, hydrated graphs are shared across requests per
+    ``(session, tick)`` (see :mod:`game.graph_cache`); with a ``tile_store``,
+    finished map snapshots are too (see :mod:`game.map_tiles`).
     """
 
     def __init__(
@@ -2222,8 +2279,12 @@ class EngineBridge:
         persistence: BridgePersistence,
         narrator: NarratorProvider | None = None,
         narrative_service: NarrativeService | None = None,
+        graph_cache: HydratedGraphCache | None = None,
+        tile_store: MapTileStore | None = None,
     ) -> None:
         self._persistence = persistence
+        self._graph_cache = graph_cache
+        self._tile_store = tile_store
         if narrator is None:
             from game.narrator import DeterministicNarrator
 
@@ -2236,6 +2297,45 @@ class EngineBridge:
         self._narrative_service = narrative_service
         logger.info("EngineBridge initialized with %s", type(persistence).__name__)
 
+    def _hydrate_graph(self, session_id: UUID, tick: int | None = None) -> BabylonGraph:
+        """Hydrate a session graph, through the graph cache when configured.
+
+        "Latest" (``tick=None``) is resolved to a concrete tick first so the
+        cache key is stable; if it cannot be (no pool, no graph yet) the
+        hydrate is served uncached, which also keeps an unseeded session's
+        empty graph out of the cache.
+
+        Args:
+            session_id: The game session UUID.
+            tick: Specific tick to load, or ``None`` for latest.
+
+        Returns:
+            The hydrated graph — read-only when cached; ``copy()`` it to write.
+        """
+        cache = self._graph_cache
+        if cache is None:
+            return self._persistence.hydrate_graph(tick=tick, session_id=session_id)
+        if tick is None:
+            tick = _fetch_latest_graph_tick_from_pool(self._persistence.pool, session_id)
+            if tick is None:
+                return self._persistence.hydrate_graph(tick=None, session_id=session_id)
+        resolved = tick
+        return cache.get(
+            session_id,
+            resolved,
+            lambda: self._persistence.hydrate_graph(tick=resolved, session_id=session_id),
+        )
+
+    def _invalidate_graph_cache(self, session_id: UUID) -> None:
+        """Drop ``session_id``'s cached graphs after a graph write."""
+        if self._graph_cache is not None:
+            self._graph_cache.invalidate(session_id)
+
+    def _invalidate_map_tiles(self, session_id: UUID) -> None:
+        """Drop ``session_id``'s map tiles after a ``hex_latest`` write."""
+        if self._tile_store is not None:
+            self._tile_store.invalidate(session_id)
+
     # ------------------------------------------------------------------ #
     # Game lifecycle
     # ------------------------------------------------------------------ #
@@ -2348,7 +2448,7 @@ class EngineBridge:
                 name that is not a registered scenario or alias (fail loud
                 on corrupt data instead of silently reseeding as ``us``).
         """
-        graph = self._persistence.hydrate_graph(tick=tick, session_id=session_id)
+        graph = self._hydrate_graph(session_id, tick=tick)
 
         # Backward-compatible bootstrap: if a legacy/new session has no persisted
         # tick-0 graph yet, seed it from the stored scenario and retry hydrate.
@@ -2400,7 +2500,9 @@ class EngineBridge:
                 )
                 # Spec-109 A1: same backfill for the snapshot/summary tables.
                 _persist_snapshots_safe(self._persistence, session_id, seeded_state)
-                graph = self._persistence.hydrate_graph(tick=tick, session_id=session_id)
+                self._invalidate_graph_cache(session_id)
+                self._invalidate_map_tiles(session_id)
+                graph = self._hydrate_graph(session_id, tick=tick)
 
         # Determine the tick from the graph metadata
         resolved_tick = tick if tick is not None else _graph_tick(graph)
@@ -2462,9 +2564,19 @@ class EngineBridge:
         None-graph handling) — fully fogged, never a crash or a fabricated
         full-visibility default; the balkanization block is simply omitted,
         same as before this task.
+
+        A complete snapshot carries ``metadata.tile_key``, the
+        :func:`~game.map_tiles.tile_key` digest of the tick, zoom and the fog
+        state resolved above (see :meth:`get_map_snapshot_key`). With a
+        ``tile_store`` it is read from / written to
+        :class:`~game.map_tiles.MapTileStore` under that digest, so only the
+        first request per fog state aggregates. Degraded snapshots — no
+        hydrated graph (the fully fogged fallback), a failed metadata block,
+        or no features — are served without a key and never stored.
         """
         import h3
 
+        from game.map_tiles import tile_key
         from game.models import GameSession, HexState
 
         try:
@@ -2476,19 +2588,9 @@ class EngineBridge:
 
         hex_states = HexState.objects.filter(game=session, tick=target_tick)
 
-        graph = None
-        try:
-            graph = self._persistence.hydrate_graph(tick=target_tick, session_id=session_id)
-        except Exception:  # noqa: BLE001 — best-effort; map still renders, fully fogged
-            logger.exception("Failed to hydrate graph for map fog for session %s", session_id)
-
-        reach = _current_organizing_reach(graph)
-        ledger = _derive_intel_ledger(session_id)
-        staleness_ticks, unknown_ticks = _current_intel_aging_ticks()
-        # G4 (veil-leak closure): a hydration failure defaults to tier 0
-        # (fully veiled) — the same "deny on ambiguity" default ``reach``
-        # already uses above, never a fabricated full-visibility fallback.
-        veil_tier = _resolve_veil_tier_from_graph(graph) if graph is not None else 0
+        graph, reach, ledger, staleness_ticks, unknown_ticks, veil_tier = self._resolve_map_fog(
+            session_id, target_tick
+        )
         h3_to_territory: dict[str, str] = (
             {
                 node_data["h3_index"]: node_id
@@ -2499,6 +2601,23 @@ class EngineBridge:
             else {}
         )
 
+        key: str | None = None
+        if graph is not None:
+            key = tile_key(
+                session_id=session_id,
+                tick=target_tick,
+                zoom=zoom,
+                reach=reach,
+                ledger=ledger,
+                staleness_ticks=staleness_ticks,
+                unknown_ticks=unknown_ticks,
+                veil_tier=veil_tier,
+            )
+            if self._tile_store is not None:
+                cached = self._tile_store.get(session_id, key)
+                if cached is not None:
+                    return cached
+
         if zoom == "hex":
             # Full hex-level detail — no aggregation
             features = []
@@ -2555,6 +2674,7 @@ class EngineBridge:
                 metadata["balkanization"] = _build_balkanization_block(graph)
             except Exception:  # noqa: BLE001 — optional block, never fails the map
                 logger.exception("Failed to build balkanization block for session %s", session_id)
+                key = None
 
             # Track 1 / Task 6: SOLIDARITY edges as literal lines — the
             # cockpit map layer's data source. Territory-anchored via the
@@ -2571,12 +2691,90 @@ class EngineBridge:
                 )
             except Exception:  # noqa: BLE001 — optional block, never fails the map
                 logger.exception("Failed to build solidarity edge lines for session %s", session_id)
+                key = None
 
-        return {
+        if key is not None and features:
+            metadata["tile_key"] = key
+        snapshot = {
             "type": "FeatureCollection",
             "metadata": metadata,
             "features": features,
         }
+        if self._tile_store is not None and "tile_key" in metadata:
+            self._tile_store.put(session_id, metadata["tile_key"], snapshot)
+        return snapshot
+
+    def get_map_snapshot_key(
+        self,
+        session_id: UUID,
+        tick: int | None = None,
+        zoom: str = "county",
+    ) -> str | None:
+        """Return the ``tile_key`` a complete map snapshot would carry.
+
+        Resolves only the fog state, not the snapshot, so the ``/map/``
+        endpoint can answer ``If-None-Match`` without aggregating. The key is
+        issued as an ETag only on complete snapshots, so a client holding a
+        matching one holds the full payload for these inputs.
+
+        Args:
+            session_id: The game session UUID.
+            tick: The tick to query data for. If None, uses current tick.
+            zoom: Spatial aggregation level.
+
+        Returns:
+            The 64-char digest, or ``None`` when the session is unknown or
+            its graph cannot be hydrated (the fully fogged fallback).
+        """
+        from game.map_tiles import tile_key
+        from game.models import GameSession
+
+        try:
+            session = GameSession.objects.get(id=session_id)
+        except GameSession.DoesNotExist:
+            return None
+
+        target_tick = tick if tick is not None else session.current_tick
+        graph, reach, ledger, staleness_ticks, unknown_ticks, veil_tier = self._resolve_map_fog(
+            session_id, target_tick
+        )
+        if graph is None:
+            return None
+        return tile_key(
+            session_id=session_id,
+            tick=target_tick,
+            zoom=zoom,
+            reach=reach,
+            ledger=ledger,
+            staleness_ticks=staleness_ticks,
+            unknown_ticks=unknown_ticks,
+            veil_tier=veil_tier,
+        )
+
+    def _resolve_map_fog(
+        self, session_id: UUID, tick: int
+    ) -> tuple[BabylonGraph | None, frozenset[str], IntelLedger, int, int, int]:
+        """Hydrate ``tick``'s graph and resolve the player's fog state from it.
+
+        Returns:
+            ``(graph, reach, ledger, staleness_ticks, unknown_ticks,
+            veil_tier)``; ``graph`` is ``None`` when hydration fails, and
+            ``reach``/``veil_tier`` then fall back to fully fogged.
+        """
+        graph = None
+        try:
+            graph = self._hydrate_graph(session_id, tick=tick)
+        except Exception:  # noqa: BLE001 — best-effort; map still renders, fully fogged
+            logger.exception("Failed to hydrate graph for map fog for session %s", session_id)
+
+        reach = _current_organizing_reach(graph)
+        ledger = _derive_intel_ledger(session_id)
+        staleness_ticks, unknown_ticks = _current_intel_aging_ticks()
+        # G4 (veil-leak closure): a hydration failure defaults to tier 0
+        # (fully veiled) — the same "deny on ambiguity" default ``reach``
+        # already uses above, never a fabricated full-visibility fallback.
+        veil_tier = _resolve_veil_tier_from_graph(graph) if graph is not None else 0
+        return graph, reach, ledger, staleness_ticks, unknown_ticks, veil_tier
 
     @staticmethod
     def _aggregate_hex_features(
@@ -3173,7 +3371,7 @@ class EngineBridge:
         # (:func:`_current_organizing_reach` on a ``None`` graph), never a
         # fabricated full-visibility fallback.
         try:
-            graph = self._persistence.hydrate_graph(tick=None, session_id=session_id)
+            graph = self._hydrate_graph(session_id, tick=None)
             veil_tier = _resolve_veil_tier_from_graph(graph)
         except Exception:  # noqa: BLE001 — diagnostic; never blocks request
             logger.exception("get_game_timeseries: veil tier resolution failed")
@@ -3574,6 +3772,7 @@ class EngineBridge:
         metric: str,
         from_tick: int | None = None,
         to_tick: int | None = None,
+        diff: bool = False,
     ) -> dict[str, Any]:
         """Return one MAP metric's per-tick, per-county replay frames.
 
@@ -3641,6 +3840,11 @@ class EngineBridge:
                 ``to_tick`` to pick the default/capped window (see below).
             to_tick: Inclusive upper tick bound; ``None`` defaults to the
                 latest tick this game has a row for.
+            diff: Serve frame diffs: the first frame stays whole, every
+                later frame carries only the counties whose value differs
+                from the previous frame (a scrubber replays them by
+                ``dict.update``), and the response gains ``"diff": True``.
+                Counties are never removed by a diff frame.
 
         Returns:
             On success: ``{"metric", "from_tick", "to_tick", "capped",
@@ -3749,7 +3953,7 @@ class EngineBridge:
         # extra. Best-effort, fails CLOSED like get_game_timeseries.
         if metric in TIER1_VALUE_RELATION_FIELDS:
             try:
-                graph = self._persistence.hydrate_graph(tick=None, session_id=session_id)
+                graph = self._hydrate_graph(session_id, tick=None)
                 veil_tier = _resolve_veil_tier_from_graph(graph)
             except Exception:  # noqa: BLE001 — diagnostic; never blocks the request
                 logger.exception("get_map_history: veil tier resolution failed for %r", metric)
@@ -3758,13 +3962,16 @@ class EngineBridge:
                 for frame in frames:
                     frame["values"] = dict.fromkeys(frame["values"])
 
-        return {
+        result: dict[str, Any] = {
             "metric": metric,
             "from_tick": resolved_from,
             "to_tick": requested_to,
             "capped": capped,
-            "frames": frames,
+            "frames": _map_history_frame_diffs(frames) if diff else frames,
         }
+        if diff:
+            result["diff"] = True
+        return result
 
     def get_class_history(self, session_id: UUID, node_id: str) -> dict[str, Any]:
         """Return one social class's per-tick history + rupture markers.
@@ -4451,7 +4658,7 @@ class EngineBridge:
             ``ContradictionSnapshot`` dict matching
             ``specs/095-endgame-chronicle/contracts/contradiction.yaml``.
         """
-        graph = self._persistence.hydrate_graph(tick=None, session_id=session_id)
+        graph = self._hydrate_graph(session_id, tick=None)
         graph_attrs: dict[str, Any] = getattr(graph, "graph", {}) or {}
         tick = int(graph_attrs.get("tick", 0))
         regime = str(graph_attrs.get("dialectical_regime", "reproduction") or "reproduction")
@@ -4536,7 +4743,7 @@ class EngineBridge:
             ``EndgameState`` dict matching
             ``specs/095-endgame-chronicle/contracts/endgame.yaml``.
         """
-        graph = self._persistence.hydrate_graph(tick=None, session_id=session_id)
+        graph = self._hydrate_graph(session_id, tick=None)
         graph_attrs: dict[str, Any] = getattr(graph, "graph", {}) or {}
         tick = int(graph_attrs.get("tick", 0))
 
@@ -4621,7 +4828,7 @@ class EngineBridge:
         Raises:
             ValueError: No pattern is currently locked.
         """
-        graph = self._persistence.hydrate_graph(tick=None, session_id=session_id)
+        graph = self._hydrate_graph(session_id, tick=None)
         graph_attrs: dict[str, Any] = getattr(graph, "graph", {}) or {}
         tick = int(graph_attrs.get("tick", 0))
 
@@ -4658,7 +4865,7 @@ class EngineBridge:
             ``ObjectivesTracker`` dict matching
             ``specs/095-endgame-chronicle/contracts/objectives.yaml``.
         """
-        graph = self._persistence.hydrate_graph(tick=None, session_id=session_id)
+        graph = self._hydrate_graph(session_id, tick=None)
         graph_attrs: dict[str, Any] = getattr(graph, "graph", {}) or {}
         tick = int(graph_attrs.get("tick", 0))
 
@@ -4761,7 +4968,7 @@ class EngineBridge:
             "dialectical_regime"}``. See :func:`_build_field_state_nodes`/
             :func:`_build_field_state_edges` for the per-entry shape.
         """
-        graph = self._persistence.hydrate_graph(tick=None, session_id=session_id)
+        graph = self._hydrate_graph(session_id, tick=None)
         graph_attrs: dict[str, Any] = getattr(graph, "graph", {}) or {}
         tick = int(graph_attrs.get("tick", 0))
 
@@ -4812,7 +5019,7 @@ class EngineBridge:
             ``specs/103-trade-surfaces/contracts/trade-flows.yaml``.
         """
         pool = self._persistence.pool
-        graph = self._persistence.hydrate_graph(tick=None, session_id=session_id)
+        graph = self._hydrate_graph(session_id, tick=None)
         graph_attrs: dict[str, Any] = getattr(graph, "graph", {}) or {}
         tick = int(graph_attrs.get("tick", 0))
 
@@ -4890,9 +5097,9 @@ class EngineBridge:
             ``specs/103-trade-surfaces/contracts/county-exposure.yaml``.
         """
         pool = self._persistence.pool
-        # hydrate_graph is called for its side-effect of ensuring the session
+        # _hydrate_graph is called for its side-effect of ensuring the session
         # is bootstrapped; the exposure payload itself carries no tick field.
-        self._persistence.hydrate_graph(tick=None, session_id=session_id)
+        self._hydrate_graph(session_id, tick=None)
 
         weights = _fetch_county_exposure_weights(pool, county_fips)
         flow_rows = _fetch_county_boundary_flows(pool, session_id, county_fips)
@@ -5000,7 +5207,7 @@ class EngineBridge:
             ``specs/103-trade-surfaces/contracts/trade-panel.yaml``.
         """
         pool = self._persistence.pool
-        graph = self._persistence.hydrate_graph(tick=None, session_id=session_id)
+        graph = self._hydrate_graph(session_id, tick=None)
         graph_attrs: dict[str, Any] = getattr(graph, "graph", {}) or {}
         tick = int(graph_attrs.get("tick", 0))
 
@@ -5105,7 +5312,7 @@ class EngineBridge:
         visibility of your own organization) via an explicit bypass, not an
         emergent property of reach.
         """
-        graph = self._persistence.hydrate_graph(tick=None, session_id=session_id)
+        graph = self._hydrate_graph(session_id, tick=None)
         if node_id not in graph.nodes:
             return {}
         data = graph.nodes[node_id]
@@ -5176,7 +5383,7 @@ class EngineBridge:
         being trivially in its own reach) — full visibility of your own
         organization is a hard guarantee, not an emergent property.
         """
-        graph = self._persistence.hydrate_graph(tick=None, session_id=session_id)
+        graph = self._hydrate_graph(session_id, tick=None)
         if org_id not in graph.nodes or graph.nodes[org_id].get("_node_type") != "organization":
             return {}
         data = graph.nodes[org_id]
@@ -5258,7 +5465,7 @@ class EngineBridge:
         logic — guarantees this inspector can never drift from the
         dashboard list it drills into.
         """
-        graph = self._persistence.hydrate_graph(tick=None, session_id=session_id)
+        graph = self._hydrate_graph(session_id, tick=None)
         for community in _build_solidarity_communities(graph):
             if community["id"] == hyperedge_id:
                 return community
@@ -5272,7 +5479,7 @@ class EngineBridge:
         ``f"{source}->{target}"`` shape for a payload field (never for URL
         routing) — reused here rather than invented.
         """
-        graph = self._persistence.hydrate_graph(tick=None, session_id=session_id)
+        graph = self._hydrate_graph(session_id, tick=None)
         source, sep, target = edge_id.partition("->")
         if not sep or (source, target) not in graph.edges:
             return {}
@@ -5331,7 +5538,7 @@ class EngineBridge:
         never a second gate. Before this task the hex inspector was the one
         drill-down surface that skipped fogging entirely.
         """
-        graph = self._persistence.hydrate_graph(tick=None, session_id=session_id)
+        graph = self._hydrate_graph(session_id, tick=None)
         territory_id: str | None = None
         for node_id, node_data in graph.nodes(data=True):
             if node_data.get("_node_type") == "territory" and node_data.get("h3_index") == h3_index:
@@ -5640,6 +5847,7 @@ class EngineBridge:
             events=events_as_dicts if events_as_dicts else None,
             session_id=session_id,
         )
+        self._invalidate_graph_cache(session_id)
 
         # T016: Persist REAL per-action results from the engine's TurnResolution
         # (published by OODASystem into persistent_context["turn_resolution"];
@@ -5743,6 +5951,10 @@ class EngineBridge:
             agitation_by_territory=_agitation_index_by_territory(new_graph, new_tenancy_members),
             centrality_by_territory=_centrality_by_territory(new_state, new_graph),
         )
+        # hex_latest was just overwritten in place: drop the session's map
+        # tiles only now, so a /map/ read racing this commit cannot publish
+        # a tile built from the previous tick's rows.
+        self._invalidate_map_tiles(session_id)
         # Spec-109 A1: fill the spec-037 snapshot tables + the tick_summary
         # aggregates that back get_game_timeseries (spec-061 FR-003 wire-up).
         # graph=new_graph (task #70): new_graph carries the tick_* rates
@@ -11611,7 +11823,7 @@ def init_persistence(db_config: dict[str, Any]) -> RuntimePersistence:
     conninfo = f"host={host} port={port} dbname={name} user={user} password={password}"
 
     _pool = ConnectionPool(conninfo=conninfo, min_size=1, max_size=4, timeout=10)
-    persistence = PostgresRuntime(_pool)
+    persistence = PostgresRuntime(_pool, delta_snapshots=True)
     try:
         persistence.init_schema()
         # Playability Spine Task 19 (spec-116): the web DB must also receive
@@ -0,0 +1,120 @@
+"""Process-wide cache of hydrated session graphs, keyed by ``(session, tick)``.
+
+Nearly every ``EngineBridge`` read endpoint starts from
+``persistence.hydrate_graph``, which rebuilds the whole ``BabylonGraph`` from
+``node_state``/``edge_state`` JSONB. A dashboard page load fans out into a
+dozen such endpoints, and several players poll at once, so the same committed
+tick is decoded over and over. A committed tick never changes, so its graph
+can be built once and shared.
+
+Entries are bounded by total graph size (nodes + edges), least-recently-used
+first out. A hit hands out the cached graph itself — copying it would cost as
+much as the decode it replaces — so every graph served from here is
+read-only: a caller that needs to write attributes takes its own
+``BabylonGraph.copy()`` first. Typed queries sort a type index in place the
+first time they read it after out-of-order inserts (hydration always leaves
+some), so a graph's indexes are sorted before it is shared. The bridge's read endpoints only read the
+hydrated graph; ``resolve_tick`` writes to the fresh graph it builds from the
+stepped state, never to the hydrated one, and drops a session's entries when
+it commits.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from uuid import UUID
+
+    from babylon.topology.graph import BabylonGraph
+
+__all__ = ["HydratedGraphCache"]
+
+logger = logging.getLogger(__name__)
+
+#: Default element budget (nodes + edges summed over cached graphs). A
+#: nationwide session graph is a few hundred thousand elements, so this holds
+#: the latest tick of a handful of large sessions or many small ones; infra
+#: bound, not a gameplay coefficient, hence no GameDefines.
+DEFAULT_MAX_ELEMENTS: Final[int] = 1_000_000
+
+
+def _graph_size(graph: BabylonGraph) -> int:
+    return int(graph.number_of_nodes()) + int(graph.number_of_edges())
+
+
+class HydratedGraphCache:
+    """Thread-safe LRU of read-only hydrated graphs.
+
+    Args:
+        max_elements: Upper bound on summed ``nodes + edges`` across cached
+            graphs. A single graph larger than the budget is served but
+            never cached.
+    """
+
+    def __init__(self, *, max_elements: int = DEFAULT_MAX_ELEMENTS) -> None:
+        if max_elements < 1:
+            raise ValueError(f"max_elements must be >= 1, got {max_elements}")
+        self._max_elements = max_elements
+        self._entries: OrderedDict[tuple[UUID, int], tuple[BabylonGraph, int]] = OrderedDict()
+        self._elements = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, session_id: UUID, tick: int, load: Callable[[], BabylonGraph]) -> BabylonGraph:
+        """Return the shared ``(session_id, tick)`` graph.
+
+        Args:
+            session_id: The game session UUID.
+            tick: A concrete committed tick (resolve "latest" first).
+            load: Hydrates the graph on a miss (called outside the lock).
+
+        Returns:
+            The cached graph, shared with every other reader: read-only.
+        """
+        key = (session_id, tick)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+        graph = load()
+        graph.sort_type_indexes()
+        size = _graph_size(graph)
+        if size <= self._max_elements:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    # Lost a load race: serve the graph other readers share.
+                    return entry[0]
+                self._entries[key] = (graph, size)
+                self._elements += size
+                self._evict()
+        return graph
+
+    def invalidate(self, session_id: UUID) -> None:
+        """Drop every cached tick of ``session_id``."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == session_id]:
+                _, size = self._entries.pop(key)
+                self._elements -= size
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._elements = 0
+
+    def _evict(self) -> None:
+        while self._elements > self._max_elements and self._entries:
+            (session_id, tick), (_, size) = self._entries.popitem(last=False)
+            self._elements -= size
+            logger.debug("graph cache evicted session %s tick %s", session_id, tick)
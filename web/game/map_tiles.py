@@ -0,0 +1,191 @@
+"""On-disk store of pre-serialized ``/map/`` snapshots ("map tiles").
+
+``EngineBridge.get_map_snapshot`` re-aggregates every ``hex_latest`` row of a
+session into a FeatureCollection on every request — the hex zoom also
+computes one H3 boundary polygon per cell — and map scrubbing/zoom toggling
+asks for the same ``(session, tick, zoom)`` over and over. A tile is that
+finished snapshot, gzip-compressed JSON, written once on the first request
+and read back for every later one.
+
+Tiles are addressed by a SHA-256 digest of every input the snapshot is a
+function of (:func:`tile_key`): session, tick, zoom AND the fog state —
+organizing reach, intel ledger, aging windows, Veil tier — so a player who
+gains reach or intel mid-tick never gets a stale fogged tile; the digest
+simply changes. The digest doubles as the ``/map/`` response's strong ETag
+(``metadata.tile_key`` on every complete snapshot), so ``game.api`` answers
+``If-None-Match`` from the fog state alone, before any aggregation. Layout is
+``<root>/<session_id>/<digest>.json.gz``; ``hex_latest`` is overwritten in
+place each tick, so ``EngineBridge`` drops a session's tiles
+(:meth:`MapTileStore.invalidate`) whenever it rewrites those rows — the
+same moments :class:`~game.graph_cache.HydratedGraphCache` is invalidated.
+
+Writes go to a temp file in the session directory and are published with
+``os.replace``, so concurrent workers (one store root shared by every
+process) never read a partial tile; a lost race just writes identical
+bytes twice.
+
+The store keeps at most ``max_sessions`` session directories: the first
+tile written for a new session drops the least recently written ones, so
+tiles of ended or deleted sessions age out on their own. Removing any
+session directory (or the whole root) by hand is always safe — a missing
+tile is a miss.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from babylon.projection.fog.ledger import IntelLedger
+
+__all__ = ["MapTileStore", "tile_key"]
+
+logger = logging.getLogger(__name__)
+
+_SUFFIX = ".json.gz"
+
+#: Default bound on session directories kept in the store. Infra bound, not a
+#: gameplay coefficient, hence no GameDefines.
+DEFAULT_MAX_SESSIONS: Final[int] = 64
+
+
+def tile_key(
+    *,
+    session_id: UUID,
+    tick: int,
+    zoom: str,
+    reach: frozenset[str],
+    ledger: IntelLedger,
+    staleness_ticks: int,
+    unknown_ticks: int,
+    veil_tier: int,
+) -> str:
+    """Digest of every input a ``get_map_snapshot`` payload depends on.
+
+    Args:
+        session_id: The game session UUID.
+        tick: The concrete tick the snapshot renders.
+        zoom: Spatial aggregation level.
+        reach: Player organizing reach (territory ids).
+        ledger: The session's intel ledger.
+        staleness_ticks: Intel staleness window.
+        unknown_ticks: Intel unknown window.
+        veil_tier: Resolved Veil-of-Money tier.
+
+    Returns:
+        64-char lowercase SHA-256 hex digest.
+    """
+    canonical = json.dumps(
+        {
+            "session_id": str(session_id),
+            "tick": tick,
+            "zoom": zoom,
+            "reach": sorted(reach),
+            "ledger": ledger.model_dump(mode="json"),
+            "aging": [staleness_ticks, unknown_ticks],
+            "veil_tier": veil_tier,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class MapTileStore:
+    """Directory of gzip-compressed map snapshots, one per :func:`tile_key`.
+
+    Every failure is logged and degrades to a miss — a tile store that
+    cannot read or write must never fail the map request itself.
+
+    Args:
+        root: Store directory (created on first write).
+        max_sessions: Session directories kept; the least recently written
+            beyond this are dropped when a new session's first tile lands.
+    """
+
+    def __init__(self, root: Path, *, max_sessions: int = DEFAULT_MAX_SESSIONS) -> None:
+        if max_sessions < 1:
+            raise ValueError(f"max_sessions must be >= 1, got {max_sessions}")
+        self._root = Path(root)
+        self._max_sessions = max_sessions
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def get(self, session_id: UUID, key: str) -> dict[str, Any] | None:
+        """Return the stored snapshot for ``key``, or ``None`` on a miss."""
+        path = self._path(session_id, key)
+        try:
+            with gzip.open(path, "rb") as fh:
+                snapshot: dict[str, Any] = json.load(fh)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.exception("map tile %s unreadable; rebuilding", path)
+            return None
+        return snapshot
+
+    def put(self, session_id: UUID, key: str, snapshot: dict[str, Any]) -> None:
+        """Atomically publish ``snapshot`` as the tile for ``key``."""
+        directory = self._root / str(session_id)
+        payload = json.dumps(snapshot, separators=(",", ":")).encode("utf-8")
+        try:
+            new_session = not directory.is_dir()
+            directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with (
+                    os.fdopen(fd, "wb") as raw,
+                    gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as fh,
+                ):
+                    fh.write(payload)
+                os.replace(tmp_name, self._path(session_id, key))
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            logger.exception("map tile write failed for session %s", session_id)
+            return
+        if new_session:
+            self._prune(keep=directory)
+
+    def invalidate(self, session_id: UUID) -> None:
+        """Drop every tile of ``session_id``."""
+        shutil.rmtree(self._root / str(session_id), ignore_errors=True)
+
+    def _prune(self, keep: Path) -> None:
+        """Drop the least recently written sessions beyond ``max_sessions``."""
+        try:
+            sessions = [path for path in self._root.iterdir() if path.is_dir() and path != keep]
+        except OSError:
+            logger.exception("map tile store %s unlistable; not pruned", self._root)
+            return
+        excess = len(sessions) + 1 - self._max_sessions
+        if excess <= 0:
+            return
+        sessions.sort(key=_mtime)
+        for stale in sessions[:excess]:
+            shutil.rmtree(stale, ignore_errors=True)
+            logger.debug("map tile store dropped session %s", stale.name)
+
+    def _path(self, session_id: UUID, key: str) -> Path:
+        return self._root / str(session_id) / f"{key}{_SUFFIX}"
+
+
+def _mtime(path: Path) -> float:
+    # A directory another worker just pruned sorts first and is skipped.
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return float("-inf")
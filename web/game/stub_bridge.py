@@ -917,6 +917,19 @@ class StubEngineBridge:
             "features": features,
         }
 
+    def get_map_snapshot_key(
+        self,
+        _session_id: UUID,
+        tick: int | None = None,  # noqa: ARG002 — no tile digest to resolve
+        zoom: str = "county",  # noqa: ARG002
+    ) -> str | None:
+        """Stub parity for ``EngineBridge.get_map_snapshot_key``.
+
+        Stub snapshots have no fog state to digest, so ``/map/`` falls back
+        to hashing the body.
+        """
+        return None
+
     def get_map_history(
         self,
         _session_id: UUID,
@@ -924,6 +937,7 @@ class StubEngineBridge:
         metric: str,
         from_tick: int | None = None,
         to_tick: int | None = None,
+        diff: bool = False,  # noqa: ARG002 — no frames to diff
     ) -> dict[str, Any]:
         """Stub parity for GET /api/games/{id}/map/history/ (Backend-W3R3).
 
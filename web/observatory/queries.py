@@ -2,12 +2,13 @@
 
 Every query reads the simulation runner's declared interfaces ONLY:
 - the value-aggregate views (``v_{national,state,county}_value_aggregate``),
-- the as-of hex view (``v_hex_state_asof``),
+- the checkpoint-bounded as-of hex read (``hex_state_asof(session, tick)``,
+  migration 0041 — the single-tick form of ``v_hex_state_asof``),
 - the commit-marker table (``tick_commit``),
 - and, best-effort, the product ``game_session`` table for metadata.
 
 The raw sparse ``dynamic_hex_state`` table is NEVER read directly (it is
-delta-persisted; per-tick reads must go through ``v_hex_state_asof``). Values
+delta-persisted; per-tick reads must go through the as-of interface). Values
 are always passed as bound parameters; only whitelisted view/column names are
 formatted into SQL (see :data:`SCOPE_VIEWS`). This satisfies Constitution II.11
 (cross-subsystem reads via declared interfaces).
@@ -85,8 +86,7 @@ SELECT h3_index, county_fips, state_fips, region_id,
        c, v, s, k,
        biocapacity_stock, energy_stock, raw_material_stock,
        internet_access_pct, surveillance_coupling, written_at_tick
-FROM v_hex_state_asof
-WHERE session_id = %s AND tick = %s{county_clause}{after_clause}
+FROM hex_state_asof(%s, %s){where_clause}
 ORDER BY h3_index
 LIMIT %s
 """
@@ -144,9 +144,11 @@ def build_hex_query(
 ) -> tuple[str, tuple[Any, ...]]:
     """Build the bounded, paginated as-of hex-frame query.
 
-    Reads ``v_hex_state_asof`` only, ordered by ``h3_index`` and capped at
-    ``fetch_limit`` rows (the caller fetches one extra to detect truncation).
-    An ``after_h3`` cursor pages forward by h3 index.
+    Reads ``hex_state_asof`` only — the nearest checkpoint frame at or
+    before ``tick`` plus its deltas, never the whole session history —
+    ordered by ``h3_index`` and capped at ``fetch_limit`` rows (the caller
+    fetches one extra to detect truncation). An ``after_h3`` cursor pages
+    forward by h3 index.
 
     Args:
         session_id: Session UUID (string).
@@ -156,19 +158,19 @@ def build_hex_query(
         fetch_limit: Hard row cap for this page.
 
     Returns:
-        ``(sql, params)`` reading ``v_hex_state_asof`` only.
+        ``(sql, params)`` reading ``hex_state_asof`` only.
     """
     params: list[Any] = [session_id, tick]
-    county_clause = ""
+    predicates: list[str] = []
     if county_fips:
-        county_clause = " AND county_fips = %s"
+        predicates.append("county_fips = %s")
         params.append(county_fips)
-    after_clause = ""
     if after_h3:
-        after_clause = " AND h3_index > %s"
+        predicates.append("h3_index > %s")
         params.append(after_h3)
     params.append(fetch_limit)
-    sql = HEX_FRAME_SQL.format(county_clause=county_clause, after_clause=after_clause)
+    where_clause = f"\nWHERE {' AND '.join(predicates)}" if predicates else ""
+    sql = HEX_FRAME_SQL.format(where_clause=where_clause)
     return sql, tuple(params)
 
 
@@ -295,7 +297,7 @@ def fetch_hex_frame(
     limit: int = DEFAULT_HEX_LIMIT,
     after_h3: str | None = None,
 ) -> tuple[list[dict[str, Any]], bool, str | None]:
-    """Return one bounded page of the reconstructed hex frame (as-of view).
+    """Return one bounded page of the reconstructed hex frame (as-of read).
 
     Fetches ``limit + 1`` rows to detect truncation without a second query.
 